@@ -0,0 +1,183 @@
+"""
+Regression micro-benchmarks of hot paths of `inference` - pre- and post-processing,
+serialisation, Execution Engine, ONNX Runtime sessions and caches. Benchmarks use synthetic
+inputs generated with fixed seed and stub models (no weights, no Roboflow API), such that
+results are comparable between commits run on the same machine.
+
+Usage (from root of repository):
+
+    # run all benchmarks and save results as named baseline
+    PYTHONPATH=. python -m development.benchmark_scripts.hot_paths run --save-baseline main
+
+    # run selected benchmarks (names or groups, glob patterns accepted)
+    PYTHONPATH=. python -m development.benchmark_scripts.hot_paths run -f postprocessing -f "serialise_*"
+
+    # compare fresh run against baseline (exits with code 1 on regression if requested)
+    PYTHONPATH=. python -m development.benchmark_scripts.hot_paths compare --baseline main --fail-on-regression
+
+    # compare two saved results
+    PYTHONPATH=. python -m development.benchmark_scripts.hot_paths compare --baseline main --current results.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+
+from development.benchmark_scripts.hot_paths import (  # noqa: F401 - registration of cases
+    cache,
+    onnx_session,
+    postprocessing,
+    preprocessing,
+    serialisation,
+    workflows,
+)
+from development.benchmark_scripts.hot_paths.core import (
+    DEFAULT_MIN_REPEAT_TIME,
+    DEFAULT_REPEATS,
+    compare_results,
+    format_comparison_report,
+    format_result,
+    run_benchmarks,
+    select_benchmark_cases,
+)
+
+BASELINES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Regression micro-benchmarks of `inference` hot paths"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Run benchmarks")
+    _add_run_arguments(parser=run_parser)
+    run_parser.add_argument(
+        "--output", "-o", help="Path to save results JSON", default=None
+    )
+    run_parser.add_argument(
+        "--save-baseline",
+        help=f"Name of baseline to save results as (in {BASELINES_DIR})",
+        default=None,
+    )
+    subparsers.add_parser("list", help="List registered benchmarks")
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare results against baseline"
+    )
+    _add_run_arguments(parser=compare_parser)
+    compare_parser.add_argument(
+        "--baseline",
+        "-b",
+        required=True,
+        help="Name of saved baseline or path to results JSON",
+    )
+    compare_parser.add_argument(
+        "--current",
+        "-c",
+        default=None,
+        help="Name of saved baseline or path to results JSON - if not given, benchmarks are run",
+    )
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative change of median time considered significant",
+    )
+    compare_parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with code 1 when any regression is detected",
+    )
+    args = parser.parse_args()
+    if args.command == "list":
+        for case in select_benchmark_cases():
+            print(f"{case.group:<16} {case.name}")
+        return None
+    if args.command == "run":
+        results = _run(
+            filters=args.filter,
+            repeats=args.repeats,
+            min_repeat_time=args.min_repeat_time,
+        )
+        if args.output is not None:
+            _dump_results(path=args.output, results=results)
+        if args.save_baseline is not None:
+            _dump_results(
+                path=_resolve_results_path(reference=args.save_baseline),
+                results=results,
+            )
+        return None
+    baseline = _load_results(reference=args.baseline)
+    if args.filter:
+        selected_names = {c.name for c in select_benchmark_cases(patterns=args.filter)}
+        baseline["results"] = [
+            r for r in baseline["results"] if r["name"] in selected_names
+        ]
+    if args.current is not None:
+        current = _load_results(reference=args.current)
+    else:
+        baseline_names = [r["name"] for r in baseline["results"]]
+        current = _run(
+            filters=args.filter or baseline_names,
+            repeats=args.repeats,
+            min_repeat_time=args.min_repeat_time,
+        )
+    comparisons = compare_results(
+        baseline=baseline, current=current, threshold=args.threshold
+    )
+    print(format_comparison_report(comparisons=comparisons))
+    if args.fail_on_regression and any(c.status == "regression" for c in comparisons):
+        sys.exit(1)
+
+
+def _add_run_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--filter",
+        "-f",
+        action="append",
+        default=None,
+        help="Name or group of benchmark (glob pattern) - can be given multiple times",
+    )
+    parser.add_argument("--repeats", "-r", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument(
+        "--min-repeat-time",
+        type=float,
+        default=DEFAULT_MIN_REPEAT_TIME,
+        help="Minimal duration of single repeat [s] - calls per repeat are calibrated",
+    )
+
+
+def _run(filters: Optional[List[str]], repeats: int, min_repeat_time: float) -> dict:
+    cases = select_benchmark_cases(patterns=filters)
+    if not cases:
+        raise ValueError(f"No benchmarks match filters: {filters}")
+    return run_benchmarks(
+        cases=cases,
+        repeats=repeats,
+        min_repeat_time=min_repeat_time,
+        on_result=lambda result: print(format_result(result=result)),
+    )
+
+
+def _resolve_results_path(reference: str) -> str:
+    if reference.endswith(".json") or os.path.sep in reference:
+        return reference
+    return os.path.join(BASELINES_DIR, f"{reference}.json")
+
+
+def _load_results(reference: str) -> dict:
+    with open(_resolve_results_path(reference=reference)) as f:
+        return json.load(f)
+
+
+def _dump_results(path: str, results: dict) -> None:
+    parent_dir = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent_dir, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=4)
+    print(f"Results saved in {path}")
+
+
+if __name__ == "__main__":
+    main()
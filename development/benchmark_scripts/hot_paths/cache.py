@@ -0,0 +1,58 @@
+import itertools
+from typing import Any, Callable
+
+import numpy as np
+
+from development.benchmark_scripts.hot_paths.core import register_benchmark
+from inference.core.cache.memory import MemoryCache
+
+GROUP = "cache"
+KEYS = 64
+PREFILLED_MEMBERS = 1000
+
+
+@register_benchmark(name="memory_cache_set_get", group=GROUP)
+def set_get(generator: np.random.Generator) -> Callable[[], Any]:
+    cache = MemoryCache()
+    keys = [f"key-{i}" for i in range(KEYS)]
+    keys_cycle = itertools.cycle(keys)
+
+    def operation() -> None:
+        key = next(keys_cycle)
+        cache.set(key, {"value": key}, expire=60)
+        cache.get(key)
+
+    return operation
+
+
+@register_benchmark(name="memory_cache_zadd_rolling_window", group=GROUP)
+def zadd(generator: np.random.Generator) -> Callable[[], Any]:
+    # members falling out of the window are removed, such that size of sorted sets (and
+    # time of single call) does not depend on number of calls made
+    cache = MemoryCache()
+    keys_cycle = itertools.cycle([f"inference:key-{i}" for i in range(KEYS)])
+    scores = itertools.count()
+
+    def operation() -> None:
+        key, score = next(keys_cycle), next(scores)
+        cache.zadd(key, {"some": "value"}, score=score, expire=60)
+        cache.zremrangebyscore(key, min=-1, max=score - PREFILLED_MEMBERS)
+
+    return operation
+
+
+@register_benchmark(name="memory_cache_zrangebyscore_window", group=GROUP)
+def zrangebyscore(generator: np.random.Generator) -> Callable[[], Any]:
+    cache = MemoryCache()
+    scores = generator.uniform(0, PREFILLED_MEMBERS, size=PREFILLED_MEMBERS)
+    for i, score in enumerate(scores):
+        cache.zadd("inference:window", {"id": i}, score=float(score))
+    windows_cycle = itertools.cycle(
+        [float(e) for e in generator.uniform(0, PREFILLED_MEMBERS * 0.9, size=128)]
+    )
+
+    def operation() -> None:
+        window_start = next(windows_cycle)
+        cache.zrangebyscore("inference:window", min=window_start, max=window_start + 50)
+
+    return operation
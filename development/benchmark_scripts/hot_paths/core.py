@@ -0,0 +1,247 @@
+import fnmatch
+import gc
+import platform
+import random
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+SEED = 42
+DEFAULT_MIN_REPEAT_TIME = 0.1
+DEFAULT_REPEATS = 7
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    group: str
+    # receives seeded random generator and returns function to be measured - such that
+    # preparation of synthetic inputs is not measured
+    setup: Callable[[np.random.Generator], Callable[[], Any]]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    group: str
+    calls_per_repeat: int
+    repeats: int
+    median_s: float
+    min_s: float
+    mean_s: float
+    iqr_s: float
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline_median_s: Optional[float]
+    current_median_s: Optional[float]
+    ratio: Optional[float]
+    status: str
+
+
+BENCHMARK_CASES: Dict[str, BenchmarkCase] = {}
+
+
+def register_benchmark(name: str, group: str) -> Callable[
+    [Callable[[np.random.Generator], Callable[[], Any]]],
+    Callable[[np.random.Generator], Callable[[], Any]],
+]:
+    def decorator(
+        setup: Callable[[np.random.Generator], Callable[[], Any]]
+    ) -> Callable[[np.random.Generator], Callable[[], Any]]:
+        if name in BENCHMARK_CASES:
+            raise ValueError(f"Benchmark case {name} registered twice.")
+        BENCHMARK_CASES[name] = BenchmarkCase(name=name, group=group, setup=setup)
+        return setup
+
+    return decorator
+
+
+def select_benchmark_cases(patterns: Optional[List[str]] = None) -> List[BenchmarkCase]:
+    cases = sorted(BENCHMARK_CASES.values(), key=lambda c: (c.group, c.name))
+    if not patterns:
+        return cases
+    return [
+        case
+        for case in cases
+        if any(
+            fnmatch.fnmatch(case.name, pattern) or fnmatch.fnmatch(case.group, pattern)
+            for pattern in patterns
+        )
+    ]
+
+
+def run_benchmark_case(
+    case: BenchmarkCase,
+    repeats: int = DEFAULT_REPEATS,
+    min_repeat_time: float = DEFAULT_MIN_REPEAT_TIME,
+) -> BenchmarkResult:
+    """
+    Measures the case similarly to `timeit` - number of calls per repeat is calibrated such
+    that each repeat lasts at least `min_repeat_time`, then `repeats` repeats are measured
+    (with GC disabled) and statistics of per-call time across repeats are reported.
+    """
+    random.seed(SEED)
+    function = case.setup(np.random.default_rng(SEED))
+    function()  # warm-up (lazy imports, caches, JIT-ed kernels)
+    calls_per_repeat = _calibrate(function=function, min_repeat_time=min_repeat_time)
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in range(calls_per_repeat):
+                function()
+            timings.append((time.perf_counter() - start) / calls_per_repeat)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    q1, median, q3 = np.percentile(timings, [25, 50, 75])
+    return BenchmarkResult(
+        name=case.name,
+        group=case.group,
+        calls_per_repeat=calls_per_repeat,
+        repeats=repeats,
+        median_s=float(median),
+        min_s=float(np.min(timings)),
+        mean_s=float(np.mean(timings)),
+        iqr_s=float(q3 - q1),
+    )
+
+
+def run_benchmarks(
+    cases: List[BenchmarkCase],
+    repeats: int = DEFAULT_REPEATS,
+    min_repeat_time: float = DEFAULT_MIN_REPEAT_TIME,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> dict:
+    results = []
+    for case in cases:
+        result = run_benchmark_case(
+            case=case, repeats=repeats, min_repeat_time=min_repeat_time
+        )
+        if on_result is not None:
+            on_result(result)
+        results.append(asdict(result))
+    return {
+        "datetime": datetime.now().isoformat(),
+        "seed": SEED,
+        "platform": {
+            "python_version": platform.python_version(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "system": platform.system(),
+            "numpy_version": np.__version__,
+        },
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: dict, current: dict, threshold: float = 0.1
+) -> List[Comparison]:
+    """
+    Compares median per-call times - change larger than `threshold` (relative) which also
+    exceeds the noise (IQR) of both runs is reported as regression or improvement.
+    """
+    baseline_results = {r["name"]: r for r in baseline["results"]}
+    current_results = {r["name"]: r for r in current["results"]}
+    comparisons = []
+    for name in sorted(set(baseline_results) | set(current_results)):
+        baseline_result = baseline_results.get(name)
+        current_result = current_results.get(name)
+        if baseline_result is None or current_result is None:
+            comparisons.append(
+                Comparison(
+                    name=name,
+                    baseline_median_s=(baseline_result or {}).get("median_s"),
+                    current_median_s=(current_result or {}).get("median_s"),
+                    ratio=None,
+                    status="new" if baseline_result is None else "missing",
+                )
+            )
+            continue
+        baseline_median = baseline_result["median_s"]
+        current_median = current_result["median_s"]
+        ratio = current_median / baseline_median if baseline_median > 0 else None
+        noise = max(baseline_result["iqr_s"], current_result["iqr_s"])
+        difference = current_median - baseline_median
+        status = "unchanged"
+        if ratio is not None and abs(difference) > noise:
+            if ratio > 1 + threshold:
+                status = "regression"
+            elif ratio < 1 - threshold:
+                status = "improvement"
+        comparisons.append(
+            Comparison(
+                name=name,
+                baseline_median_s=baseline_median,
+                current_median_s=current_median,
+                ratio=ratio,
+                status=status,
+            )
+        )
+    return comparisons
+
+
+def format_result(result: BenchmarkResult) -> str:
+    return (
+        f"{result.name:<48} median: {format_duration(result.median_s):>10} | "
+        f"min: {format_duration(result.min_s):>10} | "
+        f"iqr: {format_duration(result.iqr_s):>10} | calls/repeat: {result.calls_per_repeat}"
+    )
+
+
+def format_comparison_report(comparisons: List[Comparison]) -> str:
+    lines = [
+        f"{'benchmark':<48} {'baseline':>10} {'current':>10} {'ratio':>7}  status",
+        "-" * 90,
+    ]
+    for comparison in comparisons:
+        ratio = f"{comparison.ratio:.3f}" if comparison.ratio is not None else "-"
+        lines.append(
+            f"{comparison.name:<48} "
+            f"{format_duration(comparison.baseline_median_s):>10} "
+            f"{format_duration(comparison.current_median_s):>10} "
+            f"{ratio:>7}  {comparison.status}"
+        )
+    statuses = [c.status for c in comparisons]
+    lines.append("-" * 90)
+    lines.append(
+        f"regressions: {statuses.count('regression')} | "
+        f"improvements: {statuses.count('improvement')} | "
+        f"unchanged: {statuses.count('unchanged')}"
+    )
+    return "\n".join(lines)
+
+
+def format_duration(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if value < 1e-3:
+        return f"{value * 1e6:.1f}us"
+    if value < 1:
+        return f"{value * 1e3:.2f}ms"
+    return f"{value:.3f}s"
+
+
+def _calibrate(function: Callable[[], Any], min_repeat_time: float) -> int:
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        duration = time.perf_counter() - start
+        if duration >= min_repeat_time:
+            return calls
+        if duration <= 0:
+            calls *= 10
+            continue
+        calls = max(calls * 2, int(calls * min_repeat_time / duration * 1.1))
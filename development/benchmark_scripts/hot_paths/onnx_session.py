@@ -0,0 +1,32 @@
+from typing import Any, Callable
+
+import numpy as np
+import onnxruntime
+from onnxruntime.datasets import get_example
+
+from development.benchmark_scripts.hot_paths.core import register_benchmark
+from inference.core.models.utils.io_binding import IOBindingSessionRunner
+
+GROUP = "onnx_session"
+
+
+def _create_session() -> onnxruntime.InferenceSession:
+    # tiny model shipped with ONNX Runtime - such that overhead of running the session
+    # (allocations of inputs and outputs) dominates over computation
+    return onnxruntime.InferenceSession(
+        get_example("sigmoid.onnx"), providers=["CPUExecutionProvider"]
+    )
+
+
+@register_benchmark(name="onnx_session_run", group=GROUP)
+def session_run(generator: np.random.Generator) -> Callable[[], Any]:
+    session = _create_session()
+    input_data = generator.random((3, 4, 5), dtype=np.float32)
+    return lambda: session.run(None, {"x": input_data})
+
+
+@register_benchmark(name="onnx_session_run_with_io_binding", group=GROUP)
+def session_run_with_io_binding(generator: np.random.Generator) -> Callable[[], Any]:
+    runner = IOBindingSessionRunner(session=_create_session())
+    input_data = generator.random((3, 4, 5), dtype=np.float32)
+    return lambda: runner.run(input_name="x", input_data=input_data)
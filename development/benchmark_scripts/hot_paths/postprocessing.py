@@ -0,0 +1,108 @@
+from typing import Any, Callable, Tuple
+
+import numpy as np
+
+from development.benchmark_scripts.hot_paths.core import register_benchmark
+from inference.core.nms import w_np_non_max_suppression
+from inference.core.utils.postprocess import (
+    masks2poly,
+    process_mask_accurate,
+    process_mask_fast,
+    process_mask_tradeoff,
+)
+
+GROUP = "postprocessing"
+INPUT_SIZE = 640
+CANDIDATES = 8400  # number of anchors of YOLOv8 at 640x640
+CLASSES = 80
+MASK_PROTOTYPES = 32
+PROTOTYPES_SIZE = 160
+DETECTIONS_WITH_MASKS = 30
+
+
+def _synthetic_raw_predictions(
+    generator: np.random.Generator, num_masks: int = 0
+) -> np.ndarray:
+    centers = generator.uniform(0, INPUT_SIZE, size=(CANDIDATES, 2))
+    sizes = generator.uniform(8, INPUT_SIZE / 3, size=(CANDIDATES, 2))
+    # most candidates have low confidence - as in raw output of the model
+    class_confidences = generator.random(size=(CANDIDATES, CLASSES)) ** 8
+    max_confidence = class_confidences.max(axis=1, keepdims=True)
+    parts = [centers, sizes, max_confidence, class_confidences]
+    if num_masks > 0:
+        parts.append(generator.normal(size=(CANDIDATES, num_masks)))
+    return np.concatenate(parts, axis=1)[np.newaxis].astype(np.float32)
+
+
+def _synthetic_mask_inputs(
+    generator: np.random.Generator,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    protos = generator.normal(
+        size=(MASK_PROTOTYPES, PROTOTYPES_SIZE, PROTOTYPES_SIZE)
+    ).astype(np.float32)
+    masks_in = generator.normal(size=(DETECTIONS_WITH_MASKS, MASK_PROTOTYPES)).astype(
+        np.float32
+    )
+    top_left = generator.uniform(0, INPUT_SIZE * 0.7, size=(DETECTIONS_WITH_MASKS, 2))
+    sizes = generator.uniform(20, INPUT_SIZE * 0.3, size=(DETECTIONS_WITH_MASKS, 2))
+    bboxes = np.concatenate([top_left, top_left + sizes], axis=1).astype(np.float32)
+    return protos, masks_in, bboxes
+
+
+@register_benchmark(name="w_np_non_max_suppression_8400x80", group=GROUP)
+def nms(generator: np.random.Generator) -> Callable[[], Any]:
+    predictions = _synthetic_raw_predictions(generator=generator)
+    return lambda: w_np_non_max_suppression(
+        predictions, conf_thresh=0.25, iou_thresh=0.45
+    )
+
+
+@register_benchmark(name="w_np_non_max_suppression_class_agnostic", group=GROUP)
+def nms_class_agnostic(generator: np.random.Generator) -> Callable[[], Any]:
+    predictions = _synthetic_raw_predictions(generator=generator)
+    return lambda: w_np_non_max_suppression(
+        predictions, conf_thresh=0.25, iou_thresh=0.45, class_agnostic=True
+    )
+
+
+@register_benchmark(name="w_np_non_max_suppression_with_masks", group=GROUP)
+def nms_with_masks(generator: np.random.Generator) -> Callable[[], Any]:
+    predictions = _synthetic_raw_predictions(
+        generator=generator, num_masks=MASK_PROTOTYPES
+    )
+    return lambda: w_np_non_max_suppression(
+        predictions, conf_thresh=0.25, iou_thresh=0.45, num_masks=MASK_PROTOTYPES
+    )
+
+
+@register_benchmark(name="process_mask_accurate", group=GROUP)
+def mask_accurate(generator: np.random.Generator) -> Callable[[], Any]:
+    protos, masks_in, bboxes = _synthetic_mask_inputs(generator=generator)
+    return lambda: process_mask_accurate(
+        protos, masks_in, bboxes, (INPUT_SIZE, INPUT_SIZE)
+    )
+
+
+@register_benchmark(name="process_mask_tradeoff", group=GROUP)
+def mask_tradeoff(generator: np.random.Generator) -> Callable[[], Any]:
+    protos, masks_in, bboxes = _synthetic_mask_inputs(generator=generator)
+    return lambda: process_mask_tradeoff(
+        protos, masks_in, bboxes, (INPUT_SIZE, INPUT_SIZE), 0.5
+    )
+
+
+@register_benchmark(name="process_mask_fast", group=GROUP)
+def mask_fast(generator: np.random.Generator) -> Callable[[], Any]:
+    protos, masks_in, bboxes = _synthetic_mask_inputs(generator=generator)
+    return lambda: process_mask_fast(protos, masks_in, bboxes, (INPUT_SIZE, INPUT_SIZE))
+
+
+@register_benchmark(name="masks2poly", group=GROUP)
+def masks_to_polygons(generator: np.random.Generator) -> Callable[[], Any]:
+    masks = np.zeros((DETECTIONS_WITH_MASKS, INPUT_SIZE, INPUT_SIZE), dtype=np.float32)
+    yy, xx = np.mgrid[:INPUT_SIZE, :INPUT_SIZE]
+    for mask in masks:
+        cx, cy = generator.uniform(100, INPUT_SIZE - 100, size=2)
+        rx, ry = generator.uniform(20, 90, size=2)
+        mask[((xx - cx) / rx) ** 2 + ((yy - cy) / ry) ** 2 <= 1] = 1.0
+    return lambda: masks2poly(masks)
@@ -0,0 +1,35 @@
+from typing import Any, Callable
+
+import numpy as np
+
+from development.benchmark_scripts.hot_paths.core import register_benchmark
+from development.benchmark_scripts.hot_paths.stubs import StubPreprocessingModel
+from inference.core.utils.preprocess import letterbox_image
+
+GROUP = "preprocessing"
+
+
+def _synthetic_image(
+    generator: np.random.Generator, height: int = 720, width: int = 1280
+) -> np.ndarray:
+    return generator.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+
+
+@register_benchmark(name="letterbox_image_720p_to_640", group=GROUP)
+def letterbox_image_720p(generator: np.random.Generator) -> Callable[[], Any]:
+    image = _synthetic_image(generator=generator)
+    return lambda: letterbox_image(image, (640, 640))
+
+
+@register_benchmark(name="preproc_image_720p_letterbox_640", group=GROUP)
+def preproc_image_letterbox(generator: np.random.Generator) -> Callable[[], Any]:
+    image = _synthetic_image(generator=generator)
+    model = StubPreprocessingModel(input_size=640)
+    return lambda: model.preproc_image(image)
+
+
+@register_benchmark(name="preproc_image_720p_stretch_640", group=GROUP)
+def preproc_image_stretch(generator: np.random.Generator) -> Callable[[], Any]:
+    image = _synthetic_image(generator=generator)
+    model = StubPreprocessingModel(input_size=640, resize_method="Stretch to")
+    return lambda: model.preproc_image(image)
@@ -0,0 +1,77 @@
+import base64
+from typing import Any, Callable
+
+import cv2
+import numpy as np
+import supervision as sv
+
+from development.benchmark_scripts.hot_paths.core import register_benchmark
+from development.benchmark_scripts.hot_paths.stubs import STUB_CLASSES, StubModelManager
+from inference.core.entities.requests.inference import ObjectDetectionInferenceRequest
+from inference.core.interfaces.http.orjson_utils import orjson_response
+from inference.core.utils.image_utils import load_image_base64
+from inference.core.workflows.core_steps.common.serializers import (
+    serialise_sv_detections,
+)
+
+GROUP = "serialisation"
+DETECTIONS = 100
+
+
+def _synthetic_detections(
+    generator: np.random.Generator, with_masks: bool = False
+) -> sv.Detections:
+    top_left = generator.uniform(0, 500, size=(DETECTIONS, 2))
+    sizes = generator.uniform(10, 140, size=(DETECTIONS, 2))
+    xyxy = np.concatenate([top_left, top_left + sizes], axis=1)
+    class_id = generator.integers(0, len(STUB_CLASSES), size=DETECTIONS)
+    mask = None
+    if with_masks:
+        mask = np.zeros((DETECTIONS, 640, 640), dtype=bool)
+        for detection_mask, (x1, y1, x2, y2) in zip(mask, xyxy.astype(int)):
+            detection_mask[y1:y2, x1:x2] = True
+    return sv.Detections(
+        xyxy=xyxy,
+        mask=mask,
+        confidence=generator.uniform(0.3, 1.0, size=DETECTIONS),
+        class_id=class_id,
+        data={
+            "class_name": np.array([STUB_CLASSES[i] for i in class_id]),
+            "detection_id": np.array([f"detection-{i}" for i in range(DETECTIONS)]),
+        },
+    )
+
+
+@register_benchmark(name="serialise_sv_detections_100", group=GROUP)
+def serialise_detections(generator: np.random.Generator) -> Callable[[], Any]:
+    detections = _synthetic_detections(generator=generator)
+    return lambda: serialise_sv_detections(detections)
+
+
+@register_benchmark(name="serialise_sv_detections_100_with_masks", group=GROUP)
+def serialise_detections_with_masks(
+    generator: np.random.Generator,
+) -> Callable[[], Any]:
+    detections = _synthetic_detections(generator=generator, with_masks=True)
+    return lambda: serialise_sv_detections(detections)
+
+
+@register_benchmark(name="orjson_response_object_detection_100", group=GROUP)
+def serialise_response(generator: np.random.Generator) -> Callable[[], Any]:
+    model_manager = StubModelManager(generator=generator, detections_per_image=100)
+    request = ObjectDetectionInferenceRequest(
+        model_id="stub/1",
+        image={"type": "numpy_object", "value": np.zeros((720, 1280, 3), np.uint8)},
+    )
+    response = model_manager.infer_from_request_sync(model_id="stub/1", request=request)
+    return lambda: orjson_response(response)
+
+
+@register_benchmark(name="load_image_base64_720p_jpeg", group=GROUP)
+def decode_base64_image(generator: np.random.Generator) -> Callable[[], Any]:
+    image = cv2.GaussianBlur(
+        generator.integers(0, 256, size=(720, 1280, 3), dtype=np.uint8), (9, 9), 0
+    )
+    _, encoded = cv2.imencode(".jpg", image)
+    payload = base64.b64encode(encoded.tobytes()).decode("ascii")
+    return lambda: load_image_base64(payload)
@@ -0,0 +1,93 @@
+from typing import List, Optional
+from uuid import UUID
+
+import numpy as np
+
+from inference.core.entities.requests.inference import InferenceRequest
+from inference.core.entities.responses.inference import (
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+    ObjectDetectionPrediction,
+)
+from inference.core.models.roboflow import RoboflowInferenceModel
+
+STUB_CLASSES = ["car", "person", "dog", "cat", "bicycle"]
+
+
+class StubPreprocessingModel(RoboflowInferenceModel):
+    """
+    Roboflow model with pre-processing configuration of typical object-detection model,
+    without weights nor connection to Roboflow API - only pre-processing can be used.
+    """
+
+    def __init__(
+        self,
+        input_size: int = 640,
+        resize_method: str = "Fit (black edges) in",
+    ):
+        self.preproc = {
+            "auto-orient": {"enabled": True},
+            "resize": {
+                "enabled": True,
+                "width": input_size,
+                "height": input_size,
+                "format": resize_method,
+            },
+        }
+        self.resize_method = resize_method
+        self.img_size_h = input_size
+        self.img_size_w = input_size
+
+
+class StubModelManager:
+    """
+    Model manager answering each object-detection request with fixed number of random
+    (but deterministic for given seed) predictions - such that Workflows with model blocks
+    can be executed without models and Roboflow API.
+    """
+
+    def __init__(self, generator: np.random.Generator, detections_per_image: int = 20):
+        self._generator = generator
+        self._detections_per_image = detections_per_image
+
+    def add_model(
+        self,
+        model_id: str,
+        api_key: Optional[str],
+        model_id_alias: Optional[str] = None,
+    ) -> None:
+        pass
+
+    def infer_from_request_sync(
+        self, model_id: str, request: InferenceRequest, **kwargs
+    ) -> List[ObjectDetectionInferenceResponse]:
+        images = request.image if isinstance(request.image, list) else [request.image]
+        return [self._make_response(image=image) for image in images]
+
+    def _make_response(self, image) -> ObjectDetectionInferenceResponse:
+        height, width = image.value.shape[:2]
+        predictions = []
+        for i in range(self._detections_per_image):
+            box_width = float(self._generator.uniform(10, width / 4))
+            box_height = float(self._generator.uniform(10, height / 4))
+            class_id = int(self._generator.integers(0, len(STUB_CLASSES)))
+            predictions.append(
+                ObjectDetectionPrediction(
+                    x=float(
+                        self._generator.uniform(box_width / 2, width - box_width / 2)
+                    ),
+                    y=float(
+                        self._generator.uniform(box_height / 2, height - box_height / 2)
+                    ),
+                    width=box_width,
+                    height=box_height,
+                    confidence=float(self._generator.uniform(0.3, 1.0)),
+                    **{"class": STUB_CLASSES[class_id]},
+                    class_id=class_id,
+                    detection_id=str(UUID(int=i)),
+                )
+            )
+        return ObjectDetectionInferenceResponse(
+            predictions=predictions,
+            image=InferenceResponseImage(width=width, height=height),
+        )
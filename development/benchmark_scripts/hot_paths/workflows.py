@@ -0,0 +1,137 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import numpy as np
+
+from development.benchmark_scripts.hot_paths.core import register_benchmark
+from development.benchmark_scripts.hot_paths.stubs import StubModelManager
+from inference.core.workflows.execution_engine.core import ExecutionEngine
+
+GROUP = "workflows"
+BATCH_SIZE = 4
+
+MODEL_FREE_WORKFLOW = {
+    "version": "1.0",
+    "inputs": [{"type": "WorkflowImage", "name": "image"}],
+    "steps": [
+        {
+            "type": "roboflow_core/absolute_static_crop@v1",
+            "name": "crop",
+            "images": "$inputs.image",
+            "x_center": 320,
+            "y_center": 240,
+            "width": 200,
+            "height": 200,
+        }
+    ],
+    "outputs": [
+        {"type": "JsonField", "name": "crops", "selector": "$steps.crop.crops"}
+    ],
+}
+
+DETECTION_AND_CROP_WORKFLOW = {
+    "version": "1.0",
+    "inputs": [{"type": "WorkflowImage", "name": "image"}],
+    "steps": [
+        {
+            "type": "roboflow_core/roboflow_object_detection_model@v1",
+            "name": "detection",
+            "images": "$inputs.image",
+            "model_id": "stub/1",
+        },
+        {
+            "type": "roboflow_core/detections_filter@v1",
+            "name": "filter",
+            "predictions": "$steps.detection.predictions",
+            "operations": [
+                {
+                    "type": "DetectionsFilter",
+                    "filter_operation": {
+                        "type": "StatementGroup",
+                        "operator": "and",
+                        "statements": [
+                            {
+                                "type": "BinaryStatement",
+                                "left_operand": {
+                                    "type": "DynamicOperand",
+                                    "operations": [
+                                        {
+                                            "type": "ExtractDetectionProperty",
+                                            "property_name": "class_name",
+                                        }
+                                    ],
+                                },
+                                "comparator": {"type": "in (Sequence)"},
+                                "right_operand": {
+                                    "type": "StaticOperand",
+                                    "value": ["car", "person"],
+                                },
+                            }
+                        ],
+                    },
+                }
+            ],
+        },
+        {
+            "type": "roboflow_core/dynamic_crop@v1",
+            "name": "crops",
+            "images": "$inputs.image",
+            "predictions": "$steps.filter.predictions",
+        },
+    ],
+    "outputs": [
+        {
+            "type": "JsonField",
+            "name": "predictions",
+            "selector": "$steps.filter.predictions",
+        },
+        {"type": "JsonField", "name": "crops", "selector": "$steps.crops.crops"},
+    ],
+}
+
+
+def _prepare_workflow_run(
+    generator: np.random.Generator,
+    workflow_definition: dict,
+    max_concurrent_steps: int = 1,
+) -> Callable[[], Any]:
+    execution_engine = ExecutionEngine.init(
+        workflow_definition=workflow_definition,
+        init_parameters={
+            "workflows_core.model_manager": StubModelManager(generator=generator),
+            "workflows_core.api_key": None,
+            "workflows_core.thread_pool_executor": ThreadPoolExecutor(max_workers=4),
+        },
+        max_concurrent_steps=max_concurrent_steps,
+    )
+    images = [
+        generator.integers(0, 256, size=(480, 640, 3), dtype=np.uint8)
+        for _ in range(BATCH_SIZE)
+    ]
+    return lambda: execution_engine.run(runtime_parameters={"image": images})
+
+
+@register_benchmark(name="execution_engine_run_model_free_batch_4", group=GROUP)
+def model_free_workflow(generator: np.random.Generator) -> Callable[[], Any]:
+    return _prepare_workflow_run(
+        generator=generator, workflow_definition=MODEL_FREE_WORKFLOW
+    )
+
+
+@register_benchmark(name="execution_engine_run_detection_and_crop_batch_4", group=GROUP)
+def detection_and_crop_workflow(generator: np.random.Generator) -> Callable[[], Any]:
+    return _prepare_workflow_run(
+        generator=generator, workflow_definition=DETECTION_AND_CROP_WORKFLOW
+    )
+
+
+@register_benchmark(name="execution_engine_compilation_detection_and_crop", group=GROUP)
+def workflow_compilation(generator: np.random.Generator) -> Callable[[], Any]:
+    init_parameters = {
+        "workflows_core.model_manager": StubModelManager(generator=generator),
+        "workflows_core.api_key": None,
+    }
+    return lambda: ExecutionEngine.init(
+        workflow_definition=DETECTION_AND_CROP_WORKFLOW,
+        init_parameters=init_parameters,
+    )
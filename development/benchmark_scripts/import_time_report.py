@@ -0,0 +1,170 @@
+"""
+Reports time of importing `inference` entrypoints - aggregating output of
+`python -X importtime` by package, such that cold-start regressions (and improvements made by
+lazy imports) can be tracked. Each entrypoint is imported in fresh interpreter, `--runs` times,
+and median times are reported.
+
+Run from repository root:
+PYTHONPATH=. python development/benchmark_scripts/import_time_report.py \
+    -m inference.core.env -m inference.models.utils -m inference.core.workflows.execution_engine.core \
+    --depth 2 --top 15 --output import_times.json
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+IMPORT_TIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|(?P<indent>\s+)(?P<name>\S+)$"
+)
+DEFAULT_ENTRYPOINTS = [
+    "inference",
+    "inference.core.env",
+    "inference.models.utils",
+    "inference.core.managers.base",
+    "inference.core.workflows.execution_engine.core",
+    "inference_cli.main",
+]
+
+
+@dataclass(frozen=True)
+class ImportedModule:
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass(frozen=True)
+class EntrypointReport:
+    entrypoint: str
+    total_ms: float
+    modules_imported: int
+    packages_ms: Dict[str, float]
+    slowest_modules_ms: Dict[str, float]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Aggregated report of `python -X importtime` for `inference` entrypoints"
+    )
+    parser.add_argument(
+        "--module",
+        "-m",
+        action="append",
+        default=None,
+        help="Module to import - can be given multiple times",
+    )
+    parser.add_argument("--runs", "-r", type=int, default=3)
+    parser.add_argument(
+        "--depth",
+        "-d",
+        type=int,
+        default=1,
+        help="Number of leading components of module name used to group modules",
+    )
+    parser.add_argument("--top", "-t", type=int, default=10)
+    parser.add_argument("--output", "-o", default=None, help="Path to save JSON report")
+    args = parser.parse_args()
+    reports = [
+        build_entrypoint_report(
+            entrypoint=entrypoint, runs=args.runs, depth=args.depth, top=args.top
+        )
+        for entrypoint in args.module or DEFAULT_ENTRYPOINTS
+    ]
+    for report in reports:
+        print(format_entrypoint_report(report=report))
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump([asdict(report) for report in reports], f, indent=4)
+
+
+def build_entrypoint_report(
+    entrypoint: str, runs: int, depth: int, top: int
+) -> EntrypointReport:
+    measurements = [measure_import(entrypoint=entrypoint) for _ in range(runs)]
+    totals = [sum(m.self_us for m in modules) for modules in measurements]
+    # the run of median total time is representative one
+    modules = measurements[int(np.argsort(totals)[len(totals) // 2])]
+    packages = aggregate_by_package(modules=modules, depth=depth)
+    slowest_modules = sorted(modules, key=lambda m: m.self_us, reverse=True)[:top]
+    return EntrypointReport(
+        entrypoint=entrypoint,
+        total_ms=round(float(np.median(totals)) / 1000, 2),
+        modules_imported=len(modules),
+        packages_ms={
+            name: round(self_us / 1000, 2)
+            for name, self_us in list(packages.items())[:top]
+        },
+        slowest_modules_ms={
+            m.name: round(m.self_us / 1000, 2) for m in slowest_modules
+        },
+    )
+
+
+def measure_import(
+    entrypoint: str, python: Optional[str] = None
+) -> List[ImportedModule]:
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {entrypoint}"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Could not import {entrypoint}: {result.stderr.strip().splitlines()[-1:]}"
+        )
+    return parse_import_times(output=result.stderr)
+
+
+def parse_import_times(output: str) -> List[ImportedModule]:
+    modules = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        modules.append(
+            ImportedModule(
+                name=match.group("name"),
+                self_us=int(match.group("self")),
+                cumulative_us=int(match.group("cumulative")),
+            )
+        )
+    return modules
+
+
+def aggregate_by_package(modules: List[ImportedModule], depth: int) -> Dict[str, int]:
+    """
+    Sums self-time of modules grouped by first `depth` components of module name - self-time
+    is used, as cumulative time of nested modules would be counted many times. Returns
+    groups sorted by time, descending.
+    """
+    result = defaultdict(int)
+    for module in modules:
+        result[".".join(module.name.split(".")[:depth])] += module.self_us
+    return dict(sorted(result.items(), key=lambda e: e[1], reverse=True))
+
+
+def format_entrypoint_report(report: EntrypointReport) -> str:
+    lines = [
+        f"import {report.entrypoint}: {report.total_ms}ms "
+        f"({report.modules_imported} modules)",
+        "  slowest packages (self time):",
+    ]
+    for name, duration in report.packages_ms.items():
+        lines.append(f"    {name:<60} {duration:>10.2f}ms")
+    lines.append("  slowest modules (self time):")
+    for name, duration in report.slowest_modules_ms.items():
+        lines.append(f"    {name:<60} {duration:>10.2f}ms")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    main()
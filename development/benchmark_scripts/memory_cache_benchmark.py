@@ -0,0 +1,236 @@
+"""
+Compares `MemoryCache` against its previous dict-per-score implementation under
+the workload produced by `ModelManager` - every request adds members to "models" and
+"inference:..." sorted sets (with expiry), while metrics reporter periodically
+reads time windows with `zrangebyscore(...)`.
+
+Run from repository root:
+PYTHONPATH=. python development/benchmark_scripts/memory_cache_benchmark.py --rps 2000
+"""
+
+import argparse
+import threading
+import time
+from threading import Thread
+from typing import Any, List, Optional
+
+import numpy as np
+
+from inference.core.cache.memory import MemoryCache
+
+
+class LegacyMemoryCache:
+    """
+    Sorted-set part of `MemoryCache` before members were kept in indexed sorted lists -
+    members live in dict keyed by score (members with duplicated scores overwrite each
+    other), ranges are sorted on each read and expiry loop scans all members.
+    """
+
+    def __init__(self, expire_interval: float) -> None:
+        self.cache = dict()
+        self.zexpires = dict()
+        self._expire_interval = expire_interval
+        self._expire_thread = threading.Thread(target=self._expire)
+        self._expire_thread.daemon = True
+        self._expire_thread.start()
+
+    def _expire(self):
+        while True:
+            now = time.time()
+            keys_to_delete = []
+            for k, v in self.zexpires.copy().items():
+                if v < now:
+                    keys_to_delete.append(k)
+            for k in keys_to_delete:
+                del self.cache[k[0]][k[1]]
+                del self.zexpires[k]
+            while time.time() - now < self._expire_interval:
+                time.sleep(0.1)
+
+    def zadd(self, key: str, value: Any, score: float, expire: float = None):
+        if not key in self.cache:
+            self.cache[key] = dict()
+        self.cache[key][score] = value
+        if expire:
+            self.zexpires[(key, score)] = expire + time.time()
+
+    def zrangebyscore(
+        self,
+        key: str,
+        min: Optional[float] = -1,
+        max: Optional[float] = float("inf"),
+        withscores: bool = False,
+    ):
+        if not key in self.cache:
+            return []
+        keys = sorted([k for k in self.cache[key].keys() if min <= k <= max])
+        if withscores:
+            return [(self.cache[key][k], k) for k in keys]
+        else:
+            return [self.cache[key][k] for k in keys]
+
+
+def main(
+    rps: int,
+    duration: float,
+    threads: int,
+    models: int,
+    expire: float,
+    metrics_interval: float,
+) -> None:
+    print(
+        f"{'implementation':<16} {'requests':>9} {'rps':>9} {'p50 [us]':>9} "
+        f"{'p99 [us]':>9} {'max [us]':>10} {'range p50 [ms]':>15} {'members':>9}"
+    )
+    for name, cache in [
+        ("legacy", LegacyMemoryCache(expire_interval=expire)),
+        ("memory_cache", MemoryCache()),
+    ]:
+        benchmark_cache(
+            name=name,
+            cache=cache,
+            rps=rps,
+            duration=duration,
+            threads=threads,
+            models=models,
+            expire=expire,
+            metrics_interval=metrics_interval,
+        )
+
+
+def benchmark_cache(
+    name: str,
+    cache: Any,
+    rps: int,
+    duration: float,
+    threads: int,
+    models: int,
+    expire: float,
+    metrics_interval: float,
+) -> None:
+    stop_event = threading.Event()
+    request_latencies: List[List[float]] = [[] for _ in range(threads)]
+    range_latencies: List[float] = []
+    members_seen: List[int] = []
+    workers = [
+        Thread(
+            target=simulate_requests,
+            args=(
+                cache,
+                thread_id,
+                rps / threads,
+                models,
+                expire,
+                stop_event,
+                request_latencies[thread_id],
+            ),
+        )
+        for thread_id in range(threads)
+    ]
+    reporter = Thread(
+        target=simulate_metrics_reporter,
+        args=(
+            cache,
+            models,
+            metrics_interval,
+            stop_event,
+            range_latencies,
+            members_seen,
+        ),
+    )
+    start = time.perf_counter()
+    for worker in workers + [reporter]:
+        worker.start()
+    time.sleep(duration)
+    stop_event.set()
+    for worker in workers + [reporter]:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    latencies_us = np.array([l for ls in request_latencies for l in ls]) * 1e6
+    range_latencies_ms = np.array(range_latencies or [0.0]) * 1e3
+    print(
+        f"{name:<16} {len(latencies_us):>9} {len(latencies_us) / elapsed:>9.1f} "
+        f"{np.percentile(latencies_us, 50):>9.1f} {np.percentile(latencies_us, 99):>9.1f} "
+        f"{latencies_us.max():>10.1f} {np.percentile(range_latencies_ms, 50):>15.3f} "
+        f"{max(members_seen or [0]):>9}"
+    )
+
+
+def simulate_requests(
+    cache: Any,
+    thread_id: int,
+    rps: float,
+    models: int,
+    expire: float,
+    stop_event: threading.Event,
+    latencies: List[float],
+) -> None:
+    interval = 1 / rps
+    next_request = time.perf_counter()
+    request_id = 0
+    while not stop_event.is_set():
+        model_id = f"model/{(thread_id + request_id) % models}"
+        request_start = time.perf_counter()
+        finish_time = time.time()
+        cache.zadd(
+            "models",
+            value=f"server:api_key:{model_id}",
+            score=finish_time,
+            expire=expire,
+        )
+        cache.zadd(
+            f"inference:server:{model_id}",
+            value={"request": {"id": request_id}, "response": {"time": 0.01}},
+            score=finish_time,
+            expire=expire,
+        )
+        latencies.append(time.perf_counter() - request_start)
+        request_id += 1
+        # open-loop pacing - requests are issued on schedule, regardless of latency
+        next_request += interval
+        delay = next_request - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def simulate_metrics_reporter(
+    cache: Any,
+    models: int,
+    interval: float,
+    stop_event: threading.Event,
+    latencies: List[float],
+    members_seen: List[int],
+) -> None:
+    while not stop_event.wait(interval):
+        now = time.time()
+        for model_index in range(models):
+            start = time.perf_counter()
+            _ = cache.zrangebyscore(
+                f"inference:server:model/{model_index}",
+                min=now - interval,
+                max=now,
+                withscores=True,
+            )
+            latencies.append(time.perf_counter() - start)
+        members_seen.append(len(cache.zrangebyscore("models", withscores=True)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        "Compares throughput and latency of MemoryCache sorted sets with legacy implementation"
+    )
+    parser.add_argument("--rps", type=int, required=False, default=1000)
+    parser.add_argument("--duration", type=float, required=False, default=10.0)
+    parser.add_argument("--threads", type=int, required=False, default=8)
+    parser.add_argument("--models", type=int, required=False, default=4)
+    parser.add_argument("--expire", type=float, required=False, default=5.0)
+    parser.add_argument("--metrics_interval", type=float, required=False, default=1.0)
+    args = parser.parse_args()
+    main(
+        rps=args.rps,
+        duration=args.duration,
+        threads=args.threads,
+        models=args.models,
+        expire=args.expire,
+        metrics_interval=args.metrics_interval,
+    )
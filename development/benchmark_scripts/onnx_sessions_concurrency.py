@@ -0,0 +1,189 @@
+"""
+Measures latency of ONNX Runtime sessions of several models queried concurrently - with
+default session options (each session spawning intra-op thread per core), with thread count
+limited per model, with cores partitioned between models and with global thread pool. Each
+scenario runs in fresh interpreter, as session options are configured by environment.
+
+Any ONNX model with single image input can be used, for instance weights of the model
+cached by the server. Run from repository root:
+PYTHONPATH=. python development/benchmark_scripts/onnx_sessions_concurrency.py \
+    --model-path /tmp/cache/coco/3/weights.onnx --models 4 --requests 200 --output report.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, List
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ScenarioReport:
+    scenario: str
+    environment: Dict[str, str]
+    requests: int
+    throughput_rps: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Latency of concurrently queried ONNX Runtime sessions"
+    )
+    parser.add_argument("--model-path", "-p", required=True)
+    parser.add_argument(
+        "--models", "-m", type=int, default=4, help="Number of sessions (models)"
+    )
+    parser.add_argument(
+        "--requests", "-r", type=int, default=100, help="Requests per model"
+    )
+    parser.add_argument("--batch-size", "-b", type=int, default=1)
+    parser.add_argument(
+        "--scenario",
+        "-s",
+        action="append",
+        default=None,
+        help="Scenario to run - can be given multiple times (all are run by default)",
+    )
+    parser.add_argument("--output", "-o", default=None, help="Path to save JSON report")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        run_worker(
+            model_path=args.model_path,
+            models=args.models,
+            requests=args.requests,
+            batch_size=args.batch_size,
+        )
+        return None
+    scenarios = get_scenarios(models=args.models)
+    reports = []
+    for name in args.scenario or list(scenarios):
+        report = run_scenario(
+            name=name,
+            environment=scenarios[name],
+            model_path=args.model_path,
+            models=args.models,
+            requests=args.requests,
+            batch_size=args.batch_size,
+        )
+        print(format_scenario_report(report=report))
+        reports.append(report)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump([asdict(report) for report in reports], f, indent=4)
+
+
+def get_scenarios(models: int) -> Dict[str, Dict[str, str]]:
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else 1
+    cores_per_model = str(max(cores // models, 1))
+    return {
+        "default": {},
+        "threads_per_model": {"ONNXRUNTIME_INTRA_OP_NUM_THREADS": cores_per_model},
+        "partitioned_cores": {"ONNXRUNTIME_CORES_PER_MODEL": cores_per_model},
+        "global_thread_pool": {
+            "ONNXRUNTIME_USE_GLOBAL_THREAD_POOL": "True",
+            "ONNXRUNTIME_INTRA_OP_NUM_THREADS": str(cores),
+        },
+    }
+
+
+def run_scenario(
+    name: str,
+    environment: Dict[str, str],
+    model_path: str,
+    models: int,
+    requests: int,
+    batch_size: int,
+) -> ScenarioReport:
+    result = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--worker",
+            "--model-path",
+            model_path,
+            "--models",
+            str(models),
+            "--requests",
+            str(requests),
+            "--batch-size",
+            str(batch_size),
+        ],
+        env={**os.environ, **environment},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Scenario {name} failed: {result.stderr.strip()}")
+    measurements = json.loads(result.stdout.strip().splitlines()[-1])
+    latencies = np.array(measurements["latencies"]) * 1000
+    return ScenarioReport(
+        scenario=name,
+        environment=environment,
+        requests=len(latencies),
+        throughput_rps=round(len(latencies) / measurements["duration"], 2),
+        p50_ms=round(float(np.percentile(latencies, 50)), 2),
+        p90_ms=round(float(np.percentile(latencies, 90)), 2),
+        p99_ms=round(float(np.percentile(latencies, 99)), 2),
+        max_ms=round(float(latencies.max()), 2),
+    )
+
+
+def run_worker(model_path: str, models: int, requests: int, batch_size: int) -> None:
+    from inference.core.models.utils.onnx_session import create_inference_session
+
+    sessions = [
+        create_inference_session(
+            model_path=model_path,
+            providers=["CPUExecutionProvider"],
+            model_id=f"benchmark/{i}",
+        )
+        for i in range(models)
+    ]
+    model_input = sessions[0].get_inputs()[0]
+    # dynamic dimensions are filled with batch size and (for images) 640
+    shape = [
+        dim if isinstance(dim, int) else (batch_size if i == 0 else 640)
+        for i, dim in enumerate(model_input.shape)
+    ]
+    data = np.random.rand(*shape).astype(np.float32)
+    for session in sessions:
+        session.run(None, {model_input.name: data})
+
+    def query(session) -> List[float]:
+        latencies = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            session.run(None, {model_input.name: data})
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=models) as executor:
+        results = list(executor.map(query, sessions))
+    duration = time.perf_counter() - start
+    latencies = [latency for result in results for latency in result]
+    print(json.dumps({"latencies": latencies, "duration": duration}))
+
+
+def format_scenario_report(report: ScenarioReport) -> str:
+    return (
+        f"{report.scenario:<20} {report.throughput_rps:>10.2f} req/s | "
+        f"p50: {report.p50_ms:>8.2f}ms | p90: {report.p90_ms:>8.2f}ms | "
+        f"p99: {report.p99_ms:>8.2f}ms | max: {report.max_ms:>8.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
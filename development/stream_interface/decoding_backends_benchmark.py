@@ -0,0 +1,56 @@
+import argparse
+import time
+from typing import List
+
+import numpy as np
+
+from inference.core.interfaces.camera.video_source import (
+    VideoFrameProducerBackend,
+    initialise_video_frame_producer,
+)
+
+
+def main(videos: List[str], repeats: int) -> None:
+    print(
+        f"{'video':<40} {'backend':<8} {'frames':>8} {'fps':>10} "
+        f"{'p50 [ms]':>10} {'p99 [ms]':>10}"
+    )
+    for video in videos:
+        for backend in VideoFrameProducerBackend:
+            for _ in range(repeats):
+                benchmark_backend(video=video, backend=backend)
+
+
+def benchmark_backend(video: str, backend: VideoFrameProducerBackend) -> None:
+    producer = initialise_video_frame_producer(video=video, backend=backend)
+    latencies = []
+    start = time.perf_counter()
+    while True:
+        frame_start = time.perf_counter()
+        if not producer.grab():
+            break
+        success, _ = producer.retrieve()
+        if not success:
+            break
+        latencies.append(time.perf_counter() - frame_start)
+    duration = time.perf_counter() - start
+    producer.release()
+    if not latencies:
+        print(f"{video[-40:]:<40} {backend.value:<8} could not decode any frame")
+        return None
+    latencies_ms = np.array(latencies) * 1000
+    print(
+        f"{video[-40:]:<40} {backend.value:<8} {len(latencies):>8} "
+        f"{len(latencies) / duration:>10.1f} {np.percentile(latencies_ms, 50):>10.2f} "
+        f"{np.percentile(latencies_ms, 99):>10.2f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        "Compares decoding throughput and per-frame latency of video frames producers"
+    )
+    parser.add_argument("--video", nargs="+", required=True)
+    parser.add_argument("--repeats", type=int, required=False, default=3)
+    args = parser.parse_args()
+    main(videos=args.video, repeats=args.repeats)
@@ -1,3 +1,25 @@
-from inference.core.interfaces.stream.stream import Stream  # isort:skip
-from inference.core.interfaces.stream.inference_pipeline import InferencePipeline
-from inference.models.utils import get_model, get_roboflow_model
+import importlib
+from typing import Any, Dict, List
+
+# Public API of the package is imported on first access (PEP 562) - importing any part of
+# `inference` (for instance `inference.core.env`) does not import stream interfaces and models.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "Stream": "inference.core.interfaces.stream.stream",
+    "InferencePipeline": "inference.core.interfaces.stream.inference_pipeline",
+    "get_model": "inference.models.utils",
+    "get_roboflow_model": "inference.models.utils",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
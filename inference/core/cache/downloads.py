@@ -0,0 +1,323 @@
+import base64
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple
+
+import requests
+from requests import Response
+
+from inference.core.env import (
+    MODEL_DOWNLOAD_CHUNK_SIZE,
+    MODEL_DOWNLOAD_RETRIES,
+    MODEL_DOWNLOAD_TIMEOUT,
+    MODEL_DOWNLOAD_WORKERS,
+)
+from inference.core.exceptions import ModelArtefactError
+from inference.core.logger import logger
+from inference.core.utils.file_system import dump_json, ensure_parent_dir_exists
+from inference.core.utils.requests import api_key_safe_raise_for_status
+from inference.core.utils.url_utils import wrap_url
+
+PARTIAL_FILE_SUFFIX = ".partial"
+PROGRESS_FILE_SUFFIX = ".partial.json"
+CONTENT_RANGE_PATTERN = re.compile(r"bytes\s+\d+-\d+/(?P<size>\d+)")
+SUPPORTED_CHECKSUM_ALGORITHMS = {"md5", "sha256"}
+HASHING_BUFFER_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Checksum:
+    algorithm: str
+    hex_digest: str
+
+    @classmethod
+    def from_string(cls, value: str) -> "Checksum":
+        """Parses checksum given as `<algorithm>:<hex_digest>` - for instance `md5:9e10...`."""
+        algorithm, _, hex_digest = value.partition(":")
+        algorithm = algorithm.lower()
+        if algorithm not in SUPPORTED_CHECKSUM_ALGORITHMS or not hex_digest:
+            raise ValueError(
+                f"Checksum {value} is invalid - expected `<algorithm>:<hex_digest>` with algorithm "
+                f"being one of {sorted(SUPPORTED_CHECKSUM_ALGORITHMS)}"
+            )
+        return cls(algorithm=algorithm, hex_digest=hex_digest.lower())
+
+
+@dataclass
+class DownloadProgress:
+    size: int
+    chunk_size: int
+    validator: Optional[str]
+    completed_chunks: List[int]
+
+
+def download_file(
+    url: str,
+    target_path: str,
+    expected_checksum: Optional[Checksum] = None,
+    chunk_size: int = MODEL_DOWNLOAD_CHUNK_SIZE,
+    max_workers: int = MODEL_DOWNLOAD_WORKERS,
+    retries: int = MODEL_DOWNLOAD_RETRIES,
+    timeout: float = MODEL_DOWNLOAD_TIMEOUT,
+) -> None:
+    """Downloads file into `target_path`, using parallel range requests of `chunk_size` bytes
+    when the server supports them.
+
+    Content is written into `<target_path>.partial` file and moved into `target_path` only
+    once it is complete and its checksum is verified - such that interrupted download never
+    leaves truncated file in place of the target. Chunks which are already downloaded are
+    recorded in `<target_path>.partial.json`, and download interrupted earlier is resumed
+    from them (as long as size and ETag / Last-Modified of the file did not change).
+
+    Checksum is taken from `expected_checksum` or, if not given, from `x-goog-hash` or
+    `Content-MD5` response headers (if present).
+
+    Args:
+        url (str): URL of the file.
+        target_path (str): Path to save the file.
+        expected_checksum (Optional[Checksum]): Checksum to verify content against.
+        chunk_size (int): Size of single range request in bytes.
+        max_workers (int): Number of range requests made in parallel.
+        retries (int): Number of retries of each failed request.
+        timeout (float): Timeout of single request in seconds.
+
+    Raises:
+        ModelArtefactError: If the file could not be downloaded or checksum does not match.
+    """
+    ensure_parent_dir_exists(path=target_path)
+    url = wrap_url(url)
+    try:
+        # streamed, such that the whole content is not downloaded at once when the server
+        # ignores range requests - the response is then used to download the file
+        probe_response = _request_with_retries(
+            url=url, byte_range=(0, 0), retries=retries, timeout=timeout, stream=True
+        )
+        size = _get_size_of_ranged_content(response=probe_response)
+        if expected_checksum is None:
+            expected_checksum = get_checksum_from_headers(
+                headers=probe_response.headers, whole_content=size is None
+            )
+        if size is None:
+            logger.debug(f"Server does not support range requests for {target_path}")
+            _save_streamed_content(response=probe_response, target_path=target_path)
+        else:
+            probe_response.close()
+            _download_in_chunks(
+                url=url,
+                target_path=target_path,
+                size=size,
+                validator=_get_validator(response=probe_response),
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                retries=retries,
+                timeout=timeout,
+            )
+    except requests.exceptions.RequestException as error:
+        raise ModelArtefactError(
+            f"Could not download model artefact {os.path.basename(target_path)}. Cause: {error}"
+        ) from error
+    partial_path = target_path + PARTIAL_FILE_SUFFIX
+    if expected_checksum is not None:
+        verify_checksum(
+            path=partial_path, expected_checksum=expected_checksum, remove_on_error=True
+        )
+    os.replace(partial_path, target_path)
+    _remove_if_exists(path=target_path + PROGRESS_FILE_SUFFIX)
+
+
+def get_checksum_from_headers(
+    headers: Dict[str, str], whole_content: bool
+) -> Optional[Checksum]:
+    # GCS reports hashes of the whole object in `x-goog-hash: crc32c=<base64>,md5=<base64>`
+    # (also for range requests), while `Content-MD5` describes body of the response only
+    encoded_md5 = headers.get("Content-MD5") if whole_content else None
+    for entry in headers.get("x-goog-hash", "").split(","):
+        name, _, value = entry.strip().partition("=")
+        if name.lower() == "md5":
+            encoded_md5 = value
+    if not encoded_md5:
+        return None
+    try:
+        hex_digest = base64.b64decode(encoded_md5).hex()
+    except ValueError:
+        return None
+    return Checksum(algorithm="md5", hex_digest=hex_digest)
+
+
+def verify_checksum(
+    path: str, expected_checksum: Checksum, remove_on_error: bool = False
+) -> None:
+    hashing = hashlib.new(expected_checksum.algorithm)
+    with open(path, "rb") as f:
+        for buffer in iter(lambda: f.read(HASHING_BUFFER_SIZE), b""):
+            hashing.update(buffer)
+    if hashing.hexdigest() == expected_checksum.hex_digest:
+        return None
+    if remove_on_error:
+        _remove_if_exists(path=path)
+        _remove_if_exists(path=path[: -len(PARTIAL_FILE_SUFFIX)] + PROGRESS_FILE_SUFFIX)
+    raise ModelArtefactError(
+        f"Checksum of {os.path.basename(path)} does not match - expected "
+        f"{expected_checksum.algorithm}:{expected_checksum.hex_digest}, "
+        f"got {expected_checksum.algorithm}:{hashing.hexdigest()}."
+    )
+
+
+def _save_streamed_content(response: Response, target_path: str) -> None:
+    partial_path = target_path + PARTIAL_FILE_SUFFIX
+    with open(partial_path, "wb") as f:
+        for buffer in response.iter_content(chunk_size=HASHING_BUFFER_SIZE):
+            f.write(buffer)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _download_in_chunks(
+    url: str,
+    target_path: str,
+    size: int,
+    validator: Optional[str],
+    chunk_size: int,
+    max_workers: int,
+    retries: int,
+    timeout: float,
+) -> None:
+    partial_path = target_path + PARTIAL_FILE_SUFFIX
+    progress_path = target_path + PROGRESS_FILE_SUFFIX
+    progress = _load_progress(
+        partial_path=partial_path,
+        progress_path=progress_path,
+        size=size,
+        chunk_size=chunk_size,
+        validator=validator,
+    )
+    completed_chunks: Set[int] = set(progress.completed_chunks)
+    if not completed_chunks:
+        with open(partial_path, "wb") as f:
+            f.truncate(size)
+        _save_progress(path=progress_path, progress=progress)
+    chunks_number = max((size + chunk_size - 1) // chunk_size, 1)
+    pending_chunks = [i for i in range(chunks_number) if i not in completed_chunks]
+    if completed_chunks:
+        logger.info(
+            f"Resuming download of {os.path.basename(target_path)} - "
+            f"{len(completed_chunks)}/{chunks_number} chunks already downloaded"
+        )
+    progress_lock = Lock()
+
+    def download_chunk(chunk_id: int) -> None:
+        start = chunk_id * chunk_size
+        end = min(start + chunk_size, size) - 1
+        if end < start:
+            return None
+        response = _request_with_retries(
+            url=url, byte_range=(start, end), retries=retries, timeout=timeout
+        )
+        content = response.content
+        if response.status_code != 206 or len(content) != end - start + 1:
+            raise ModelArtefactError(
+                f"Server returned invalid content for bytes {start}-{end} of "
+                f"{os.path.basename(target_path)}."
+            )
+        with open(partial_path, "r+b") as f:
+            f.seek(start)
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        with progress_lock:
+            progress.completed_chunks.append(chunk_id)
+            _save_progress(path=progress_path, progress=progress)
+
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        futures = [executor.submit(download_chunk, i) for i in pending_chunks]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            # chunks which are not started yet are left for the resumed download
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def _load_progress(
+    partial_path: str,
+    progress_path: str,
+    size: int,
+    chunk_size: int,
+    validator: Optional[str],
+) -> DownloadProgress:
+    fresh_progress = DownloadProgress(
+        size=size, chunk_size=chunk_size, validator=validator, completed_chunks=[]
+    )
+    if not os.path.isfile(partial_path) or not os.path.isfile(progress_path):
+        return fresh_progress
+    try:
+        with open(progress_path) as f:
+            progress = DownloadProgress(**json.load(f))
+    except (ValueError, TypeError):
+        return fresh_progress
+    content_changed = progress.size != size or progress.validator != validator
+    if content_changed or progress.chunk_size != chunk_size:
+        return fresh_progress
+    if os.path.getsize(partial_path) != size:
+        return fresh_progress
+    return progress
+
+
+def _save_progress(path: str, progress: DownloadProgress) -> None:
+    dump_json(path=path, content=asdict(progress), allow_override=True)
+
+
+def _request_with_retries(
+    url: str,
+    byte_range: Optional[Tuple[int, int]],
+    retries: int,
+    timeout: float,
+    stream: bool = False,
+) -> Response:
+    headers = {}
+    if byte_range is not None:
+        headers["Range"] = f"bytes={byte_range[0]}-{byte_range[1]}"
+    for attempt in range(retries + 1):
+        try:
+            response = requests.get(
+                url, headers=headers, timeout=timeout, stream=stream
+            )
+            api_key_safe_raise_for_status(response=response)
+            return response
+        except requests.exceptions.RequestException as error:
+            is_client_error = (
+                isinstance(error, requests.exceptions.HTTPError)
+                and error.response is not None
+                and 400 <= error.response.status_code < 500
+                and error.response.status_code != 429
+            )
+            if is_client_error or attempt >= retries:
+                raise error
+            logger.warning(
+                f"Request for model artefact failed (attempt {attempt + 1}/{retries + 1}): {error}"
+            )
+
+
+def _get_size_of_ranged_content(response: Response) -> Optional[int]:
+    if response.status_code != 206:
+        return None
+    match = CONTENT_RANGE_PATTERN.match(response.headers.get("Content-Range", ""))
+    if match is None:
+        return None
+    return int(match.group("size"))
+
+
+def _get_validator(response: Response) -> Optional[str]:
+    return response.headers.get("ETag") or response.headers.get("Last-Modified")
+
+
+def _remove_if_exists(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Hashable, List, Sequence
+
+import numpy as np
+
+
+class EmbeddingsCache:
+    """
+    In-process, thread-safe cache of embeddings (for instance text embeddings of CLIP) with
+    least recently used entries dropped once `max_entries` is exceeded.
+
+    Keys must identify both the model and the embedded value - the same text embedded by
+    different versions of a model gives different vectors.
+    """
+
+    def __init__(self, max_entries: int):
+        if max_entries < 0:
+            raise ValueError(
+                f"`EmbeddingsCache` size must not be negative, {max_entries} given."
+            )
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    def get_or_compute(
+        self,
+        keys: Sequence[Hashable],
+        compute: Callable[[List[int]], np.ndarray],
+    ) -> np.ndarray:
+        """
+        Returns embeddings stacked in order of `keys`. Embeddings missing in cache are computed
+        with single call of `compute(...)`, which receives indices (in `keys`) of missing
+        (unique) entries and must return their embeddings in the same order.
+        """
+        embeddings = [None] * len(keys)
+        missing = {}
+        with self._lock:
+            for index, key in enumerate(keys):
+                embedding = self._entries.get(key)
+                if embedding is None:
+                    missing.setdefault(key, []).append(index)
+                    continue
+                self._entries.move_to_end(key)
+                embeddings[index] = embedding
+            self._hits += len(keys) - sum(len(i) for i in missing.values())
+            self._misses += len(missing)
+        if missing:
+            computed = compute([indices[0] for indices in missing.values()])
+            with self._lock:
+                for (key, indices), embedding in zip(missing.items(), computed):
+                    for index in indices:
+                        embeddings[index] = embedding
+                    if self._max_entries > 0:
+                        # copy - not to retain whole batch the row is view of
+                        self._entries[key] = np.array(embedding, copy=True)
+                        self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        return np.stack(embeddings, axis=0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def hits(self) -> int:
+        with self._lock:
+            return self._hits
+
+    @property
+    def misses(self) -> int:
+        with self._lock:
+            return self._misses
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -1,30 +1,102 @@
+import heapq
+import itertools
 import threading
 import time
+from bisect import bisect_left, bisect_right
 from threading import Lock
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
 
 from inference.core.cache.base import BaseCache
-from inference.core.env import MEMORY_CACHE_EXPIRE_INTERVAL
+from inference.core.env import MEMORY_CACHE_EXPIRE_INTERVAL, MEMORY_CACHE_LOCK_STRIPES
+
+EXPIRATION_BATCH_SIZE = 256
+
+
+class SortedSet:
+    """
+    Sorted set keeping members ordered by score, with bisect-based O(log n) lookups
+    of score ranges. Members are not deduplicated and many members may share the same
+    score - ties are ordered by insertion. Each added member is identified by sequence
+    number returned from `add(...)`, which allows removing specific member once it expires.
+
+    Not thread safe - `MemoryCache` guards access to instances.
+    """
+
+    def __init__(self):
+        self._scores: List[float] = []
+        self._members: List[Tuple[int, Any]] = []
+        self._sequence = itertools.count()
+
+    def add(self, value: Any, score: float) -> int:
+        sequence = next(self._sequence)
+        position = bisect_right(self._scores, score)
+        self._scores.insert(position, score)
+        self._members.insert(position, (sequence, value))
+        return sequence
+
+    def range_by_score(self, min: float, max: float) -> List[Tuple[Any, float]]:
+        start, end = self._find_range(min=min, max=max)
+        return [
+            (value, score)
+            for (_, value), score in zip(
+                self._members[start:end], self._scores[start:end]
+            )
+        ]
+
+    def remove_range_by_score(self, min: float, max: float) -> int:
+        start, end = self._find_range(min=min, max=max)
+        if end <= start:
+            return 0
+        del self._scores[start:end]
+        del self._members[start:end]
+        return end - start
+
+    def remove(self, score: float, sequence: int) -> bool:
+        start = bisect_left(self._scores, score)
+        end = bisect_right(self._scores, score)
+        for position in range(start, end):
+            if self._members[position][0] == sequence:
+                del self._scores[position]
+                del self._members[position]
+                return True
+        return False
+
+    def _find_range(self, min: float, max: float) -> Tuple[int, int]:
+        start = bisect_left(self._scores, min)
+        end = bisect_right(self._scores, max)
+        return start, end
+
+    def __len__(self) -> int:
+        return len(self._scores)
 
 
 class MemoryCache(BaseCache):
     """
     MemoryCache is an in-memory cache that implements the BaseCache interface.
 
+    Keys are spread over `lock_stripes` locks, such that threads touching different keys
+    rarely contend. Expiration times are tracked in time-ordered heaps (one per stripe),
+    so expiration never scans the whole cache.
+
     Attributes:
-        cache (dict): A dictionary to store the cache values.
+        cache (dict): A dictionary to store the cache values (sorted sets are stored as `SortedSet`).
         expires (dict): A dictionary to store the expiration times of the cache values.
-        zexpires (dict): A dictionary to store the expiration times of the sorted set values.
         _expire_thread (threading.Thread): A thread that runs the _expire method.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, lock_stripes: int = MEMORY_CACHE_LOCK_STRIPES) -> None:
         """
         Initializes a new instance of the MemoryCache class.
+
+        Args:
+            lock_stripes (int): Number of locks guarding keys of the cache.
         """
         self.cache = dict()
         self.expires = dict()
-        self.zexpires = dict()
+        lock_stripes = max(lock_stripes, 1)
+        self._locks = [Lock() for _ in range(lock_stripes)]
+        self._expiration_heaps: List[list] = [[] for _ in range(lock_stripes)]
+        self._expiration_sequence = itertools.count()
 
         self._expire_thread = threading.Thread(target=self._expire)
         self._expire_thread.daemon = True
@@ -32,29 +104,45 @@ class MemoryCache(BaseCache):
 
     def _expire(self):
         """
-        Removes the expired keys from the cache and zexpires dictionaries.
+        Removes the expired keys and sorted set members from the cache.
 
         This method runs in an infinite loop and sleeps for MEMORY_CACHE_EXPIRE_INTERVAL seconds between each iteration.
         """
         while True:
             now = time.time()
-            keys_to_delete = []
-            for k, v in self.expires.copy().items():
-                if v < now:
-                    keys_to_delete.append(k)
-            for k in keys_to_delete:
-                del self.cache[k]
-                del self.expires[k]
-            keys_to_delete = []
-            for k, v in self.zexpires.copy().items():
-                if v < now:
-                    keys_to_delete.append(k)
-            for k in keys_to_delete:
-                del self.cache[k[0]][k[1]]
-                del self.zexpires[k]
+            self._remove_expired_entries(now=now)
             while time.time() - now < MEMORY_CACHE_EXPIRE_INTERVAL:
                 time.sleep(0.1)
 
+    def _remove_expired_entries(self, now: float) -> None:
+        for stripe, lock in enumerate(self._locks):
+            while self._remove_expired_entries_batch(stripe=stripe, lock=lock, now=now):
+                pass
+
+    def _remove_expired_entries_batch(
+        self, stripe: int, lock: Lock, now: float
+    ) -> bool:
+        # lock is released between batches, such that expiring many entries at once
+        # does not block requests touching the stripe
+        heap = self._expiration_heaps[stripe]
+        with lock:
+            for _ in range(EXPIRATION_BATCH_SIZE):
+                if not heap or heap[0][0] >= now:
+                    return False
+                expires_at, _, key, member = heapq.heappop(heap)
+                if member is None:
+                    if self.expires.get(key) == expires_at:
+                        del self.cache[key]
+                        del self.expires[key]
+                    continue
+                sorted_set = self.cache.get(key)
+                if not isinstance(sorted_set, SortedSet):
+                    continue
+                sorted_set.remove(score=member[0], sequence=member[1])
+                if not len(sorted_set):
+                    del self.cache[key]
+        return True
+
     def get(self, key: str):
         """
         Gets the value associated with the given key.
@@ -65,12 +153,8 @@ class MemoryCache(BaseCache):
         Returns:
             str: The value associated with the key, or None if the key does not exist or is expired.
         """
-        if key in self.expires:
-            if self.expires[key] < time.time():
-                del self.cache[key]
-                del self.expires[key]
-                return None
-        return self.cache.get(key)
+        with self._lock_for(key=key):
+            return self._get(key=key)
 
     def set(self, key: str, value: str, expire: float = None):
         """
@@ -81,25 +165,30 @@ class MemoryCache(BaseCache):
             value (str): The value to store.
             expire (float, optional): The time, in seconds, after which the key will expire. Defaults to None.
         """
-        self.cache[key] = value
-        if expire:
-            self.expires[key] = expire + time.time()
+        with self._lock_for(key=key):
+            self._set(key=key, value=value, expire=expire)
 
     def zadd(self, key: str, value: Any, score: float, expire: float = None):
         """
-        Adds a member with the specified score to the sorted set stored at key.
+        Adds a member with the specified score to the sorted set stored at key. Many members
+        may share the same score.
 
         Args:
             key (str): The key of the sorted set.
             value (str): The value to add to the sorted set.
             score (float): The score associated with the value.
-            expire (float, optional): The time, in seconds, after which the key will expire. Defaults to None.
+            expire (float, optional): The time, in seconds, after which the member will expire. Defaults to None.
         """
-        if not key in self.cache:
-            self.cache[key] = dict()
-        self.cache[key][score] = value
-        if expire:
-            self.zexpires[(key, score)] = expire + time.time()
+        with self._lock_for(key=key):
+            sorted_set = self.cache.get(key)
+            if not isinstance(sorted_set, SortedSet):
+                sorted_set = SortedSet()
+                self.cache[key] = sorted_set
+            sequence = sorted_set.add(value=value, score=score)
+            if expire:
+                self._schedule_expiration(
+                    key=key, expires_at=expire + time.time(), member=(score, sequence)
+                )
 
     def zrangebyscore(
         self,
@@ -120,13 +209,14 @@ class MemoryCache(BaseCache):
         Returns:
             list: A list of values (or value-score pairs if withscores is True) in the specified score range.
         """
-        if not key in self.cache:
-            return []
-        keys = sorted([k for k in self.cache[key].keys() if min <= k <= max])
+        with self._lock_for(key=key):
+            sorted_set = self.cache.get(key)
+            if not isinstance(sorted_set, SortedSet):
+                return []
+            members = sorted_set.range_by_score(min=min, max=max)
         if withscores:
-            return [(self.cache[key][k], k) for k in keys]
-        else:
-            return [self.cache[key][k] for k in keys]
+            return members
+        return [value for value, _ in members]
 
     def zremrangebyscore(
         self,
@@ -145,17 +235,18 @@ class MemoryCache(BaseCache):
         Returns:
             int: The number of members removed from the sorted set.
         """
-        res = self.zrangebyscore(key, min=min, max=max, withscores=True)
-        keys_to_delete = [k[1] for k in res]
-        for k in keys_to_delete:
-            del self.cache[key][k]
-        return len(keys_to_delete)
+        with self._lock_for(key=key):
+            sorted_set = self.cache.get(key)
+            if not isinstance(sorted_set, SortedSet):
+                return 0
+            return sorted_set.remove_range_by_score(min=min, max=max)
 
     def acquire_lock(self, key: str, expire=None) -> Any:
-        lock: Optional[Lock] = self.get(key)
-        if lock is None:
-            lock = Lock()
-            self.set(key, lock, expire=expire)
+        with self._lock_for(key=key):
+            lock: Optional[Lock] = self._get(key=key)
+            if lock is None:
+                lock = Lock()
+                self._set(key=key, value=lock, expire=expire)
         if expire is None:
             expire = -1
         acquired = lock.acquire(timeout=expire)
@@ -170,3 +261,36 @@ class MemoryCache(BaseCache):
 
     def get_numpy(self, key: str):
         return self.get(key)
+
+    def _get(self, key: str) -> Any:
+        if key in self.expires:
+            if self.expires[key] < time.time():
+                del self.cache[key]
+                del self.expires[key]
+                return None
+        return self.cache.get(key)
+
+    def _set(self, key: str, value: Any, expire: Optional[float]) -> None:
+        self.cache[key] = value
+        if expire:
+            expires_at = expire + time.time()
+            self.expires[key] = expires_at
+            self._schedule_expiration(key=key, expires_at=expires_at, member=None)
+
+    def _schedule_expiration(
+        self,
+        key: str,
+        expires_at: float,
+        member: Optional[Tuple[float, int]],
+    ) -> None:
+        # sequence number breaks ties, such that keys and members are never compared
+        heapq.heappush(
+            self._expiration_heaps[self._stripe_of(key=key)],
+            (expires_at, next(self._expiration_sequence), key, member),
+        )
+
+    def _lock_for(self, key: str) -> Lock:
+        return self._locks[self._stripe_of(key=key)]
+
+    def _stripe_of(self, key: str) -> int:
+        return hash(key) % len(self._locks)
@@ -0,0 +1,612 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from inference.core.logger import logger
+
+SPILL_DTYPE = np.float16
+
+
+@dataclass(frozen=True)
+class TensorsCacheStats:
+    name: str
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    spilled_entries: int
+    spilled_bytes: int
+    spill_hits: int
+
+
+class TensorsCache:
+    """
+    Thread-safe LRU cache of model outputs (for instance image embeddings of SAM) bounded by
+    total size of arrays / tensors it holds (`max_bytes`) and optionally by number of
+    entries (`max_entries`).
+
+    Entries evicted from memory may spill to `spill_dir` (bounded by `spill_max_bytes`) -
+    floating-point arrays are written as float16 `.npy` files and read back through memory
+    map, such that recently evicted entries are restored without recomputation. Values must
+    be arrays or (nested) dicts / lists / tuples of arrays and plain values - `to_host(...)`
+    and `from_host(...)` convert spilled values into this form and back (for instance
+    `tensors_to_numpy(...)` and `numpy_to_tensors(...)` for torch tensors). Persisted
+    tuples are restored as lists.
+
+    With `spill_persistent=True`, entries are written to `spill_dir` as soon as they are
+    cached (not on eviction) and are found there after restart - keys must be strings then.
+
+    `get_or_compute(...)` coalesces concurrent computations of the same key - threads
+    requesting the entry which is being computed wait for the result.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int,
+        max_entries: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        spill_max_bytes: int = 0,
+        spill_persistent: bool = False,
+        to_host: Callable[[Any], Any] = lambda value: value,
+        from_host: Callable[[Any], Any] = lambda value: value,
+    ):
+        if max_bytes < 0 or (max_entries is not None and max_entries < 0):
+            raise ValueError(
+                f"`TensorsCache` bounds must not be negative, max_bytes={max_bytes} and "
+                f"max_entries={max_entries} given."
+            )
+        self.name = name
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._size_bytes = 0
+        self._in_flight: Dict[Hashable, _InFlight] = {}
+        self._pending_spill: Dict[Hashable, Any] = {}
+        self._spill: Optional[_SpillStore] = None
+        if spill_dir and spill_max_bytes > 0:
+            self._spill = _SpillStore(
+                name=name,
+                root_dir=spill_dir,
+                max_bytes=spill_max_bytes,
+                persistent=spill_persistent,
+            )
+        self._write_through = self._spill is not None and spill_persistent
+        self._to_host = to_host
+        self._from_host = from_host
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+        self._spill_hits = 0
+        self._lock = Lock()
+        _register_tensors_cache(cache=self)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        value = self._get(key=key)
+        if value is None:
+            with self._lock:
+                self._misses += 1
+        return value
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            value = self._get_from_memory(key=key)
+            if value is not None:
+                self._hits += 1
+                return value
+            in_flight = self._in_flight.get(key)
+            is_owner = in_flight is None
+            if is_owner:
+                in_flight = _InFlight()
+                self._in_flight[key] = in_flight
+        if not is_owner:
+            in_flight.done.wait()
+            with self._lock:
+                self._coalesced += 1
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.value
+        try:
+            value = self._get_from_spill(key=key)
+            if value is None:
+                with self._lock:
+                    self._misses += 1
+                value = compute()
+                self.put(key=key, value=value)
+            else:
+                self._put(key=key, value=value, write_through=False)
+            in_flight.value = value
+            return value
+        except BaseException as error:
+            in_flight.error = error
+            raise error
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.done.set()
+
+    def get_or_compute_many(
+        self,
+        keys: List[Hashable],
+        compute: Callable[[List[Hashable]], List[Any]],
+    ) -> List[Any]:
+        """Batch version of `get_or_compute(...)` - `compute(...)` is called once, with keys
+        neither cached nor being computed by other threads, and returns their values in
+        order. Keys being computed by other threads are awaited."""
+        values: Dict[Hashable, Any] = {}
+        owned: Dict[Hashable, _InFlight] = {}
+        awaited: Dict[Hashable, _InFlight] = {}
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                value = self._get_from_memory(key=key)
+                if value is not None:
+                    self._hits += 1
+                    values[key] = value
+                elif key in self._in_flight:
+                    awaited[key] = self._in_flight[key]
+                else:
+                    owned[key] = _InFlight()
+                    self._in_flight[key] = owned[key]
+        try:
+            missing = []
+            for key in owned:
+                value = self._get_from_spill(key=key)
+                if value is None:
+                    missing.append(key)
+                else:
+                    self._put(key=key, value=value, write_through=False)
+                    values[key] = value
+            if missing:
+                with self._lock:
+                    self._misses += len(missing)
+                for key, value in zip(missing, compute(missing)):
+                    self.put(key=key, value=value)
+                    values[key] = value
+            for key, in_flight in owned.items():
+                in_flight.value = values[key]
+        except BaseException as error:
+            for in_flight in owned.values():
+                in_flight.error = error
+            raise error
+        finally:
+            with self._lock:
+                for key in owned:
+                    del self._in_flight[key]
+            for in_flight in owned.values():
+                in_flight.done.set()
+        # awaited only after own computation - threads never wait for each other in cycle
+        for key, in_flight in awaited.items():
+            in_flight.done.wait()
+            with self._lock:
+                self._coalesced += 1
+            if in_flight.error is not None:
+                raise in_flight.error
+            values[key] = in_flight.value
+        return [values[key] for key in keys]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._put(key=key, value=value, write_through=self._write_through)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove_from_memory(key=key)
+            self._pending_spill.pop(key, None)
+        if self._spill is not None:
+            self._spill.remove(key=key)
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Snapshot of entries held in memory, from the least recently used - not
+        affecting the order."""
+        with self._lock:
+            return [(key, value) for key, (value, _) in self._entries.items()]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._pending_spill.clear()
+            self._size_bytes = 0
+        if self._spill is not None:
+            self._spill.clear()
+
+    def stats(self) -> TensorsCacheStats:
+        spilled_entries, spilled_bytes = 0, 0
+        if self._spill is not None:
+            spilled_entries, spilled_bytes = self._spill.usage()
+        with self._lock:
+            return TensorsCacheStats(
+                name=self.name,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_bytes=self._max_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                coalesced=self._coalesced,
+                evictions=self._evictions,
+                spilled_entries=spilled_entries,
+                spilled_bytes=spilled_bytes,
+                spill_hits=self._spill_hits,
+            )
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            if key in self._entries or key in self._pending_spill:
+                return True
+        return self._spill is not None and key in self._spill
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._get_from_memory(key=key)
+            if value is not None:
+                self._hits += 1
+                return value
+        value = self._get_from_spill(key=key)
+        if value is not None:
+            self._put(key=key, value=value, write_through=False)
+        return value
+
+    def _put(self, key: Hashable, value: Any, write_through: bool) -> None:
+        size = estimate_size(value)
+        with self._lock:
+            self._remove_from_memory(key=key)
+            self._pending_spill.pop(key, None)
+            self._entries[key] = (value, size)
+            self._size_bytes += size
+            evicted = self._evict()
+        if write_through:
+            self._store_in_spill(key=key, value=value)
+        self._spill_entries(entries=evicted)
+
+    def _get_from_memory(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[0]
+        # evicted, but possibly not yet written to spill
+        return self._pending_spill.get(key)
+
+    def _get_from_spill(self, key: Hashable) -> Optional[Any]:
+        if self._spill is None:
+            return None
+        value = self._spill.load(key=key)
+        if value is None:
+            return None
+        with self._lock:
+            self._spill_hits += 1
+        return self._from_host(value)
+
+    def _remove_from_memory(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry[1]
+
+    def _evict(self) -> List[Tuple[Hashable, Any]]:
+        evicted = []
+        while self._entries and (
+            self._size_bytes > self._max_bytes
+            or (
+                self._max_entries is not None and len(self._entries) > self._max_entries
+            )
+        ):
+            key, (value, size) = self._entries.popitem(last=False)
+            self._size_bytes -= size
+            self._evictions += 1
+            if self._spill is not None and not self._write_through:
+                self._pending_spill[key] = value
+                evicted.append((key, value))
+        return evicted
+
+    def _spill_entries(self, entries: List[Tuple[Hashable, Any]]) -> None:
+        # written outside of the lock - entries stay readable from `_pending_spill`
+        for key, value in entries:
+            self._store_in_spill(key=key, value=value)
+            with self._lock:
+                if self._pending_spill.get(key) is value:
+                    del self._pending_spill[key]
+
+    def _store_in_spill(self, key: Hashable, value: Any) -> None:
+        try:
+            self._spill.store(key=key, value=self._to_host(value))
+        except Exception as error:
+            logger.warning(
+                f"Could not spill entry of {self.name} cache to disk: {error}"
+            )
+
+
+class _InFlight:
+    def __init__(self):
+        self.done = Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+@dataclass(frozen=True)
+class _SpilledEntry:
+    paths: List[str]
+    dtypes: List[np.dtype]
+    structure: Any
+    size_bytes: int
+    metadata_path: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _ArrayReference:
+    index: int
+
+
+class _SpillStore:
+    def __init__(
+        self, name: str, root_dir: str, max_bytes: int, persistent: bool = False
+    ):
+        prefix = re.sub(r"[^A-Za-z0-9_\-]", "_", name)
+        if persistent:
+            self.directory = os.path.join(root_dir, prefix)
+            os.makedirs(self.directory, exist_ok=True)
+        else:
+            os.makedirs(root_dir, exist_ok=True)
+            self.directory = tempfile.mkdtemp(prefix=f"{prefix}-", dir=root_dir)
+            weakref.finalize(self, shutil.rmtree, self.directory, True)
+        self._persistent = persistent
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, _SpilledEntry]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = Lock()
+        if persistent:
+            self._load_index()
+
+    def store(self, key: Hashable, value: Any) -> None:
+        if self._persistent and not isinstance(key, str):
+            raise ValueError(f"Keys of persistent spill must be strings, got {key}")
+        arrays: List[np.ndarray] = []
+        structure = _flatten(value=value, arrays=arrays)
+        file_id = uuid4().hex
+        paths, dtypes, size = [], [], 0
+        for array_index, array in enumerate(arrays):
+            path = os.path.join(self.directory, f"{file_id}-{array_index}.npy")
+            stored = array
+            if np.issubdtype(array.dtype, np.floating) and array.itemsize > 2:
+                stored = array.astype(SPILL_DTYPE)
+            np.save(path, stored, allow_pickle=False)
+            paths.append(path)
+            dtypes.append(array.dtype)
+            size += stored.nbytes
+        metadata_path = None
+        if self._persistent:
+            # metadata written last (atomically) - entry without it is not complete
+            metadata_path = os.path.join(self.directory, f"{file_id}.json")
+            with open(f"{metadata_path}.tmp", "w") as f:
+                json.dump(
+                    {
+                        "key": key,
+                        "dtypes": [dtype.str for dtype in dtypes],
+                        "structure": _encode_structure(structure=structure),
+                        "size_bytes": size,
+                    },
+                    f,
+                )
+            os.replace(f"{metadata_path}.tmp", metadata_path)
+        entry = _SpilledEntry(
+            paths=paths,
+            dtypes=dtypes,
+            structure=structure,
+            size_bytes=size,
+            metadata_path=metadata_path,
+        )
+        self._add_entry(key=key, entry=entry)
+
+    def _add_entry(self, key: Hashable, entry: _SpilledEntry) -> None:
+        removed = []
+        with self._lock:
+            replaced = self._entries.pop(key, None)
+            if replaced is not None:
+                self._size_bytes -= replaced.size_bytes
+                removed.append(replaced)
+            self._entries[key] = entry
+            self._size_bytes += entry.size_bytes
+            while self._size_bytes > self._max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= evicted.size_bytes
+                removed.append(evicted)
+        for removed_entry in removed:
+            _remove_files(entry=removed_entry)
+
+    def _load_index(self) -> None:
+        metadata_paths = sorted(
+            (
+                os.path.join(self.directory, file_name)
+                for file_name in os.listdir(self.directory)
+                if file_name.endswith(".json")
+            ),
+            key=os.path.getmtime,
+        )
+        for metadata_path in metadata_paths:
+            try:
+                with open(metadata_path) as f:
+                    metadata = json.load(f)
+            except (OSError, ValueError):
+                continue
+            file_id = os.path.basename(metadata_path)[: -len(".json")]
+            dtypes = [np.dtype(dtype) for dtype in metadata["dtypes"]]
+            entry = _SpilledEntry(
+                paths=[
+                    os.path.join(self.directory, f"{file_id}-{array_index}.npy")
+                    for array_index in range(len(dtypes))
+                ],
+                dtypes=dtypes,
+                structure=_decode_structure(structure=metadata["structure"]),
+                size_bytes=metadata["size_bytes"],
+                metadata_path=metadata_path,
+            )
+            self._add_entry(key=metadata["key"], entry=entry)
+
+    def load(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        try:
+            arrays = [
+                np.load(path, mmap_mode="r").astype(dtype)
+                for path, dtype in zip(entry.paths, entry.dtypes)
+            ]
+        except OSError:
+            # entry removed concurrently
+            return None
+        return _unflatten(structure=entry.structure, arrays=arrays)
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self._size_bytes -= entry.size_bytes
+        _remove_files(entry=entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._size_bytes = 0
+        for entry in entries:
+            _remove_files(entry=entry)
+
+    def usage(self) -> Tuple[int, int]:
+        with self._lock:
+            return len(self._entries), self._size_bytes
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+
+def estimate_size(value: Any) -> int:
+    """Number of bytes held by arrays / tensors of (nested) value."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if _is_torch_tensor(value):
+        return value.element_size() * value.nelement()
+    if isinstance(value, dict):
+        return sum(estimate_size(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(v) for v in value)
+    return 0
+
+
+def tensors_to_numpy(value: Any) -> Any:
+    """Copies torch tensors of (nested) value to host as float32 numpy arrays - `to_host`
+    of caches of models running on torch."""
+    return map_leaves(
+        value,
+        lambda leaf: leaf.float().cpu().numpy() if _is_torch_tensor(leaf) else leaf,
+    )
+
+
+def numpy_to_tensors(value: Any, device: str) -> Any:
+    """Moves numpy arrays of (nested) value to torch `device` - `from_host` of caches of
+    models running on torch."""
+    import torch  # dependency of models running on torch only
+
+    return map_leaves(
+        value,
+        lambda leaf: (
+            torch.from_numpy(leaf).to(device) if isinstance(leaf, np.ndarray) else leaf
+        ),
+    )
+
+
+def _is_torch_tensor(value: Any) -> bool:
+    # duck-typed, such that torch is not required
+    return hasattr(value, "element_size") and hasattr(value, "nelement")
+
+
+def map_leaves(value: Any, function: Callable[[Any], Any]) -> Any:
+    """Applies function to leaves of (nested) dicts / lists / tuples."""
+    if isinstance(value, dict):
+        return {k: map_leaves(v, function) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(map_leaves(v, function) for v in value)
+    return function(value)
+
+
+def _flatten(value: Any, arrays: List[np.ndarray]) -> Any:
+    def flatten_leaf(leaf: Any) -> Any:
+        if not isinstance(leaf, np.ndarray):
+            return leaf
+        arrays.append(leaf)
+        return _ArrayReference(index=len(arrays) - 1)
+
+    return map_leaves(value, flatten_leaf)
+
+
+def _unflatten(structure: Any, arrays: List[np.ndarray]) -> Any:
+    return map_leaves(
+        structure,
+        lambda leaf: (
+            arrays[leaf.index] if isinstance(leaf, _ArrayReference) else leaf
+        ),
+    )
+
+
+def _encode_structure(structure: Any) -> Any:
+    return map_leaves(
+        structure,
+        lambda leaf: (
+            {"__array__": leaf.index} if isinstance(leaf, _ArrayReference) else leaf
+        ),
+    )
+
+
+def _decode_structure(structure: Any) -> Any:
+    if isinstance(structure, dict):
+        if set(structure.keys()) == {"__array__"}:
+            return _ArrayReference(index=structure["__array__"])
+        return {k: _decode_structure(v) for k, v in structure.items()}
+    if isinstance(structure, list):
+        return [_decode_structure(v) for v in structure]
+    return structure
+
+
+def _remove_files(entry: _SpilledEntry) -> None:
+    paths = entry.paths
+    if entry.metadata_path is not None:
+        paths = [entry.metadata_path] + paths
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+_tensors_caches: "weakref.WeakValueDictionary[str, TensorsCache]" = (
+    weakref.WeakValueDictionary()
+)
+_tensors_caches_lock = Lock()
+
+
+def _register_tensors_cache(cache: TensorsCache) -> None:
+    with _tensors_caches_lock:
+        _tensors_caches[cache.name] = cache
+
+
+def get_tensors_caches_stats() -> Dict[str, TensorsCacheStats]:
+    with _tensors_caches_lock:
+        caches = list(_tensors_caches.values())
+    return {cache.name: cache.stats() for cache in caches}
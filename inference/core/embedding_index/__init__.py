@@ -0,0 +1,4 @@
+from inference.core.embedding_index.index import EmbeddingIndex
+from inference.core.env import EMBEDDING_INDEX_DIR
+
+embedding_index = EmbeddingIndex(root_dir=EMBEDDING_INDEX_DIR)
@@ -0,0 +1,219 @@
+import math
+import shutil
+from dataclasses import dataclass
+from threading import RLock
+from typing import List, Optional
+
+import numpy as np
+
+from inference.core.embedding_index.ivf import IVFIndex
+from inference.core.embedding_index.storage import VectorsStorage
+from inference.core.env import (
+    EMBEDDING_INDEX_IVF_LISTS,
+    EMBEDDING_INDEX_IVF_MIN_VECTORS,
+    EMBEDDING_INDEX_IVF_PROBES,
+)
+from inference.core.exceptions import (
+    EmbeddingCollectionNotFoundError,
+    InvalidEmbeddingIndexRequestError,
+)
+
+COMPACTION_MIN_DEAD_ROWS = 1024
+
+
+@dataclass(frozen=True)
+class EmbeddingMatch:
+    id: str
+    similarity: float
+
+
+class EmbeddingCollection:
+    """
+    Named collection of embeddings with nearest-neighbour (cosine similarity) search.
+
+    Vectors are normalised and persisted (see `VectorsStorage`). On the first search, they
+    are loaded into in-memory `IVFIndex` - flat one (searched exactly) for collections
+    smaller than `ivf_min_vectors`, inverted lists (searched approximately, unless exact
+    search is requested) for larger ones (rebuilt once collection doubles since training).
+
+    Collection is thread-safe - once dropped, operations in flight are finished and further
+    ones fail with `EmbeddingCollectionNotFoundError`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        storage: VectorsStorage,
+        ivf_lists: int = EMBEDDING_INDEX_IVF_LISTS,
+        ivf_probes: int = EMBEDDING_INDEX_IVF_PROBES,
+        ivf_min_vectors: int = EMBEDDING_INDEX_IVF_MIN_VECTORS,
+    ):
+        self.name = name
+        self._storage = storage
+        self._ivf_lists = ivf_lists
+        self._ivf_probes = ivf_probes
+        self._ivf_min_vectors = max(ivf_min_vectors, 1)
+        self._index: Optional[IVFIndex] = None
+        self._dropped = False
+        self._lock = RLock()
+
+    @property
+    def model_id(self) -> str:
+        return self._storage.model_id
+
+    @property
+    def dimension(self) -> int:
+        return self._storage.dimension
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_not_dropped()
+            return self._storage.size
+
+    def __contains__(self, vector_id: str) -> bool:
+        with self._lock:
+            self._ensure_not_dropped()
+            return vector_id in self._storage
+
+    def ids(self) -> List[str]:
+        with self._lock:
+            self._ensure_not_dropped()
+            return self._storage.ids()
+
+    def add(self, ids: List[str], embeddings: np.ndarray) -> None:
+        """Adds embeddings under given ids - embeddings of ids already in collection are
+        replaced."""
+        if len(set(ids)) != len(ids):
+            raise InvalidEmbeddingIndexRequestError(
+                "Ids of added embeddings must be unique"
+            )
+        vectors = _normalise(np.atleast_2d(embeddings))
+        with self._lock:
+            self._ensure_not_dropped()
+            self._storage.add(ids=ids, vectors=vectors)
+            self._compact_if_needed()
+
+    def delete(self, ids: List[str]) -> int:
+        with self._lock:
+            self._ensure_not_dropped()
+            deleted = self._storage.delete(ids=ids)
+            self._compact_if_needed()
+            return deleted
+
+    def search(
+        self,
+        embeddings: np.ndarray,
+        top_k: int = 10,
+        exact: bool = False,
+        min_similarity: Optional[float] = None,
+        probes: Optional[int] = None,
+    ) -> List[List[EmbeddingMatch]]:
+        """Returns `top_k` most similar embeddings (ordered by descending cosine similarity)
+        for each of queries."""
+        queries = _normalise(np.atleast_2d(embeddings))
+        if queries.shape[1] != self.dimension:
+            raise InvalidEmbeddingIndexRequestError(
+                f"Collection {self.name} stores embeddings of dimension {self.dimension}, "
+                f"got queries of shape {queries.shape}"
+            )
+        with self._lock:
+            self._ensure_not_dropped()
+            index = self._get_index()
+            alive = self._storage.alive
+            results = []
+            for query in queries:
+                rows, similarities = index.score(
+                    query=query, probes=index.lists_number if exact else probes
+                )
+                is_alive = alive[rows]
+                results.append(
+                    self._select_matches(
+                        rows=rows[is_alive],
+                        similarities=similarities[is_alive],
+                        top_k=top_k,
+                        min_similarity=min_similarity,
+                    )
+                )
+            return results
+
+    def close(self) -> None:
+        with self._lock:
+            self._storage.close()
+
+    def drop(self) -> None:
+        """Removes persisted embeddings - once operations in flight are finished."""
+        with self._lock:
+            self._dropped = True
+            self._index = None
+            self._storage.close()
+            shutil.rmtree(self._storage.directory)
+
+    def _ensure_not_dropped(self) -> None:
+        if self._dropped:
+            raise EmbeddingCollectionNotFoundError(
+                f"Embedding collection {self.name} does not exist"
+            )
+
+    def _select_matches(
+        self,
+        rows: np.ndarray,
+        similarities: np.ndarray,
+        top_k: int,
+        min_similarity: Optional[float],
+    ) -> List[EmbeddingMatch]:
+        top_k = min(top_k, len(similarities))
+        if top_k <= 0:
+            return []
+        top = np.argpartition(-similarities, top_k - 1)[:top_k]
+        top = top[np.argsort(-similarities[top], kind="stable")]
+        matches = []
+        for position in top:
+            similarity = float(similarities[position])
+            if min_similarity is not None and similarity < min_similarity:
+                break
+            matches.append(
+                EmbeddingMatch(
+                    id=self._storage.row_id(int(rows[position])), similarity=similarity
+                )
+            )
+        return matches
+
+    def _get_index(self) -> IVFIndex:
+        size = self._storage.size
+        index = self._index
+        if size < self._ivf_min_vectors:
+            # small collection - flat index
+            stale = index is None
+            lists_number = 1
+        else:
+            stale = (
+                index is None
+                or index.lists_number == 1
+                or size >= 2 * index.trained_rows
+            )
+            lists_number = self._ivf_lists or int(math.sqrt(size))
+        if stale:
+            index = IVFIndex(
+                dimension=self.dimension,
+                lists_number=lists_number,
+                probes=self._ivf_probes,
+            )
+            index.build(vectors=self._storage.vectors, alive=self._storage.alive)
+            self._index = index
+        elif index.indexed_rows < self._storage.rows:
+            index.add(vectors=self._storage.vectors, alive=self._storage.alive)
+        return index
+
+    def _compact_if_needed(self) -> None:
+        dead_rows = self._storage.rows - self._storage.size
+        if dead_rows < max(COMPACTION_MIN_DEAD_ROWS, self._storage.size):
+            return None
+        self._storage.compact()
+        # row numbers changed - index is rebuilt on the next search
+        self._index = None
+
+
+def _normalise(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
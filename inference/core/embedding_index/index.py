@@ -0,0 +1,137 @@
+import os
+import re
+import shutil
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from inference.core.embedding_index.collection import EmbeddingCollection
+from inference.core.embedding_index.storage import VectorsStorage
+from inference.core.exceptions import (
+    EmbeddingCollectionNotFoundError,
+    InvalidEmbeddingIndexRequestError,
+)
+from inference.core.logger import logger
+
+COLLECTION_NAME_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9_\-]{0,63}")
+NAMESPACE_DIR_PREFIX = "@"
+
+
+class EmbeddingIndex:
+    """
+    Collections of embeddings persisted in `root_dir` (one directory per collection), opened
+    lazily on the first use.
+
+    Collection is bound to the model which produced its embeddings - embeddings of other
+    models (even of the same dimension) live in different spaces and cannot be mixed.
+
+    Collections may be scoped by `namespace` (for instance workspace of the caller) - the
+    same name in different namespaces denotes different collections.
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        self._collections: Dict[Tuple[Optional[str], str], EmbeddingCollection] = {}
+        self._lock = Lock()
+
+    def get_collection(
+        self, name: str, namespace: Optional[str] = None
+    ) -> EmbeddingCollection:
+        _validate_collection_name(name=name, namespace=namespace)
+        with self._lock:
+            collection = self._collections.get((namespace, name))
+            if collection is not None:
+                return collection
+            directory = self._get_collection_directory(name=name, namespace=namespace)
+            if not VectorsStorage.exists(directory=directory):
+                raise EmbeddingCollectionNotFoundError(
+                    f"Embedding collection {name} does not exist"
+                )
+            collection = EmbeddingCollection(
+                name=name, storage=VectorsStorage.open(directory=directory)
+            )
+            self._collections[(namespace, name)] = collection
+            return collection
+
+    def get_or_create_collection(
+        self,
+        name: str,
+        model_id: str,
+        dimension: int,
+        namespace: Optional[str] = None,
+    ) -> EmbeddingCollection:
+        _validate_collection_name(name=name, namespace=namespace)
+        with self._lock:
+            directory = self._get_collection_directory(name=name, namespace=namespace)
+            if (namespace, name) not in self._collections and not VectorsStorage.exists(
+                directory=directory
+            ):
+                logger.info(f"Creating embedding collection {name} ({model_id})")
+                self._collections[(namespace, name)] = EmbeddingCollection(
+                    name=name,
+                    storage=VectorsStorage.create(
+                        directory=directory, dimension=dimension, model_id=model_id
+                    ),
+                )
+        collection = self.get_collection(name=name, namespace=namespace)
+        if collection.model_id != model_id or collection.dimension != dimension:
+            raise InvalidEmbeddingIndexRequestError(
+                f"Embedding collection {name} stores embeddings of model "
+                f"{collection.model_id} (dimension {collection.dimension}) - cannot use it "
+                f"with embeddings of model {model_id} (dimension {dimension})"
+            )
+        return collection
+
+    def list_collections(self, namespace: Optional[str] = None) -> List[str]:
+        _validate_namespace(namespace=namespace)
+        namespace_dir = self._get_namespace_directory(namespace=namespace)
+        if not os.path.isdir(namespace_dir):
+            return []
+        return sorted(
+            name
+            for name in os.listdir(namespace_dir)
+            if VectorsStorage.exists(
+                directory=self._get_collection_directory(name=name, namespace=namespace)
+            )
+        )
+
+    def drop_collection(self, name: str, namespace: Optional[str] = None) -> None:
+        _validate_collection_name(name=name, namespace=namespace)
+        with self._lock:
+            collection = self._collections.pop((namespace, name), None)
+            if collection is not None:
+                # waits for operations in flight on the collection, fails further ones
+                collection.drop()
+                return None
+            directory = self._get_collection_directory(name=name, namespace=namespace)
+            if not VectorsStorage.exists(directory=directory):
+                raise EmbeddingCollectionNotFoundError(
+                    f"Embedding collection {name} does not exist"
+                )
+            shutil.rmtree(directory)
+
+    def _get_collection_directory(
+        self, name: str, namespace: Optional[str] = None
+    ) -> str:
+        return os.path.join(self._get_namespace_directory(namespace=namespace), name)
+
+    def _get_namespace_directory(self, namespace: Optional[str]) -> str:
+        if namespace is None:
+            return self.root_dir
+        # namespaces are prefixed, such that they never collide with collection names
+        return os.path.join(self.root_dir, f"{NAMESPACE_DIR_PREFIX}{namespace}")
+
+
+def _validate_collection_name(name: str, namespace: Optional[str] = None) -> None:
+    _validate_namespace(namespace=namespace)
+    if not COLLECTION_NAME_PATTERN.fullmatch(name):
+        raise InvalidEmbeddingIndexRequestError(
+            f"Embedding collection name {name} is invalid - use up to 64 letters, digits, "
+            f"`_` and `-`"
+        )
+
+
+def _validate_namespace(namespace: Optional[str]) -> None:
+    if namespace is not None and not COLLECTION_NAME_PATTERN.fullmatch(namespace):
+        raise InvalidEmbeddingIndexRequestError(
+            f"Embedding index namespace {namespace} is invalid"
+        )
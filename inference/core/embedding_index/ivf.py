@@ -0,0 +1,150 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+CHUNK_ROWS = 65536
+
+
+class _InvertedList:
+    def __init__(self, dimension: int):
+        self.size = 0
+        self._rows = np.empty((16,), dtype=np.int64)
+        self._vectors = np.empty((16, dimension), dtype=np.float32)
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._rows[: self.size]
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._vectors[: self.size]
+
+    def append(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        required = self.size + len(rows)
+        if required > len(self._rows):
+            capacity = max(required, 2 * len(self._rows))
+            self._rows = np.resize(self._rows, (capacity,))
+            grown = np.empty((capacity, self._vectors.shape[1]), dtype=np.float32)
+            grown[: self.size] = self.vectors
+            self._vectors = grown
+        self._rows[self.size : required] = rows
+        self._vectors[self.size : required] = vectors
+        self.size = required
+
+
+class IVFIndex:
+    """
+    Inverted file index over L2-normalised vectors, kept in memory as float32 - vectors are
+    assigned to the closest of `lists_number` centroids (trained with spherical k-means),
+    search only scores vectors of `probes` lists which centroids are the closest to the
+    query. This trades exactness for scoring a fraction of the collection. Index with single
+    list (no training needed) is flat one - searched exactly.
+
+    Index refers to vectors by row numbers of storage - rows appended after training are
+    assigned to existing centroids, rows deleted from storage must be filtered out by the
+    caller. Caller also decides when index is stale and must be rebuilt (for instance once
+    collection doubled since training).
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        lists_number: int,
+        probes: int,
+        training_iterations: int = 10,
+        training_samples_per_list: int = 64,
+        seed: int = 0,
+    ):
+        self.dimension = dimension
+        self.lists_number = max(lists_number, 1)
+        self.probes = max(min(probes, self.lists_number), 1)
+        self._training_iterations = training_iterations
+        self._training_samples_per_list = training_samples_per_list
+        self._random_state = np.random.RandomState(seed)
+        self._centroids = np.zeros((1, dimension), dtype=np.float32)
+        self._lists = [_InvertedList(dimension=dimension)]
+        self.trained_rows = 0
+        self.indexed_rows = 0
+
+    def build(self, vectors: np.ndarray, alive: np.ndarray) -> None:
+        """Trains centroids on alive `vectors` and assigns them to lists."""
+        alive_rows = np.flatnonzero(alive)
+        if self.lists_number > 1 and len(alive_rows) > 1:
+            self._centroids = self._train_centroids(
+                vectors=vectors, alive_rows=alive_rows
+            )
+        self._lists = [
+            _InvertedList(dimension=self.dimension) for _ in range(len(self._centroids))
+        ]
+        self.indexed_rows = 0
+        self.add(vectors=vectors, alive=alive)
+        self.trained_rows = len(alive_rows)
+
+    def add(self, vectors: np.ndarray, alive: np.ndarray) -> None:
+        """Assigns rows written since last call to lists."""
+        for start in range(self.indexed_rows, len(vectors), CHUNK_ROWS):
+            end = min(start + CHUNK_ROWS, len(vectors))
+            chunk_alive = alive[start:end]
+            chunk = np.asarray(vectors[start:end][chunk_alive], dtype=np.float32)
+            rows = np.arange(start, end)[chunk_alive]
+            if len(self._lists) == 1:
+                self._lists[0].append(rows=rows, vectors=chunk)
+                continue
+            assignment = np.argmax(chunk @ self._centroids.T, axis=1)
+            for list_id in np.unique(assignment):
+                members = assignment == list_id
+                self._lists[list_id].append(rows=rows[members], vectors=chunk[members])
+        self.indexed_rows = len(vectors)
+
+    def score(
+        self, query: np.ndarray, probes: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns rows of lists closest to the (normalised) query and their similarities
+        to the query."""
+        probes = max(min(probes or self.probes, len(self._lists)), 1)
+        if probes == len(self._lists):
+            probed_lists = range(len(self._lists))
+        else:
+            closest = np.argpartition(-(self._centroids @ query), probes - 1)
+            probed_lists = closest[:probes]
+        rows, similarities = [], []
+        for list_id in probed_lists:
+            inverted_list = self._lists[list_id]
+            if inverted_list.size == 0:
+                continue
+            rows.append(inverted_list.rows)
+            similarities.append(inverted_list.vectors @ query)
+        if not rows:
+            return np.empty((0,), dtype=np.int64), np.empty((0,), dtype=np.float32)
+        return np.concatenate(rows), np.concatenate(similarities)
+
+    def _train_centroids(
+        self, vectors: np.ndarray, alive_rows: np.ndarray
+    ) -> np.ndarray:
+        samples_number = min(
+            len(alive_rows), self.lists_number * self._training_samples_per_list
+        )
+        samples_rows = np.sort(
+            self._random_state.choice(alive_rows, size=samples_number, replace=False)
+        )
+        samples = np.asarray(vectors[samples_rows], dtype=np.float32)
+        lists_number = min(self.lists_number, len(samples))
+        centroids = samples[
+            self._random_state.choice(len(samples), size=lists_number, replace=False)
+        ]
+        for _ in range(self._training_iterations):
+            assignment = np.argmax(samples @ centroids.T, axis=1)
+            for list_id in range(lists_number):
+                members = samples[assignment == list_id]
+                if len(members) == 0:
+                    # empty list - re-seeded with random sample
+                    centroids[list_id] = samples[
+                        self._random_state.randint(len(samples))
+                    ]
+                    continue
+                centroid = members.sum(axis=0)
+                centroids[list_id] = centroid / max(np.linalg.norm(centroid), 1e-12)
+        return centroids
+
+    def lists_sizes(self) -> List[int]:
+        return [inverted_list.size for inverted_list in self._lists]
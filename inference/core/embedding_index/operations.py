@@ -0,0 +1,143 @@
+import hashlib
+from typing import Any, List, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from inference.core.cache import cache
+from inference.core.embedding_index.collection import (
+    EmbeddingCollection,
+    EmbeddingMatch,
+)
+from inference.core.embedding_index.index import EmbeddingIndex
+from inference.core.env import CLIP_MAX_BATCH_SIZE
+from inference.core.exceptions import (
+    InvalidEmbeddingIndexRequestError,
+    MissingApiKeyError,
+)
+from inference.core.models.utils.batching import create_batches
+from inference.core.roboflow_api import get_roboflow_workspace
+
+NAMESPACE_CACHE_EXPIRE = 3600
+
+
+def get_collections_namespace(api_key: Optional[str]) -> str:
+    """Namespace of collections the owner of API key can access - collections are scoped
+    by workspace, such that callers of shared server cannot reach others' collections"""
+    if not api_key:
+        raise MissingApiKeyError("API key is required to access embedding index")
+    api_key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    cache_key = f"embedding_index:namespace:{api_key_hash}"
+    namespace = cache.get(cache_key)
+    if namespace is None:
+        namespace = get_roboflow_workspace(api_key=api_key)
+        cache.set(cache_key, namespace, expire=NAMESPACE_CACHE_EXPIRE)
+    return namespace
+
+
+def add_images_to_collection(
+    embedding_index: EmbeddingIndex,
+    clip_model: Any,
+    collection_name: str,
+    images: List[Any],
+    ids: Optional[List[str]] = None,
+    namespace: Optional[str] = None,
+) -> Tuple[EmbeddingCollection, List[str]]:
+    """Embeds images with CLIP model and adds embeddings to collection (created if it does
+    not exist) - returns the collection and ids of added embeddings."""
+    if ids is not None and len(ids) != len(images):
+        raise InvalidEmbeddingIndexRequestError(
+            f"Got {len(ids)} ids for {len(images)} images"
+        )
+    return add_embeddings_to_collection(
+        embedding_index=embedding_index,
+        model_id=clip_model.endpoint,
+        collection_name=collection_name,
+        embeddings=embed_images(clip_model=clip_model, images=images),
+        ids=ids,
+        namespace=namespace,
+    )
+
+
+def add_embeddings_to_collection(
+    embedding_index: EmbeddingIndex,
+    model_id: str,
+    collection_name: str,
+    embeddings: np.ndarray,
+    ids: Optional[List[str]] = None,
+    namespace: Optional[str] = None,
+) -> Tuple[EmbeddingCollection, List[str]]:
+    if ids is None:
+        ids = [uuid4().hex for _ in embeddings]
+    collection = embedding_index.get_or_create_collection(
+        name=collection_name,
+        model_id=model_id,
+        dimension=embeddings.shape[1],
+        namespace=namespace,
+    )
+    collection.add(ids=ids, embeddings=embeddings)
+    return collection, ids
+
+
+def search_collection(
+    embedding_index: EmbeddingIndex,
+    clip_model: Any,
+    collection_name: str,
+    images: Optional[List[Any]] = None,
+    texts: Optional[List[str]] = None,
+    top_k: int = 10,
+    exact: bool = False,
+    min_similarity: Optional[float] = None,
+    namespace: Optional[str] = None,
+) -> List[List[EmbeddingMatch]]:
+    """Finds embeddings of collection closest to CLIP embeddings of images (or texts, if
+    images not given)."""
+    collection = get_model_collection(
+        embedding_index=embedding_index,
+        model_id=clip_model.endpoint,
+        collection_name=collection_name,
+        namespace=namespace,
+    )
+    if images:
+        embeddings = embed_images(clip_model=clip_model, images=images)
+    elif texts:
+        embeddings = clip_model.embed_text(texts)
+    else:
+        raise InvalidEmbeddingIndexRequestError(
+            "Search requires image(s) or text(s) as query"
+        )
+    return collection.search(
+        embeddings=embeddings,
+        top_k=top_k,
+        exact=exact,
+        min_similarity=min_similarity,
+    )
+
+
+def get_model_collection(
+    embedding_index: EmbeddingIndex,
+    model_id: str,
+    collection_name: str,
+    namespace: Optional[str] = None,
+) -> EmbeddingCollection:
+    collection = embedding_index.get_collection(
+        name=collection_name, namespace=namespace
+    )
+    if collection.model_id != model_id:
+        raise InvalidEmbeddingIndexRequestError(
+            f"Embedding collection {collection_name} stores embeddings of model "
+            f"{collection.model_id} - cannot use it with {model_id}"
+        )
+    return collection
+
+
+def embed_images(clip_model: Any, images: List[Any]) -> np.ndarray:
+    if not images:
+        raise InvalidEmbeddingIndexRequestError("At least one image is required")
+    return np.concatenate(
+        [
+            clip_model.embed_image(batch)
+            for batch in create_batches(sequence=images, batch_size=CLIP_MAX_BATCH_SIZE)
+        ],
+        axis=0,
+    )
@@ -0,0 +1,239 @@
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from inference.core.exceptions import InvalidEmbeddingIndexRequestError
+from inference.core.utils.file_system import dump_json, read_json
+
+VECTORS_FILE = "vectors.f16"
+IDS_LOG_FILE = "ids.log"
+METADATA_FILE = "collection.json"
+STORAGE_DTYPE = np.float16
+MIN_CAPACITY = 1024
+
+
+class VectorsStorage:
+    """
+    Persistent storage of (L2-normalised) vectors of single collection, kept as float16 in
+    memory-mapped file (`vectors.f16`) - such that collection is not loaded into memory and
+    survives restarts.
+
+    Vectors are only appended - `ids.log` records (in append-only manner) which row holds
+    vector of which id, and which ids were deleted. Rows of deleted (or replaced) vectors
+    are dead until `compact()` rewrites the storage.
+
+    Storage is not thread-safe - callers must synchronise access.
+    """
+
+    def __init__(self, directory: str, dimension: int, model_id: str):
+        self.directory = directory
+        self.dimension = dimension
+        self.model_id = model_id
+        self._vectors: Optional[np.memmap] = None
+        self._row_ids: List[Optional[str]] = []
+        self._id_rows: Dict[str, int] = {}
+        self._alive = np.zeros((0,), dtype=bool)
+
+    @classmethod
+    def create(cls, directory: str, dimension: int, model_id: str) -> "VectorsStorage":
+        os.makedirs(directory, exist_ok=True)
+        dump_json(
+            path=os.path.join(directory, METADATA_FILE),
+            content={"dimension": dimension, "model_id": model_id},
+            allow_override=True,
+        )
+        storage = cls(directory=directory, dimension=dimension, model_id=model_id)
+        storage._open(rows=0)
+        return storage
+
+    @classmethod
+    def open(cls, directory: str) -> "VectorsStorage":
+        metadata = read_json(path=os.path.join(directory, METADATA_FILE))
+        storage = cls(
+            directory=directory,
+            dimension=metadata["dimension"],
+            model_id=metadata["model_id"],
+        )
+        storage._open(rows=storage._replay_ids_log())
+        return storage
+
+    @staticmethod
+    def exists(directory: str) -> bool:
+        return os.path.isfile(os.path.join(directory, METADATA_FILE))
+
+    @property
+    def rows(self) -> int:
+        return len(self._row_ids)
+
+    @property
+    def size(self) -> int:
+        return len(self._id_rows)
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """All rows written so far (including dead ones, see `alive`)."""
+        return self._vectors[: self.rows]
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self._alive[: self.rows]
+
+    def row_id(self, row: int) -> Optional[str]:
+        return self._row_ids[row]
+
+    def ids(self) -> List[str]:
+        return list(self._id_rows)
+
+    def __contains__(self, vector_id: str) -> bool:
+        return vector_id in self._id_rows
+
+    def add(self, ids: List[str], vectors: np.ndarray) -> Tuple[int, int]:
+        """Appends vectors (replacing vectors of ids already stored) - returns range of rows
+        written."""
+        if vectors.ndim != 2 or vectors.shape[1] != self.dimension:
+            raise InvalidEmbeddingIndexRequestError(
+                f"Collection stores vectors of dimension {self.dimension}, got vectors of "
+                f"shape {vectors.shape}"
+            )
+        if len(ids) != len(vectors):
+            raise InvalidEmbeddingIndexRequestError(
+                f"Got {len(ids)} ids for {len(vectors)} vectors"
+            )
+        start = self.rows
+        self._ensure_capacity(rows=start + len(ids))
+        self._vectors[start : start + len(ids)] = vectors
+        self._vectors.flush()
+        records = []
+        for offset, vector_id in enumerate(ids):
+            row = start + offset
+            self._kill(vector_id=vector_id)
+            self._row_ids.append(vector_id)
+            self._id_rows[vector_id] = row
+            self._alive[row] = True
+            records.append(["add", vector_id, row])
+        self._append_to_ids_log(records=records)
+        return start, self.rows
+
+    def delete(self, ids: Iterable[str]) -> int:
+        records = [
+            ["delete", vector_id]
+            for vector_id in ids
+            if self._kill(vector_id=vector_id)
+        ]
+        self._append_to_ids_log(records=records)
+        return len(records)
+
+    def compact(self) -> None:
+        """Rewrites storage with alive rows only (row numbers change)."""
+        alive_rows = np.flatnonzero(self.alive)
+        ids = [self._row_ids[row] for row in alive_rows]
+        vectors_path = os.path.join(self.directory, VECTORS_FILE)
+        ids_log_path = os.path.join(self.directory, IDS_LOG_FILE)
+        capacity = max(len(ids), MIN_CAPACITY)
+        compacted = np.memmap(
+            f"{vectors_path}.tmp",
+            dtype=STORAGE_DTYPE,
+            mode="w+",
+            shape=(capacity, self.dimension),
+        )
+        compacted[: len(ids)] = self._vectors[alive_rows]
+        compacted.flush()
+        del compacted
+        with open(f"{ids_log_path}.tmp", "w") as f:
+            f.write(
+                "".join(
+                    json.dumps(["add", vector_id, row]) + "\n"
+                    for row, vector_id in enumerate(ids)
+                )
+            )
+        self._close()
+        os.replace(f"{vectors_path}.tmp", vectors_path)
+        os.replace(f"{ids_log_path}.tmp", ids_log_path)
+        self._row_ids = list(ids)
+        self._id_rows = {vector_id: row for row, vector_id in enumerate(ids)}
+        self._open(rows=len(ids))
+
+    def close(self) -> None:
+        self._close()
+
+    def _kill(self, vector_id: str) -> bool:
+        row = self._id_rows.pop(vector_id, None)
+        if row is None:
+            return False
+        self._row_ids[row] = None
+        self._alive[row] = False
+        return True
+
+    def _replay_ids_log(self) -> int:
+        path = os.path.join(self.directory, IDS_LOG_FILE)
+        if not os.path.isfile(path):
+            return 0
+        with open(path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # torn write of the last record (process killed while appending)
+                    break
+                if record[0] == "add":
+                    vector_id, row = record[1], record[2]
+                    self._replay_deletion(vector_id=vector_id)
+                    while len(self._row_ids) <= row:
+                        self._row_ids.append(None)
+                    self._row_ids[row] = vector_id
+                    self._id_rows[vector_id] = row
+                elif record[0] == "delete":
+                    self._replay_deletion(vector_id=record[1])
+        return len(self._row_ids)
+
+    def _replay_deletion(self, vector_id: str) -> None:
+        row = self._id_rows.pop(vector_id, None)
+        if row is not None:
+            self._row_ids[row] = None
+
+    def _append_to_ids_log(self, records: List[list]) -> None:
+        if not records:
+            return None
+        with open(os.path.join(self.directory, IDS_LOG_FILE), "a") as f:
+            f.write("".join(json.dumps(record) + "\n" for record in records))
+
+    def _open(self, rows: int) -> None:
+        path = os.path.join(self.directory, VECTORS_FILE)
+        if not os.path.exists(path):
+            open(path, "wb").close()
+        file_rows = os.path.getsize(path) // (
+            self.dimension * np.dtype(STORAGE_DTYPE).itemsize
+        )
+        capacity = max(file_rows, rows, MIN_CAPACITY)
+        self._map(capacity=capacity)
+        self._alive = np.zeros((capacity,), dtype=bool)
+        for row, vector_id in enumerate(self._row_ids):
+            self._alive[row] = vector_id is not None
+
+    def _ensure_capacity(self, rows: int) -> None:
+        capacity = len(self._vectors)
+        if rows <= capacity:
+            return None
+        while capacity < rows:
+            capacity *= 2
+        self._vectors.flush()
+        self._close()
+        self._map(capacity=capacity)
+        alive = np.zeros((capacity,), dtype=bool)
+        alive[: len(self._alive)] = self._alive
+        self._alive = alive
+
+    def _map(self, capacity: int) -> None:
+        self._vectors = np.memmap(
+            os.path.join(self.directory, VECTORS_FILE),
+            dtype=STORAGE_DTYPE,
+            mode="r+",
+            shape=(capacity, self.dimension),
+        )
+
+    def _close(self) -> None:
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
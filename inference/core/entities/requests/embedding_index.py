@@ -0,0 +1,80 @@
+from typing import List, Optional, Union
+
+from pydantic import Field
+
+from inference.core.entities.requests.clip import ClipInferenceRequest
+from inference.core.entities.requests.inference import InferenceRequestImage
+
+
+class EmbeddingIndexRequest(ClipInferenceRequest):
+    """Request operating on collection of local embedding index.
+
+    Attributes:
+        collection (str): Name of the collection.
+    """
+
+    collection: str = Field(
+        examples=["products"],
+        description="Name of the collection (up to 64 letters, digits, `_` and `-`)",
+    )
+
+
+class EmbeddingIndexAddRequest(EmbeddingIndexRequest):
+    """Request to embed image(s) with CLIP and add them to collection (created if it does
+    not exist).
+
+    Attributes:
+        image (Union[List[InferenceRequestImage], InferenceRequestImage]): Image(s) to be added.
+        ids (Optional[List[str]]): Ids of images - random ones are generated if not given.
+            Embeddings of ids already in collection are replaced.
+    """
+
+    image: Union[List[InferenceRequestImage], InferenceRequestImage]
+    ids: Optional[List[str]] = Field(
+        default=None,
+        examples=[["image-1"]],
+        description="Ids of images (one per image) - random ones are generated if not given",
+    )
+
+
+class EmbeddingIndexSearchRequest(EmbeddingIndexRequest):
+    """Request to find embeddings closest to CLIP embeddings of image(s) or text(s).
+
+    Attributes:
+        image (Optional[Union[List[InferenceRequestImage], InferenceRequestImage]]): Query image(s).
+        text (Optional[Union[List[str], str]]): Query text(s) - used if image not given.
+        top_k (int): Number of matches returned for each query.
+        exact (bool): Flag to score all embeddings instead of approximate search.
+        min_similarity (Optional[float]): Minimal cosine similarity of returned matches.
+    """
+
+    image: Optional[Union[List[InferenceRequestImage], InferenceRequestImage]] = None
+    text: Optional[Union[List[str], str]] = Field(
+        default=None,
+        examples=["red sneakers"],
+        description="Query text(s) - used if image is not given",
+    )
+    top_k: int = Field(
+        default=10, ge=1, description="Number of matches returned for each query"
+    )
+    exact: bool = Field(
+        default=False,
+        description="Flag to score all embeddings of collection instead of approximate search",
+    )
+    min_similarity: Optional[float] = Field(
+        default=None,
+        examples=[0.9],
+        description="Minimal cosine similarity of returned matches",
+    )
+
+
+class EmbeddingIndexDeleteRequest(EmbeddingIndexRequest):
+    """Request to delete embeddings from collection.
+
+    Attributes:
+        ids (List[str]): Ids of embeddings to be deleted.
+    """
+
+    ids: List[str] = Field(
+        examples=[["image-1"]], description="Ids of embeddings to be deleted"
+    )
@@ -34,7 +34,8 @@ class OwlV2InferenceRequest(BaseRequest):
         api_key (Optional[str]): Roboflow API Key.
         owlv2_version_id (Optional[str]): The version ID of Gaze to be used for this request.
         image (Union[List[InferenceRequestImage], InferenceRequestImage]): Image(s) for inference.
-        training_data (List[TrainingImage]): Training data to ground the model on
+        training_data (Optional[List[TrainingImage]]): Training data to ground the model on
+        prompt_set_id (Optional[str]): ID under which training data is registered for reuse
         confidence (float): Confidence threshold to filter predictions by
     """
 
@@ -50,8 +51,16 @@ class OwlV2InferenceRequest(BaseRequest):
     image: Union[List[InferenceRequestImage], InferenceRequestImage] = Field(
         description="Images to run the model on"
     )
-    training_data: List[TrainingImage] = Field(
-        description="Training images for the owlvit model to learn form"
+    training_data: Optional[List[TrainingImage]] = Field(
+        default=None,
+        description="Training images for the owlvit model to learn form",
+    )
+    prompt_set_id: Optional[str] = Field(
+        default=None,
+        examples=["my-prompt-set"],
+        description="ID of prompt set (scoped by API key) - if given together with "
+        "`training_data`, the training data is registered under this ID, if given alone, "
+        "previously registered training data is used",
     )
     confidence: Optional[float] = Field(
         default=0.99,
@@ -80,6 +89,12 @@ class OwlV2InferenceRequest(BaseRequest):
         description="If true, the predictions will be drawn on the original image and returned as a base64 string",
     )
 
+    @validator("prompt_set_id", always=True, allow_reuse=True)
+    def validate_prompt_set_id(cls, value, values):
+        if value is None and values.get("training_data") is None:
+            raise ValueError("Either `training_data` or `prompt_set_id` must be given")
+        return value
+
     # TODO[pydantic]: We couldn't refactor the `validator`, please replace it by `field_validator` manually.
     # Check https://docs.pydantic.dev/dev-v2/migration/#changes-to-validators for more information.
     @validator("model_id", always=True, allow_reuse=True)
@@ -174,3 +174,43 @@ class Sam2SegmentationRequest(Sam2InferenceRequest):
         "This can significantly speed up inference when making multiple similar requests on the same image. "
         "This feature is ignored if DISABLE_SAM2_LOGITS_CACHE env variable is set True",
     )
+
+
+class Sam2BatchSegmentationRequest(Sam2InferenceRequest):
+    """SAM2 segmentation request for batch of images - image encoder embeds images missing in
+    embeddings cache together and mask decoder decodes prompts of each image together.
+
+    Attributes:
+        images (List[InferenceRequestImage]): The images to be segmented.
+        image_ids (Optional[List[Optional[str]]]): The IDs of the images used to retrieve cached embeddings.
+        prompts (List[Sam2PromptSet]): Prompt set of each image.
+    """
+
+    images: List[InferenceRequestImage] = Field(
+        description="The images to be segmented.",
+    )
+    image_ids: Optional[List[Optional[str]]] = Field(
+        default=None,
+        description="The IDs of the images to be segmented used to retrieve cached embeddings - "
+        "must match length of images if given.",
+    )
+    prompts: Optional[List[Sam2PromptSet]] = Field(
+        default=None,
+        description="Prompt set of each image - must match length of images if given.",
+    )
+    multimask_output: bool = Field(
+        default=True,
+        examples=[True],
+        description="If true, the model predicts three masks for each prompt and returns "
+        "the one with the highest predicted quality score.",
+    )
+    save_logits_to_cache: bool = Field(
+        default=False,
+        description="If True, saves the low-resolution logits of each image to the cache. "
+        "This feature is ignored if DISABLE_SAM2_LOGITS_CACHE env variable is set True",
+    )
+    load_logits_from_cache: bool = Field(
+        default=False,
+        description="If True, attempts to load previously cached low-resolution logits for each image. "
+        "This feature is ignored if DISABLE_SAM2_LOGITS_CACHE env variable is set True",
+    )
@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from inference.core.entities.common import ApiKey, ModelID, ModelType
 
@@ -29,3 +29,19 @@ class ClearModelRequest(BaseModel):
 
     model_config = ConfigDict(protected_namespaces=())
     model_id: str = ModelID
+
+
+class PrefetchModelsRequest(BaseModel):
+    """Request to download artefacts of models (and load them) ahead of inference requests.
+
+    Attributes:
+        model_ids (List[str]): Unique model identifiers.
+        api_key (Optional[str]): Roboflow API Key that will be used to retrieve artifacts of models.
+    """
+
+    model_config = ConfigDict(protected_namespaces=())
+    model_ids: List[str] = Field(
+        description="Identifiers of models to prefetch",
+        examples=[["some-project/3", "yolov8n-640"]],
+    )
+    api_key: Optional[str] = ApiKey
@@ -0,0 +1,65 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class EmbeddingIndexMatch(BaseModel):
+    """Embedding of collection matching the query.
+
+    Attributes:
+        id (str): Id of the embedding.
+        similarity (float): Cosine similarity to the query.
+    """
+
+    id: str = Field(description="Id of the embedding")
+    similarity: float = Field(description="Cosine similarity to the query")
+
+
+class EmbeddingIndexAddResponse(BaseModel):
+    """Response for adding embeddings to collection.
+
+    Attributes:
+        collection (str): Name of the collection.
+        ids (List[str]): Ids of added embeddings.
+        size (int): Number of embeddings in collection.
+        time (float): The time in seconds it took to embed and add images.
+    """
+
+    collection: str
+    ids: List[str] = Field(description="Ids of added embeddings")
+    size: int = Field(description="Number of embeddings in collection")
+    time: Optional[float] = Field(
+        None, description="The time in seconds it took to embed and add images"
+    )
+
+
+class EmbeddingIndexSearchResponse(BaseModel):
+    """Response for search in collection.
+
+    Attributes:
+        collection (str): Name of the collection.
+        matches (List[List[EmbeddingIndexMatch]]): Matches (most similar first) for each query.
+        time (float): The time in seconds it took to embed queries and search.
+    """
+
+    collection: str
+    matches: List[List[EmbeddingIndexMatch]] = Field(
+        description="Matches (most similar first) for each query"
+    )
+    time: Optional[float] = Field(
+        None, description="The time in seconds it took to embed queries and search"
+    )
+
+
+class EmbeddingIndexDeleteResponse(BaseModel):
+    """Response for deleting embeddings from collection.
+
+    Attributes:
+        collection (str): Name of the collection.
+        deleted (int): Number of deleted embeddings.
+        size (int): Number of embeddings left in collection.
+    """
+
+    collection: str
+    deleted: int = Field(description="Number of deleted embeddings")
+    size: int = Field(description="Number of embeddings left in collection")
@@ -2,7 +2,7 @@ from typing import List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from inference.core.managers.entities import ModelDescription
+from inference.core.managers.entities import ModelDescription, ModelPrefetchState
 
 
 class ServerVersionInfo(BaseModel):
@@ -40,6 +40,10 @@ class ModelDescriptionEntity(BaseModel):
         None,
         description="Image input width accepted by the model (if registered).",
     )
+    session_load_time: Optional[float] = Field(
+        None,
+        description="Time (in seconds) of creating inference session of the model (if registered).",
+    )
 
     @classmethod
     def from_model_description(
@@ -51,6 +55,7 @@ class ModelDescriptionEntity(BaseModel):
             batch_size=model_description.batch_size,
             input_height=model_description.input_height,
             input_width=model_description.input_width,
+            session_load_time=model_description.session_load_time,
         )
 
 
@@ -71,3 +76,51 @@ class ModelsDescriptions(BaseModel):
                 for model_description in models_descriptions
             ]
         )
+
+
+class ModelPrefetchStateEntity(BaseModel):
+    model_config = ConfigDict(protected_namespaces=())
+    model_id: str = Field(
+        description="Identifier of the model", examples=["some-project/3"]
+    )
+    status: str = Field(
+        description="Status of prefetching: pending, downloading, downloaded, loading, "
+        "ready or failed",
+        examples=["ready"],
+    )
+    error: Optional[str] = Field(
+        None, description="Reason of failure (if prefetching failed)."
+    )
+
+    @classmethod
+    def from_model_prefetch_state(
+        cls, model_prefetch_state: ModelPrefetchState
+    ) -> "ModelPrefetchStateEntity":
+        return cls(
+            model_id=model_prefetch_state.model_id,
+            status=model_prefetch_state.status.value,
+            error=model_prefetch_state.error,
+        )
+
+
+class ModelsPrefetchStatus(BaseModel):
+    ready: bool = Field(
+        description="Flag telling whether prefetching of all requested models is finished"
+    )
+    models: List[ModelPrefetchStateEntity] = Field(
+        description="States of models requested to be prefetched.",
+    )
+
+    @classmethod
+    def from_models_prefetch_states(
+        cls, ready: bool, models_prefetch_states: List[ModelPrefetchState]
+    ) -> "ModelsPrefetchStatus":
+        return cls(
+            ready=ready,
+            models=[
+                ModelPrefetchStateEntity.from_model_prefetch_state(
+                    model_prefetch_state=state
+                )
+                for state in models_prefetch_states
+            ],
+        )
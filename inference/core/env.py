@@ -88,6 +88,12 @@ TINY_CACHE = str2bool(os.getenv("TINY_CACHE", True))
 # Maximum batch size for CLIP, default is 8
 CLIP_MAX_BATCH_SIZE = int(os.getenv("CLIP_MAX_BATCH_SIZE", 8))
 
+# Number of CLIP text embeddings (per CLIP version and text) kept in memory, such that fixed
+# prompts (like classes of zero-shot classification) are embedded once, default is 4096
+CLIP_TEXT_EMBEDDINGS_CACHE_SIZE = int(
+    os.getenv("CLIP_TEXT_EMBEDDINGS_CACHE_SIZE", 4096)
+)
+
 # Class agnostic NMS flag, default is False
 CLASS_AGNOSTIC_NMS_ENV = "CLASS_AGNOSTIC_NMS"
 DEFAULT_CLASS_AGNOSTIC_NMS = False
@@ -233,6 +239,9 @@ MAX_DETECTIONS = int(os.getenv(MAX_DETECTIONS_ENV, DEFAULT_MAX_DETECTIONS))
 # Loop interval for expiration of memory cache, default is 5
 MEMORY_CACHE_EXPIRE_INTERVAL = int(os.getenv("MEMORY_CACHE_EXPIRE_INTERVAL", 5))
 
+# Number of locks guarding keys of memory cache, default is 16
+MEMORY_CACHE_LOCK_STRIPES = int(os.getenv("MEMORY_CACHE_LOCK_STRIPES", 16))
+
 # Metrics enabled flag, default is True
 METRICS_ENABLED = str2bool(os.getenv("METRICS_ENABLED", True))
 if LAMBDA:
@@ -241,12 +250,67 @@ if LAMBDA:
 # Interval for metrics aggregation, default is 60
 METRICS_INTERVAL = int(os.getenv("METRICS_INTERVAL", 60))
 
+# Number of seconds of recent history kept by in-process inference metrics (in one-second
+# slots), default is twice the metrics interval
+INFERENCE_METRICS_WINDOW = int(
+    os.getenv("INFERENCE_METRICS_WINDOW", METRICS_INTERVAL * 2)
+)
+
 # URL for posting metrics to Roboflow API, default is "{API_BASE_URL}/inference-stats"
 METRICS_URL = os.getenv("METRICS_URL", f"{API_BASE_URL}/inference-stats")
 
 # Model cache directory, default is "/tmp/cache"
 MODEL_CACHE_DIR = os.getenv("MODEL_CACHE_DIR", "/tmp/cache")
 
+# Directory of local embedding index collections, default is MODEL_CACHE_DIR/embedding_index
+EMBEDDING_INDEX_DIR = os.getenv(
+    "EMBEDDING_INDEX_DIR", os.path.join(MODEL_CACHE_DIR, "embedding_index")
+)
+
+# Number of lists of approximate (IVF) search index of embedding collection, default is 0
+# (square root of collection size)
+EMBEDDING_INDEX_IVF_LISTS = int(os.getenv("EMBEDDING_INDEX_IVF_LISTS", 0))
+
+# Number of lists scored by approximate search of embedding collection, default is 8
+EMBEDDING_INDEX_IVF_PROBES = int(os.getenv("EMBEDDING_INDEX_IVF_PROBES", 8))
+
+# Size of embedding collection from which approximate search is used (smaller collections
+# are searched exactly), default is 10000
+EMBEDDING_INDEX_IVF_MIN_VECTORS = int(
+    os.getenv("EMBEDDING_INDEX_IVF_MIN_VECTORS", 10000)
+)
+
+# Size (in bytes) of chunks model weights are downloaded in with parallel range requests,
+# default is 16MB
+MODEL_DOWNLOAD_CHUNK_SIZE = int(
+    os.getenv("MODEL_DOWNLOAD_CHUNK_SIZE", 16 * 1024 * 1024)
+)
+
+# Number of parallel range requests made while downloading model weights, default is 8
+MODEL_DOWNLOAD_WORKERS = int(os.getenv("MODEL_DOWNLOAD_WORKERS", 8))
+
+# Number of retries of failed request for model artefacts, default is 3
+MODEL_DOWNLOAD_RETRIES = int(os.getenv("MODEL_DOWNLOAD_RETRIES", 3))
+
+# Timeout (in seconds) of single request for model artefacts, default is 60
+MODEL_DOWNLOAD_TIMEOUT = float(os.getenv("MODEL_DOWNLOAD_TIMEOUT", 60.0))
+
+# Comma-separated list of models which artefacts are downloaded (and which are loaded, if
+# PREFETCH_LOAD_MODELS is set) when the server starts - before it reports readiness,
+# default is empty
+PREFETCH_MODELS = [
+    model_id.strip()
+    for model_id in os.getenv("PREFETCH_MODELS", "").split(",")
+    if model_id.strip()
+]
+
+# Flag to load prefetched models into model manager (initialising inference sessions),
+# default is True
+PREFETCH_LOAD_MODELS = str2bool(os.getenv("PREFETCH_LOAD_MODELS", True))
+
+# Number of models which artefacts are prefetched concurrently, default is 4
+PREFETCH_MAX_CONCURRENT_MODELS = int(os.getenv("PREFETCH_MAX_CONCURRENT_MODELS", 4))
+
 # Model ID, default is None
 MODEL_ID = os.getenv("MODEL_ID")
 
@@ -267,6 +331,111 @@ ONNXRUNTIME_EXECUTION_PROVIDERS = os.getenv(
     "[CUDAExecutionProvider,OpenVINOExecutionProvider,CPUExecutionProvider]",
 )
 
+# Number of threads used to parallelise execution within ONNX Runtime operators of each
+# session, default is 0 (ONNX Runtime default - one thread per physical core)
+ONNXRUNTIME_INTRA_OP_NUM_THREADS = int(os.getenv("ONNXRUNTIME_INTRA_OP_NUM_THREADS", 0))
+
+# Number of threads used to parallelise execution of ONNX Runtime graph nodes (applies to
+# parallel execution mode only), default is 0 (ONNX Runtime default)
+ONNXRUNTIME_INTER_OP_NUM_THREADS = int(os.getenv("ONNXRUNTIME_INTER_OP_NUM_THREADS", 0))
+
+# ONNX Runtime graph optimisation level - disable, basic, extended or all, default is None
+# (ONNX Runtime default - all)
+ONNXRUNTIME_GRAPH_OPTIMIZATION_LEVEL = os.getenv(
+    "ONNXRUNTIME_GRAPH_OPTIMIZATION_LEVEL", None
+)
+
+# Flag to save graphs optimised by ONNX Runtime into model cache directory and load them
+# (skipping optimisation) when the model is loaded again, default is True
+ONNXRUNTIME_OPTIMIZED_MODEL_CACHE_ENABLED = str2bool(
+    os.getenv("ONNXRUNTIME_OPTIMIZED_MODEL_CACHE_ENABLED", True)
+)
+
+# ONNX Runtime execution mode - sequential or parallel, default is None (ONNX Runtime default)
+ONNXRUNTIME_EXECUTION_MODE = os.getenv("ONNXRUNTIME_EXECUTION_MODE", None)
+
+# Flags to enable ONNX Runtime CPU memory arena and memory pattern optimisation, default is True
+ONNXRUNTIME_ENABLE_CPU_MEM_ARENA = str2bool(
+    os.getenv("ONNXRUNTIME_ENABLE_CPU_MEM_ARENA", True)
+)
+ONNXRUNTIME_ENABLE_MEM_PATTERN = str2bool(
+    os.getenv("ONNXRUNTIME_ENABLE_MEM_PATTERN", True)
+)
+
+# Flag to make all ONNX Runtime sessions share one process-wide thread pool (sized with
+# ONNXRUNTIME_INTRA_OP_NUM_THREADS and ONNXRUNTIME_INTER_OP_NUM_THREADS) instead of creating
+# their own, default is False
+ONNXRUNTIME_USE_GLOBAL_THREAD_POOL = str2bool(
+    os.getenv("ONNXRUNTIME_USE_GLOBAL_THREAD_POOL", False)
+)
+
+# Number of CPU cores assigned to each ONNX Runtime session - when set, available cores are
+# partitioned into disjoint sets the intra-op threads of concurrently loaded models are pinned
+# to, default is 0 (partitioning disabled)
+ONNXRUNTIME_CORES_PER_MODEL = int(os.getenv("ONNXRUNTIME_CORES_PER_MODEL", 0))
+
+# JSON object with ONNX Runtime session options per model ID (overriding global ones), for
+# instance {"some-project/3": {"intra_op_num_threads": 2, "cores": [0, 1]}}, default is None
+ONNXRUNTIME_SESSION_CONFIG = os.getenv("ONNXRUNTIME_SESSION_CONFIG", None)
+
+# Minimal number of ONNX Runtime session replicas of each model, default is 1
+ONNXRUNTIME_SESSION_MIN_REPLICAS = int(os.getenv("ONNXRUNTIME_SESSION_MIN_REPLICAS", 1))
+
+# Maximal number of ONNX Runtime session replicas of each model - replicas are added when all
+# of them are busy and removed once idle, 0 sizes the limit from number of CPU cores and
+# threads of each session, default is 1 (single session per model)
+ONNXRUNTIME_SESSION_MAX_REPLICAS = int(os.getenv("ONNXRUNTIME_SESSION_MAX_REPLICAS", 1))
+
+# Number of requests in flight on the least busy replica which triggers adding a replica,
+# default is 1 (replica is added when all replicas are busy)
+ONNXRUNTIME_SESSION_REPLICAS_SCALE_UP_QUEUE_DEPTH = int(
+    os.getenv("ONNXRUNTIME_SESSION_REPLICAS_SCALE_UP_QUEUE_DEPTH", 1)
+)
+
+# Time (in seconds) after which idle session replica is removed, default is 60
+ONNXRUNTIME_SESSION_REPLICAS_IDLE_TIMEOUT = float(
+    os.getenv("ONNXRUNTIME_SESSION_REPLICAS_IDLE_TIMEOUT", 60.0)
+)
+
+# Memory (in MB, estimated with size of model weights) all additional session replicas may
+# take, default is 2048
+ONNXRUNTIME_SESSION_REPLICAS_MAX_MEMORY_MB = float(
+    os.getenv("ONNXRUNTIME_SESSION_REPLICAS_MAX_MEMORY_MB", 2048)
+)
+
+# Flag to run ONNX models with input and outputs bound to buffers preallocated per input
+# shape (reused across calls with the same shape, like video frames), default is False
+ONNXRUNTIME_IO_BINDING_ENABLED = str2bool(
+    os.getenv("ONNXRUNTIME_IO_BINDING_ENABLED", False)
+)
+
+# Maximum number of input shapes each model keeps bound buffers for, default is 4
+ONNXRUNTIME_IO_BINDING_MAX_SHAPES = int(
+    os.getenv("ONNXRUNTIME_IO_BINDING_MAX_SHAPES", 4)
+)
+
+# INT8 quantization of ONNX models served on CPU - none, dynamic or static, default is None
+# (FP32 models are served)
+ONNXRUNTIME_QUANTIZATION = os.getenv("ONNXRUNTIME_QUANTIZATION", None)
+
+# Directory with images used to calibrate and validate quantized models, default is
+# MODEL_CACHE_DIR/calibration
+ONNXRUNTIME_QUANTIZATION_CALIBRATION_DIR = os.getenv(
+    "ONNXRUNTIME_QUANTIZATION_CALIBRATION_DIR",
+    os.path.join(MODEL_CACHE_DIR, "calibration"),
+)
+
+# Maximum number of images used to calibrate and validate quantized models, default is 32
+ONNXRUNTIME_QUANTIZATION_CALIBRATION_IMAGES = int(
+    os.getenv("ONNXRUNTIME_QUANTIZATION_CALIBRATION_IMAGES", 32)
+)
+
+# Maximum drop of mAP@0.5 of quantized model (measured against detections of FP32 model)
+# for the quantized model to be served, default is 0.02
+ONNXRUNTIME_QUANTIZATION_MAX_MAP_DRIFT = float(
+    os.getenv("ONNXRUNTIME_QUANTIZATION_MAX_MAP_DRIFT", 0.02)
+)
+
 # Port, default is 9001
 PORT = int(os.getenv("PORT", 9001))
 
@@ -297,6 +466,56 @@ SAM2_MAX_EMBEDDING_CACHE_SIZE = int(os.getenv("SAM2_MAX_EMBEDDING_CACHE_SIZE", 1
 SAM2_MAX_LOGITS_CACHE_SIZE = int(os.getenv("SAM2_MAX_LOGITS_CACHE_SIZE", 1000))
 DISABLE_SAM2_LOGITS_CACHE = str2bool(os.getenv("DISABLE_SAM2_LOGITS_CACHE", False))
 
+# Maximum number of images SAM2 image encoder embeds at once, default is 4
+SAM2_MAX_BATCH_SIZE = int(os.getenv("SAM2_MAX_BATCH_SIZE", 4))
+
+# Maximum number of prompts SAM2 mask decoder decodes at once, default is 32
+SAM2_MAX_PROMPTS_BATCH_SIZE = int(os.getenv("SAM2_MAX_PROMPTS_BATCH_SIZE", 32))
+
+# Memory (in MB) SAM and SAM2 embeddings and logits caches may hold - caches are bounded
+# by both memory and number of entries
+SAM_MAX_EMBEDDING_CACHE_MEMORY_MB = float(
+    os.getenv("SAM_MAX_EMBEDDING_CACHE_MEMORY_MB", 512)
+)
+SAM2_MAX_EMBEDDING_CACHE_MEMORY_MB = float(
+    os.getenv("SAM2_MAX_EMBEDDING_CACHE_MEMORY_MB", 2048)
+)
+SAM2_MAX_LOGITS_CACHE_MEMORY_MB = float(
+    os.getenv("SAM2_MAX_LOGITS_CACHE_MEMORY_MB", 512)
+)
+
+# Directory to which SAM and SAM2 embeddings evicted from memory spill (as float16),
+# default is None (spilling disabled)
+SAM_EMBEDDING_CACHE_SPILL_DIR = os.getenv("SAM_EMBEDDING_CACHE_SPILL_DIR", None)
+
+# Disk space (in MB) spilled embeddings of single model may take, default is 4096
+SAM_EMBEDDING_CACHE_SPILL_MAX_MB = float(
+    os.getenv("SAM_EMBEDDING_CACHE_SPILL_MAX_MB", 4096)
+)
+
+# Number of OWLv2 image embeddings kept in memory, default is 50
+OWLV2_IMAGE_CACHE_SIZE = int(os.getenv("OWLV2_IMAGE_CACHE_SIZE", 50))
+
+# Memory (in MB) OWLv2 image embeddings cache may hold, default is 1024
+OWLV2_IMAGE_CACHE_MEMORY_MB = float(os.getenv("OWLV2_IMAGE_CACHE_MEMORY_MB", 1024))
+
+# Directory to persist OWLv2 image embeddings in - such that embeddings of training images
+# survive restarts, default is None (embeddings are kept in memory only)
+OWLV2_IMAGE_EMBEDDINGS_CACHE_DIR = os.getenv("OWLV2_IMAGE_EMBEDDINGS_CACHE_DIR", None)
+
+# Disk space (in MB) persisted OWLv2 image embeddings may take, default is 4096
+OWLV2_IMAGE_EMBEDDINGS_CACHE_MAX_MB = float(
+    os.getenv("OWLV2_IMAGE_EMBEDDINGS_CACHE_MAX_MB", 4096)
+)
+
+# Number of OWLv2 query embeddings (computed from training data) kept in memory, default is 128
+OWLV2_QUERY_EMBEDDINGS_CACHE_SIZE = int(
+    os.getenv("OWLV2_QUERY_EMBEDDINGS_CACHE_SIZE", 128)
+)
+
+# Number of OWLv2 prompt sets registered by ID (least recently used are dropped), default is 256
+OWLV2_MAX_PROMPT_SETS = int(os.getenv("OWLV2_MAX_PROMPT_SETS", 256))
+
 # SAM version ID, default is "vit_h"
 SAM_VERSION_ID = os.getenv("SAM_VERSION_ID", "vit_h")
 SAM2_VERSION_ID = os.getenv("SAM2_VERSION_ID", "hiera_large")
@@ -371,6 +590,25 @@ DEFAULT_MINIMUM_ADAPTIVE_MODE_SAMPLES = int(
 DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW = int(
     os.getenv("VIDEO_SOURCE_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW", "16")
 )
+DEFAULT_SOURCE_DECODING_PROCESSES = os.getenv("VIDEO_SOURCE_DECODING_PROCESSES")
+if DEFAULT_SOURCE_DECODING_PROCESSES is not None:
+    DEFAULT_SOURCE_DECODING_PROCESSES = int(DEFAULT_SOURCE_DECODING_PROCESSES)
+DEFAULT_DECODING_RING_BUFFER_SLOTS = int(
+    os.getenv("VIDEO_SOURCE_DECODING_RING_BUFFER_SLOTS", "2")
+)
+DEFAULT_FRAME_MAX_DIMENSION = os.getenv("VIDEO_SOURCE_FRAME_MAX_DIMENSION")
+if DEFAULT_FRAME_MAX_DIMENSION is not None:
+    DEFAULT_FRAME_MAX_DIMENSION = int(DEFAULT_FRAME_MAX_DIMENSION)
+DEFAULT_FULL_RESOLUTION_FRAMES_CAPACITY = int(
+    os.getenv("VIDEO_SOURCE_FULL_RESOLUTION_FRAMES_CAPACITY", "16")
+)
+DEFAULT_FRAME_PRODUCER_BACKEND = os.getenv(
+    "VIDEO_SOURCE_FRAME_PRODUCER_BACKEND", "cv2"
+).lower()
+DEFAULT_PYAV_CODEC_THREADS = int(os.getenv("VIDEO_SOURCE_PYAV_CODEC_THREADS", "0"))
+DEFAULT_PYAV_LOW_LATENCY = os.getenv("VIDEO_SOURCE_PYAV_LOW_LATENCY")
+if DEFAULT_PYAV_LOW_LATENCY is not None:
+    DEFAULT_PYAV_LOW_LATENCY = str2bool(DEFAULT_PYAV_LOW_LATENCY)
 
 NUM_CELERY_WORKERS = os.getenv("NUM_CELERY_WORKERS", 4)
 CELERY_LOG_LEVEL = os.getenv("CELERY_LOG_LEVEL", "WARNING")
@@ -411,6 +649,12 @@ WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS = int(
 ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS = str2bool(
     os.getenv("ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS", True)
 )
+WORKFLOWS_DYNAMIC_BLOCKS_CACHE_SIZE = int(
+    os.getenv("WORKFLOWS_DYNAMIC_BLOCKS_CACHE_SIZE", "64")
+)
+WORKFLOWS_COMPILED_WORKFLOWS_CACHE_SIZE = int(
+    os.getenv("WORKFLOWS_COMPILED_WORKFLOWS_CACHE_SIZE", "64")
+)
 
 MODEL_VALIDATION_DISABLED = str2bool(os.getenv("MODEL_VALIDATION_DISABLED", "False"))
 
@@ -436,6 +680,8 @@ DOCKER_SOCKET_PATH: Optional[str] = os.getenv("DOCKER_SOCKET_PATH")
 
 ENABLE_WORKFLOWS_PROFILING = str2bool(os.getenv("ENABLE_WORKFLOWS_PROFILING", "False"))
 WORKFLOWS_PROFILER_BUFFER_SIZE = int(os.getenv("WORKFLOWS_PROFILER_BUFFER_SIZE", "64"))
+ENABLE_MODEL_TRACING = str2bool(os.getenv("ENABLE_MODEL_TRACING", "False"))
+MODEL_TRACING_BUFFER_SIZE = int(os.getenv("MODEL_TRACING_BUFFER_SIZE", "64"))
 WORKFLOWS_DEFINITION_CACHE_EXPIRY = int(
     os.getenv("WORKFLOWS_DEFINITION_CACHE_EXPIRY", 15 * 60)
 )
@@ -190,3 +190,19 @@ class ActiveLearningConfigurationError(ActiveLearningError):
 
 class CannotInitialiseModelError(Exception):
     pass
+
+
+class EmbeddingIndexError(Exception):
+    pass
+
+
+class EmbeddingCollectionNotFoundError(EmbeddingIndexError):
+    pass
+
+
+class InvalidEmbeddingIndexRequestError(EmbeddingIndexError):
+    pass
+
+
+class OwlV2PromptSetNotFoundError(Exception):
+    pass
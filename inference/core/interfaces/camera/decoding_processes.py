@@ -0,0 +1,581 @@
+import itertools
+import multiprocessing
+from dataclasses import dataclass
+from datetime import datetime
+from multiprocessing import shared_memory
+from queue import Empty, Queue
+from threading import Lock, Thread
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from inference.core import logger
+from inference.core.env import DEFAULT_DECODING_RING_BUFFER_SLOTS
+from inference.core.interfaces.camera.entities import (
+    FrameTimestamp,
+    SourceProperties,
+    VideoFrameProducer,
+)
+from inference.core.interfaces.camera.exceptions import DecodingWorkerError
+from inference.core.interfaces.camera.video_source import (
+    VideoFrameProducerBackend,
+    initialise_video_frame_producer,
+)
+
+OPEN_COMMAND = "open"
+IS_OPENED_COMMAND = "is_opened"
+GRAB_COMMAND = "grab"
+RETRIEVE_COMMAND = "retrieve"
+INITIALIZE_SOURCE_PROPERTIES_COMMAND = "initialize_source_properties"
+DISCOVER_SOURCE_PROPERTIES_COMMAND = "discover_source_properties"
+RELEASE_COMMAND = "release"
+
+WORKER_LIVENESS_CHECK_INTERVAL = 1.0
+
+
+@dataclass(frozen=True)
+class SharedFrameMetadata:
+    """Info needed to load decoded frame from shared-memory ring buffer"""
+
+    shm_name: str
+    slot: int
+    slot_size: int
+    array_shape: Tuple[int, ...]
+    array_dtype: str
+
+
+class SharedMemoryFrameRing:
+    """
+    Ring of fixed-size slots in shared memory - owned (created and unlinked) by decoding
+    worker, attached by name in the consumer process. Frames are written into consecutive
+    slots and consumer copies each frame out of its slot once notified about it.
+    """
+
+    @classmethod
+    def create(cls, slot_size: int, slots: int) -> "SharedMemoryFrameRing":
+        shm = shared_memory.SharedMemory(create=True, size=slot_size * slots)
+        return cls(shm=shm, slot_size=slot_size, slots=slots)
+
+    def __init__(self, shm: shared_memory.SharedMemory, slot_size: int, slots: int):
+        self._shm = shm
+        self._slot_size = slot_size
+        self._slots = slots
+        self._next_slot = 0
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def fits(self, image: np.ndarray) -> bool:
+        return image.nbytes <= self._slot_size
+
+    def write(self, image: np.ndarray) -> SharedFrameMetadata:
+        slot = self._next_slot
+        self._next_slot = (self._next_slot + 1) % self._slots
+        shared = np.ndarray(
+            image.shape,
+            dtype=image.dtype,
+            buffer=self._shm.buf,
+            offset=slot * self._slot_size,
+        )
+        shared[:] = image
+        return SharedFrameMetadata(
+            shm_name=self._shm.name,
+            slot=slot,
+            slot_size=self._slot_size,
+            array_shape=image.shape,
+            array_dtype=image.dtype.name,
+        )
+
+    def release(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+
+def load_frame_from_shared_memory(
+    shm: shared_memory.SharedMemory, metadata: SharedFrameMetadata
+) -> np.ndarray:
+    # copy is made for consumer to own the frame - slot gets overwritten by worker
+    return np.ndarray(
+        metadata.array_shape,
+        dtype=metadata.array_dtype,
+        buffer=shm.buf,
+        offset=metadata.slot * metadata.slot_size,
+    ).copy()
+
+
+class VideoDecodingProcessPool:
+    """
+    Pool of worker processes decoding video sources, to be used when number of sources
+    to be consumed in a single process makes decoding threads compete for GIL with
+    inference and dispatching threads.
+
+    Sources are sharded across workers (new source is assigned to the worker with the
+    lowest number of active sources). Each worker process runs separate decoding thread
+    per source and passes decoded frames back through shared-memory ring buffers - frames
+    are never pickled. Pool only hands out `VideoFrameProducer` implementations, so
+    `VideoSource` keeps all of its logic (buffer filling / consumption strategies,
+    status updates, restarts) in the consumer process - which means that re-connection
+    of sources handled by `multiplex_videos(...)` works as usual. Worker that died is
+    respawned when the next producer is requested - that happens naturally during
+    source re-connection.
+    """
+
+    @classmethod
+    def init(
+        cls,
+        workers: int,
+        ring_buffer_slots: int = DEFAULT_DECODING_RING_BUFFER_SLOTS,
+    ) -> "VideoDecodingProcessPool":
+        if workers < 1:
+            raise ValueError(
+                f"`VideoDecodingProcessPool` requires at least one worker, {workers} given."
+            )
+        context = multiprocessing.get_context("spawn")
+        decoding_workers = [
+            DecodingWorker.init(context=context, ring_buffer_slots=ring_buffer_slots)
+            for _ in range(workers)
+        ]
+        return cls(decoding_workers=decoding_workers, context=context)
+
+    def __init__(
+        self,
+        decoding_workers: List["DecodingWorker"],
+        context: multiprocessing.context.BaseContext,
+    ):
+        self._decoding_workers = decoding_workers
+        self._context = context
+        self._producers_ids = itertools.count()
+        self._lock = Lock()
+        self._is_shut_down = False
+
+    @property
+    def workers(self) -> int:
+        return len(self._decoding_workers)
+
+    def producer_factory(
+        self,
+        video_reference: Union[str, int],
+        backend: VideoFrameProducerBackend = VideoFrameProducerBackend.CV2,
+    ) -> "ProcessVideoFrameProducerFactory":
+        return ProcessVideoFrameProducerFactory(
+            pool=self, video_reference=video_reference, backend=backend
+        )
+
+    def create_producer(
+        self,
+        video_reference: Union[str, int],
+        backend: VideoFrameProducerBackend = VideoFrameProducerBackend.CV2,
+    ) -> "ProcessVideoFrameProducer":
+        with self._lock:
+            if self._is_shut_down:
+                raise DecodingWorkerError(
+                    "Attempted to create video frames producer in shut down decoding pool."
+                )
+            worker_ord = self._select_worker()
+            producer_id = next(self._producers_ids)
+            worker = self._decoding_workers[worker_ord]
+        return ProcessVideoFrameProducer.init(
+            worker=worker,
+            producer_id=producer_id,
+            video_reference=video_reference,
+            backend=backend,
+        )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._is_shut_down:
+                return None
+            self._is_shut_down = True
+        for worker in self._decoding_workers:
+            worker.shutdown()
+
+    def _select_worker(self) -> int:
+        for worker_ord, worker in enumerate(self._decoding_workers):
+            if not worker.is_alive():
+                logger.warning(
+                    f"Decoding worker {worker_ord} is not alive - spawning new one."
+                )
+                worker.shutdown()
+                self._decoding_workers[worker_ord] = DecodingWorker.init(
+                    context=self._context,
+                    ring_buffer_slots=worker.ring_buffer_slots,
+                )
+        return min(
+            range(len(self._decoding_workers)),
+            key=lambda worker_ord: self._decoding_workers[worker_ord].active_producers,
+        )
+
+
+class ProcessVideoFrameProducerFactory:
+    """
+    Callable creating `ProcessVideoFrameProducer` - to be passed into `VideoSource` as
+    video reference. String representation is the one of wrapped video reference, such that
+    `VideoSource.describe_source()` reports the actual source.
+    """
+
+    def __init__(
+        self,
+        pool: VideoDecodingProcessPool,
+        video_reference: Union[str, int],
+        backend: VideoFrameProducerBackend = VideoFrameProducerBackend.CV2,
+    ):
+        self._pool = pool
+        self._video_reference = video_reference
+        self._backend = backend
+
+    def __call__(self) -> "ProcessVideoFrameProducer":
+        return self._pool.create_producer(
+            video_reference=self._video_reference, backend=self._backend
+        )
+
+    def __str__(self) -> str:
+        return str(self._video_reference)
+
+
+class DecodingWorker:
+    """
+    Handle to decoding worker process, living in consumer process. Requests from all
+    producers hosted by the worker go through single queue, responses are routed back to
+    producers by the dispatching thread.
+    """
+
+    @classmethod
+    def init(
+        cls,
+        context: multiprocessing.context.BaseContext,
+        ring_buffer_slots: int,
+    ) -> "DecodingWorker":
+        requests_queue = context.Queue()
+        responses_queue = context.Queue()
+        process = context.Process(
+            target=run_decoding_worker,
+            args=(requests_queue, responses_queue, ring_buffer_slots),
+            daemon=True,
+        )
+        process.start()
+        worker = cls(
+            process=process,
+            requests_queue=requests_queue,
+            responses_queue=responses_queue,
+            ring_buffer_slots=ring_buffer_slots,
+        )
+        worker.start_responses_dispatching()
+        return worker
+
+    def __init__(
+        self,
+        process: multiprocessing.Process,
+        requests_queue: multiprocessing.Queue,
+        responses_queue: multiprocessing.Queue,
+        ring_buffer_slots: int,
+    ):
+        self._process = process
+        self._requests_queue = requests_queue
+        self._responses_queue = responses_queue
+        self._ring_buffer_slots = ring_buffer_slots
+        self._producers_responses: Dict[int, Queue] = {}
+        self._lock = Lock()
+        self._dispatching_thread: Optional[Thread] = None
+        self._is_shut_down = False
+
+    @property
+    def ring_buffer_slots(self) -> int:
+        return self._ring_buffer_slots
+
+    @property
+    def active_producers(self) -> int:
+        return len(self._producers_responses)
+
+    def is_alive(self) -> bool:
+        return not self._is_shut_down and self._process.is_alive()
+
+    def start_responses_dispatching(self) -> None:
+        self._dispatching_thread = Thread(target=self._dispatch_responses, daemon=True)
+        self._dispatching_thread.start()
+
+    def register_producer(self, producer_id: int) -> None:
+        with self._lock:
+            self._producers_responses[producer_id] = Queue()
+
+    def unregister_producer(self, producer_id: int) -> None:
+        with self._lock:
+            if producer_id in self._producers_responses:
+                del self._producers_responses[producer_id]
+
+    def execute(self, producer_id: int, command: str, payload: Any = None) -> Any:
+        responses = self._producers_responses.get(producer_id)
+        if responses is None or not self.is_alive():
+            raise DecodingWorkerError(
+                f"Decoding worker cannot execute command {command} for producer {producer_id} - "
+                f"worker is not alive or producer is not registered."
+            )
+        self._requests_queue.put((producer_id, command, payload))
+        while True:
+            try:
+                status, result = responses.get(timeout=WORKER_LIVENESS_CHECK_INTERVAL)
+                break
+            except Empty:
+                if not self.is_alive():
+                    raise DecodingWorkerError(
+                        f"Decoding worker died while executing command {command} "
+                        f"for producer {producer_id}."
+                    )
+        if status is False:
+            error_type, error_message = result
+            raise DecodingWorkerError(
+                f"Decoding worker failed to execute command {command} for producer {producer_id}. "
+                f"Error: {error_type} - {error_message}"
+            )
+        return result
+
+    def shutdown(self) -> None:
+        if self._is_shut_down:
+            return None
+        self._is_shut_down = True
+        if self._process.is_alive():
+            self._requests_queue.put(None)
+            self._process.join(timeout=5.0)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._responses_queue.put(None)
+        if self._dispatching_thread is not None:
+            self._dispatching_thread.join()
+
+    def _dispatch_responses(self) -> None:
+        while True:
+            response = self._responses_queue.get()
+            if response is None:
+                break
+            producer_id, status, result = response
+            with self._lock:
+                responses = self._producers_responses.get(producer_id)
+            if responses is not None:
+                responses.put((status, result))
+
+
+class ProcessVideoFrameProducer(VideoFrameProducer):
+    """
+    Proxy of `VideoFrameProducer` running in decoding worker process. Interface
+    methods are executed remotely, frames retrieved are read from shared memory.
+    Presentation timestamps (if provided by remote producer) are sent along with
+    results of `grab()`.
+    """
+
+    @classmethod
+    def init(
+        cls,
+        worker: DecodingWorker,
+        producer_id: int,
+        video_reference: Union[str, int],
+        backend: VideoFrameProducerBackend = VideoFrameProducerBackend.CV2,
+    ) -> "ProcessVideoFrameProducer":
+        worker.register_producer(producer_id=producer_id)
+        producer = cls(worker=worker, producer_id=producer_id)
+        try:
+            worker.execute(
+                producer_id=producer_id,
+                command=OPEN_COMMAND,
+                payload=(video_reference, backend.value),
+            )
+        except DecodingWorkerError as error:
+            logger.warning(f"Could not open video source in decoding worker: {error}")
+            producer.release()
+        return producer
+
+    def __init__(self, worker: DecodingWorker, producer_id: int):
+        self._worker = worker
+        self._producer_id = producer_id
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._is_released = False
+        self._presentation_timestamp: Optional[datetime] = None
+
+    def isOpened(self) -> bool:
+        if self._is_released:
+            return False
+        try:
+            return self._execute(command=IS_OPENED_COMMAND)
+        except DecodingWorkerError as error:
+            logger.warning(f"Decoding worker error: {error}")
+            return False
+
+    def grab(self) -> bool:
+        try:
+            success, self._presentation_timestamp = self._execute(command=GRAB_COMMAND)
+            return success
+        except DecodingWorkerError as error:
+            # treated as end of stream - letting `VideoSource` clients to re-connect
+            logger.warning(f"Decoding worker error: {error}")
+            self._presentation_timestamp = None
+            return False
+
+    def retrieve_presentation_timestamp(self) -> Optional[FrameTimestamp]:
+        return self._presentation_timestamp
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        try:
+            metadata: Optional[SharedFrameMetadata] = self._execute(
+                command=RETRIEVE_COMMAND
+            )
+        except DecodingWorkerError as error:
+            logger.warning(f"Decoding worker error: {error}")
+            return False, None
+        if metadata is None:
+            return False, None
+        if self._shm is None or self._shm.name != metadata.shm_name:
+            self._close_shared_memory()
+            self._shm = shared_memory.SharedMemory(name=metadata.shm_name)
+        return True, load_frame_from_shared_memory(shm=self._shm, metadata=metadata)
+
+    def initialize_source_properties(self, properties: Dict[str, float]) -> None:
+        self._execute(command=INITIALIZE_SOURCE_PROPERTIES_COMMAND, payload=properties)
+
+    def discover_source_properties(self) -> SourceProperties:
+        return self._execute(command=DISCOVER_SOURCE_PROPERTIES_COMMAND)
+
+    def release(self) -> None:
+        if self._is_released:
+            return None
+        self._is_released = True
+        self._close_shared_memory()
+        try:
+            if self._worker.is_alive():
+                self._execute(command=RELEASE_COMMAND)
+        except DecodingWorkerError as error:
+            logger.warning(
+                f"Could not release video source in decoding worker: {error}"
+            )
+        finally:
+            self._worker.unregister_producer(producer_id=self._producer_id)
+
+    def _execute(self, command: str, payload: Any = None) -> Any:
+        return self._worker.execute(
+            producer_id=self._producer_id, command=command, payload=payload
+        )
+
+    def _close_shared_memory(self) -> None:
+        if self._shm is None:
+            return None
+        self._shm.close()
+        self._shm = None
+
+
+def run_decoding_worker(
+    requests_queue: multiprocessing.Queue,
+    responses_queue: multiprocessing.Queue,
+    ring_buffer_slots: int,
+) -> None:
+    producers_requests: Dict[int, Queue] = {}
+    producers_threads: Dict[int, Thread] = {}
+    while True:
+        request = requests_queue.get()
+        if request is None:
+            break
+        producer_id, command, payload = request
+        if command == OPEN_COMMAND:
+            producers_requests[producer_id] = Queue()
+            producers_threads[producer_id] = Thread(
+                target=run_remote_producer,
+                args=(
+                    producer_id,
+                    *payload,
+                    producers_requests[producer_id],
+                    responses_queue,
+                    ring_buffer_slots,
+                ),
+            )
+            producers_threads[producer_id].start()
+            continue
+        if producer_id not in producers_requests:
+            responses_queue.put(
+                (
+                    producer_id,
+                    False,
+                    ("KeyError", f"Producer {producer_id} not opened in worker."),
+                )
+            )
+            continue
+        producers_requests[producer_id].put((command, payload))
+        if command == RELEASE_COMMAND:
+            producers_threads[producer_id].join()
+            del producers_requests[producer_id]
+            del producers_threads[producer_id]
+    for producer_id, producer_requests in producers_requests.items():
+        producer_requests.put((RELEASE_COMMAND, None))
+        producers_threads[producer_id].join()
+
+
+def run_remote_producer(
+    producer_id: int,
+    video_reference: Union[str, int],
+    backend: str,
+    requests: Queue,
+    responses_queue: multiprocessing.Queue,
+    ring_buffer_slots: int,
+) -> None:
+    video: Optional[VideoFrameProducer] = None
+    ring: Optional[SharedMemoryFrameRing] = None
+    command = OPEN_COMMAND
+    try:
+        video = initialise_video_frame_producer(
+            video=video_reference, backend=VideoFrameProducerBackend(backend)
+        )
+        responses_queue.put((producer_id, True, None))
+        while True:
+            command, payload = requests.get()
+            if command == RELEASE_COMMAND:
+                break
+            if command == RETRIEVE_COMMAND:
+                result, ring = _retrieve_to_shared_memory(
+                    video=video, ring=ring, ring_buffer_slots=ring_buffer_slots
+                )
+            elif command == IS_OPENED_COMMAND:
+                result = video.isOpened()
+            elif command == GRAB_COMMAND:
+                success = video.grab()
+                result = (
+                    success,
+                    video.retrieve_presentation_timestamp() if success else None,
+                )
+            elif command == INITIALIZE_SOURCE_PROPERTIES_COMMAND:
+                result = video.initialize_source_properties(payload)
+            elif command == DISCOVER_SOURCE_PROPERTIES_COMMAND:
+                result = video.discover_source_properties()
+            else:
+                raise ValueError(f"Unknown command: {command}")
+            responses_queue.put((producer_id, True, result))
+    except Exception as error:
+        responses_queue.put(
+            (producer_id, False, (error.__class__.__name__, str(error)))
+        )
+        # draining requests until release, such that producer proxy is answered
+        while command != RELEASE_COMMAND:
+            command, _ = requests.get()
+            if command != RELEASE_COMMAND:
+                responses_queue.put(
+                    (producer_id, False, ("RuntimeError", "Producer failed before."))
+                )
+    finally:
+        if video is not None:
+            video.release()
+        if ring is not None:
+            ring.release()
+    responses_queue.put((producer_id, True, None))
+
+
+def _retrieve_to_shared_memory(
+    video: VideoFrameProducer,
+    ring: Optional[SharedMemoryFrameRing],
+    ring_buffer_slots: int,
+) -> Tuple[Optional[SharedFrameMetadata], Optional[SharedMemoryFrameRing]]:
+    success, image = video.retrieve()
+    if not success or image is None:
+        return None, ring
+    if ring is None or not ring.fits(image=image):
+        if ring is not None:
+            ring.release()
+        ring = SharedMemoryFrameRing.create(
+            slot_size=image.nbytes, slots=ring_buffer_slots
+        )
+    return ring.write(image=image), ring
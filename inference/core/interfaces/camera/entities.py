@@ -57,6 +57,9 @@ class VideoFrame:
             (useful when multiple streams are passed to InferencePipeline).
         fps (Optional[float]): FPS of source (if possible to be acquired)
         comes_from_video_file (Optional[bool]): flag to determine if frame comes from video file
+        scaling_factor (Optional[float]): ratio of `image` size to original size of decoded frame - present only
+            when frame was downscaled by `VideoSource` (see `frame_max_dimension` option). Coordinates of
+            predictions made against `image` can be divided by this value to be expressed in original resolution.
     """
 
     image: np.ndarray
@@ -65,6 +68,7 @@ class VideoFrame:
     fps: Optional[float] = None
     source_id: Optional[int] = None
     comes_from_video_file: Optional[bool] = None
+    scaling_factor: Optional[float] = None
 
 
 @dataclass(frozen=True)
@@ -96,5 +100,12 @@ class VideoFrameProducer:
     def initialize_source_properties(self, properties: Dict[str, float]):
         pass
 
+    def retrieve_presentation_timestamp(self) -> Optional[FrameTimestamp]:
+        """
+        Producers able to determine presentation timestamp of the last grabbed frame should
+        return it here - otherwise the time of grabbing the frame is used as frame timestamp.
+        """
+        return None
+
 
 VideoSourceIdentifier = Union[str, int, Callable[[], VideoFrameProducer]]
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from inference.core.env import DEFAULT_FULL_RESOLUTION_FRAMES_CAPACITY
+from inference.core.interfaces.camera.entities import FrameID
+
+
+class FullResolutionFramesRegistry:
+    """
+    Side channel for full-resolution frames of sources that downscale frames at decoding
+    time (see `frame_max_dimension` option of `VideoSource`). Only downscaled frames travel
+    through decoding buffers and pipelines - but component that needs original frame (for
+    instance sink saving high-resolution snapshot once something of interest is detected)
+    may request full-resolution version of upcoming frames of specific source with
+    `request(...)`. Decoding thread retains original image only for requested frames, which
+    can be later picked up with `retrieve(...)` using `source_id` and `frame_id` of
+    `VideoFrame` delivered to the component. Registry is bounded - once `capacity` is
+    exceeded, the oldest frames not retrieved on time are dropped.
+
+    Registry is thread-safe and may be shared among multiple sources.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_FULL_RESOLUTION_FRAMES_CAPACITY):
+        if capacity < 1:
+            raise ValueError(
+                f"`FullResolutionFramesRegistry` capacity must be positive, {capacity} given."
+            )
+        self._capacity = capacity
+        self._requests: Dict[Optional[int], int] = {}
+        self._frames: "OrderedDict[Tuple[Optional[int], FrameID], np.ndarray]" = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def request(self, source_id: Optional[int], frames: int = 1) -> None:
+        """
+        Requests full-resolution version of next `frames` frames decoded from source with
+        given `source_id`. Requests accumulate.
+        """
+        with self._lock:
+            self._requests[source_id] = self._requests.get(source_id, 0) + frames
+
+    def pending_requests(self, source_id: Optional[int]) -> int:
+        with self._lock:
+            return self._requests.get(source_id, 0)
+
+    def offer(
+        self, source_id: Optional[int], frame_id: FrameID, image: np.ndarray
+    ) -> bool:
+        """
+        Called by decoding thread with original frame - retains it only if it was requested.
+
+        Returns: boolean flag indicating if frame was retained
+        """
+        with self._lock:
+            if self._requests.get(source_id, 0) < 1:
+                return False
+            self._requests[source_id] -= 1
+            self._frames[(source_id, frame_id)] = image
+            while len(self._frames) > self._capacity:
+                self._frames.popitem(last=False)
+            return True
+
+    def retrieve(
+        self, source_id: Optional[int], frame_id: FrameID
+    ) -> Optional[np.ndarray]:
+        """
+        Returns full-resolution frame (removing it from registry) or None if frame was not
+        requested or already dropped.
+        """
+        with self._lock:
+            return self._frames.pop((source_id, frame_id), None)
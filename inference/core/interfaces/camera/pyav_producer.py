@@ -0,0 +1,223 @@
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+import av
+import cv2
+import numpy as np
+
+from inference.core import logger
+from inference.core.env import DEFAULT_PYAV_CODEC_THREADS, DEFAULT_PYAV_LOW_LATENCY
+from inference.core.interfaces.camera.entities import (
+    FrameTimestamp,
+    SourceProperties,
+    VideoFrameProducer,
+)
+
+STREAM_PROTOCOLS = (
+    "rtsp://",
+    "rtmp://",
+    "udp://",
+    "tcp://",
+    "srt://",
+    "http://",
+    "https://",
+)
+LOW_LATENCY_CONTAINER_OPTIONS = {
+    "fflags": "nobuffer",
+    "flags": "low_delay",
+    "max_delay": "0",
+}
+RTSP_CONTAINER_OPTIONS = {
+    "rtsp_transport": "tcp",
+}
+CODEC_THREADS_PROPERTIES = {"codec_threads", "thread_count"}
+I420_PIXEL_FORMAT = "yuv420p"
+
+
+class PyAVVideoFrameProducer(VideoFrameProducer):
+    """
+    `VideoFrameProducer` backed by PyAV (FFmpeg bindings) - alternative to
+    `CV2VideoFrameProducer` giving control over decoding which OpenCV hides:
+    * number of codec threads (`codec_threads` - 0 means FFmpeg auto-detection)
+    * low-latency demuxing and decoding flags - enabled by default for network streams
+    * presentation timestamps (PTS) of decoded frames - which are reported to `VideoSource`
+    to be used as `VideoFrame.frame_timestamp` (anchored in wall-clock time of the first frame)
+
+    `grab()` decodes next frame, `retrieve()` converts it into BGR `np.ndarray`. For
+    I420 frames (the most common output of decoders), planes are gathered into staging buffer
+    preallocated for the stream and converted directly into the output array with OpenCV -
+    without intermediate allocations made by FFmpeg software scaler. Output array is still
+    allocated per frame, as its ownership is handed over to consumer.
+
+    `initialize_source_properties(...)` accepts `codec_threads` (alias: `thread_count`) - other
+    properties are specific to OpenCV and are ignored with warning.
+    """
+
+    def __init__(
+        self,
+        video: Union[str, int],
+        codec_threads: int = DEFAULT_PYAV_CODEC_THREADS,
+        low_latency: Optional[bool] = DEFAULT_PYAV_LOW_LATENCY,
+    ):
+        self._video_reference = video
+        self._container: Optional[av.container.InputContainer] = None
+        self._stream: Optional[av.video.stream.VideoStream] = None
+        self._frames: Optional[Iterator[av.VideoFrame]] = None
+        self._grabbed_frame: Optional[av.VideoFrame] = None
+        self._staging_buffer: Optional[np.ndarray] = None
+        self._first_frame_time: Optional[float] = None
+        self._first_frame_timestamp: Optional[datetime] = None
+        self._is_network_stream = isinstance(video, str) and video.lower().startswith(
+            STREAM_PROTOCOLS
+        )
+        if low_latency is None:
+            low_latency = self._is_network_stream
+        try:
+            self._container = av.open(
+                _resolve_video_reference(video=video),
+                format=_resolve_container_format(video=video),
+                options=_prepare_container_options(
+                    video=video, low_latency=low_latency
+                ),
+            )
+            self._stream = self._container.streams.video[0]
+        except (av.FFmpegError, IndexError, OSError) as error:
+            logger.warning(f"Could not open video source {video} with PyAV: {error}")
+            self._release_container()
+            return None
+        self._stream.thread_type = "AUTO"
+        self._stream.codec_context.thread_count = codec_threads
+        if low_latency:
+            self._stream.codec_context.options = {"flags": "low_delay"}
+
+    def isOpened(self) -> bool:
+        return self._container is not None
+
+    def grab(self) -> bool:
+        if self._container is None:
+            return False
+        if self._frames is None:
+            self._frames = self._container.decode(self._stream)
+        try:
+            self._grabbed_frame = next(self._frames)
+        except (StopIteration, av.FFmpegError) as error:
+            if not isinstance(error, StopIteration):
+                logger.warning(f"PyAV decoding error: {error}")
+            self._grabbed_frame = None
+            return False
+        return True
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self._grabbed_frame is None:
+            return False, None
+        frame = self._grabbed_frame
+        if (
+            frame.format.name != I420_PIXEL_FORMAT
+            or frame.width % 2 != 0
+            or frame.height % 2 != 0
+        ):
+            return True, frame.to_ndarray(format="bgr24")
+        return True, self._convert_i420_frame(frame=frame)
+
+    def retrieve_presentation_timestamp(self) -> Optional[FrameTimestamp]:
+        if self._grabbed_frame is None or self._grabbed_frame.time is None:
+            return None
+        frame_time = self._grabbed_frame.time
+        if self._first_frame_time is None:
+            self._first_frame_time = frame_time
+            self._first_frame_timestamp = datetime.now()
+        return self._first_frame_timestamp + timedelta(
+            seconds=frame_time - self._first_frame_time
+        )
+
+    def initialize_source_properties(self, properties: Dict[str, float]) -> None:
+        if self._stream is None:
+            return None
+        for property_id, value in properties.items():
+            if property_id.lower() in CODEC_THREADS_PROPERTIES:
+                self._stream.codec_context.thread_count = int(value)
+                continue
+            logger.warning(
+                f"Property {property_id} is not supported by PyAV frames producer - ignoring."
+            )
+
+    def discover_source_properties(self) -> SourceProperties:
+        fps = 0.0
+        if self._stream.average_rate is not None:
+            fps = float(self._stream.average_rate)
+        total_frames = self._stream.frames
+        if total_frames == 0 and not self._is_network_stream:
+            total_frames = _estimate_total_frames(stream=self._stream, fps=fps)
+        return SourceProperties(
+            width=self._stream.codec_context.width,
+            height=self._stream.codec_context.height,
+            total_frames=total_frames,
+            is_file=total_frames > 0,
+            fps=fps,
+        )
+
+    def release(self) -> None:
+        self._grabbed_frame = None
+        self._frames = None
+        self._release_container()
+
+    def _release_container(self) -> None:
+        if self._container is None:
+            return None
+        self._container.close()
+        self._container = None
+        self._stream = None
+
+    def _convert_i420_frame(self, frame: av.VideoFrame) -> np.ndarray:
+        height, width = frame.height, frame.width
+        if self._staging_buffer is None or self._staging_buffer.shape != (
+            height * 3 // 2,
+            width,
+        ):
+            self._staging_buffer = np.empty((height * 3 // 2, width), dtype=np.uint8)
+        staging = self._staging_buffer.reshape(-1)
+        offset = 0
+        for plane, (plane_height, plane_width) in zip(
+            frame.planes,
+            [(height, width), (height // 2, width // 2), (height // 2, width // 2)],
+        ):
+            plane_size = plane_height * plane_width
+            plane_view = np.frombuffer(plane, dtype=np.uint8).reshape(
+                -1, plane.line_size
+            )[:plane_height, :plane_width]
+            staging[offset : offset + plane_size].reshape(plane_height, plane_width)[
+                :
+            ] = plane_view
+            offset += plane_size
+        result = np.empty((height, width, 3), dtype=np.uint8)
+        cv2.cvtColor(self._staging_buffer, cv2.COLOR_YUV2BGR_I420, dst=result)
+        return result
+
+
+def _resolve_video_reference(video: Union[str, int]) -> str:
+    if isinstance(video, int):
+        return f"/dev/video{video}"
+    return video
+
+
+def _resolve_container_format(video: Union[str, int]) -> Optional[str]:
+    if isinstance(video, int) or video.startswith("/dev/video"):
+        return "v4l2"
+    return None
+
+
+def _prepare_container_options(
+    video: Union[str, int], low_latency: bool
+) -> Dict[str, str]:
+    options = {}
+    if isinstance(video, str) and video.lower().startswith("rtsp://"):
+        options.update(RTSP_CONTAINER_OPTIONS)
+    if low_latency:
+        options.update(LOW_LATENCY_CONTAINER_OPTIONS)
+    return options
+
+
+def _estimate_total_frames(stream: av.video.stream.VideoStream, fps: float) -> int:
+    if stream.duration is None or stream.time_base is None:
+        return 0
+    return int(round(float(stream.duration * stream.time_base) * fps))
@@ -15,6 +15,8 @@ from inference.core.env import (
     DEFAULT_ADAPTIVE_MODE_READER_PACE_TOLERANCE,
     DEFAULT_ADAPTIVE_MODE_STREAM_PACE_TOLERANCE,
     DEFAULT_BUFFER_SIZE,
+    DEFAULT_FRAME_MAX_DIMENSION,
+    DEFAULT_FRAME_PRODUCER_BACKEND,
     DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW,
     DEFAULT_MINIMUM_ADAPTIVE_MODE_SAMPLES,
     RUNS_ON_JETSON,
@@ -32,6 +34,10 @@ from inference.core.interfaces.camera.exceptions import (
     SourceConnectionError,
     StreamOperationNotAllowedError,
 )
+from inference.core.interfaces.camera.frames_registry import (
+    FullResolutionFramesRegistry,
+)
+from inference.core.interfaces.camera.pyav_producer import PyAVVideoFrameProducer
 
 VIDEO_SOURCE_CONTEXT = "video_source"
 VIDEO_CONSUMER_CONTEXT = "video_consumer"
@@ -106,6 +112,11 @@ class BufferConsumptionStrategy(Enum):
     EAGER = "EAGER"
 
 
+class VideoFrameProducerBackend(Enum):
+    CV2 = "cv2"
+    PYAV = "pyav"
+
+
 @dataclass(frozen=True)
 class SourceMetadata:
     source_properties: Optional[SourceProperties]
@@ -169,6 +180,15 @@ class CV2VideoFrameProducer(VideoFrameProducer):
         self.stream.release()
 
 
+def initialise_video_frame_producer(
+    video: Union[str, int],
+    backend: VideoFrameProducerBackend = VideoFrameProducerBackend.CV2,
+) -> VideoFrameProducer:
+    if backend is VideoFrameProducerBackend.PYAV:
+        return PyAVVideoFrameProducer(video)
+    return CV2VideoFrameProducer(video)
+
+
 def _consumes_camera_on_jetson(video: Union[str, int]) -> bool:
     if not RUNS_ON_JETSON:
         return False
@@ -192,6 +212,9 @@ class VideoSource:
         maximum_adaptive_frames_dropped_in_row: int = DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW,
         video_source_properties: Optional[Dict[str, float]] = None,
         source_id: Optional[int] = None,
+        frame_max_dimension: Optional[int] = DEFAULT_FRAME_MAX_DIMENSION,
+        full_resolution_frames_registry: Optional[FullResolutionFramesRegistry] = None,
+        frame_producer_backend: Optional[VideoFrameProducerBackend] = None,
     ):
         """
         This class is meant to represent abstraction over video sources - both video files and
@@ -277,6 +300,8 @@ class VideoSource:
         * VIDEO_SOURCE_ADAPTIVE_MODE_READER_PACE_TOLERANCE - default: 5.0
         * VIDEO_SOURCE_MINIMUM_ADAPTIVE_MODE_SAMPLES - default: 10
         * VIDEO_SOURCE_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW - default: 16
+        * VIDEO_SOURCE_FRAME_MAX_DIMENSION - default: None (frames not resized)
+        * VIDEO_SOURCE_FRAME_PRODUCER_BACKEND - default: cv2
 
         As an `inference` user, please use .init() method instead of constructor to instantiate objects.
 
@@ -301,10 +326,28 @@ class VideoSource:
             source_id (Optional[int]): Optional identifier of video source - mainly useful to recognise specific source
                 when multiple ones are in use. Identifier will be added to emitted frames and updates. It is advised
                 to keep it unique within all sources in use.
+            frame_max_dimension (Optional[int]): When given - frames with larger side exceeding this value are
+                downscaled (keeping aspect ratio) in decoding thread, right after decoding - such that buffers
+                and all further processing steps hold smaller frames. Ratio of resized to original size is
+                available as `VideoFrame.scaling_factor`. Useful when source resolution is much higher than input
+                size of models used. For camera devices, lower capture resolution may also be requested directly
+                via `video_source_properties` (`frame_width` and `frame_height`).
+            full_resolution_frames_registry (Optional[FullResolutionFramesRegistry]): Side channel retaining
+                original (not downscaled) frames - only for frames explicitly requested by consumers. Relevant
+                only when `frame_max_dimension` is set.
+            frame_producer_backend (Optional[VideoFrameProducerBackend]): Library used to decode video referenced
+                by str or int - `VideoFrameProducerBackend.CV2` (OpenCV) or `VideoFrameProducerBackend.PYAV`
+                (PyAV / FFmpeg, giving control over decoding threads, low-latency flags and using presentation
+                timestamps of frames as `VideoFrame.frame_timestamp`). Not relevant when callable producing
+                `VideoFrameProducer` is given as `video_reference`. Default taken from env.
 
         Returns: Instance of `VideoSource` class
         """
         frames_buffer = Queue(maxsize=buffer_size)
+        if frame_producer_backend is None:
+            frame_producer_backend = VideoFrameProducerBackend(
+                DEFAULT_FRAME_PRODUCER_BACKEND
+            )
         if status_update_handlers is None:
             status_update_handlers = []
         video_consumer = VideoConsumer.init(
@@ -314,6 +357,8 @@ class VideoSource:
             minimum_adaptive_mode_samples=minimum_adaptive_mode_samples,
             maximum_adaptive_frames_dropped_in_row=maximum_adaptive_frames_dropped_in_row,
             status_update_handlers=status_update_handlers,
+            frame_max_dimension=frame_max_dimension,
+            full_resolution_frames_registry=full_resolution_frames_registry,
         )
         return cls(
             stream_reference=video_reference,
@@ -323,6 +368,7 @@ class VideoSource:
             video_consumer=video_consumer,
             video_source_properties=video_source_properties,
             source_id=source_id,
+            frame_producer_backend=frame_producer_backend,
         )
 
     def __init__(
@@ -334,6 +380,7 @@ class VideoSource:
         video_consumer: "VideoConsumer",
         video_source_properties: Optional[Dict[str, float]],
         source_id: Optional[int],
+        frame_producer_backend: VideoFrameProducerBackend = VideoFrameProducerBackend.CV2,
     ):
         self._stream_reference = stream_reference
         self._video: Optional[VideoFrameProducer] = None
@@ -349,6 +396,7 @@ class VideoSource:
         self._state_change_lock = Lock()
         self._video_source_properties = video_source_properties or {}
         self._source_id = source_id
+        self._frame_producer_backend = frame_producer_backend
 
     @property
     def source_id(self) -> Optional[int]:
@@ -584,7 +632,10 @@ class VideoSource:
         if callable(self._stream_reference):
             self._video = self._stream_reference()
         else:
-            self._video = CV2VideoFrameProducer(self._stream_reference)
+            self._video = initialise_video_frame_producer(
+                video=self._stream_reference,
+                backend=self._frame_producer_backend,
+            )
         if not self._video.isOpened():
             self._change_state(target_state=StreamState.ERROR)
             raise SourceConnectionError(
@@ -750,6 +801,8 @@ class VideoConsumer:
         minimum_adaptive_mode_samples: int,
         maximum_adaptive_frames_dropped_in_row: int,
         status_update_handlers: List[Callable[[StatusUpdate], None]],
+        frame_max_dimension: Optional[int] = None,
+        full_resolution_frames_registry: Optional[FullResolutionFramesRegistry] = None,
     ) -> "VideoConsumer":
         minimum_adaptive_mode_samples = max(minimum_adaptive_mode_samples, 2)
         reader_pace_monitor = sv.FPSMonitor(
@@ -771,6 +824,8 @@ class VideoConsumer:
             reader_pace_monitor=reader_pace_monitor,
             stream_consumption_pace_monitor=stream_consumption_pace_monitor,
             decoding_pace_monitor=decoding_pace_monitor,
+            frame_max_dimension=frame_max_dimension,
+            full_resolution_frames_registry=full_resolution_frames_registry,
         )
 
     def __init__(
@@ -784,6 +839,8 @@ class VideoConsumer:
         reader_pace_monitor: sv.FPSMonitor,
         stream_consumption_pace_monitor: sv.FPSMonitor,
         decoding_pace_monitor: sv.FPSMonitor,
+        frame_max_dimension: Optional[int] = None,
+        full_resolution_frames_registry: Optional[FullResolutionFramesRegistry] = None,
     ):
         self._buffer_filling_strategy = buffer_filling_strategy
         self._frame_counter = 0
@@ -798,6 +855,8 @@ class VideoConsumer:
         self._stream_consumption_pace_monitor = stream_consumption_pace_monitor
         self._decoding_pace_monitor = decoding_pace_monitor
         self._status_update_handlers = status_update_handlers
+        self._frame_max_dimension = frame_max_dimension
+        self._full_resolution_frames_registry = full_resolution_frames_registry
 
     @property
     def buffer_filling_strategy(self) -> Optional[BufferFillingStrategy]:
@@ -833,6 +892,9 @@ class VideoConsumer:
         self._stream_consumption_pace_monitor.tick()
         if not success:
             return False
+        presentation_timestamp = retrieve_presentation_timestamp(video=video)
+        if presentation_timestamp is not None:
+            frame_timestamp = presentation_timestamp
         self._frame_counter += 1
         send_video_source_status_update(
             severity=UpdateSeverity.DEBUG,
@@ -910,6 +972,8 @@ class VideoConsumer:
                 source_id=source_id,
                 fps=declared_source_fps,
                 comes_from_video_file=is_source_video_file,
+                frame_max_dimension=self._frame_max_dimension,
+                full_resolution_frames_registry=self._full_resolution_frames_registry,
             )
         if self._buffer_filling_strategy in DROP_OLDEST_STRATEGIES:
             return self._process_stream_frame_dropping_oldest(
@@ -1002,6 +1066,8 @@ class VideoConsumer:
             decoding_pace_monitor=self._decoding_pace_monitor,
             source_id=source_id,
             comes_from_video_file=is_video_file,
+            frame_max_dimension=self._frame_max_dimension,
+            full_resolution_frames_registry=self._full_resolution_frames_registry,
         )
 
 
@@ -1109,11 +1175,22 @@ def decode_video_frame_to_buffer(
     source_id: Optional[int],
     fps: Optional[float] = None,
     comes_from_video_file: Optional[bool] = None,
+    frame_max_dimension: Optional[int] = None,
+    full_resolution_frames_registry: Optional[FullResolutionFramesRegistry] = None,
 ) -> bool:
     success, image = video.retrieve()
     if not success:
         return False
     decoding_pace_monitor.tick()
+    scaling_factor = None
+    if frame_max_dimension is not None:
+        if full_resolution_frames_registry is not None:
+            full_resolution_frames_registry.offer(
+                source_id=source_id, frame_id=frame_id, image=image
+            )
+        image, scaling_factor = downscale_frame(
+            image=image, max_dimension=frame_max_dimension
+        )
     video_frame = VideoFrame(
         image=image,
         frame_id=frame_id,
@@ -1121,11 +1198,41 @@ def decode_video_frame_to_buffer(
         fps=fps,
         source_id=source_id,
         comes_from_video_file=comes_from_video_file,
+        scaling_factor=scaling_factor,
     )
     buffer.put(video_frame)
     return True
 
 
+def downscale_frame(
+    image: ndarray, max_dimension: int
+) -> Tuple[ndarray, Optional[float]]:
+    """
+    Downscales frame (keeping aspect ratio) to make its larger side equal to `max_dimension`.
+    Frames not exceeding the limit are returned untouched.
+
+    Returns: tuple with frame and scaling factor (None if frame was not resized)
+    """
+    height, width = image.shape[:2]
+    larger_dimension = max(height, width)
+    if larger_dimension <= max_dimension:
+        return image, None
+    scaling_factor = max_dimension / larger_dimension
+    target_size = (
+        max(round(width * scaling_factor), 1),
+        max(round(height * scaling_factor), 1),
+    )
+    resized = cv2.resize(image, target_size, interpolation=cv2.INTER_AREA)
+    return resized, scaling_factor
+
+
+def retrieve_presentation_timestamp(video: VideoFrameProducer) -> Optional[datetime]:
+    if not isinstance(video, VideoFrameProducer):
+        # duck-typed producers are not obliged to provide timestamps
+        return None
+    return video.retrieve_presentation_timestamp()
+
+
 def get_fps_if_tick_happens_now(fps_monitor: sv.FPSMonitor) -> float:
     if len(fps_monitor.all_timestamps) == 0:
         return 0.0
@@ -1,8 +1,9 @@
+import asyncio
 import base64
 import os
 import traceback
 from functools import partial, wraps
-from time import sleep
+from time import perf_counter, sleep
 from typing import Any, Dict, List, Optional, Union
 
 import asgi_correlation_id
@@ -17,6 +18,12 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 from inference.core import logger
 from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
+from inference.core.embedding_index import embedding_index
+from inference.core.embedding_index.operations import (
+    add_images_to_collection,
+    get_collections_namespace,
+    search_collection,
+)
 from inference.core.entities.requests.clip import (
     ClipCompareRequest,
     ClipImageEmbeddingRequest,
@@ -24,6 +31,11 @@ from inference.core.entities.requests.clip import (
 )
 from inference.core.entities.requests.cogvlm import CogVLMInferenceRequest
 from inference.core.entities.requests.doctr import DoctrOCRInferenceRequest
+from inference.core.entities.requests.embedding_index import (
+    EmbeddingIndexAddRequest,
+    EmbeddingIndexDeleteRequest,
+    EmbeddingIndexSearchRequest,
+)
 from inference.core.entities.requests.gaze import GazeDetectionInferenceRequest
 from inference.core.entities.requests.groundingdino import GroundingDINOInferenceRequest
 from inference.core.entities.requests.inference import (
@@ -41,12 +53,14 @@ from inference.core.entities.requests.sam import (
     SamSegmentationRequest,
 )
 from inference.core.entities.requests.sam2 import (
+    Sam2BatchSegmentationRequest,
     Sam2EmbeddingRequest,
     Sam2SegmentationRequest,
 )
 from inference.core.entities.requests.server_state import (
     AddModelRequest,
     ClearModelRequest,
+    PrefetchModelsRequest,
 )
 from inference.core.entities.requests.trocr import TrOCRInferenceRequest
 from inference.core.entities.requests.workflows import (
@@ -64,6 +78,12 @@ from inference.core.entities.responses.clip import (
     ClipEmbeddingResponse,
 )
 from inference.core.entities.responses.cogvlm import CogVLMResponse
+from inference.core.entities.responses.embedding_index import (
+    EmbeddingIndexAddResponse,
+    EmbeddingIndexDeleteResponse,
+    EmbeddingIndexMatch,
+    EmbeddingIndexSearchResponse,
+)
 from inference.core.entities.responses.gaze import GazeDetectionInferenceResponse
 from inference.core.entities.responses.inference import (
     ClassificationInferenceResponse,
@@ -87,6 +107,7 @@ from inference.core.entities.responses.sam2 import (
 )
 from inference.core.entities.responses.server_state import (
     ModelsDescriptions,
+    ModelsPrefetchStatus,
     ServerVersionInfo,
 )
 from inference.core.entities.responses.workflows import (
@@ -113,6 +134,7 @@ from inference.core.env import (
     DEDICATED_DEPLOYMENT_WORKSPACE_URL,
     DISABLE_WORKFLOW_ENDPOINTS,
     DOCKER_SOCKET_PATH,
+    ENABLE_MODEL_TRACING,
     ENABLE_PROMETHEUS,
     ENABLE_STREAM_API,
     ENABLE_WORKFLOWS_PROFILING,
@@ -121,11 +143,14 @@ from inference.core.env import (
     LMM_ENABLED,
     METLO_KEY,
     METRICS_ENABLED,
+    METRICS_INTERVAL,
     NOTEBOOK_ENABLED,
     NOTEBOOK_PASSWORD,
     NOTEBOOK_PORT,
+    PREFETCH_MODELS,
     PROFILE,
     ROBOFLOW_SERVICE_SECRET,
+    WORKFLOWS_COMPILED_WORKFLOWS_CACHE_SIZE,
     WORKFLOWS_MAX_CONCURRENT_STEPS,
     WORKFLOWS_PROFILER_BUFFER_SIZE,
     WORKFLOWS_STEP_EXECUTION_MODE,
@@ -133,8 +158,10 @@ from inference.core.env import (
 from inference.core.exceptions import (
     ContentTypeInvalid,
     ContentTypeMissing,
+    EmbeddingCollectionNotFoundError,
     InferenceModelNotFound,
     InputImageLoadError,
+    InvalidEmbeddingIndexRequestError,
     InvalidEnvironmentVariableError,
     InvalidMaskDecodeArgument,
     InvalidModelIDError,
@@ -144,6 +171,7 @@ from inference.core.exceptions import (
     MissingServiceSecretError,
     ModelArtefactError,
     OnnxProviderNotAvailable,
+    OwlV2PromptSetNotFoundError,
     PostProcessingError,
     PreProcessingError,
     RoboflowAPIConnectionError,
@@ -189,8 +217,11 @@ from inference.core.interfaces.stream_manager.manager_app.errors import (
     MessageToBigError,
 )
 from inference.core.managers.base import ModelManager
+from inference.core.managers.inference_metrics import InferenceStage, inference_metrics
 from inference.core.managers.metrics import get_container_stats
+from inference.core.managers.prefetch import ModelsPrefetcher
 from inference.core.managers.prometheus import InferenceInstrumentator
+from inference.core.models.tracing import model_tracer
 from inference.core.roboflow_api import (
     get_roboflow_dataset_type,
     get_roboflow_workspace,
@@ -227,6 +258,9 @@ from inference.core.workflows.execution_engine.profiling.core import (
     NullWorkflowsProfiler,
     WorkflowsProfiler,
 )
+from inference.core.workflows.execution_engine.v1.compiler.cache import (
+    CompiledWorkflowsCache,
+)
 from inference.core.workflows.execution_engine.v1.compiler.syntactic_parser import (
     get_workflow_schema_description,
     parse_workflow_definition,
@@ -288,6 +322,11 @@ def with_route_exceptions(route):
                 content={"message": "Invalid Model ID sent in request."},
             )
             traceback.print_exc()
+        except InvalidEmbeddingIndexRequestError as error:
+            resp = JSONResponse(
+                status_code=400,
+                content={"message": str(error)},
+            )
         except InvalidMaskDecodeArgument:
             resp = JSONResponse(
                 status_code=400,
@@ -360,6 +399,11 @@ def with_route_exceptions(route):
                 },
             )
             traceback.print_exc()
+        except (EmbeddingCollectionNotFoundError, OwlV2PromptSetNotFoundError) as error:
+            resp = JSONResponse(
+                status_code=404,
+                content={"message": str(error)},
+            )
         except ProcessesManagerNotFoundError as error:
             resp = JSONResponse(
                 status_code=404,
@@ -583,8 +627,29 @@ class HttpInterface(BaseInterface):
                 container_stats = get_container_stats(
                     docker_socket_path=DOCKER_SOCKET_PATH
                 )
+                container_stats["inference_metrics"] = inference_metrics.to_dict(
+                    window=METRICS_INTERVAL
+                )
                 return JSONResponse(status_code=200, content=container_stats)
 
+        if ENABLE_MODEL_TRACING:
+
+            @app.get(
+                "/debug/model_traces",
+                summary="Model traces",
+                description="Get traces of recent model inference requests in Chrome trace format",
+            )
+            async def model_traces(
+                trace_id: Optional[str] = Query(
+                    None,
+                    description="Identifier of the request trace (inference request id) - all buffered traces are returned if not given",
+                ),
+            ):
+                return JSONResponse(
+                    status_code=200,
+                    content=model_tracer.export_trace(trace_id=trace_id),
+                )
+
         if DEDICATED_DEPLOYMENT_WORKSPACE_URL:
             cached_api_keys = dict()
             cached_projects = dict()
@@ -672,6 +737,13 @@ class HttpInterface(BaseInterface):
 
         self.app = app
         self.model_manager = model_manager
+        self.models_prefetcher: Optional[ModelsPrefetcher] = None
+        self.compiled_workflows_cache: Optional[CompiledWorkflowsCache] = None
+        if WORKFLOWS_COMPILED_WORKFLOWS_CACHE_SIZE > 0:
+            self.compiled_workflows_cache = CompiledWorkflowsCache(
+                cache_size=WORKFLOWS_COMPILED_WORKFLOWS_CACHE_SIZE,
+                request_scoped_init_parameters=["workflows_core.background_tasks"],
+            )
         self.stream_manager_client: Optional[StreamManagerClient] = None
 
         if ENABLE_STREAM_API:
@@ -702,7 +774,10 @@ class HttpInterface(BaseInterface):
             resp = await self.model_manager.infer_from_request(
                 de_aliased_model_id, inference_request, **kwargs
             )
-            return orjson_response(resp)
+            with inference_metrics.stage_timer(
+                InferenceStage.SERIALISE, model_id=de_aliased_model_id
+            ):
+                return orjson_response(resp)
 
         def process_workflow_inference_request(
             workflow_request: WorkflowInferenceRequest,
@@ -721,6 +796,7 @@ class HttpInterface(BaseInterface):
                 max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
                 prevent_local_images_loading=True,
                 profiler=profiler,
+                compiled_workflows_cache=self.compiled_workflows_cache,
             )
             result = execution_engine.run(runtime_parameters=workflow_request.inputs)
             with profiler.profile_execution_phase(
@@ -854,6 +930,49 @@ class HttpInterface(BaseInterface):
         The TrOCR model ID.
         """
 
+        def create_models_prefetcher() -> ModelsPrefetcher:
+            event_loop = asyncio.get_running_loop()
+
+            async def add_model(model_id: str, api_key: Optional[str]) -> None:
+                self.model_manager.add_model(model_id, api_key)
+
+            def load_model(model_id: str, api_key: Optional[str]) -> None:
+                # model managers are not thread-safe - models are loaded on the event loop,
+                # alongside the ones added by requests
+                asyncio.run_coroutine_threadsafe(
+                    add_model(model_id=model_id, api_key=api_key), event_loop
+                ).result()
+
+            return ModelsPrefetcher(
+                model_manager=self.model_manager, model_loader=load_model
+            )
+
+        if PREFETCH_MODELS:
+
+            @app.on_event("startup")
+            async def prefetch_models_on_startup():
+                logger.info(f"Prefetching models: {PREFETCH_MODELS}")
+                self.models_prefetcher = create_models_prefetcher()
+                self.models_prefetcher.prefetch_in_background(model_ids=PREFETCH_MODELS)
+
+        @app.get(
+            "/readiness",
+            summary="Readiness",
+            description="Check whether the server is ready to serve requests - "
+            "which is after models requested to be prefetched are loaded",
+        )
+        async def readiness():
+            """Endpoint to check whether the server is ready.
+
+            Returns:
+                JSONResponse: Status 200 if the server is ready, 503 otherwise.
+            """
+            if self.models_prefetcher is not None and not (
+                self.models_prefetcher.is_ready()
+            ):
+                return JSONResponse(status_code=503, content={"status": "not ready"})
+            return JSONResponse(status_code=200, content={"status": "ready"})
+
         @app.get(
             "/info",
             response_model=ServerVersionInfo,
@@ -919,6 +1038,54 @@ class HttpInterface(BaseInterface):
                     models_descriptions=models_descriptions
                 )
 
+            @app.post(
+                "/model/prefetch",
+                response_model=ModelsPrefetchStatus,
+                summary="Prefetch models",
+                description="Download artefacts of models with given IDs (and load the models) "
+                "in the background",
+            )
+            @with_route_exceptions
+            async def model_prefetch(request: PrefetchModelsRequest):
+                """Start prefetching models with given IDs in the background.
+
+                Args:
+                    request (PrefetchModelsRequest): The request containing model IDs and optional API key.
+
+                Returns:
+                    ModelsPrefetchStatus: The object containing states of prefetched models
+                """
+                logger.debug(f"Reached /model/prefetch")
+                if self.models_prefetcher is None:
+                    self.models_prefetcher = create_models_prefetcher()
+                self.models_prefetcher.prefetch_in_background(
+                    model_ids=request.model_ids, api_key=request.api_key
+                )
+                return ModelsPrefetchStatus.from_models_prefetch_states(
+                    ready=self.models_prefetcher.is_ready(),
+                    models_prefetch_states=self.models_prefetcher.describe(),
+                )
+
+            @app.get(
+                "/model/prefetch",
+                response_model=ModelsPrefetchStatus,
+                summary="Get status of prefetched models",
+                description="Get states of models requested to be prefetched",
+            )
+            async def model_prefetch_status():
+                """Get states of models requested to be prefetched.
+
+                Returns:
+                    ModelsPrefetchStatus: The object containing states of prefetched models
+                """
+                logger.debug(f"Reached /model/prefetch")
+                if self.models_prefetcher is None:
+                    return ModelsPrefetchStatus(ready=True, models=[])
+                return ModelsPrefetchStatus.from_models_prefetch_states(
+                    ready=self.models_prefetcher.is_ready(),
+                    models_prefetch_states=self.models_prefetcher.describe(),
+                )
+
             @app.post(
                 "/model/remove",
                 response_model=ModelsDescriptions,
@@ -953,13 +1120,15 @@ class HttpInterface(BaseInterface):
             )
             @with_route_exceptions
             async def model_clear():
-                """Remove all loaded models from the model manager.
+                """Remove all loaded models from the model manager (dropping cached compiled workflows as well).
 
                 Returns:
                     ModelsDescriptions: The object containing models descriptions
                 """
                 logger.debug(f"Reached /model/clear")
                 self.model_manager.clear()
+                if self.compiled_workflows_cache is not None:
+                    self.compiled_workflows_cache.invalidate()
                 models_descriptions = self.model_manager.describe_models()
                 return ModelsDescriptions.from_models_descriptions(
                     models_descriptions=models_descriptions
@@ -1560,6 +1729,168 @@ class HttpInterface(BaseInterface):
                         trackUsage(clip_model_id, actor, n=2)
                     return response
 
+                # embedding index keeps state of the server, hence it is not exposed in
+                # lambda deployments
+                if not LAMBDA:
+
+                    @app.post(
+                        "/embedding_index/add",
+                        response_model=EmbeddingIndexAddResponse,
+                        summary="Embedding Index Add",
+                        description="Embed images with CLIP and add them to collection of local embedding index.",
+                    )
+                    @with_route_exceptions
+                    async def embedding_index_add(
+                        inference_request: EmbeddingIndexAddRequest,
+                        request: Request,
+                        api_key: Optional[str] = Query(
+                            None,
+                            description="Roboflow API Key that will be passed to the model during initialization for artifact retrieval",
+                        ),
+                    ):
+                        """
+                        Embeds images with the OpenAI CLIP model and adds embeddings to collection of local
+                        embedding index (created if it does not exist).
+
+                        Args:
+                            inference_request (EmbeddingIndexAddRequest): The request containing the images to be added.
+                            api_key (Optional[str], default None): Roboflow API Key passed to the model during initialization for artifact retrieval.
+                            request (Request, default Body()): The HTTP request.
+
+                        Returns:
+                            EmbeddingIndexAddResponse: The response containing ids of added embeddings.
+                        """
+                        logger.debug(f"Reached /embedding_index/add")
+                        t1 = perf_counter()
+                        clip_model_id = load_clip_model(
+                            inference_request, api_key=api_key
+                        )
+                        namespace = get_collections_namespace(
+                            api_key=inference_request.api_key
+                        )
+                        images = inference_request.image
+                        collection, ids = add_images_to_collection(
+                            embedding_index=embedding_index,
+                            clip_model=self.model_manager[clip_model_id],
+                            collection_name=inference_request.collection,
+                            images=images if isinstance(images, list) else [images],
+                            ids=inference_request.ids,
+                            namespace=namespace,
+                        )
+                        return EmbeddingIndexAddResponse(
+                            collection=collection.name,
+                            ids=ids,
+                            size=len(collection),
+                            time=perf_counter() - t1,
+                        )
+
+                    @app.post(
+                        "/embedding_index/search",
+                        response_model=EmbeddingIndexSearchResponse,
+                        summary="Embedding Index Search",
+                        description="Find embeddings of collection of local embedding index closest to CLIP embeddings of images or texts.",
+                    )
+                    @with_route_exceptions
+                    async def embedding_index_search(
+                        inference_request: EmbeddingIndexSearchRequest,
+                        request: Request,
+                        api_key: Optional[str] = Query(
+                            None,
+                            description="Roboflow API Key that will be passed to the model during initialization for artifact retrieval",
+                        ),
+                    ):
+                        """
+                        Finds embeddings of collection of local embedding index closest to the OpenAI CLIP
+                        embeddings of query images (or texts).
+
+                        Args:
+                            inference_request (EmbeddingIndexSearchRequest): The request containing the queries.
+                            api_key (Optional[str], default None): Roboflow API Key passed to the model during initialization for artifact retrieval.
+                            request (Request, default Body()): The HTTP request.
+
+                        Returns:
+                            EmbeddingIndexSearchResponse: The response containing matches of each query.
+                        """
+                        logger.debug(f"Reached /embedding_index/search")
+                        t1 = perf_counter()
+                        clip_model_id = load_clip_model(
+                            inference_request, api_key=api_key
+                        )
+                        namespace = get_collections_namespace(
+                            api_key=inference_request.api_key
+                        )
+                        images, texts = inference_request.image, inference_request.text
+                        matches = search_collection(
+                            embedding_index=embedding_index,
+                            clip_model=self.model_manager[clip_model_id],
+                            collection_name=inference_request.collection,
+                            images=(
+                                images
+                                if isinstance(images, list) or images is None
+                                else [images]
+                            ),
+                            texts=(
+                                texts
+                                if isinstance(texts, list) or texts is None
+                                else [texts]
+                            ),
+                            top_k=inference_request.top_k,
+                            exact=inference_request.exact,
+                            min_similarity=inference_request.min_similarity,
+                            namespace=namespace,
+                        )
+                        return EmbeddingIndexSearchResponse(
+                            collection=inference_request.collection,
+                            matches=[
+                                [
+                                    EmbeddingIndexMatch(
+                                        id=match.id, similarity=match.similarity
+                                    )
+                                    for match in query_matches
+                                ]
+                                for query_matches in matches
+                            ],
+                            time=perf_counter() - t1,
+                        )
+
+                    @app.post(
+                        "/embedding_index/delete",
+                        response_model=EmbeddingIndexDeleteResponse,
+                        summary="Embedding Index Delete",
+                        description="Delete embeddings from collection of local embedding index.",
+                    )
+                    @with_route_exceptions
+                    async def embedding_index_delete(
+                        inference_request: EmbeddingIndexDeleteRequest,
+                        api_key: Optional[str] = Query(
+                            None,
+                            description="Roboflow API Key identifying workspace the collection belongs to",
+                        ),
+                    ):
+                        """
+                        Deletes embeddings from collection of local embedding index.
+
+                        Args:
+                            inference_request (EmbeddingIndexDeleteRequest): The request containing ids of embeddings to be deleted.
+                            api_key (Optional[str], default None): Roboflow API Key identifying workspace the collection belongs to.
+
+                        Returns:
+                            EmbeddingIndexDeleteResponse: The response containing number of deleted embeddings.
+                        """
+                        logger.debug(f"Reached /embedding_index/delete")
+                        namespace = get_collections_namespace(
+                            api_key=api_key or inference_request.api_key
+                        )
+                        collection = embedding_index.get_collection(
+                            name=inference_request.collection, namespace=namespace
+                        )
+                        deleted = collection.delete(ids=inference_request.ids)
+                        return EmbeddingIndexDeleteResponse(
+                            collection=collection.name,
+                            deleted=deleted,
+                            size=len(collection),
+                        )
+
             if CORE_MODEL_GROUNDINGDINO_ENABLED:
 
                 @app.post(
@@ -1851,6 +2182,39 @@ class HttpInterface(BaseInterface):
                         )
                     return model_response
 
+                @app.post(
+                    "/sam2/segment_images",
+                    response_model=List[Sam2SegmentationResponse],
+                    summary="SAM2 Batch Image Segmentation",
+                    description="Run the Meta AI Segment Anything 2 Model to generate segmentations for batch of images, each with its own prompts.",
+                )
+                @with_route_exceptions
+                async def sam2_segment_images(
+                    inference_request: Sam2BatchSegmentationRequest,
+                    request: Request,
+                    api_key: Optional[str] = Query(
+                        None,
+                        description="Roboflow API Key that will be passed to the model during initialization for artifact retrieval",
+                    ),
+                ):
+                    """
+                    Generates segmentations for batch of images using the Meta AI Segment Anything 2 Model - images are
+                    embedded together and prompts of each image are decoded together.
+
+                    Args:
+                        inference_request (Sam2BatchSegmentationRequest): The request containing the images to be segmented.
+                        api_key (Optional[str], default None): Roboflow API Key passed to the model during initialization for artifact retrieval.
+                        request (Request, default Body()): The HTTP request.
+
+                    Returns:
+                        List[Sam2SegmentationResponse]: The response for each of images.
+                    """
+                    logger.debug(f"Reached /sam2/segment_images")
+                    sam2_model_id = load_sam2_model(inference_request, api_key=api_key)
+                    return await self.model_manager.infer_from_request(
+                        sam2_model_id, inference_request
+                    )
+
             if CORE_MODEL_OWLV2_ENABLED:
 
                 @app.post(
@@ -15,6 +15,8 @@ from inference.core.cache import cache
 from inference.core.env import (
     ACTIVE_LEARNING_ENABLED,
     API_KEY,
+    DEFAULT_FRAME_MAX_DIMENSION,
+    DEFAULT_SOURCE_DECODING_PROCESSES,
     DISABLE_PREPROC_AUTO_ORIENT,
     ENABLE_WORKFLOWS_PROFILING,
     MAX_ACTIVE_MODELS,
@@ -22,16 +24,23 @@ from inference.core.env import (
     WORKFLOWS_PROFILER_BUFFER_SIZE,
 )
 from inference.core.exceptions import CannotInitialiseModelError, MissingApiKeyError
+from inference.core.interfaces.camera.decoding_processes import (
+    VideoDecodingProcessPool,
+)
 from inference.core.interfaces.camera.entities import (
     StatusUpdate,
     UpdateSeverity,
     VideoFrame,
     VideoSourceIdentifier,
 )
+from inference.core.interfaces.camera.frames_registry import (
+    FullResolutionFramesRegistry,
+)
 from inference.core.interfaces.camera.utils import multiplex_videos
 from inference.core.interfaces.camera.video_source import (
     BufferConsumptionStrategy,
     BufferFillingStrategy,
+    VideoFrameProducerBackend,
     VideoSource,
 )
 from inference.core.interfaces.stream.entities import (
@@ -47,6 +56,7 @@ from inference.core.interfaces.stream.sinks import active_learning_sink, multi_s
 from inference.core.interfaces.stream.utils import (
     on_pipeline_end,
     prepare_video_sources,
+    wrap_in_list,
 )
 from inference.core.interfaces.stream.watchdog import (
     NullPipelineWatchdog,
@@ -107,6 +117,10 @@ class InferencePipeline:
         active_learning_target_dataset: Optional[str] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        source_decoding_processes: Optional[int] = DEFAULT_SOURCE_DECODING_PROCESSES,
+        source_frame_max_dimension: Optional[int] = DEFAULT_FRAME_MAX_DIMENSION,
+        full_resolution_frames_registry: Optional[FullResolutionFramesRegistry] = None,
+        source_frame_producer_backend: Optional[VideoFrameProducerBackend] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from Roboflow models against video stream.
@@ -203,6 +217,23 @@ class InferencePipeline:
                 to grab frames from multiple sources can wait for batch to be filled before yielding already collected
                 frames. Please set this value in PRODUCTION to avoid performance drops when specific sources shows
                 unstable latency. Visit `multiplex_videos(...)` for more information about multiplexing process.
+            source_decoding_processes (Optional[int]): Number of worker processes to decode video sources with.
+                If not given (default, unless `VIDEO_SOURCE_DECODING_PROCESSES` env is set) - each source is decoded
+                by separate thread of the main process. When given - sources are sharded across pool of decoding
+                processes and frames are passed back through shared memory, which saves the main process from GIL
+                contention when large number of streams is consumed. Custom frames producers (callables passed
+                as `video_reference`) are always decoded in the main process.
+            source_frame_max_dimension (Optional[int]): When given - video frames are downscaled right after decoding,
+                such that their larger side does not exceed this value - saving memory and copying in all buffers
+                of the pipeline. Predictions are made against downscaled frames, `VideoFrame.scaling_factor` can be
+                used to express them in original resolution. Default: `VIDEO_SOURCE_FRAME_MAX_DIMENSION` env or None.
+            full_resolution_frames_registry (Optional[FullResolutionFramesRegistry]): Side channel that sinks may
+                use to request and retrieve original resolution of selected frames when `source_frame_max_dimension`
+                is in use.
+            source_frame_producer_backend (Optional[VideoFrameProducerBackend]): Library used to decode video
+                sources - `VideoFrameProducerBackend.CV2` (OpenCV) or `VideoFrameProducerBackend.PYAV` (PyAV, with
+                configurable codec threads, low-latency flags for streams and frames timestamped with their
+                presentation timestamps). Default: `VIDEO_SOURCE_FRAME_PRODUCER_BACKEND` env or "cv2".
             sink_mode (SinkMode): Parameter that controls how video frames and predictions will be passed to sink
                 handler. With SinkMode.SEQUENTIAL - each frame and prediction triggers separate call for sink,
                 in case of SinkMode.BATCH - list of frames and predictions will be provided to sink, always aligned
@@ -289,6 +320,10 @@ class InferencePipeline:
             source_buffer_consumption_strategy=source_buffer_consumption_strategy,
             video_source_properties=video_source_properties,
             batch_collection_timeout=batch_collection_timeout,
+            source_decoding_processes=source_decoding_processes,
+            source_frame_max_dimension=source_frame_max_dimension,
+            full_resolution_frames_registry=full_resolution_frames_registry,
+            source_frame_producer_backend=source_frame_producer_backend,
             sink_mode=sink_mode,
         )
 
@@ -312,6 +347,10 @@ class InferencePipeline:
         video_source_properties: Optional[Dict[str, float]] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        source_decoding_processes: Optional[int] = DEFAULT_SOURCE_DECODING_PROCESSES,
+        source_frame_max_dimension: Optional[int] = DEFAULT_FRAME_MAX_DIMENSION,
+        full_resolution_frames_registry: Optional[FullResolutionFramesRegistry] = None,
+        source_frame_producer_backend: Optional[VideoFrameProducerBackend] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from YoloWorld against video stream.
@@ -367,6 +406,23 @@ class InferencePipeline:
                 to grab frames from multiple sources can wait for batch to be filled before yielding already collected
                 frames. Please set this value in PRODUCTION to avoid performance drops when specific sources shows
                 unstable latency. Visit `multiplex_videos(...)` for more information about multiplexing process.
+            source_decoding_processes (Optional[int]): Number of worker processes to decode video sources with.
+                If not given (default, unless `VIDEO_SOURCE_DECODING_PROCESSES` env is set) - each source is decoded
+                by separate thread of the main process. When given - sources are sharded across pool of decoding
+                processes and frames are passed back through shared memory, which saves the main process from GIL
+                contention when large number of streams is consumed. Custom frames producers (callables passed
+                as `video_reference`) are always decoded in the main process.
+            source_frame_max_dimension (Optional[int]): When given - video frames are downscaled right after decoding,
+                such that their larger side does not exceed this value - saving memory and copying in all buffers
+                of the pipeline. Predictions are made against downscaled frames, `VideoFrame.scaling_factor` can be
+                used to express them in original resolution. Default: `VIDEO_SOURCE_FRAME_MAX_DIMENSION` env or None.
+            full_resolution_frames_registry (Optional[FullResolutionFramesRegistry]): Side channel that sinks may
+                use to request and retrieve original resolution of selected frames when `source_frame_max_dimension`
+                is in use.
+            source_frame_producer_backend (Optional[VideoFrameProducerBackend]): Library used to decode video
+                sources - `VideoFrameProducerBackend.CV2` (OpenCV) or `VideoFrameProducerBackend.PYAV` (PyAV, with
+                configurable codec threads, low-latency flags for streams and frames timestamped with their
+                presentation timestamps). Default: `VIDEO_SOURCE_FRAME_PRODUCER_BACKEND` env or "cv2".
             sink_mode (SinkMode): Parameter that controls how video frames and predictions will be passed to sink
                 handler. With SinkMode.SEQUENTIAL - each frame and prediction triggers separate call for sink,
                 in case of SinkMode.BATCH - list of frames and predictions will be provided to sink, always aligned
@@ -425,6 +481,10 @@ class InferencePipeline:
             source_buffer_consumption_strategy=source_buffer_consumption_strategy,
             video_source_properties=video_source_properties,
             batch_collection_timeout=batch_collection_timeout,
+            source_decoding_processes=source_decoding_processes,
+            source_frame_max_dimension=source_frame_max_dimension,
+            full_resolution_frames_registry=full_resolution_frames_registry,
+            source_frame_producer_backend=source_frame_producer_backend,
             sink_mode=sink_mode,
         )
 
@@ -456,6 +516,10 @@ class InferencePipeline:
         batch_collection_timeout: Optional[float] = None,
         profiling_directory: str = "./inference_profiling",
         use_workflow_definition_cache: bool = True,
+        source_decoding_processes: Optional[int] = DEFAULT_SOURCE_DECODING_PROCESSES,
+        source_frame_max_dimension: Optional[int] = DEFAULT_FRAME_MAX_DIMENSION,
+        full_resolution_frames_registry: Optional[FullResolutionFramesRegistry] = None,
+        source_frame_producer_backend: Optional[VideoFrameProducerBackend] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from given workflow against video stream.
@@ -518,6 +582,23 @@ class InferencePipeline:
                 to grab frames from multiple sources can wait for batch to be filled before yielding already collected
                 frames. Please set this value in PRODUCTION to avoid performance drops when specific sources shows
                 unstable latency. Visit `multiplex_videos(...)` for more information about multiplexing process.
+            source_decoding_processes (Optional[int]): Number of worker processes to decode video sources with.
+                If not given (default, unless `VIDEO_SOURCE_DECODING_PROCESSES` env is set) - each source is decoded
+                by separate thread of the main process. When given - sources are sharded across pool of decoding
+                processes and frames are passed back through shared memory, which saves the main process from GIL
+                contention when large number of streams is consumed. Custom frames producers (callables passed
+                as `video_reference`) are always decoded in the main process.
+            source_frame_max_dimension (Optional[int]): When given - video frames are downscaled right after decoding,
+                such that their larger side does not exceed this value - saving memory and copying in all buffers
+                of the pipeline. Predictions are made against downscaled frames, `VideoFrame.scaling_factor` can be
+                used to express them in original resolution. Default: `VIDEO_SOURCE_FRAME_MAX_DIMENSION` env or None.
+            full_resolution_frames_registry (Optional[FullResolutionFramesRegistry]): Side channel that sinks may
+                use to request and retrieve original resolution of selected frames when `source_frame_max_dimension`
+                is in use.
+            source_frame_producer_backend (Optional[VideoFrameProducerBackend]): Library used to decode video
+                sources - `VideoFrameProducerBackend.CV2` (OpenCV) or `VideoFrameProducerBackend.PYAV` (PyAV, with
+                configurable codec threads, low-latency flags for streams and frames timestamped with their
+                presentation timestamps). Default: `VIDEO_SOURCE_FRAME_PRODUCER_BACKEND` env or "cv2".
             profiling_directory (str): Directory where workflows profiler traces will be dumped. To enable profiling
                 export `ENABLE_WORKFLOWS_PROFILING=True` environmental variable. You may specify number of workflow
                 runs in a buffer with environmental variable `WORKFLOWS_PROFILER_BUFFER_SIZE=n` - making last `n`
@@ -639,6 +720,10 @@ class InferencePipeline:
             source_buffer_consumption_strategy=source_buffer_consumption_strategy,
             video_source_properties=video_source_properties,
             batch_collection_timeout=batch_collection_timeout,
+            source_decoding_processes=source_decoding_processes,
+            source_frame_max_dimension=source_frame_max_dimension,
+            full_resolution_frames_registry=full_resolution_frames_registry,
+            source_frame_producer_backend=source_frame_producer_backend,
         )
 
     @classmethod
@@ -657,6 +742,10 @@ class InferencePipeline:
         video_source_properties: Optional[Dict[str, float]] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        source_decoding_processes: Optional[int] = DEFAULT_SOURCE_DECODING_PROCESSES,
+        source_frame_max_dimension: Optional[int] = DEFAULT_FRAME_MAX_DIMENSION,
+        full_resolution_frames_registry: Optional[FullResolutionFramesRegistry] = None,
+        source_frame_producer_backend: Optional[VideoFrameProducerBackend] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from given workflow against video stream.
@@ -707,6 +796,23 @@ class InferencePipeline:
                 to grab frames from multiple sources can wait for batch to be filled before yielding already collected
                 frames. Please set this value in PRODUCTION to avoid performance drops when specific sources shows
                 unstable latency. Visit `multiplex_videos(...)` for more information about multiplexing process.
+            source_decoding_processes (Optional[int]): Number of worker processes to decode video sources with.
+                If not given (default, unless `VIDEO_SOURCE_DECODING_PROCESSES` env is set) - each source is decoded
+                by separate thread of the main process. When given - sources are sharded across pool of decoding
+                processes and frames are passed back through shared memory, which saves the main process from GIL
+                contention when large number of streams is consumed. Custom frames producers (callables passed
+                as `video_reference`) are always decoded in the main process.
+            source_frame_max_dimension (Optional[int]): When given - video frames are downscaled right after decoding,
+                such that their larger side does not exceed this value - saving memory and copying in all buffers
+                of the pipeline. Predictions are made against downscaled frames, `VideoFrame.scaling_factor` can be
+                used to express them in original resolution. Default: `VIDEO_SOURCE_FRAME_MAX_DIMENSION` env or None.
+            full_resolution_frames_registry (Optional[FullResolutionFramesRegistry]): Side channel that sinks may
+                use to request and retrieve original resolution of selected frames when `source_frame_max_dimension`
+                is in use.
+            source_frame_producer_backend (Optional[VideoFrameProducerBackend]): Library used to decode video
+                sources - `VideoFrameProducerBackend.CV2` (OpenCV) or `VideoFrameProducerBackend.PYAV` (PyAV, with
+                configurable codec threads, low-latency flags for streams and frames timestamped with their
+                presentation timestamps). Default: `VIDEO_SOURCE_FRAME_PRODUCER_BACKEND` env or "cv2".
             sink_mode (SinkMode): Parameter that controls how video frames and predictions will be passed to sink
                 handler. With SinkMode.SEQUENTIAL - each frame and prediction triggers separate call for sink,
                 in case of SinkMode.BATCH - list of frames and predictions will be provided to sink, always aligned
@@ -735,12 +841,24 @@ class InferencePipeline:
         if status_update_handlers is None:
             status_update_handlers = []
         status_update_handlers.append(watchdog.on_status_update)
+        decoding_processes_pool = None
+        if source_decoding_processes is not None:
+            decoding_processes_pool = VideoDecodingProcessPool.init(
+                workers=min(
+                    source_decoding_processes,
+                    len(wrap_in_list(element=video_reference)),
+                ),
+            )
         video_sources = prepare_video_sources(
             video_reference=video_reference,
             video_source_properties=video_source_properties,
             status_update_handlers=status_update_handlers,
             source_buffer_filling_strategy=source_buffer_filling_strategy,
             source_buffer_consumption_strategy=source_buffer_consumption_strategy,
+            decoding_processes_pool=decoding_processes_pool,
+            frame_max_dimension=source_frame_max_dimension,
+            full_resolution_frames_registry=full_resolution_frames_registry,
+            frame_producer_backend=source_frame_producer_backend,
         )
         watchdog.register_video_sources(video_sources=video_sources)
         predictions_queue = Queue(maxsize=PREDICTIONS_QUEUE_SIZE)
@@ -756,6 +874,7 @@ class InferencePipeline:
             on_pipeline_end=on_pipeline_end,
             batch_collection_timeout=batch_collection_timeout,
             sink_mode=sink_mode,
+            decoding_processes_pool=decoding_processes_pool,
         )
 
     def __init__(
@@ -771,6 +890,7 @@ class InferencePipeline:
         max_fps: Optional[float] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        decoding_processes_pool: Optional[VideoDecodingProcessPool] = None,
     ):
         self._on_video_frame = on_video_frame
         self._video_sources = video_sources
@@ -788,6 +908,7 @@ class InferencePipeline:
         self._on_pipeline_end = on_pipeline_end
         self._batch_collection_timeout = batch_collection_timeout
         self._sink_mode = sink_mode
+        self._decoding_processes_pool = decoding_processes_pool
 
     def start(self, use_main_thread: bool = True) -> None:
         self._stop = False
@@ -830,6 +951,8 @@ class InferencePipeline:
         if self._dispatching_thread is not None:
             self._dispatching_thread.join()
             self._dispatching_thread = None
+        if self._decoding_processes_pool is not None:
+            self._decoding_processes_pool.shutdown()
         if self._on_pipeline_end is not None:
             self._on_pipeline_end()
 
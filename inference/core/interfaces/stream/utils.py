@@ -4,14 +4,25 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Callable, Dict, List, Optional, TypeVar, Union
 
-from inference.core.env import ENABLE_WORKFLOWS_PROFILING
+from inference.core.env import (
+    DEFAULT_FRAME_MAX_DIMENSION,
+    DEFAULT_FRAME_PRODUCER_BACKEND,
+    ENABLE_WORKFLOWS_PROFILING,
+)
+from inference.core.interfaces.camera.decoding_processes import (
+    VideoDecodingProcessPool,
+)
 from inference.core.interfaces.camera.entities import (
     StatusUpdate,
     VideoSourceIdentifier,
 )
+from inference.core.interfaces.camera.frames_registry import (
+    FullResolutionFramesRegistry,
+)
 from inference.core.interfaces.camera.video_source import (
     BufferConsumptionStrategy,
     BufferFillingStrategy,
+    VideoFrameProducerBackend,
     VideoSource,
 )
 from inference.core.workflows.execution_engine.profiling.core import WorkflowsProfiler
@@ -27,6 +38,10 @@ def prepare_video_sources(
     status_update_handlers: Optional[List[Callable[[StatusUpdate], None]]],
     source_buffer_filling_strategy: Optional[BufferFillingStrategy],
     source_buffer_consumption_strategy: Optional[BufferConsumptionStrategy],
+    decoding_processes_pool: Optional[VideoDecodingProcessPool] = None,
+    frame_max_dimension: Optional[int] = DEFAULT_FRAME_MAX_DIMENSION,
+    full_resolution_frames_registry: Optional[FullResolutionFramesRegistry] = None,
+    frame_producer_backend: Optional[VideoFrameProducerBackend] = None,
 ) -> List[VideoSource]:
     video_reference = wrap_in_list(element=video_reference)
     if len(video_reference) < 1:
@@ -46,6 +61,10 @@ def prepare_video_sources(
         status_update_handlers=status_update_handlers,
         source_buffer_filling_strategy=source_buffer_filling_strategy,
         source_buffer_consumption_strategy=source_buffer_consumption_strategy,
+        decoding_processes_pool=decoding_processes_pool,
+        frame_max_dimension=frame_max_dimension,
+        full_resolution_frames_registry=full_resolution_frames_registry,
+        frame_producer_backend=frame_producer_backend,
     )
 
 
@@ -73,7 +92,26 @@ def initialise_video_sources(
     status_update_handlers: Optional[List[Callable[[StatusUpdate], None]]],
     source_buffer_filling_strategy: Optional[BufferFillingStrategy],
     source_buffer_consumption_strategy: Optional[BufferConsumptionStrategy],
+    decoding_processes_pool: Optional[VideoDecodingProcessPool] = None,
+    frame_max_dimension: Optional[int] = DEFAULT_FRAME_MAX_DIMENSION,
+    full_resolution_frames_registry: Optional[FullResolutionFramesRegistry] = None,
+    frame_producer_backend: Optional[VideoFrameProducerBackend] = None,
 ) -> List[VideoSource]:
+    if frame_producer_backend is None:
+        frame_producer_backend = VideoFrameProducerBackend(
+            DEFAULT_FRAME_PRODUCER_BACKEND
+        )
+    if decoding_processes_pool is not None:
+        video_reference = [
+            (
+                reference
+                if callable(reference)
+                else decoding_processes_pool.producer_factory(
+                    video_reference=reference, backend=frame_producer_backend
+                )
+            )
+            for reference in video_reference
+        ]
     return [
         VideoSource.init(
             video_reference=reference,
@@ -82,6 +120,9 @@ def initialise_video_sources(
             buffer_consumption_strategy=source_buffer_consumption_strategy,
             video_source_properties=source_properties,
             source_id=i,
+            frame_max_dimension=frame_max_dimension,
+            full_resolution_frames_registry=full_resolution_frames_registry,
+            frame_producer_backend=frame_producer_backend,
         )
         for i, (reference, source_properties) in enumerate(
             zip(video_reference, video_source_properties)
@@ -18,8 +18,13 @@ from inference.core.env import (
 from inference.core.exceptions import InferenceModelNotFound
 from inference.core.logger import logger
 from inference.core.managers.entities import ModelDescription
+from inference.core.managers.inference_metrics import inference_metrics, model_context
 from inference.core.managers.pingback import PingbackInfo
 from inference.core.models.base import Model, PreprocessReturnMetadata
+from inference.core.models.utils.onnx_session import (
+    OnnxSessionConfig,
+    set_onnx_session_config,
+)
 from inference.core.registries.base import ModelRegistry
 
 
@@ -65,6 +70,18 @@ class ModelManager:
         logger.debug("ModelManager - model successfully loaded.")
         self._models[resolved_identifier] = model
 
+    def set_onnx_session_config(
+        self, model_id: str, config: Optional[OnnxSessionConfig]
+    ) -> None:
+        """Sets options of ONNX Runtime sessions of the model, which are applied when the model
+        is added (model which is already loaded must be removed and added again).
+
+        Args:
+            model_id (str): The identifier of the model.
+            config (Optional[OnnxSessionConfig]): Session options, `None` to restore defaults.
+        """
+        set_onnx_session_config(model_id=model_id, config=config)
+
     def check_for_model(self, model_id: str) -> None:
         """Checks whether the model with the given ID is in the manager.
 
@@ -95,10 +112,13 @@ class ModelManager:
         if METRICS_ENABLED and self.pingback:
             logger.debug("ModelManager - setting pingback fallback api key...")
             self.pingback.fallback_api_key = request.api_key
+        start = time.perf_counter()
         try:
-            rtn_val = await self.model_infer(
-                model_id=model_id, request=request, **kwargs
-            )
+            with model_context(model_id=model_id):
+                rtn_val = await self.model_infer(
+                    model_id=model_id, request=request, **kwargs
+                )
+            duration = time.perf_counter() - start
             logger.debug(
                 f"ModelManager - inference from request finished for model_id={model_id}."
             )
@@ -128,8 +148,10 @@ class ModelManager:
                 logger.debug(
                     f"ModelManager - caching inference request finished for model_id={model_id}"
                 )
-            return rtn_val
         except Exception as e:
+            inference_metrics.record_request(
+                model_id=model_id, duration=time.perf_counter() - start, error=True
+            )
             finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
                 cache.zadd(
@@ -150,6 +172,9 @@ class ModelManager:
                     expire=METRICS_INTERVAL * 2,
                 )
             raise
+        else:
+            inference_metrics.record_request(model_id=model_id, duration=duration)
+            return rtn_val
 
     def infer_from_request_sync(
         self, model_id: str, request: InferenceRequest, **kwargs
@@ -169,10 +194,13 @@ class ModelManager:
         if METRICS_ENABLED and self.pingback:
             logger.debug("ModelManager - setting pingback fallback api key...")
             self.pingback.fallback_api_key = request.api_key
+        start = time.perf_counter()
         try:
-            rtn_val = self.model_infer_sync(
-                model_id=model_id, request=request, **kwargs
-            )
+            with model_context(model_id=model_id):
+                rtn_val = self.model_infer_sync(
+                    model_id=model_id, request=request, **kwargs
+                )
+            duration = time.perf_counter() - start
             logger.debug(
                 f"ModelManager - inference from request finished for model_id={model_id}."
             )
@@ -202,8 +230,10 @@ class ModelManager:
                 logger.debug(
                     f"ModelManager - caching inference request finished for model_id={model_id}"
                 )
-            return rtn_val
         except Exception as e:
+            inference_metrics.record_request(
+                model_id=model_id, duration=time.perf_counter() - start, error=True
+            )
             finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
                 cache.zadd(
@@ -224,6 +254,9 @@ class ModelManager:
                     expire=METRICS_INTERVAL * 2,
                 )
             raise
+        else:
+            inference_metrics.record_request(model_id=model_id, duration=duration)
+            return rtn_val
 
     async def model_infer(self, model_id: str, request: InferenceRequest, **kwargs):
         self.check_for_model(model_id)
@@ -404,6 +437,7 @@ class ModelManager:
                 batch_size=getattr(model, "batch_size", None),
                 input_width=getattr(model, "img_size_w", None),
                 input_height=getattr(model, "img_size_h", None),
+                session_load_time=getattr(model, "session_load_time", None),
             )
             for model_id, model in self._models.items()
         ]
@@ -0,0 +1,300 @@
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from threading import Lock
+from typing import Dict, Generator, List, Optional, Tuple
+
+from inference.core.env import INFERENCE_METRICS_WINDOW
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+current_model_id: ContextVar[Optional[str]] = ContextVar(
+    "current_model_id", default=None
+)
+
+
+class InferenceStage(Enum):
+    DECODE = "decode"
+    PREPROCESS = "preprocess"
+    PREDICT = "predict"
+    POSTPROCESS = "postprocess"
+    SERIALISE = "serialise"
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    buckets: List[Tuple[float, int]]  # (upper bound, cumulative count)
+    count: int
+    sum: float
+
+    def to_dict(self) -> dict:
+        return {
+            "buckets": [[bound, count] for bound, count in self.buckets],
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+@dataclass(frozen=True)
+class WindowMetrics:
+    num_inferences: int
+    avg_inference_time: float
+    num_errors: int
+
+    def to_dict(self) -> dict:
+        return {
+            "num_inferences": self.num_inferences,
+            "avg_inference_time": self.avg_inference_time,
+            "num_errors": self.num_errors,
+        }
+
+
+class Histogram:
+    """
+    Fixed-buckets histogram. Not thread safe - guarded by `ModelMetrics` lock.
+    """
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        buckets = []
+        cumulative_count = 0
+        for bound, count in zip(self._bounds + (float("inf"),), self._counts):
+            cumulative_count += count
+            buckets.append((bound, cumulative_count))
+        return HistogramSnapshot(buckets=buckets, count=cumulative_count, sum=self._sum)
+
+
+class SlidingWindow:
+    """
+    Ring of per-second slots accumulating number of requests, errors and total duration,
+    such that metrics for any window up to `size` seconds are computed from `size` slots -
+    regardless of number of requests. Not thread safe - guarded by `ModelMetrics` lock.
+    """
+
+    def __init__(self, size: int):
+        self._size = max(size, 1)
+        self._seconds = [-1] * self._size
+        self._requests = [0] * self._size
+        self._errors = [0] * self._size
+        self._durations = [0.0] * self._size
+
+    def record(self, now: float, duration: float, error: bool) -> None:
+        second = int(now)
+        slot = second % self._size
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._requests[slot] = 0
+            self._errors[slot] = 0
+            self._durations[slot] = 0.0
+        self._requests[slot] += 1
+        self._errors[slot] += int(error)
+        self._durations[slot] += duration
+
+    def summarise(self, now: float, window: float) -> WindowMetrics:
+        oldest_second = now - min(window, self._size)
+        requests, errors, durations = 0, 0, 0.0
+        for second, slot_requests, slot_errors, slot_durations in zip(
+            self._seconds, self._requests, self._errors, self._durations
+        ):
+            if second < oldest_second or second > now:
+                continue
+            requests += slot_requests
+            errors += slot_errors
+            durations += slot_durations
+        successful_requests = requests - errors
+        return WindowMetrics(
+            num_inferences=successful_requests,
+            avg_inference_time=(
+                durations / successful_requests if successful_requests > 0 else 0
+            ),
+            num_errors=errors,
+        )
+
+
+class ModelMetrics:
+    """
+    Metrics of single model - counters of requests and errors, sliding window used to report
+    metrics over recent period of time and latency histograms of inference stages.
+    """
+
+    def __init__(self, window_size: int):
+        self._lock = Lock()
+        self._requests = 0
+        self._errors = 0
+        self._window = SlidingWindow(size=window_size)
+        self._stages: Dict[str, Histogram] = {}
+
+    def record_request(self, duration: float, error: bool, now: float) -> None:
+        with self._lock:
+            self._requests += 1
+            self._errors += int(error)
+            # only successful requests are accounted in latency, as in cache-based metrics
+            self._window.record(
+                now=now, duration=0.0 if error else duration, error=error
+            )
+
+    def observe_stage(self, stage: str, duration: float) -> None:
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = Histogram()
+                self._stages[stage] = histogram
+            histogram.observe(duration)
+
+    def summarise_window(self, now: float, window: float) -> WindowMetrics:
+        with self._lock:
+            return self._window.summarise(now=now, window=window)
+
+    def to_dict(self, now: float, window: float) -> dict:
+        with self._lock:
+            return {
+                "requests_total": self._requests,
+                "errors_total": self._errors,
+                "window": self._window.summarise(now=now, window=window).to_dict(),
+                "stages": {
+                    stage: histogram.snapshot().to_dict()
+                    for stage, histogram in self._stages.items()
+                },
+            }
+
+    @property
+    def requests(self) -> int:
+        return self._requests
+
+    @property
+    def errors(self) -> int:
+        return self._errors
+
+    def stages_snapshot(self) -> Dict[str, HistogramSnapshot]:
+        with self._lock:
+            return {
+                stage: histogram.snapshot() for stage, histogram in self._stages.items()
+            }
+
+
+class InferenceMetricsRegistry:
+    """
+    In-process registry of per-model inference metrics. Hot paths update metrics directly
+    (`record_request(...)`, `observe_stage(...)` or `stage_timer(...)`) at the cost of
+    taking single, per-model lock - while readers (Prometheus collector, `/device/stats`
+    endpoint and pingback) get the metrics in time proportional to number of models,
+    not number of requests served.
+
+    Stage timings are independent - `preprocess` stage includes image `decode`.
+    """
+
+    def __init__(self, window_size: int = INFERENCE_METRICS_WINDOW):
+        self._window_size = window_size
+        self._models: Dict[str, ModelMetrics] = {}
+        self._lock = Lock()
+
+    def record_request(
+        self, model_id: str, duration: float, error: bool = False
+    ) -> None:
+        self._get_model_metrics(model_id=model_id).record_request(
+            duration=duration, error=error, now=time.time()
+        )
+
+    def observe_stage(self, model_id: str, stage: str, duration: float) -> None:
+        self._get_model_metrics(model_id=model_id).observe_stage(
+            stage=stage, duration=duration
+        )
+
+    @contextmanager
+    def stage_timer(
+        self, stage: InferenceStage, model_id: Optional[str] = None
+    ) -> Generator[None, None, None]:
+        """
+        Measures duration of the stage. If `model_id` is not given, it is taken from
+        `current_model_id` context variable (set with `model_context(...)`) - and nothing
+        is measured when there is no model in context.
+        """
+        if model_id is None:
+            model_id = current_model_id.get()
+        if model_id is None:
+            yield None
+            return None
+        start = time.perf_counter()
+        try:
+            yield None
+        finally:
+            self.observe_stage(
+                model_id=model_id,
+                stage=stage.value,
+                duration=time.perf_counter() - start,
+            )
+
+    def models(self) -> List[str]:
+        with self._lock:
+            return list(self._models.keys())
+
+    def get_model_metrics(self, model_id: str) -> Optional[ModelMetrics]:
+        return self._models.get(model_id)
+
+    def get_window_metrics(
+        self, model_id: str, window: float, now: Optional[float] = None
+    ) -> WindowMetrics:
+        if now is None:
+            now = time.time()
+        model_metrics = self._models.get(model_id)
+        if model_metrics is None:
+            return WindowMetrics(num_inferences=0, avg_inference_time=0, num_errors=0)
+        return model_metrics.summarise_window(now=now, window=window)
+
+    def to_dict(self, window: float, now: Optional[float] = None) -> dict:
+        if now is None:
+            now = time.time()
+        return {
+            model_id: self._models[model_id].to_dict(now=now, window=window)
+            for model_id in self.models()
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models = {}
+
+    def _get_model_metrics(self, model_id: str) -> ModelMetrics:
+        model_metrics = self._models.get(model_id)
+        if model_metrics is not None:
+            return model_metrics
+        with self._lock:
+            if model_id not in self._models:
+                self._models[model_id] = ModelMetrics(window_size=self._window_size)
+            return self._models[model_id]
+
+
+@contextmanager
+def model_context(model_id: Optional[str]) -> Generator[None, None, None]:
+    token = current_model_id.set(model_id)
+    try:
+        yield None
+    finally:
+        current_model_id.reset(token)
+
+
+inference_metrics = InferenceMetricsRegistry()
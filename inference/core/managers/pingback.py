@@ -13,6 +13,7 @@ from inference.core.env import (
     TAGS,
 )
 from inference.core.logger import logger
+from inference.core.managers.inference_metrics import inference_metrics
 from inference.core.managers.metrics import (
     get_inference_results_for_model,
     get_system_info,
@@ -106,9 +107,14 @@ class PingbackInfo:
             model_manager (ModelManager): Reference to the model manager object.
 
         The data is collected and reset for the next window, and a POST request is made to the pingback URL.
+        Aggregated per-model metrics (counters, metrics over last window and latency histograms of
+        inference stages) are taken from in-process metrics registry.
         """
         all_data = self.environment_info.copy()
         all_data["inference_results"] = []
+        all_data["inference_metrics"] = inference_metrics.to_dict(
+            window=METRICS_INTERVAL
+        )
 
         # use fallback api key if env didn't have one
         if self.fallback_api_key and not all_data.get("api_key"):
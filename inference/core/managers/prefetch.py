@@ -0,0 +1,165 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Thread
+from typing import Callable, Dict, List, Optional
+
+from inference.core.env import (
+    API_KEY,
+    PREFETCH_LOAD_MODELS,
+    PREFETCH_MAX_CONCURRENT_MODELS,
+)
+from inference.core.logger import logger
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.base import ModelManagerDecorator
+from inference.core.managers.entities import ModelPrefetchState, PrefetchStatus
+from inference.core.models.roboflow import RoboflowInferenceModel
+from inference.models.aliases import resolve_roboflow_model_alias
+
+ModelLoader = Callable[[str, Optional[str]], None]
+
+
+FINAL_STATUSES = {PrefetchStatus.READY, PrefetchStatus.FAILED}
+
+
+class ModelsPrefetcher:
+    """Downloads artefacts of models ahead of the first request and (optionally) loads
+    the models into model manager - such that inference sessions are initialised before
+    the server reports readiness.
+
+    Prefetching runs in two phases: artefacts of all models are downloaded concurrently
+    (`max_concurrent_models` at a time), then models are loaded one by one with `model_loader`
+    (`model_manager.add_model(...)` by default), as model managers are not thread-safe.
+    Model which artefacts could not be downloaded is still attempted to be loaded, as its
+    class may download artefacts in its own way.
+
+    Attributes:
+        model_manager (ModelManager): Model manager models are prefetched for.
+    """
+
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        load_models: bool = PREFETCH_LOAD_MODELS,
+        max_concurrent_models: int = PREFETCH_MAX_CONCURRENT_MODELS,
+        model_loader: Optional[ModelLoader] = None,
+    ):
+        self.model_manager = model_manager
+        self._load_models = load_models
+        self._max_concurrent_models = max(max_concurrent_models, 1)
+        self._model_loader = model_loader or self._add_model
+        self._states: Dict[str, ModelPrefetchState] = {}
+        self._state_lock = Lock()
+        self._prefetch_lock = Lock()
+
+    def prefetch(
+        self, model_ids: List[str], api_key: Optional[str] = None
+    ) -> List[ModelPrefetchState]:
+        """Prefetches given models, blocking until all of them are processed.
+
+        Args:
+            model_ids (List[str]): Identifiers (or aliases) of models to prefetch.
+            api_key (Optional[str]): Roboflow API key, `API_KEY` is used if not given.
+
+        Returns:
+            List[ModelPrefetchState]: Final states of prefetched models.
+        """
+        api_key = api_key or API_KEY
+        model_ids = self._register(model_ids=model_ids)
+        with self._prefetch_lock:
+            with ThreadPoolExecutor(
+                max_workers=self._max_concurrent_models
+            ) as executor:
+                list(
+                    executor.map(
+                        lambda model_id: self._download(model_id, api_key), model_ids
+                    )
+                )
+            for model_id in model_ids:
+                self._load(model_id=model_id, api_key=api_key)
+        return [self._states[model_id] for model_id in model_ids]
+
+    def prefetch_in_background(
+        self, model_ids: List[str], api_key: Optional[str] = None
+    ) -> Thread:
+        """Starts prefetching given models in a daemon thread - models are reported as
+        pending by `describe()` from the moment this method returns."""
+        self._register(model_ids=model_ids)
+        thread = Thread(
+            target=self.prefetch,
+            kwargs={"model_ids": model_ids, "api_key": api_key},
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def describe(self) -> List[ModelPrefetchState]:
+        with self._state_lock:
+            return list(self._states.values())
+
+    def is_ready(self) -> bool:
+        """Tells whether all requested models are processed (loaded, or downloaded only if
+        models are not to be loaded) - regardless of failures."""
+        final_statuses = set(FINAL_STATUSES)
+        if not self._load_models:
+            final_statuses.add(PrefetchStatus.DOWNLOADED)
+        return all(state.status in final_statuses for state in self.describe())
+
+    def _register(self, model_ids: List[str]) -> List[str]:
+        resolved_model_ids = []
+        for model_id in model_ids:
+            model_id = resolve_roboflow_model_alias(model_id=model_id)
+            if model_id not in resolved_model_ids:
+                resolved_model_ids.append(model_id)
+        with self._state_lock:
+            for model_id in resolved_model_ids:
+                current_state = self._states.get(model_id)
+                if current_state is None or current_state.status in FINAL_STATUSES:
+                    self._states[model_id] = ModelPrefetchState(
+                        model_id=model_id, status=PrefetchStatus.PENDING
+                    )
+        return resolved_model_ids
+
+    def _download(self, model_id: str, api_key: Optional[str]) -> None:
+        self._set_state(model_id=model_id, status=PrefetchStatus.DOWNLOADING)
+        try:
+            model_class = self._get_model_registry().get_model(model_id, api_key)
+            if isinstance(model_class, type) and issubclass(
+                model_class, RoboflowInferenceModel
+            ):
+                model_class.prefetch_artefacts(model_id=model_id, api_key=api_key)
+            self._set_state(model_id=model_id, status=PrefetchStatus.DOWNLOADED)
+        except Exception as error:
+            logger.warning(f"Could not prefetch artefacts of {model_id}: {error}")
+            self._set_state(
+                model_id=model_id, status=PrefetchStatus.FAILED, error=str(error)
+            )
+
+    def _load(self, model_id: str, api_key: Optional[str]) -> None:
+        if not self._load_models:
+            return None
+        self._set_state(model_id=model_id, status=PrefetchStatus.LOADING)
+        try:
+            self._model_loader(model_id, api_key)
+            self._set_state(model_id=model_id, status=PrefetchStatus.READY)
+            logger.info(f"Model {model_id} prefetched and loaded")
+        except Exception as error:
+            logger.warning(f"Could not load prefetched model {model_id}: {error}")
+            self._set_state(
+                model_id=model_id, status=PrefetchStatus.FAILED, error=str(error)
+            )
+
+    def _add_model(self, model_id: str, api_key: Optional[str]) -> None:
+        self.model_manager.add_model(model_id=model_id, api_key=api_key)
+
+    def _get_model_registry(self):
+        model_manager = self.model_manager
+        while isinstance(model_manager, ModelManagerDecorator):
+            model_manager = model_manager.model_manager
+        return model_manager.model_registry
+
+    def _set_state(
+        self, model_id: str, status: PrefetchStatus, error: Optional[str] = None
+    ) -> None:
+        with self._state_lock:
+            self._states[model_id] = ModelPrefetchState(
+                model_id=model_id, status=status, error=error
+            )
@@ -1,14 +1,27 @@
 import re
 import time
-from typing import Callable
+from typing import Callable, Dict
 
-from prometheus_client.core import REGISTRY, CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.core import (
+    REGISTRY,
+    CounterMetricFamily,
+    GaugeMetricFamily,
+    HistogramMetricFamily,
+)
 from prometheus_client.registry import Collector
+from prometheus_client.utils import floatToGoString
 from prometheus_fastapi_instrumentator import Instrumentator
 
-from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
+from inference.core.cache.tensors import TensorsCacheStats, get_tensors_caches_stats
 from inference.core.logger import logger
-from inference.core.managers.metrics import get_model_metrics
+from inference.core.managers.inference_metrics import (
+    InferenceMetricsRegistry,
+    inference_metrics,
+)
+from inference.core.models.utils.session_pool import (
+    SessionPoolStats,
+    get_session_pools_stats,
+)
 
 
 class InferenceInstrumentator:
@@ -27,14 +40,27 @@ class InferenceInstrumentator:
 
 
 class CustomCollector(Collector):
-    def __init__(self, model_manager, time_window: int = 10):
+    def __init__(
+        self,
+        model_manager,
+        time_window: int = 10,
+        metrics_registry: InferenceMetricsRegistry = inference_metrics,
+        session_pools_stats_provider: Callable[
+            [], Dict[str, SessionPoolStats]
+        ] = get_session_pools_stats,
+        tensors_caches_stats_provider: Callable[
+            [], Dict[str, TensorsCacheStats]
+        ] = get_tensors_caches_stats,
+    ):
         super(CustomCollector, self).__init__()
         self.model_manager = model_manager
         self.time_window = time_window
+        self.metrics_registry = metrics_registry
+        self.session_pools_stats_provider = session_pools_stats_provider
+        self.tensors_caches_stats_provider = tensors_caches_stats_provider
 
     def get_metrics(self, maxModels: int = 25):
         now = time.time()
-        start = now - self.time_window
         count = 0
         results = {}
         if self.model_manager is None:
@@ -46,9 +72,9 @@ class CustomCollector(Collector):
             if count >= maxModels:
                 break
             try:
-                results[model_id] = get_model_metrics(
-                    GLOBAL_INFERENCE_SERVER_ID, model_id, min=start, max=now
-                )
+                results[model_id] = self.metrics_registry.get_window_metrics(
+                    model_id=model_id, window=self.time_window, now=now
+                ).to_dict()
             except Exception as e:
                 logger.debug(
                     "Error getting metrics for model " + model_id + ": " + str(e)
@@ -100,3 +126,142 @@ class CustomCollector(Collector):
             f"Total number of errors in {self.time_window}s",
             value=num_errors_total,
         )
+        yield from self.collect_models_metrics()
+        yield from self.collect_session_pools_metrics()
+        yield from self.collect_tensors_caches_metrics()
+
+    def collect_models_metrics(self):
+        requests = CounterMetricFamily(
+            "inference_requests",
+            "Number of inference requests served by model",
+            labels=["model_id"],
+        )
+        errors = CounterMetricFamily(
+            "inference_errors",
+            "Number of inference requests failed by model",
+            labels=["model_id"],
+        )
+        stages_durations = HistogramMetricFamily(
+            "inference_stage_duration_seconds",
+            "Duration of inference stages (decode, preprocess, predict, postprocess, serialise)",
+            labels=["model_id", "stage"],
+        )
+        for model_id in self.metrics_registry.models():
+            model_metrics = self.metrics_registry.get_model_metrics(model_id=model_id)
+            if model_metrics is None:
+                continue
+            requests.add_metric([model_id], model_metrics.requests)
+            errors.add_metric([model_id], model_metrics.errors)
+            for stage, histogram in model_metrics.stages_snapshot().items():
+                stages_durations.add_metric(
+                    [model_id, stage],
+                    buckets=[
+                        (floatToGoString(bound), count)
+                        for bound, count in histogram.buckets
+                    ],
+                    sum_value=histogram.sum,
+                )
+        yield requests
+        yield errors
+        yield stages_durations
+
+    def collect_session_pools_metrics(self):
+        replicas = GaugeMetricFamily(
+            "onnx_session_replicas",
+            "Number of ONNX Runtime session replicas of model",
+            labels=["model_id"],
+        )
+        max_replicas = GaugeMetricFamily(
+            "onnx_session_max_replicas",
+            "Maximal number of ONNX Runtime session replicas of model",
+            labels=["model_id"],
+        )
+        in_flight = GaugeMetricFamily(
+            "onnx_session_replica_in_flight_requests",
+            "Number of requests in flight on ONNX Runtime session replica",
+            labels=["model_id", "replica"],
+        )
+        replica_requests = CounterMetricFamily(
+            "onnx_session_replica_requests",
+            "Number of requests served by ONNX Runtime session replica",
+            labels=["model_id", "replica"],
+        )
+        busy_seconds = CounterMetricFamily(
+            "onnx_session_replica_busy_seconds",
+            "Time ONNX Runtime session replica spent serving requests",
+            labels=["model_id", "replica"],
+        )
+        for model_id, pool_stats in self.session_pools_stats_provider().items():
+            replicas.add_metric([model_id], len(pool_stats.replicas))
+            max_replicas.add_metric([model_id], pool_stats.max_replicas)
+            for replica in pool_stats.replicas:
+                labels = [model_id, str(replica.replica_id)]
+                in_flight.add_metric(labels, replica.in_flight)
+                replica_requests.add_metric(labels, replica.requests)
+                busy_seconds.add_metric(labels, replica.busy_seconds)
+        yield replicas
+        yield max_replicas
+        yield in_flight
+        yield replica_requests
+        yield busy_seconds
+
+    def collect_tensors_caches_metrics(self):
+        gauges = {
+            "entries": GaugeMetricFamily(
+                "tensors_cache_entries",
+                "Number of entries held in memory by cache",
+                labels=["cache"],
+            ),
+            "size_bytes": GaugeMetricFamily(
+                "tensors_cache_bytes",
+                "Memory taken by arrays held by cache",
+                labels=["cache"],
+            ),
+            "max_bytes": GaugeMetricFamily(
+                "tensors_cache_max_bytes",
+                "Memory cache may take",
+                labels=["cache"],
+            ),
+            "spilled_entries": GaugeMetricFamily(
+                "tensors_cache_spilled_entries",
+                "Number of cache entries spilled to disk",
+                labels=["cache"],
+            ),
+            "spilled_bytes": GaugeMetricFamily(
+                "tensors_cache_spilled_bytes",
+                "Disk space taken by cache entries spilled to disk",
+                labels=["cache"],
+            ),
+        }
+        counters = {
+            "hits": CounterMetricFamily(
+                "tensors_cache_hits",
+                "Number of cache lookups served from memory",
+                labels=["cache"],
+            ),
+            "misses": CounterMetricFamily(
+                "tensors_cache_misses",
+                "Number of cache lookups which required computation",
+                labels=["cache"],
+            ),
+            "coalesced": CounterMetricFamily(
+                "tensors_cache_coalesced_requests",
+                "Number of cache lookups which waited for computation of the same entry",
+                labels=["cache"],
+            ),
+            "evictions": CounterMetricFamily(
+                "tensors_cache_evictions",
+                "Number of entries evicted from memory",
+                labels=["cache"],
+            ),
+            "spill_hits": CounterMetricFamily(
+                "tensors_cache_spill_hits",
+                "Number of cache lookups served from disk",
+                labels=["cache"],
+            ),
+        }
+        for name, cache_stats in self.tensors_caches_stats_provider().items():
+            for field, metric in {**gauges, **counters}.items():
+                metric.add_metric([name], getattr(cache_stats, field))
+        yield from gauges.values()
+        yield from counters.values()
@@ -6,6 +6,11 @@ import numpy as np
 from inference.core import logger
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.managers.inference_metrics import (
+    InferenceStage,
+    current_model_id,
+)
+from inference.core.models.tracing import inference_stage, model_tracer
 from inference.core.models.types import PreprocessReturnMetadata
 from inference.usage_tracking.collector import usage_collector
 
@@ -22,12 +27,17 @@ class BaseInference:
         - image:
             can be a BGR numpy array, filepath, InferenceRequestImage, PIL Image, byte-string, etc.
         """
-        preproc_image, returned_metadata = self.preprocess(image, **kwargs)
+        with inference_stage(InferenceStage.PREPROCESS):
+            preproc_image, returned_metadata = self.preprocess(image, **kwargs)
         logger.debug(
             f"Preprocessed input shape: {getattr(preproc_image, 'shape', None)}"
         )
-        predicted_arrays = self.predict(preproc_image, **kwargs)
-        postprocessed = self.postprocess(predicted_arrays, returned_metadata, **kwargs)
+        with inference_stage(InferenceStage.PREDICT):
+            predicted_arrays = self.predict(preproc_image, **kwargs)
+        with inference_stage(InferenceStage.POSTPROCESS):
+            postprocessed = self.postprocess(
+                predicted_arrays, returned_metadata, **kwargs
+            )
 
         return postprocessed
 
@@ -126,16 +136,25 @@ class Model(BaseInference):
             - If `visualize_predictions` is set to True in the request, a visualization of the prediction
               is also included in the response.
         """
-        t1 = perf_counter()
-        responses = self.infer(**request.dict(), return_image_dims=False)
-        for response in responses:
-            response.time = perf_counter() - t1
-            if request.id:
-                response.inference_id = request.id
-
-        if request.visualize_predictions:
+        model_id = (
+            current_model_id.get()
+            or getattr(request, "model_id", None)
+            or self.__class__.__name__
+        )
+        with model_tracer.trace_request(model_id=model_id, trace_id=request.id):
+            t1 = perf_counter()
+            responses = self.infer(**request.dict(), return_image_dims=False)
             for response in responses:
-                response.visualization = self.draw_predictions(request, response)
+                response.time = perf_counter() - t1
+                if request.id:
+                    response.inference_id = request.id
+
+            if request.visualize_predictions:
+                with model_tracer.stage(name="visualisation"):
+                    for response in responses:
+                        response.visualization = self.draw_predictions(
+                            request, response
+                        )
 
         if not isinstance(request.image, list) and len(responses) > 0:
             responses = responses[0]
@@ -13,6 +13,7 @@ from inference.core.entities.responses.inference import (
     MultiLabelClassificationInferenceResponse,
 )
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
+from inference.core.models.tracing import model_tracer
 from inference.core.models.types import PreprocessReturnMetadata
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
@@ -172,12 +173,13 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         **kwargs,
     ) -> Union[ClassificationInferenceResponse, List[ClassificationInferenceResponse]]:
         predictions = predictions[0]
-        return self.make_response(
-            predictions, preprocess_return_metadata["img_dims"], **kwargs
-        )
+        with model_tracer.stage(name="make_response"):
+            return self.make_response(
+                predictions, preprocess_return_metadata["img_dims"], **kwargs
+            )
 
     def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray]:
-        predictions = self.onnx_session.run(None, {self.input_name: img_in})
+        predictions = self.run_onnx_session(img_in)
         return (predictions,)
 
     def preprocess(
@@ -353,7 +355,10 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
     def get_model_output_shape(self) -> Tuple[int, int, int]:
         test_image = (np.random.rand(1024, 1024, 3) * 255).astype(np.uint8)
         test_image, _ = self.preprocess(test_image)
-        output = np.array(self.predict(test_image))
+        try:
+            output = np.array(self.predict(test_image))
+        finally:
+            self._release_io_binding_buffers()
         return output.shape
 
     def validate_model_classes(self) -> None:
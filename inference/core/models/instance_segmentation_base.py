@@ -10,6 +10,7 @@ from inference.core.entities.responses.inference import (
 )
 from inference.core.exceptions import InvalidMaskDecodeArgument
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
+from inference.core.models.tracing import model_tracer
 from inference.core.models.types import PreprocessReturnMetadata
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
@@ -120,15 +121,16 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
         List[InstanceSegmentationInferenceResponse],
     ]:
         predictions, protos = predictions
-        predictions = w_np_non_max_suppression(
-            predictions,
-            conf_thresh=kwargs["confidence"],
-            iou_thresh=kwargs["iou_threshold"],
-            class_agnostic=kwargs["class_agnostic_nms"],
-            max_detections=kwargs["max_detections"],
-            max_candidate_detections=kwargs["max_candidates"],
-            num_masks=self.num_masks,
-        )
+        with model_tracer.stage(name="nms"):
+            predictions = w_np_non_max_suppression(
+                predictions,
+                conf_thresh=kwargs["confidence"],
+                iou_thresh=kwargs["iou_threshold"],
+                class_agnostic=kwargs["class_agnostic_nms"],
+                max_detections=kwargs["max_detections"],
+                max_candidate_detections=kwargs["max_candidates"],
+                num_masks=self.num_masks,
+            )
         infer_shape = (self.img_size_h, self.img_size_w)
         masks = []
         mask_decode_mode = kwargs["mask_decode_mode"]
@@ -189,9 +191,10 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
                 resize_method=self.resize_method,
             )
             masks.append(polys)
-        return self.make_response(
-            predictions, masks, preprocess_return_metadata["img_dims"], **kwargs
-        )
+        with model_tracer.stage(name="make_response"):
+            return self.make_response(
+                predictions, masks, preprocess_return_metadata["img_dims"], **kwargs
+            )
 
     def preprocess(
         self, image: Any, **kwargs
@@ -12,6 +12,7 @@ from inference.core.exceptions import ModelArtefactError
 from inference.core.models.object_detection_base import (
     ObjectDetectionBaseOnnxRoboflowInferenceModel,
 )
+from inference.core.models.tracing import model_tracer
 from inference.core.models.types import PreprocessReturnMetadata
 from inference.core.models.utils.keypoints import model_keypoints_to_response
 from inference.core.models.utils.validate import (
@@ -74,15 +75,16 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
         predictions = predictions[0]
         number_of_classes = len(self.get_class_names)
         num_masks = predictions.shape[2] - 5 - number_of_classes
-        predictions = w_np_non_max_suppression(
-            predictions,
-            conf_thresh=confidence,
-            iou_thresh=iou_threshold,
-            class_agnostic=class_agnostic_nms,
-            max_detections=max_detections,
-            max_candidate_detections=max_candidates,
-            num_masks=num_masks,
-        )
+        with model_tracer.stage(name="nms"):
+            predictions = w_np_non_max_suppression(
+                predictions,
+                conf_thresh=confidence,
+                iou_thresh=iou_threshold,
+                class_agnostic=class_agnostic_nms,
+                max_detections=max_detections,
+                max_candidate_detections=max_candidates,
+                num_masks=num_masks,
+            )
 
         infer_shape = (self.img_size_h, self.img_size_w)
         img_dims = preproc_return_metadata["img_dims"]
@@ -107,7 +109,8 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
                 "disable_preproc_static_crop"
             ],
         )
-        return self.make_response(predictions, img_dims, **kwargs)
+        with model_tracer.stage(name="make_response"):
+            return self.make_response(predictions, img_dims, **kwargs)
 
     def make_response(
         self,
@@ -17,6 +17,7 @@ from inference.core.models.defaults import (
     DEFAUlT_MAX_DETECTIONS,
 )
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
+from inference.core.models.tracing import model_tracer
 from inference.core.models.types import PreprocessReturnMetadata
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
@@ -168,15 +169,16 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
             List[ObjectDetectionInferenceResponse]: The post-processed predictions.
         """
         predictions = predictions[0]
-        predictions = w_np_non_max_suppression(
-            predictions,
-            conf_thresh=confidence,
-            iou_thresh=iou_threshold,
-            class_agnostic=class_agnostic_nms,
-            max_detections=max_detections,
-            max_candidate_detections=max_candidates,
-            box_format=self.box_format,
-        )
+        with model_tracer.stage(name="nms"):
+            predictions = w_np_non_max_suppression(
+                predictions,
+                conf_thresh=confidence,
+                iou_thresh=iou_threshold,
+                class_agnostic=class_agnostic_nms,
+                max_detections=max_detections,
+                max_candidate_detections=max_candidates,
+                box_format=self.box_format,
+            )
 
         infer_shape = (self.img_size_h, self.img_size_w)
         img_dims = preproc_return_metadata["img_dims"]
@@ -190,7 +192,8 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
                 "disable_preproc_static_crop"
             ],
         )
-        return self.make_response(predictions, img_dims, **kwargs)
+        with model_tracer.stage(name="make_response"):
+            return self.make_response(predictions, img_dims, **kwargs)
 
     def preprocess(
         self,
@@ -13,6 +13,7 @@ import onnxruntime
 from PIL import Image
 
 from inference.core.cache import cache
+from inference.core.cache.downloads import download_file
 from inference.core.cache.model_artifacts import (
     are_all_files_cached,
     clear_cache,
@@ -21,7 +22,6 @@ from inference.core.cache.model_artifacts import (
     initialise_cache,
     load_json_from_cache,
     load_text_file_from_cache,
-    save_bytes_in_cache,
     save_json_in_cache,
     save_text_lines_in_cache,
 )
@@ -43,14 +43,41 @@ from inference.core.env import (
     MODEL_CACHE_DIR,
     MODEL_VALIDATION_DISABLED,
     ONNXRUNTIME_EXECUTION_PROVIDERS,
+    ONNXRUNTIME_IO_BINDING_ENABLED,
+    ONNXRUNTIME_IO_BINDING_MAX_SHAPES,
+    ONNXRUNTIME_QUANTIZATION_CALIBRATION_DIR,
+    ONNXRUNTIME_QUANTIZATION_CALIBRATION_IMAGES,
+    ONNXRUNTIME_QUANTIZATION_MAX_MAP_DRIFT,
     REQUIRED_ONNX_PROVIDERS,
     TENSORRT_CACHE_PATH,
 )
 from inference.core.exceptions import ModelArtefactError, OnnxProviderNotAvailable
 from inference.core.logger import logger
 from inference.core.models.base import Model
+from inference.core.models.tracing import model_tracer
 from inference.core.models.utils.batching import create_batches
-from inference.core.models.utils.onnx import has_trt
+from inference.core.models.utils.io_binding import IOBindingSessionRunner
+from inference.core.models.utils.onnx_session import (
+    create_inference_session,
+    get_onnx_session_config,
+)
+from inference.core.models.utils.quantization import (
+    QUANTIZABLE_TASK_TYPES,
+    compute_map_drift,
+    detections_from_responses,
+    get_quantized_model_metadata,
+    get_quantized_model_path,
+    load_calibration_images,
+    load_quantization_report,
+    quantize_model,
+    remove_quantized_model,
+    save_quantization_report,
+)
+from inference.core.models.utils.session_pool import (
+    OnnxSessionPool,
+    OnnxSessionReplica,
+    get_max_replicas,
+)
 from inference.core.roboflow_api import (
     ModelEndpointType,
     get_from_url,
@@ -223,6 +250,20 @@ class RoboflowInferenceModel(Model):
             return None
         self.download_model_artifacts_from_roboflow_api()
 
+    @classmethod
+    def prefetch_artefacts(cls, model_id: str, api_key: Optional[str] = None) -> None:
+        """Downloads artefacts of the model into cache, without loading the model.
+
+        Args:
+            model_id (str): The unique identifier for the model.
+            api_key (str, optional): API key for authentication. Defaults to None.
+        """
+        # model constructors load artefacts into inference sessions - only the base
+        # initialisation is needed to resolve which files are to be cached
+        model = cls.__new__(cls)
+        RoboflowInferenceModel.__init__(model, model_id=model_id, api_key=api_key)
+        model.cache_model_artefacts()
+
     def get_all_required_infer_bucket_file(self) -> List[str]:
         infer_bucket_files = self.get_infer_bucket_file_list()
         infer_bucket_files.append(self.weights_file)
@@ -277,13 +318,18 @@ class RoboflowInferenceModel(Model):
             raise ModelArtefactError(
                 "Could not find `environment` key in roboflow API model description response."
             )
-        environment = get_from_url(api_data["environment"])
-        model_weights_response = get_from_url(api_data["model"], json_response=False)
-        save_bytes_in_cache(
-            content=model_weights_response.content,
-            file=self.weights_file,
-            model_id=self.endpoint,
-        )
+        # environment and weights (in parallel chunks) are downloaded concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            environment_future = executor.submit(get_from_url, api_data["environment"])
+            weights_future = executor.submit(
+                download_file,
+                url=api_data["model"],
+                target_path=get_cache_file_path(
+                    file=self.weights_file, model_id=self.endpoint
+                ),
+            )
+            environment = environment_future.result()
+            weights_future.result()
         if "colors" in api_data:
             environment["COLORS"] = api_data["colors"]
         save_json_in_cache(
@@ -389,34 +435,38 @@ class RoboflowInferenceModel(Model):
             or "auto-orient" not in self.preproc.keys()
             or DISABLE_PREPROC_AUTO_ORIENT,
         )
-        preprocessed_image, img_dims = self.preprocess_image(
-            np_image,
-            disable_preproc_contrast=disable_preproc_contrast,
-            disable_preproc_grayscale=disable_preproc_grayscale,
-            disable_preproc_static_crop=disable_preproc_static_crop,
-        )
-
-        if self.resize_method == "Stretch to":
-            resized = cv2.resize(
-                preprocessed_image, (self.img_size_w, self.img_size_h), cv2.INTER_CUBIC
-            )
-        elif self.resize_method == "Fit (black edges) in":
-            resized = letterbox_image(
-                preprocessed_image, (self.img_size_w, self.img_size_h)
-            )
-        elif self.resize_method == "Fit (white edges) in":
-            resized = letterbox_image(
-                preprocessed_image,
-                (self.img_size_w, self.img_size_h),
-                color=(255, 255, 255),
-            )
-        elif self.resize_method == "Fit (grey edges) in":
-            resized = letterbox_image(
-                preprocessed_image,
-                (self.img_size_w, self.img_size_h),
-                color=(114, 114, 114),
+        with model_tracer.stage(name="preprocess_image"):
+            preprocessed_image, img_dims = self.preprocess_image(
+                np_image,
+                disable_preproc_contrast=disable_preproc_contrast,
+                disable_preproc_grayscale=disable_preproc_grayscale,
+                disable_preproc_static_crop=disable_preproc_static_crop,
             )
 
+        with model_tracer.stage(name="resize"):
+            if self.resize_method == "Stretch to":
+                resized = cv2.resize(
+                    preprocessed_image,
+                    (self.img_size_w, self.img_size_h),
+                    cv2.INTER_CUBIC,
+                )
+            elif self.resize_method == "Fit (black edges) in":
+                resized = letterbox_image(
+                    preprocessed_image, (self.img_size_w, self.img_size_h)
+                )
+            elif self.resize_method == "Fit (white edges) in":
+                resized = letterbox_image(
+                    preprocessed_image,
+                    (self.img_size_w, self.img_size_h),
+                    color=(255, 255, 255),
+                )
+            elif self.resize_method == "Fit (grey edges) in":
+                resized = letterbox_image(
+                    preprocessed_image,
+                    (self.img_size_w, self.img_size_h),
+                    color=(114, 114, 114),
+                )
+
         if is_bgr:
             resized = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
         img_in = np.transpose(resized, (2, 0, 1))
@@ -482,6 +532,12 @@ class RoboflowCoreModel(RoboflowInferenceModel):
         super().__init__(model_id, api_key=api_key)
         self.download_weights()
 
+    @classmethod
+    def prefetch_artefacts(cls, model_id: str, api_key: Optional[str] = None) -> None:
+        model = cls.__new__(cls)
+        RoboflowInferenceModel.__init__(model, model_id=model_id, api_key=api_key)
+        model.download_weights()
+
     def download_weights(self) -> None:
         """Downloads the model weights from the configured source.
 
@@ -510,12 +566,10 @@ class RoboflowCoreModel(RoboflowInferenceModel):
         for weights_url_key in api_data["weights"]:
             weights_url = api_data["weights"][weights_url_key]
             t1 = perf_counter()
-            model_weights_response = get_from_url(weights_url, json_response=False)
             filename = weights_url.split("?")[0].split("/")[-1]
-            save_bytes_in_cache(
-                content=model_weights_response.content,
-                file=filename,
-                model_id=self.endpoint,
+            download_file(
+                url=weights_url,
+                target_path=get_cache_file_path(file=filename, model_id=self.endpoint),
             )
             if perf_counter() - t1 > 120:
                 logger.debug(
@@ -590,6 +644,8 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
             **kwargs: Arbitrary keyword arguments.
         """
         super().__init__(model_id, *args, **kwargs)
+        self.io_binding_runner: Optional[IOBindingSessionRunner] = None
+        self.onnx_session_pool: Optional[OnnxSessionPool] = None
         if self.load_weights or not self.has_model_metadata:
             self.onnxruntime_execution_providers = onnxruntime_execution_providers
             expanded_execution_providers = []
@@ -610,6 +666,10 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
 
         self.initialize_model()
         self.image_loader_threadpool = ThreadPoolExecutor(max_workers=None)
+        self.quantization = None
+        if self.load_weights:
+            self.initialize_quantized_model()
+            self.initialize_onnx_session_pool()
         try:
             self.validate_model()
         except ModelArtefactError as e:
@@ -622,6 +682,13 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
         - image:
             can be a BGR numpy array, filepath, InferenceRequestImage, PIL Image, byte-string, etc.
         """
+        try:
+            return self._infer_in_batches(image, **kwargs)
+        finally:
+            # results are postprocessed - bound output buffers may be reused
+            self._release_io_binding_buffers()
+
+    def _infer_in_batches(self, image: Any, **kwargs) -> Any:
         input_elements = len(image) if isinstance(image, list) else 1
         max_batch_size = MAX_BATCH_SIZE if self.batching_enabled else self.batch_size
         if (input_elements == 1) or (max_batch_size == float("inf")):
@@ -636,6 +703,54 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
             inference_results.append(batch_inference_results)
         return self.merge_inference_results(inference_results=inference_results)
 
+    def run_onnx_session(self, img_in: np.ndarray) -> List[np.ndarray]:
+        """Runs the inference session on preprocessed input - equivalent of
+        `self.onnx_session.run(None, {self.input_name: img_in})`.
+
+        If the model has pool of session replicas (see `initialize_onnx_session_pool()`),
+        the least busy replica is used.
+
+        With `ONNXRUNTIME_IO_BINDING_ENABLED`, input and outputs are bound to buffers
+        preallocated per input shape (see `IOBindingSessionRunner`) - returned arrays are
+        then only valid until `infer(...)` finishes, so they must not be kept beyond
+        postprocessing.
+        """
+        if self.onnx_session_pool is None:
+            return self._run_onnx_session(
+                session=self.onnx_session, runner_owner=self, img_in=img_in
+            )
+        with self.onnx_session_pool.replica() as replica:
+            return self._run_onnx_session(
+                session=replica.session, runner_owner=replica, img_in=img_in
+            )
+
+    def _run_onnx_session(
+        self,
+        session: onnxruntime.InferenceSession,
+        runner_owner: Union["OnnxRoboflowInferenceModel", OnnxSessionReplica],
+        img_in: np.ndarray,
+    ) -> List[np.ndarray]:
+        if not ONNXRUNTIME_IO_BINDING_ENABLED:
+            return session.run(None, {self.input_name: img_in})
+        runner = runner_owner.io_binding_runner
+        if runner is None or runner.session is not session:
+            runner = IOBindingSessionRunner(
+                session=session, max_shapes=ONNXRUNTIME_IO_BINDING_MAX_SHAPES
+            )
+            runner_owner.io_binding_runner = runner
+        return runner.run(input_name=self.input_name, input_data=img_in)
+
+    def _release_io_binding_buffers(self) -> None:
+        runners = [self.io_binding_runner]
+        if self.onnx_session_pool is not None:
+            runners.extend(
+                replica.io_binding_runner
+                for replica in self.onnx_session_pool.replicas()
+            )
+        for runner in runners:
+            if runner is not None:
+                runner.release()
+
     def merge_inference_results(self, inference_results: List[Any]) -> Any:
         return list(itertools.chain(*inference_results))
 
@@ -675,9 +790,12 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
         test_image = (np.random.rand(1024, 1024, 3) * 255).astype(np.uint8)
         logger.debug(f"Getting model output shape. Image size: {test_image.shape}")
         test_image, _ = self.preprocess(test_image)
-        output = self.predict(test_image)[0]
+        try:
+            output_shape = self.predict(test_image)[0].shape
+        finally:
+            self._release_io_binding_buffers()
         logger.debug(f"Model output shape test finished.")
-        return output.shape
+        return output_shape
 
     def validate_model_classes(self) -> None:
         pass
@@ -702,24 +820,20 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
 
             if not self.load_weights:
                 providers = ["OpenVINOExecutionProvider", "CPUExecutionProvider"]
+            self.onnx_model_path = self.cache_file(self.weights_file)
             try:
-                session_options = onnxruntime.SessionOptions()
-                # TensorRT does better graph optimization for its EP than onnx
-                if has_trt(providers):
-                    session_options.graph_optimization_level = (
-                        onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
-                    )
-                self.onnx_session = onnxruntime.InferenceSession(
-                    self.cache_file(self.weights_file),
+                self.onnx_session = create_inference_session(
+                    model_path=self.onnx_model_path,
                     providers=providers,
-                    sess_options=session_options,
+                    model_id=self.endpoint,
                 )
             except Exception as e:
                 self.clear_cache()
                 raise ModelArtefactError(
                     f"Unable to load ONNX session. Cause: {e}"
                 ) from e
-            logger.debug(f"Session created in {perf_counter() - t1_session} seconds")
+            self.session_load_time = perf_counter() - t1_session
+            logger.debug(f"Session created in {self.session_load_time} seconds")
 
             if REQUIRED_ONNX_PROVIDERS:
                 available_providers = onnxruntime.get_available_providers()
@@ -788,6 +902,167 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
                 )
         logger.debug("Model initialisation finished.")
 
+    def initialize_quantized_model(self) -> None:
+        """Swaps the inference session for the one of INT8 copy of the model, if requested
+        with `quantization` session option (see `OnnxSessionConfig`) and the model runs on CPU.
+
+        The copy is saved next to the weights, on the first load - quantized `dynamic`ally or
+        `static`ally, with activations calibrated on images from
+        `ONNXRUNTIME_QUANTIZATION_CALIBRATION_DIR`. Detections of both models on these images
+        are compared, and the INT8 model is only served if its mAP@0.5 (with FP32 detections
+        taken as ground truth) drops by no more than `ONNXRUNTIME_QUANTIZATION_MAX_MAP_DRIFT` -
+        otherwise the FP32 model is kept. Only models predicting bounding boxes (see
+        `QUANTIZABLE_TASK_TYPES`) can be validated that way, so others are never quantized.
+        """
+        mode = get_onnx_session_config(model_id=self.endpoint).quantization
+        if mode is None or mode == "none":
+            return None
+        task_type = getattr(self, "task_type", None)
+        if task_type not in QUANTIZABLE_TASK_TYPES:
+            logger.info(
+                f"Quantization of model {self.endpoint} skipped - it only applies to models "
+                f"of types {sorted(QUANTIZABLE_TASK_TYPES)}, but model type is: {task_type}"
+            )
+            return None
+        if set(self.onnx_session.get_providers()) != {"CPUExecutionProvider"}:
+            logger.info(
+                f"Quantization of model {self.endpoint} skipped - it only applies to models "
+                f"served on CPU, but providers are: {self.onnx_session.get_providers()}"
+            )
+            return None
+        model_path = self.cache_file(self.weights_file)
+        quantized_model_path = get_quantized_model_path(
+            model_path=model_path, mode=mode
+        )
+        metadata = get_quantized_model_metadata(model_path=model_path, mode=mode)
+        fp32_session = self.onnx_session
+        try:
+            report = load_quantization_report(
+                quantized_model_path=quantized_model_path, metadata=metadata
+            )
+            if report is None:
+                report = self._quantize_and_validate_model(
+                    model_path=model_path,
+                    quantized_model_path=quantized_model_path,
+                    metadata=metadata,
+                    mode=mode,
+                )
+            if report is None:
+                return None
+            if report["map_drift"] > ONNXRUNTIME_QUANTIZATION_MAX_MAP_DRIFT:
+                logger.warning(
+                    f"INT8 ({mode}) model {self.endpoint} is not served, as its mAP "
+                    f"drift {report['map_drift']:.4f} exceeds "
+                    f"{ONNXRUNTIME_QUANTIZATION_MAX_MAP_DRIFT} - falling back to FP32 model."
+                )
+                self.onnx_session = fp32_session
+                return None
+            if self.onnx_session is fp32_session:
+                self.onnx_session = create_inference_session(
+                    model_path=quantized_model_path,
+                    providers=self.onnxruntime_execution_providers,
+                    model_id=self.endpoint,
+                )
+        except Exception as error:
+            logger.warning(
+                f"Could not serve INT8 ({mode}) model {self.endpoint} - falling back to "
+                f"FP32 model. Cause: {error}"
+            )
+            self.onnx_session = fp32_session
+            remove_quantized_model(quantized_model_path=quantized_model_path)
+            return None
+        self.quantization = mode
+        self.onnx_model_path = quantized_model_path
+        logger.info(
+            f"Serving INT8 ({mode}) model {self.endpoint}, mAP drift: "
+            f"{report['map_drift']:.4f}"
+        )
+
+    def initialize_onnx_session_pool(self) -> None:
+        """Creates pool of replicas of the inference session, if more than one replica is
+        allowed for the model with `min_replicas` / `max_replicas` session options (see
+        `OnnxSessionConfig`) - replicas are added when all of them are busy and removed once
+        idle (see `OnnxSessionPool`)."""
+        config = get_onnx_session_config(model_id=self.endpoint)
+        max_replicas = get_max_replicas(config=config)
+        if max_replicas <= 1:
+            return None
+        self.onnx_session_pool = OnnxSessionPool(
+            model_id=self.endpoint,
+            primary_session=self.onnx_session,
+            session_factory=partial(
+                create_inference_session,
+                model_path=self.onnx_model_path,
+                providers=self.onnxruntime_execution_providers,
+                model_id=self.endpoint,
+            ),
+            min_replicas=config.min_replicas or 1,
+            max_replicas=max_replicas,
+            replica_memory_size=os.path.getsize(self.onnx_model_path),
+        )
+        logger.info(
+            f"Model {self.endpoint} is served with up to {max_replicas} session replicas"
+        )
+
+    def _quantize_and_validate_model(
+        self,
+        model_path: str,
+        quantized_model_path: str,
+        metadata: Dict[str, Any],
+        mode: str,
+    ) -> Optional[Dict[str, Any]]:
+        images = load_calibration_images(
+            directories=[ONNXRUNTIME_QUANTIZATION_CALIBRATION_DIR],
+            max_images=ONNXRUNTIME_QUANTIZATION_CALIBRATION_IMAGES,
+        )
+        if not images:
+            logger.warning(
+                f"Quantization of model {self.endpoint} skipped - no calibration images "
+                f"found in {ONNXRUNTIME_QUANTIZATION_CALIBRATION_DIR}."
+            )
+            return None
+        start = perf_counter()
+        calibration_inputs = None
+        if mode == "static":
+            calibration_inputs = [
+                {self.input_name: self.preprocess(image)[0]} for image in images
+            ]
+        quantize_model(
+            model_path=model_path,
+            quantized_model_path=quantized_model_path,
+            mode=mode,
+            calibration_inputs=calibration_inputs,
+        )
+        fp32_detections = self._infer_detections(images=images)
+        self.onnx_session = create_inference_session(
+            model_path=quantized_model_path,
+            providers=self.onnxruntime_execution_providers,
+            model_id=self.endpoint,
+        )
+        int8_detections = self._infer_detections(images=images)
+        map_drift = compute_map_drift(
+            reference=fp32_detections, candidate=int8_detections
+        )
+        logger.info(
+            f"Model {self.endpoint} quantized ({mode}) and validated on {len(images)} "
+            f"images in {perf_counter() - start:.3f} seconds"
+        )
+        return save_quantization_report(
+            quantized_model_path=quantized_model_path,
+            metadata=metadata,
+            map_drift=map_drift,
+            calibration_images=len(images),
+        )
+
+    def _infer_detections(self, images: List[np.ndarray]) -> List[np.ndarray]:
+        detections = []
+        for image in images:
+            responses = self.infer(image, usage_inference_test_run=True)
+            if not isinstance(responses, list):
+                responses = [responses]
+            detections.extend(detections_from_responses(responses=responses))
+        return detections
+
     def load_image(
         self,
         image: Any,
@@ -0,0 +1,226 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import ContextManager, Deque, Dict, Generator, List, Optional, Union
+from uuid import uuid4
+
+from inference.core.env import ENABLE_MODEL_TRACING, MODEL_TRACING_BUFFER_SIZE
+from inference.core.managers.inference_metrics import (
+    InferenceMetricsRegistry,
+    InferenceStage,
+    inference_metrics,
+)
+
+MODEL_TRACING_CATEGORY = "model_tracing"
+REQUEST_EVENT_NAME = "model_inference_request"
+NULL_CONTEXT = nullcontext()
+METRICS_STAGES = {stage.value for stage in InferenceStage}
+
+
+@dataclass
+class ModelTrace:
+    trace_id: str
+    model_id: str
+    events: List[dict] = field(default_factory=list)
+
+
+active_trace: ContextVar[Optional[ModelTrace]] = ContextVar(
+    "active_model_trace", default=None
+)
+
+
+class ModelTracer(ABC):
+    """
+    Tracer of stages of model lifecycle (decoding, pre-processing, prediction, post-processing,
+    NMS, response construction, ...). Model base classes open trace for each request with
+    `trace_request(...)` and wrap stages with `stage(...)`. Events are recorded in Chrome
+    trace format - the same as used by `WorkflowsProfiler` - such that traces can be merged
+    and opened with `chrome://tracing` or Perfetto.
+    """
+
+    @classmethod
+    @abstractmethod
+    def init(cls, **kwargs) -> "ModelTracer":
+        pass
+
+    @abstractmethod
+    def trace_request(
+        self, model_id: str, trace_id: Optional[str] = None
+    ) -> ContextManager[None]:
+        pass
+
+    @abstractmethod
+    def stage(
+        self,
+        name: str,
+        metadata: Optional[Dict[str, Union[str, int, float, bool, list, dict]]] = None,
+    ) -> ContextManager[None]:
+        pass
+
+    @abstractmethod
+    def export_trace(self, trace_id: Optional[str] = None) -> List[dict]:
+        pass
+
+
+class NullModelTracer(ModelTracer):
+
+    @classmethod
+    def init(cls, **kwargs) -> "NullModelTracer":
+        return cls()
+
+    def trace_request(
+        self, model_id: str, trace_id: Optional[str] = None
+    ) -> ContextManager[None]:
+        return NULL_CONTEXT
+
+    def stage(
+        self,
+        name: str,
+        metadata: Optional[Dict[str, Union[str, int, float, bool, list, dict]]] = None,
+    ) -> ContextManager[None]:
+        return NULL_CONTEXT
+
+    def export_trace(self, trace_id: Optional[str] = None) -> List[dict]:
+        return []
+
+
+class BaseModelTracer(ModelTracer):
+    """
+    Keeps last `max_traces_in_buffer` request traces in ring buffer. Stages that are not
+    measured by inference metrics on their own (for instance `nms` or `make_response`) are
+    additionally reported to inference metrics registry once request trace is completed.
+    Stages entered outside of request trace (or in threads not inheriting the context) are
+    not recorded.
+    """
+
+    @classmethod
+    def init(
+        cls,
+        max_traces_in_buffer: int = MODEL_TRACING_BUFFER_SIZE,
+        metrics_registry: Optional[InferenceMetricsRegistry] = inference_metrics,
+        **kwargs,
+    ) -> "BaseModelTracer":
+        traces_buffer = deque(maxlen=max_traces_in_buffer)
+        return cls(traces_buffer=traces_buffer, metrics_registry=metrics_registry)
+
+    def __init__(
+        self,
+        traces_buffer: Deque[ModelTrace],
+        metrics_registry: Optional[InferenceMetricsRegistry],
+    ):
+        self._traces_buffer = traces_buffer
+        self._metrics_registry = metrics_registry
+        self._lock = Lock()
+
+    def trace_request(
+        self, model_id: str, trace_id: Optional[str] = None
+    ) -> ContextManager[None]:
+        if active_trace.get() is not None:
+            # nested requests (for instance in batches) belong to the outer trace
+            return NULL_CONTEXT
+        return self._trace_request(model_id=model_id, trace_id=trace_id)
+
+    def stage(
+        self,
+        name: str,
+        metadata: Optional[Dict[str, Union[str, int, float, bool, list, dict]]] = None,
+    ) -> ContextManager[None]:
+        trace = active_trace.get()
+        if trace is None:
+            return NULL_CONTEXT
+        return self._record_stage(trace=trace, name=name, metadata=metadata)
+
+    def export_trace(self, trace_id: Optional[str] = None) -> List[dict]:
+        with self._lock:
+            traces = list(self._traces_buffer)
+        result = []
+        for trace in traces:
+            if trace_id is None or trace.trace_id == trace_id:
+                result.extend(trace.events)
+        return result
+
+    @contextmanager
+    def _trace_request(
+        self, model_id: str, trace_id: Optional[str]
+    ) -> Generator[None, None, None]:
+        trace = ModelTrace(trace_id=trace_id or str(uuid4()), model_id=model_id)
+        token = active_trace.set(trace)
+        try:
+            with self._record_stage(trace=trace, name=REQUEST_EVENT_NAME):
+                yield None
+        finally:
+            active_trace.reset(token)
+            with self._lock:
+                self._traces_buffer.append(trace)
+            self._report_stages_to_metrics(trace=trace)
+
+    @contextmanager
+    def _record_stage(
+        self,
+        trace: ModelTrace,
+        name: str,
+        metadata: Optional[Dict[str, Union[str, int, float, bool, list, dict]]] = None,
+    ) -> Generator[None, None, None]:
+        start_ts = round(time.monotonic() * 10**6)
+        error = None
+        try:
+            yield None
+        except Exception as e:
+            error = e
+            raise e
+        finally:
+            duration = round(time.monotonic() * 10**6) - start_ts
+            args = {"trace_id": trace.trace_id, "model_id": trace.model_id}
+            if metadata:
+                args.update(metadata)
+            if error is not None:
+                args["error"] = error.__class__.__name__
+            trace.events.append(
+                {
+                    "name": name,
+                    "ph": "X",
+                    "pid": os.getpid(),
+                    "tid": threading.get_native_id(),
+                    "ts": start_ts,
+                    "dur": duration,
+                    "cat": MODEL_TRACING_CATEGORY,
+                    "args": args,
+                }
+            )
+
+    def _report_stages_to_metrics(self, trace: ModelTrace) -> None:
+        if self._metrics_registry is None:
+            return None
+        for event in trace.events:
+            if event["name"] in METRICS_STAGES or event["name"] == REQUEST_EVENT_NAME:
+                continue
+            self._metrics_registry.observe_stage(
+                model_id=trace.model_id,
+                stage=event["name"],
+                duration=event["dur"] / 10**6,
+            )
+
+
+def initialise_model_tracer() -> ModelTracer:
+    if ENABLE_MODEL_TRACING:
+        return BaseModelTracer.init()
+    return NullModelTracer.init()
+
+
+model_tracer = initialise_model_tracer()
+
+
+@contextmanager
+def inference_stage(stage: InferenceStage) -> Generator[None, None, None]:
+    """
+    Measures stage of inference for inference metrics and records it in request trace
+    (if tracing is enabled).
+    """
+    with inference_metrics.stage_timer(stage), model_tracer.stage(name=stage.value):
+        yield None
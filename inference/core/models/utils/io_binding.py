@@ -0,0 +1,194 @@
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import onnxruntime
+
+from inference.core.logger import logger
+
+BufferKey = Tuple[Tuple[int, ...], str]
+
+
+@dataclass
+class _BoundBuffers:
+    key: BufferKey
+    input_buffer: np.ndarray
+    output_buffers: List[np.ndarray]
+    io_binding: Optional[onnxruntime.IOBinding] = None
+
+
+@dataclass
+class _ShapeState:
+    occurrences: int = 0
+    output_specs: Optional[List[Tuple[Tuple[int, ...], np.dtype]]] = None
+    allocated_buffers: int = 0
+    irregular: bool = False
+
+
+class IOBindingSessionRunner:
+    """Runs ONNX Runtime session with input and outputs bound (with IOBinding) to buffers
+    preallocated per input shape - such that steady stream of same-shaped inputs (for
+    instance video frames) does not allocate fresh arrays on every call.
+
+    Shape is given buffers once it is seen `min_shape_occurrences` times (the first call
+    runs the session in a regular way, to learn shapes of outputs), at most `max_shapes`
+    (least recently used) shapes keep their buffers. Irregular shapes, shapes which outputs
+    change between calls and inputs received while all buffers of the shape are in use run
+    in a regular way.
+
+    Arrays returned by `run(...)` are the bound output buffers - they are leased to the
+    calling thread until it calls `release()` (or `run(...)` again), so postprocessing must be
+    done (or outputs copied) before that.
+    """
+
+    def __init__(
+        self,
+        session: onnxruntime.InferenceSession,
+        max_shapes: int = 4,
+        max_buffers_per_shape: int = 4,
+        min_shape_occurrences: int = 2,
+    ):
+        self.session = session
+        self._max_shapes = max(max_shapes, 1)
+        self._max_buffers_per_shape = max(max_buffers_per_shape, 1)
+        self._min_shape_occurrences = max(min_shape_occurrences, 2)
+        self._output_names = [output.name for output in session.get_outputs()]
+        self._shapes: "OrderedDict[BufferKey, _ShapeState]" = OrderedDict()
+        self._free_buffers: Dict[BufferKey, List[_BoundBuffers]] = defaultdict(list)
+        self._leases = threading.local()
+        self._lock = Lock()
+
+    def run(self, input_name: str, input_data: np.ndarray) -> List[np.ndarray]:
+        self.release()
+        key = (tuple(input_data.shape), input_data.dtype.str)
+        buffers, shape_state = self._acquire(key=key)
+        if buffers is None:
+            outputs = self.session.run(None, {input_name: input_data})
+            if shape_state is not None:
+                self._register_outputs(shape_state=shape_state, outputs=outputs)
+            return outputs
+        try:
+            np.copyto(buffers.input_buffer, input_data)
+            if buffers.io_binding is None:
+                buffers.io_binding = self._bind(input_name=input_name, buffers=buffers)
+            self.session.run_with_iobinding(buffers.io_binding)
+        except Exception as error:
+            logger.debug(
+                f"Could not run session with bound buffers for input of shape "
+                f"{input_data.shape} - falling back to regular run. Cause: {error}"
+            )
+            self._mark_irregular(key=key)
+            return self.session.run(None, {input_name: input_data})
+        self._get_thread_leases().append(buffers)
+        return buffers.output_buffers
+
+    def release(self) -> None:
+        """Returns buffers leased to the calling thread - arrays returned by `run(...)` must
+        not be used afterwards."""
+        leases = self._get_thread_leases()
+        if not leases:
+            return None
+        with self._lock:
+            for buffers in leases:
+                shape_state = self._shapes.get(buffers.key)
+                if shape_state is not None and not shape_state.irregular:
+                    self._free_buffers[buffers.key].append(buffers)
+        leases.clear()
+
+    def bound_shapes(self) -> Set[Tuple[int, ...]]:
+        with self._lock:
+            return {
+                key[0]
+                for key, state in self._shapes.items()
+                if state.allocated_buffers > 0 and not state.irregular
+            }
+
+    def _acquire(
+        self, key: BufferKey
+    ) -> Tuple[Optional[_BoundBuffers], Optional[_ShapeState]]:
+        with self._lock:
+            shape_state = self._shapes.get(key)
+            if shape_state is None:
+                shape_state = _ShapeState()
+                self._shapes[key] = shape_state
+                self._evict_shapes()
+            self._shapes.move_to_end(key)
+            shape_state.occurrences += 1
+            if (
+                shape_state.irregular
+                or shape_state.output_specs is None
+                or shape_state.occurrences < self._min_shape_occurrences
+            ):
+                # outputs of regular runs are checked, not to bind shapes which outputs vary
+                return None, shape_state
+            if self._free_buffers[key]:
+                return self._free_buffers[key].pop(), None
+            if shape_state.allocated_buffers >= self._max_buffers_per_shape:
+                return None, None
+            shape_state.allocated_buffers += 1
+            output_specs = shape_state.output_specs
+        return (
+            _BoundBuffers(
+                key=key,
+                input_buffer=np.empty(key[0], dtype=np.dtype(key[1])),
+                output_buffers=[
+                    np.empty(shape, dtype=dtype) for shape, dtype in output_specs
+                ],
+            ),
+            None,
+        )
+
+    def _register_outputs(
+        self, shape_state: _ShapeState, outputs: List[np.ndarray]
+    ) -> None:
+        if not all(isinstance(output, np.ndarray) for output in outputs):
+            # sequences and maps cannot be bound to preallocated buffers
+            shape_state.irregular = True
+            return None
+        output_specs = [(tuple(output.shape), output.dtype) for output in outputs]
+        with self._lock:
+            if shape_state.output_specs is None:
+                shape_state.output_specs = output_specs
+            elif shape_state.output_specs != output_specs:
+                shape_state.irregular = True
+
+    def _bind(self, input_name: str, buffers: _BoundBuffers) -> onnxruntime.IOBinding:
+        io_binding = self.session.io_binding()
+        io_binding.bind_input(
+            input_name,
+            "cpu",
+            0,
+            buffers.input_buffer.dtype,
+            list(buffers.input_buffer.shape),
+            buffers.input_buffer.ctypes.data,
+        )
+        for name, output_buffer in zip(self._output_names, buffers.output_buffers):
+            io_binding.bind_output(
+                name,
+                "cpu",
+                0,
+                output_buffer.dtype,
+                list(output_buffer.shape),
+                output_buffer.ctypes.data,
+            )
+        return io_binding
+
+    def _mark_irregular(self, key: BufferKey) -> None:
+        with self._lock:
+            shape_state = self._shapes.get(key)
+            if shape_state is not None:
+                shape_state.irregular = True
+            self._free_buffers.pop(key, None)
+
+    def _evict_shapes(self) -> None:
+        while len(self._shapes) > self._max_shapes:
+            key, _ = self._shapes.popitem(last=False)
+            self._free_buffers.pop(key, None)
+
+    def _get_thread_leases(self) -> List[_BoundBuffers]:
+        if not hasattr(self._leases, "buffers"):
+            self._leases.buffers = []
+        return self._leases.buffers
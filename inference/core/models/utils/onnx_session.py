@@ -0,0 +1,557 @@
+import hashlib
+import json
+import os
+import platform
+import weakref
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from uuid import uuid4
+
+import onnxruntime
+
+from inference.core.env import (
+    ONNXRUNTIME_CORES_PER_MODEL,
+    ONNXRUNTIME_ENABLE_CPU_MEM_ARENA,
+    ONNXRUNTIME_ENABLE_MEM_PATTERN,
+    ONNXRUNTIME_EXECUTION_MODE,
+    ONNXRUNTIME_GRAPH_OPTIMIZATION_LEVEL,
+    ONNXRUNTIME_INTER_OP_NUM_THREADS,
+    ONNXRUNTIME_INTRA_OP_NUM_THREADS,
+    ONNXRUNTIME_OPTIMIZED_MODEL_CACHE_ENABLED,
+    ONNXRUNTIME_QUANTIZATION,
+    ONNXRUNTIME_SESSION_CONFIG,
+    ONNXRUNTIME_SESSION_MAX_REPLICAS,
+    ONNXRUNTIME_SESSION_MIN_REPLICAS,
+    ONNXRUNTIME_USE_GLOBAL_THREAD_POOL,
+)
+from inference.core.exceptions import InvalidEnvironmentVariableError
+from inference.core.logger import logger
+from inference.core.models.utils.onnx import has_trt
+from inference.core.utils.file_system import dump_json, read_json
+
+GRAPH_OPTIMIZATION_LEVELS = {
+    "disable": onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+OPTIMIZED_MODEL_SUFFIX = ".optimized.onnx"
+OPTIMIZED_MODEL_METADATA_SUFFIX = ".json"
+EXECUTION_MODES = {
+    "sequential": onnxruntime.ExecutionMode.ORT_SEQUENTIAL,
+    "parallel": onnxruntime.ExecutionMode.ORT_PARALLEL,
+}
+QUANTIZATION_MODES = {"none", "dynamic", "static"}
+# execution providers compiling graph nodes into their own kernels - ONNX Runtime cannot
+# save optimized graphs containing compiled nodes
+COMPILING_EXECUTION_PROVIDERS = {
+    "CoreMLExecutionProvider",
+    "MIGraphXExecutionProvider",
+    "NnapiExecutionProvider",
+    "OpenVINOExecutionProvider",
+    "QNNExecutionProvider",
+    "TensorrtExecutionProvider",
+    "VitisAIExecutionProvider",
+}
+
+
+@dataclass(frozen=True)
+class OnnxSessionConfig:
+    """Options of ONNX Runtime session - `None` means that the option is not set and
+    the less specific configuration (or ONNX Runtime default) applies.
+
+    Attributes:
+        intra_op_num_threads (Optional[int]): Threads parallelising execution within operators.
+        inter_op_num_threads (Optional[int]): Threads parallelising execution of graph nodes.
+        graph_optimization_level (Optional[str]): `disable`, `basic`, `extended` or `all`.
+        execution_mode (Optional[str]): `sequential` or `parallel`.
+        enable_cpu_mem_arena (Optional[bool]): Flag to enable CPU memory arena.
+        enable_mem_pattern (Optional[bool]): Flag to enable memory pattern optimisation.
+        cores (Optional[Tuple[int, ...]]): CPU cores intra-op threads are pinned to (if given,
+            takes precedence over cores partitioning).
+        quantization (Optional[str]): `none`, `dynamic` or `static` - INT8 quantization of
+            the model served on CPU (see `OnnxRoboflowInferenceModel.initialize_quantized_model()`).
+        min_replicas (Optional[int]): Minimal number of session replicas of the model.
+        max_replicas (Optional[int]): Maximal number of session replicas of the model (`0` -
+            sized from CPU cores, see `OnnxSessionPool`).
+    """
+
+    intra_op_num_threads: Optional[int] = None
+    inter_op_num_threads: Optional[int] = None
+    graph_optimization_level: Optional[str] = None
+    execution_mode: Optional[str] = None
+    enable_cpu_mem_arena: Optional[bool] = None
+    enable_mem_pattern: Optional[bool] = None
+    cores: Optional[Tuple[int, ...]] = None
+    quantization: Optional[str] = None
+    min_replicas: Optional[int] = None
+    max_replicas: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if (
+            self.graph_optimization_level is not None
+            and self.graph_optimization_level not in GRAPH_OPTIMIZATION_LEVELS
+        ):
+            raise ValueError(
+                f"Graph optimization level {self.graph_optimization_level} is invalid - "
+                f"expected one of {list(GRAPH_OPTIMIZATION_LEVELS)}"
+            )
+        if (
+            self.execution_mode is not None
+            and self.execution_mode not in EXECUTION_MODES
+        ):
+            raise ValueError(
+                f"Execution mode {self.execution_mode} is invalid - expected one of "
+                f"{sorted(EXECUTION_MODES)}"
+            )
+        if (
+            self.quantization is not None
+            and self.quantization not in QUANTIZATION_MODES
+        ):
+            raise ValueError(
+                f"Quantization {self.quantization} is invalid - expected one of "
+                f"{sorted(QUANTIZATION_MODES)}"
+            )
+        if self.min_replicas is not None and self.min_replicas < 1:
+            raise ValueError("Minimal number of replicas must be positive")
+        if self.max_replicas is not None and self.max_replicas < 0:
+            raise ValueError("Maximal number of replicas must not be negative")
+        if self.cores is not None:
+            object.__setattr__(self, "cores", tuple(self.cores))
+
+    @classmethod
+    def from_dict(cls, value: dict) -> "OnnxSessionConfig":
+        known_fields = {field.name for field in fields(cls)}
+        unknown_fields = set(value) - known_fields
+        if unknown_fields:
+            raise ValueError(
+                f"Unknown ONNX session options: {sorted(unknown_fields)} - expected "
+                f"{sorted(known_fields)}"
+            )
+        return cls(**value)
+
+    def override(self, other: Optional["OnnxSessionConfig"]) -> "OnnxSessionConfig":
+        """Returns config with options of `other` taking precedence over the ones of `self`."""
+        if other is None:
+            return self
+        values = {
+            field.name: (
+                getattr(other, field.name)
+                if getattr(other, field.name) is not None
+                else getattr(self, field.name)
+            )
+            for field in fields(self)
+        }
+        return OnnxSessionConfig(**values)
+
+
+DEFAULT_ONNX_SESSION_CONFIG = OnnxSessionConfig(
+    intra_op_num_threads=ONNXRUNTIME_INTRA_OP_NUM_THREADS or None,
+    inter_op_num_threads=ONNXRUNTIME_INTER_OP_NUM_THREADS or None,
+    graph_optimization_level=ONNXRUNTIME_GRAPH_OPTIMIZATION_LEVEL,
+    execution_mode=ONNXRUNTIME_EXECUTION_MODE,
+    enable_cpu_mem_arena=ONNXRUNTIME_ENABLE_CPU_MEM_ARENA,
+    enable_mem_pattern=ONNXRUNTIME_ENABLE_MEM_PATTERN,
+    quantization=ONNXRUNTIME_QUANTIZATION,
+    min_replicas=ONNXRUNTIME_SESSION_MIN_REPLICAS,
+    max_replicas=ONNXRUNTIME_SESSION_MAX_REPLICAS,
+)
+
+
+class CPUCoresPartitioner:
+    """Splits CPU cores into disjoint partitions and hands them out to sessions - the
+    partition used by the smallest number of sessions is given first, such that
+    concurrently loaded models are spread across cores instead of competing for all of them.
+    """
+
+    def __init__(self, cores: List[int], cores_per_partition: int):
+        cores_per_partition = max(min(cores_per_partition, len(cores)), 1)
+        partitions_number = max(len(cores) // cores_per_partition, 1)
+        self._partitions = [
+            cores[i * cores_per_partition : (i + 1) * cores_per_partition]
+            for i in range(partitions_number)
+        ]
+        self._usage = [0] * partitions_number
+        self._lock = Lock()
+
+    @property
+    def partitions(self) -> List[List[int]]:
+        return [list(partition) for partition in self._partitions]
+
+    def acquire(self) -> Tuple[int, List[int]]:
+        with self._lock:
+            partition_id = min(
+                range(len(self._partitions)), key=lambda i: self._usage[i]
+            )
+            self._usage[partition_id] += 1
+            return partition_id, list(self._partitions[partition_id])
+
+    def release(self, partition_id: int) -> None:
+        with self._lock:
+            self._usage[partition_id] = max(self._usage[partition_id] - 1, 0)
+
+    def usage(self) -> List[int]:
+        with self._lock:
+            return list(self._usage)
+
+
+_session_configs: Dict[str, OnnxSessionConfig] = {}
+_session_configs_lock = Lock()
+_global_thread_pool_lock = Lock()
+_global_thread_pool_initialised = False
+
+
+def set_onnx_session_config(model_id: str, config: Optional[OnnxSessionConfig]) -> None:
+    """Registers options of ONNX Runtime sessions of given model, which are applied when
+    the model is loaded next time (`None` removes registered options)."""
+    with _session_configs_lock:
+        if config is None:
+            _session_configs.pop(model_id, None)
+        else:
+            _session_configs[model_id] = config
+
+
+def get_onnx_session_config(model_id: Optional[str]) -> OnnxSessionConfig:
+    """Resolves options of ONNX Runtime sessions of given model - global options from
+    environment are overridden by options given for the model in `ONNXRUNTIME_SESSION_CONFIG`,
+    which are overridden by options registered with `set_onnx_session_config(...)`."""
+    config = DEFAULT_ONNX_SESSION_CONFIG
+    if model_id is None:
+        return config
+    config = config.override(
+        _get_session_configs_from_env(raw_config=ONNXRUNTIME_SESSION_CONFIG).get(
+            model_id
+        )
+    )
+    with _session_configs_lock:
+        return config.override(_session_configs.get(model_id))
+
+
+def create_inference_session(
+    model_path: str,
+    providers: List[Union[str, Tuple[str, dict]]],
+    model_id: Optional[str] = None,
+) -> onnxruntime.InferenceSession:
+    """Creates ONNX Runtime session with options resolved for given model.
+
+    Graph optimised by ONNX Runtime is saved next to the model on first load (unless
+    disabled with `ONNXRUNTIME_OPTIMIZED_MODEL_CACHE_ENABLED`), and loaded instead of the
+    original model later on - as long as ONNX Runtime version, available execution providers,
+    optimisation level, CPU and the original model did not change. Graphs are not saved when
+    execution provider compiling nodes (for instance OpenVINO) is available.
+
+    Args:
+        model_path (str): Path to ONNX model.
+        providers (List[Union[str, Tuple[str, dict]]]): Execution providers in priority order.
+        model_id (Optional[str]): ID of the model, used to resolve model-specific options.
+
+    Returns:
+        onnxruntime.InferenceSession: Created session.
+    """
+    config = get_onnx_session_config(model_id=model_id)
+    if has_trt(providers):
+        # TensorRT does better graph optimization for its EP than onnx
+        config = config.override(OnnxSessionConfig(graph_optimization_level="disable"))
+    partition_id, cores = None, config.cores
+    if cores is None and ONNXRUNTIME_CORES_PER_MODEL > 0:
+        partition_id, cores = get_cpu_cores_partitioner().acquire()
+    try:
+        session = _create_session_with_optimized_model_cache(
+            model_path=model_path, providers=providers, config=config, cores=cores
+        )
+    except Exception:
+        if partition_id is not None:
+            get_cpu_cores_partitioner().release(partition_id=partition_id)
+        raise
+    if partition_id is not None:
+        weakref.finalize(
+            session, get_cpu_cores_partitioner().release, partition_id=partition_id
+        )
+    return session
+
+
+def apply_onnx_session_config(
+    session_options: onnxruntime.SessionOptions,
+    config: OnnxSessionConfig,
+    cores: Optional[Sequence[int]] = None,
+) -> None:
+    """Applies config onto session options, pinning intra-op threads to `cores` (if given)."""
+    if config.graph_optimization_level is not None:
+        session_options.graph_optimization_level = GRAPH_OPTIMIZATION_LEVELS[
+            config.graph_optimization_level
+        ]
+    if config.execution_mode is not None:
+        session_options.execution_mode = EXECUTION_MODES[config.execution_mode]
+    if config.enable_cpu_mem_arena is not None:
+        session_options.enable_cpu_mem_arena = config.enable_cpu_mem_arena
+    if config.enable_mem_pattern is not None:
+        session_options.enable_mem_pattern = config.enable_mem_pattern
+    if ONNXRUNTIME_USE_GLOBAL_THREAD_POOL and _ensure_global_thread_pool():
+        # once global thread pool is created, all sessions are obliged to use it - thread
+        # counts and affinities are properties of the pool, not of the session
+        session_options.use_per_session_threads = False
+        return None
+    if config.inter_op_num_threads is not None:
+        session_options.inter_op_num_threads = config.inter_op_num_threads
+    intra_op_num_threads = config.intra_op_num_threads
+    if cores:
+        cores = list(cores)
+        intra_op_num_threads = min(intra_op_num_threads or len(cores), len(cores))
+        affinities = get_intra_op_thread_affinities(cores=cores[:intra_op_num_threads])
+        if affinities:
+            session_options.add_session_config_entry(
+                "session.intra_op_thread_affinities", affinities
+            )
+    if intra_op_num_threads is not None:
+        session_options.intra_op_num_threads = intra_op_num_threads
+
+
+def get_optimized_model_path(model_path: str, metadata: Dict[str, Any]) -> str:
+    key = hashlib.sha256(
+        json.dumps(metadata, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:16]
+    stem = os.path.splitext(model_path)[0]
+    return f"{stem}.{key}{OPTIMIZED_MODEL_SUFFIX}"
+
+
+def get_optimized_model_metadata(
+    model_path: str,
+    providers: List[Union[str, Tuple[str, dict]]],
+    config: OnnxSessionConfig,
+) -> Dict[str, Any]:
+    """Describes everything the optimised graph depends on - the graph is stale if any of
+    these changes."""
+    available_providers = set(onnxruntime.get_available_providers())
+    provider_names = [p[0] if isinstance(p, tuple) else p for p in providers]
+    model_stat = os.stat(model_path)
+    return {
+        "onnxruntime_version": onnxruntime.__version__,
+        "providers": [p for p in provider_names if p in available_providers],
+        "graph_optimization_level": config.graph_optimization_level or "all",
+        "cpu": _get_cpu_signature(),
+        "model_file": os.path.basename(model_path),
+        "model_size": model_stat.st_size,
+        "model_mtime_ns": model_stat.st_mtime_ns,
+    }
+
+
+def _create_session_with_optimized_model_cache(
+    model_path: str,
+    providers: List[Union[str, Tuple[str, dict]]],
+    config: OnnxSessionConfig,
+    cores: Optional[Sequence[int]],
+) -> onnxruntime.InferenceSession:
+    if (
+        not ONNXRUNTIME_OPTIMIZED_MODEL_CACHE_ENABLED
+        or config.graph_optimization_level == "disable"
+    ):
+        return _create_session(
+            model_path=model_path, providers=providers, config=config, cores=cores
+        )
+    metadata = get_optimized_model_metadata(
+        model_path=model_path, providers=providers, config=config
+    )
+    if COMPILING_EXECUTION_PROVIDERS.intersection(metadata["providers"]):
+        return _create_session(
+            model_path=model_path, providers=providers, config=config, cores=cores
+        )
+    optimized_model_path = get_optimized_model_path(
+        model_path=model_path, metadata=metadata
+    )
+    if _is_optimized_model_valid(path=optimized_model_path, metadata=metadata):
+        start = perf_counter()
+        try:
+            session = _create_session(
+                model_path=optimized_model_path,
+                providers=providers,
+                config=config.override(
+                    OnnxSessionConfig(graph_optimization_level="disable")
+                ),
+                cores=cores,
+            )
+            logger.debug(
+                f"Optimized model {optimized_model_path} loaded in "
+                f"{perf_counter() - start:.3f} seconds"
+            )
+            return session
+        except Exception as error:
+            logger.warning(
+                f"Could not load optimized model {optimized_model_path}, falling back to "
+                f"{model_path}. Cause: {error}"
+            )
+            _remove_optimized_model(path=optimized_model_path)
+    temporary_path = f"{optimized_model_path}.{uuid4().hex}.tmp"
+    start = perf_counter()
+    try:
+        session = _create_session(
+            model_path=model_path,
+            providers=providers,
+            config=config,
+            cores=cores,
+            optimized_model_filepath=temporary_path,
+        )
+    except Exception as error:
+        # for instance, models above 2GB cannot be serialised - loading is re-attempted
+        # without saving the optimized graph, such that genuine errors are raised
+        logger.debug(f"Could not save optimized model of {model_path}: {error}")
+        _remove_if_exists(path=temporary_path)
+        return _create_session(
+            model_path=model_path, providers=providers, config=config, cores=cores
+        )
+    logger.debug(
+        f"Model {model_path} optimized in {perf_counter() - start:.3f} seconds"
+    )
+    _persist_optimized_model(
+        temporary_path=temporary_path,
+        optimized_model_path=optimized_model_path,
+        metadata=metadata,
+    )
+    return session
+
+
+def _create_session(
+    model_path: str,
+    providers: List[Union[str, Tuple[str, dict]]],
+    config: OnnxSessionConfig,
+    cores: Optional[Sequence[int]],
+    optimized_model_filepath: Optional[str] = None,
+) -> onnxruntime.InferenceSession:
+    session_options = onnxruntime.SessionOptions()
+    apply_onnx_session_config(
+        session_options=session_options, config=config, cores=cores
+    )
+    if optimized_model_filepath is not None:
+        session_options.optimized_model_filepath = optimized_model_filepath
+    return onnxruntime.InferenceSession(
+        model_path, providers=providers, sess_options=session_options
+    )
+
+
+def _is_optimized_model_valid(path: str, metadata: Dict[str, Any]) -> bool:
+    metadata_path = path + OPTIMIZED_MODEL_METADATA_SUFFIX
+    if not os.path.isfile(path) or not os.path.isfile(metadata_path):
+        return False
+    try:
+        saved_metadata = read_json(path=metadata_path)
+    except ValueError:
+        return False
+    if not isinstance(saved_metadata, dict):
+        return False
+    optimized_model_size = saved_metadata.pop("optimized_model_size", None)
+    return saved_metadata == metadata and optimized_model_size == os.path.getsize(path)
+
+
+def _persist_optimized_model(
+    temporary_path: str, optimized_model_path: str, metadata: Dict[str, Any]
+) -> None:
+    if not os.path.isfile(temporary_path):
+        return None
+    try:
+        optimized_model_size = os.path.getsize(temporary_path)
+        os.replace(temporary_path, optimized_model_path)
+        dump_json(
+            path=optimized_model_path + OPTIMIZED_MODEL_METADATA_SUFFIX,
+            content={**metadata, "optimized_model_size": optimized_model_size},
+            allow_override=True,
+        )
+    except OSError as error:
+        logger.warning(
+            f"Could not save optimized model {optimized_model_path}: {error}"
+        )
+        _remove_if_exists(path=temporary_path)
+
+
+def _remove_optimized_model(path: str) -> None:
+    _remove_if_exists(path=path + OPTIMIZED_MODEL_METADATA_SUFFIX)
+    _remove_if_exists(path=path)
+
+
+def _remove_if_exists(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+@lru_cache(maxsize=None)
+def _get_cpu_signature() -> str:
+    # optimized graphs may use layouts specific to instruction sets supported by the CPU
+    flags = ""
+    if os.path.isfile("/proc/cpuinfo"):
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith(("flags", "Features")):
+                    flags = line.split(":", 1)[-1].strip()
+                    break
+    flags_digest = hashlib.sha256(flags.encode("utf-8")).hexdigest()[:16]
+    return f"{platform.machine()}-{flags_digest}"
+
+
+def get_intra_op_thread_affinities(cores: List[int]) -> str:
+    # the first intra-op thread is the one calling the session, so affinities are
+    # specified for remaining threads only - with 1-based processor IDs
+    return ";".join(str(core + 1) for core in cores[1:])
+
+
+def get_available_cpu_cores() -> List[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+@lru_cache(maxsize=None)
+def get_cpu_cores_partitioner() -> CPUCoresPartitioner:
+    partitioner = CPUCoresPartitioner(
+        cores=get_available_cpu_cores(),
+        cores_per_partition=ONNXRUNTIME_CORES_PER_MODEL,
+    )
+    logger.info(
+        f"ONNX Runtime sessions are pinned to partitions: {partitioner.partitions}"
+    )
+    return partitioner
+
+
+def _ensure_global_thread_pool() -> bool:
+    global _global_thread_pool_initialised
+    with _global_thread_pool_lock:
+        if _global_thread_pool_initialised:
+            return True
+        try:
+            from onnxruntime.capi._pybind_state import set_global_thread_pool_sizes
+
+            set_global_thread_pool_sizes(
+                ONNXRUNTIME_INTRA_OP_NUM_THREADS, ONNXRUNTIME_INTER_OP_NUM_THREADS
+            )
+        except ImportError:
+            logger.warning(
+                "Installed ONNX Runtime does not support global thread pool - "
+                "sessions use their own thread pools."
+            )
+            return False
+        except Exception as error:
+            # raised if the pool is already created - which is fine, as long as it exists
+            logger.warning(f"Could not set size of ONNX Runtime thread pool: {error}")
+        _global_thread_pool_initialised = True
+        return True
+
+
+@lru_cache(maxsize=None)
+def _get_session_configs_from_env(
+    raw_config: Optional[str],
+) -> Dict[str, OnnxSessionConfig]:
+    if not raw_config:
+        return {}
+    try:
+        parsed_config = json.loads(raw_config)
+        return {
+            model_id: OnnxSessionConfig.from_dict(value)
+            for model_id, value in parsed_config.items()
+        }
+    except (ValueError, TypeError, AttributeError) as error:
+        raise InvalidEnvironmentVariableError(
+            f"Expected ONNXRUNTIME_SESSION_CONFIG to be JSON object mapping model IDs into "
+            f"session options, but got '{raw_config}'. Cause: {error}"
+        ) from error
@@ -0,0 +1,284 @@
+import os
+from glob import glob
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import cv2
+import numpy as np
+import onnxruntime
+
+from inference.core.entities.responses.inference import (
+    InstanceSegmentationInferenceResponse,
+    KeypointsDetectionInferenceResponse,
+    ObjectDetectionInferenceResponse,
+)
+from inference.core.logger import logger
+from inference.core.utils.file_system import dump_json, read_json
+
+QUANTIZED_MODEL_SUFFIX = ".onnx"
+QUANTIZATION_REPORT_SUFFIX = ".json"
+CALIBRATION_IMAGES_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+# accuracy of quantized model is validated against bounding boxes (see `detections_from_responses`)
+QUANTIZABLE_TASK_TYPES = {
+    "object-detection",
+    "instance-segmentation",
+    "keypoint-detection",
+}
+
+
+def get_quantized_model_path(model_path: str, mode: str) -> str:
+    stem = os.path.splitext(model_path)[0]
+    return f"{stem}.int8-{mode}{QUANTIZED_MODEL_SUFFIX}"
+
+
+def get_quantized_model_metadata(model_path: str, mode: str) -> Dict[str, Any]:
+    """Describes everything the quantized model depends on - the model (and its validation
+    result) is stale if any of these changes."""
+    model_stat = os.stat(model_path)
+    return {
+        "onnxruntime_version": onnxruntime.__version__,
+        "quantization": mode,
+        "model_file": os.path.basename(model_path),
+        "model_size": model_stat.st_size,
+        "model_mtime_ns": model_stat.st_mtime_ns,
+    }
+
+
+def load_quantization_report(
+    quantized_model_path: str, metadata: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Returns result of validation of quantized model saved next to it - or `None` if the
+    model was not validated yet or is stale."""
+    report_path = quantized_model_path + QUANTIZATION_REPORT_SUFFIX
+    if not os.path.isfile(quantized_model_path) or not os.path.isfile(report_path):
+        return None
+    try:
+        report = read_json(path=report_path)
+    except ValueError:
+        return None
+    if not isinstance(report, dict) or report.get("metadata") != metadata:
+        return None
+    if report.get("quantized_model_size") != os.path.getsize(quantized_model_path):
+        return None
+    return report
+
+
+def save_quantization_report(
+    quantized_model_path: str,
+    metadata: Dict[str, Any],
+    map_drift: float,
+    calibration_images: int,
+) -> Dict[str, Any]:
+    report = {
+        "metadata": metadata,
+        "map_drift": map_drift,
+        "calibration_images": calibration_images,
+        "quantized_model_size": os.path.getsize(quantized_model_path),
+    }
+    dump_json(
+        path=quantized_model_path + QUANTIZATION_REPORT_SUFFIX,
+        content=report,
+        allow_override=True,
+    )
+    return report
+
+
+def remove_quantized_model(quantized_model_path: str) -> None:
+    for path in (
+        quantized_model_path + QUANTIZATION_REPORT_SUFFIX,
+        quantized_model_path,
+    ):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def load_calibration_images(
+    directories: List[str], max_images: int
+) -> List[np.ndarray]:
+    images = []
+    for directory in directories:
+        if not os.path.isdir(directory):
+            continue
+        for path in sorted(glob(os.path.join(directory, "*"))):
+            if len(images) >= max_images:
+                return images
+            if not path.lower().endswith(CALIBRATION_IMAGES_EXTENSIONS):
+                continue
+            image = cv2.imread(path)
+            if image is None:
+                logger.warning(f"Could not load calibration image {path}")
+                continue
+            images.append(image)
+    return images
+
+
+def quantize_model(
+    model_path: str,
+    quantized_model_path: str,
+    mode: str,
+    calibration_inputs: Optional[List[Dict[str, np.ndarray]]] = None,
+) -> None:
+    """Saves INT8 copy of the model - with weights quantized ahead of time and activations
+    quantized on the fly (`dynamic`) or with activations' ranges calibrated on
+    `calibration_inputs` (`static`)."""
+    try:
+        from onnxruntime.quantization import (
+            CalibrationDataReader,
+            QuantFormat,
+            QuantType,
+            quantize_dynamic,
+            quantize_static,
+        )
+    except ImportError as error:
+        raise ImportError(
+            "Quantization of ONNX models requires `onnx` package - install it with "
+            "`pip install onnx`"
+        ) from error
+
+    class _CalibrationDataReader(CalibrationDataReader):
+        def __init__(self, inputs: Iterable[Dict[str, np.ndarray]]):
+            self._inputs: Iterator[Dict[str, np.ndarray]] = iter(inputs)
+
+        def get_next(self) -> Optional[Dict[str, np.ndarray]]:
+            return next(self._inputs, None)
+
+    temporary_path = f"{quantized_model_path}.tmp"
+    try:
+        if mode == "dynamic":
+            quantize_dynamic(
+                model_input=model_path,
+                model_output=temporary_path,
+                weight_type=QuantType.QUInt8,
+            )
+        elif mode == "static":
+            if not calibration_inputs:
+                raise ValueError("Static quantization requires calibration inputs")
+            quantize_static(
+                model_input=model_path,
+                model_output=temporary_path,
+                calibration_data_reader=_CalibrationDataReader(calibration_inputs),
+                quant_format=QuantFormat.QDQ,
+                activation_type=QuantType.QUInt8,
+                weight_type=QuantType.QInt8,
+            )
+        else:
+            raise ValueError(f"Quantization {mode} is not supported")
+        os.replace(temporary_path, quantized_model_path)
+    finally:
+        if os.path.isfile(temporary_path):
+            os.remove(temporary_path)
+
+
+def detections_from_responses(responses: List[Any]) -> List[np.ndarray]:
+    """Converts detection responses into arrays of `[x_min, y_min, x_max, y_max, confidence,
+    class_id]` rows - one per image."""
+    detections = []
+    for response in responses:
+        if not isinstance(
+            response,
+            (
+                ObjectDetectionInferenceResponse,
+                InstanceSegmentationInferenceResponse,
+                KeypointsDetectionInferenceResponse,
+            ),
+        ):
+            raise ValueError(
+                f"Responses of type {type(response).__name__} do not contain bounding boxes"
+            )
+        detections.append(
+            np.array(
+                [
+                    [
+                        p.x - p.width / 2,
+                        p.y - p.height / 2,
+                        p.x + p.width / 2,
+                        p.y + p.height / 2,
+                        p.confidence,
+                        p.class_id,
+                    ]
+                    for p in response.predictions
+                ],
+                dtype=np.float64,
+            ).reshape(-1, 6)
+        )
+    return detections
+
+
+def compute_map_drift(
+    reference: List[np.ndarray],
+    candidate: List[np.ndarray],
+    iou_threshold: float = 0.5,
+) -> float:
+    """Returns `1 - mAP` of `candidate` detections, evaluated with `reference` detections
+    (of the same images) taken as ground truth - 0.0 means no drift. Classes detected only
+    by `candidate` count as ones with zero AP."""
+    classes = set()
+    for detections in reference + candidate:
+        classes.update(detections[:, 5].astype(int).tolist())
+    if not classes:
+        return 0.0
+    average_precisions = [
+        _compute_class_average_precision(
+            reference=reference,
+            candidate=candidate,
+            class_id=class_id,
+            iou_threshold=iou_threshold,
+        )
+        for class_id in sorted(classes)
+    ]
+    return float(1.0 - np.mean(average_precisions))
+
+
+def _compute_class_average_precision(
+    reference: List[np.ndarray],
+    candidate: List[np.ndarray],
+    class_id: int,
+    iou_threshold: float,
+) -> float:
+    ground_truth_count = 0
+    scores, true_positives = [], []
+    for reference_detections, candidate_detections in zip(reference, candidate):
+        ground_truth = reference_detections[reference_detections[:, 5] == class_id]
+        predictions = candidate_detections[candidate_detections[:, 5] == class_id]
+        ground_truth_count += len(ground_truth)
+        if len(predictions) == 0:
+            continue
+        predictions = predictions[np.argsort(-predictions[:, 4], kind="stable")]
+        matched = np.zeros(len(ground_truth), dtype=bool)
+        ious = _compute_iou(predictions[:, :4], ground_truth[:, :4])
+        for prediction_id in range(len(predictions)):
+            is_true_positive = False
+            if len(ground_truth) > 0:
+                prediction_ious = np.where(matched, -1.0, ious[prediction_id])
+                best_match = int(np.argmax(prediction_ious))
+                if prediction_ious[best_match] >= iou_threshold:
+                    matched[best_match] = True
+                    is_true_positive = True
+            scores.append(predictions[prediction_id, 4])
+            true_positives.append(is_true_positive)
+    if ground_truth_count == 0 or not scores:
+        return 0.0
+    order = np.argsort(-np.array(scores), kind="stable")
+    true_positives = np.array(true_positives)[order]
+    true_positives_cumulative = np.cumsum(true_positives)
+    recall = true_positives_cumulative / ground_truth_count
+    precision = true_positives_cumulative / np.arange(1, len(true_positives) + 1)
+    # all-points interpolated area under precision-recall curve
+    recall = np.concatenate(([0.0], recall, [1.0]))
+    precision = np.concatenate(([0.0], precision, [0.0]))
+    precision = np.flip(np.maximum.accumulate(np.flip(precision)))
+    changes = np.where(recall[1:] != recall[:-1])[0]
+    return float(
+        np.sum((recall[changes + 1] - recall[changes]) * precision[changes + 1])
+    )
+
+
+def _compute_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    area_a = np.prod(boxes_a[:, 2:] - boxes_a[:, :2], axis=1)
+    area_b = np.prod(boxes_b[:, 2:] - boxes_b[:, :2], axis=1)
+    union = area_a[:, None] + area_b[None, :] - intersection
+    return intersection / np.maximum(union, 1e-9)
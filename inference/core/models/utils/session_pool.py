@@ -0,0 +1,328 @@
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import count
+from threading import Lock, Thread
+from typing import Callable, Dict, Generator, List, Optional
+
+import onnxruntime
+
+from inference.core.env import (
+    ONNXRUNTIME_CORES_PER_MODEL,
+    ONNXRUNTIME_SESSION_REPLICAS_IDLE_TIMEOUT,
+    ONNXRUNTIME_SESSION_REPLICAS_MAX_MEMORY_MB,
+    ONNXRUNTIME_SESSION_REPLICAS_SCALE_UP_QUEUE_DEPTH,
+)
+from inference.core.logger import logger
+from inference.core.models.utils.io_binding import IOBindingSessionRunner
+from inference.core.models.utils.onnx_session import (
+    OnnxSessionConfig,
+    get_available_cpu_cores,
+)
+
+
+class ReplicasMemoryBudget:
+    """Memory shared by additional session replicas of all models - replica is only added
+    if its (estimated) memory fits into the budget."""
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._reserved_bytes = 0
+        self._lock = Lock()
+
+    def reserve(self, size: int) -> bool:
+        with self._lock:
+            if self._reserved_bytes + size > self._max_bytes:
+                return False
+            self._reserved_bytes += size
+            return True
+
+    def release(self, size: int) -> None:
+        with self._lock:
+            self._reserved_bytes = max(self._reserved_bytes - size, 0)
+
+    @property
+    def reserved_bytes(self) -> int:
+        with self._lock:
+            return self._reserved_bytes
+
+
+REPLICAS_MEMORY_BUDGET = ReplicasMemoryBudget(
+    max_bytes=int(ONNXRUNTIME_SESSION_REPLICAS_MAX_MEMORY_MB * 2**20)
+)
+
+# interval (in seconds) of background checks for idle replicas of all session pools
+IDLE_REPLICAS_CHECK_INTERVAL = 5.0
+
+
+class OnnxSessionReplica:
+    def __init__(self, replica_id: int, session: onnxruntime.InferenceSession):
+        self.replica_id = replica_id
+        self.session = session
+        self.io_binding_runner: Optional[IOBindingSessionRunner] = None
+        self.in_flight = 0
+        self.requests = 0
+        self.last_used = time.monotonic()
+        self._busy_since: Optional[float] = None
+        self._busy_seconds = 0.0
+
+    def start_request(self, now: float) -> None:
+        if self.in_flight == 0:
+            self._busy_since = now
+        self.in_flight += 1
+        self.requests += 1
+
+    def finish_request(self, now: float) -> None:
+        self.in_flight -= 1
+        self.last_used = now
+        if self.in_flight == 0 and self._busy_since is not None:
+            self._busy_seconds += now - self._busy_since
+            self._busy_since = None
+
+    def busy_seconds(self, now: float) -> float:
+        if self._busy_since is None:
+            return self._busy_seconds
+        return self._busy_seconds + now - self._busy_since
+
+
+@dataclass(frozen=True)
+class ReplicaStats:
+    replica_id: int
+    in_flight: int
+    requests: int
+    busy_seconds: float
+
+
+@dataclass(frozen=True)
+class SessionPoolStats:
+    model_id: str
+    replicas: List[ReplicaStats]
+    max_replicas: int
+
+    @property
+    def in_flight(self) -> int:
+        return sum(replica.in_flight for replica in self.replicas)
+
+
+class OnnxSessionPool:
+    """Replicas of ONNX Runtime session of a model, such that concurrent requests do not
+    compete for a single session.
+
+    Requests are dispatched to the replica with the smallest number of requests in flight.
+    Once the least busy replica has `scale_up_queue_depth` requests in flight, another
+    replica is created (in background) - as long as there are less than `max_replicas` of
+    them and estimated memory of the replica fits into `memory_budget`. Replicas idle for
+    `idle_timeout` seconds are removed, down to `min_replicas` - checked when replicas are
+    leased and released, when stats are read and periodically in background (so that idle
+    replicas of a model which is no longer requested are removed as well).
+    """
+
+    def __init__(
+        self,
+        model_id: str,
+        primary_session: onnxruntime.InferenceSession,
+        session_factory: Callable[[], onnxruntime.InferenceSession],
+        min_replicas: int,
+        max_replicas: int,
+        replica_memory_size: int,
+        scale_up_queue_depth: int = ONNXRUNTIME_SESSION_REPLICAS_SCALE_UP_QUEUE_DEPTH,
+        idle_timeout: float = ONNXRUNTIME_SESSION_REPLICAS_IDLE_TIMEOUT,
+        memory_budget: ReplicasMemoryBudget = REPLICAS_MEMORY_BUDGET,
+    ):
+        self.model_id = model_id
+        self.max_replicas = max(max_replicas, 1)
+        self._min_replicas = min(max(min_replicas, 1), self.max_replicas)
+        self._session_factory = session_factory
+        self._replica_memory_size = replica_memory_size
+        self._scale_up_queue_depth = max(scale_up_queue_depth, 1)
+        self._idle_timeout = idle_timeout
+        self._memory_budget = memory_budget
+        self._replica_ids = count()
+        self._replicas = [
+            OnnxSessionReplica(
+                replica_id=next(self._replica_ids), session=primary_session
+            )
+        ]
+        self._scaling_up = False
+        self._lock = Lock()
+        # shared with finalizer, which returns memory of replicas of garbage-collected pool
+        self._reserved_memory = [0]
+        weakref.finalize(
+            self, _release_replicas_memory, memory_budget, self._reserved_memory
+        )
+        for _ in range(self._min_replicas - 1):
+            if not self._add_replica():
+                break
+        _register_session_pool(pool=self)
+
+    @contextmanager
+    def replica(self) -> Generator[OnnxSessionReplica, None, None]:
+        """Leases the least busy replica for the duration of the request."""
+        now = time.monotonic()
+        self.scale_down_idle(now=now)
+        with self._lock:
+            replica = min(self._replicas, key=lambda r: r.in_flight)
+            scale_up = self._should_scale_up(queue_depth=replica.in_flight)
+            replica.start_request(now=now)
+            if scale_up:
+                self._scaling_up = True
+        if scale_up:
+            Thread(target=self._scale_up, daemon=True).start()
+        try:
+            yield replica
+        finally:
+            now = time.monotonic()
+            with self._lock:
+                replica.finish_request(now=now)
+            self.scale_down_idle(now=now)
+
+    def replicas(self) -> List[OnnxSessionReplica]:
+        with self._lock:
+            return list(self._replicas)
+
+    def scale_down_idle(self, now: Optional[float] = None) -> None:
+        now = now if now is not None else time.monotonic()
+        with self._lock:
+            removable = len(self._replicas) - self._min_replicas
+            if removable <= 0:
+                return None
+            # the primary replica (first one) is kept - it is the session of the model
+            idle_replicas = [
+                replica
+                for replica in self._replicas[1:]
+                if replica.in_flight == 0
+                and now - replica.last_used >= self._idle_timeout
+            ][:removable]
+            for replica in idle_replicas:
+                self._replicas.remove(replica)
+                self._reserved_memory[0] -= self._replica_memory_size
+                self._memory_budget.release(size=self._replica_memory_size)
+        for replica in idle_replicas:
+            logger.debug(
+                f"Removed idle session replica {replica.replica_id} of model {self.model_id}"
+            )
+
+    def stats(self) -> SessionPoolStats:
+        now = time.monotonic()
+        self.scale_down_idle(now=now)
+        with self._lock:
+            replicas = [
+                ReplicaStats(
+                    replica_id=replica.replica_id,
+                    in_flight=replica.in_flight,
+                    requests=replica.requests,
+                    busy_seconds=replica.busy_seconds(now=now),
+                )
+                for replica in self._replicas
+            ]
+        return SessionPoolStats(
+            model_id=self.model_id, replicas=replicas, max_replicas=self.max_replicas
+        )
+
+    def _should_scale_up(self, queue_depth: int) -> bool:
+        return (
+            not self._scaling_up
+            and len(self._replicas) < self.max_replicas
+            and queue_depth >= self._scale_up_queue_depth
+        )
+
+    def _scale_up(self) -> None:
+        try:
+            self._add_replica()
+        finally:
+            with self._lock:
+                self._scaling_up = False
+
+    def _add_replica(self) -> bool:
+        if not self._memory_budget.reserve(size=self._replica_memory_size):
+            logger.debug(
+                f"Session replica of model {self.model_id} not added - memory budget of "
+                f"replicas exhausted"
+            )
+            return False
+        start = time.perf_counter()
+        try:
+            session = self._session_factory()
+        except Exception as error:
+            logger.warning(
+                f"Could not create session replica of model {self.model_id}: {error}"
+            )
+            self._memory_budget.release(size=self._replica_memory_size)
+            return False
+        with self._lock:
+            replica = OnnxSessionReplica(
+                replica_id=next(self._replica_ids), session=session
+            )
+            self._replicas.append(replica)
+            self._reserved_memory[0] += self._replica_memory_size
+            replicas_number = len(self._replicas)
+        logger.info(
+            f"Added session replica {replica.replica_id} of model {self.model_id} in "
+            f"{time.perf_counter() - start:.3f} seconds ({replicas_number} replicas)"
+        )
+        return True
+
+
+def _release_replicas_memory(
+    memory_budget: ReplicasMemoryBudget, reserved_memory: List[int]
+) -> None:
+    memory_budget.release(size=reserved_memory[0])
+
+
+def get_max_replicas(config: OnnxSessionConfig) -> int:
+    """Resolves maximal number of replicas - `0` means as many replicas as there are
+    disjoint sets of cores the sessions use."""
+    if config.max_replicas is None:
+        return 1
+    if config.max_replicas > 0:
+        return config.max_replicas
+    cores = len(get_available_cpu_cores())
+    cores_per_replica = (
+        len(config.cores or ())
+        or config.intra_op_num_threads
+        or ONNXRUNTIME_CORES_PER_MODEL
+        or cores
+    )
+    return max(cores // cores_per_replica, 1)
+
+
+_session_pools: "weakref.WeakValueDictionary[str, OnnxSessionPool]" = (
+    weakref.WeakValueDictionary()
+)
+_session_pools_lock = Lock()
+_idle_replicas_reaper: Optional[Thread] = None
+
+
+def _register_session_pool(pool: OnnxSessionPool) -> None:
+    global _idle_replicas_reaper
+    with _session_pools_lock:
+        _session_pools[pool.model_id] = pool
+        if _idle_replicas_reaper is None:
+            _idle_replicas_reaper = Thread(target=_reap_idle_replicas, daemon=True)
+            _idle_replicas_reaper.start()
+
+
+def _reap_idle_replicas() -> None:
+    while True:
+        time.sleep(IDLE_REPLICAS_CHECK_INTERVAL)
+        scale_down_idle_session_pools()
+
+
+def scale_down_idle_session_pools() -> None:
+    with _session_pools_lock:
+        pools = list(_session_pools.values())
+    for pool in pools:
+        try:
+            pool.scale_down_idle()
+        except Exception as error:
+            logger.warning(
+                f"Could not remove idle session replicas of model {pool.model_id}: "
+                f"{error}"
+            )
+
+
+def get_session_pools_stats() -> Dict[str, SessionPoolStats]:
+    with _session_pools_lock:
+        pools = list(_session_pools.values())
+    return {pool.model_id: pool.stats() for pool in pools}
@@ -0,0 +1,89 @@
+import importlib
+from threading import Lock
+from typing import Any, Dict, Hashable, Iterator, MutableMapping, Union
+
+from inference.core.exceptions import ModelNotRecognisedError
+from inference.core.logger import logger
+
+
+def import_object(path: str) -> Any:
+    """Imports object given its path in format `package.module:ObjectName`.
+
+    Args:
+        path (str): Path to the object.
+
+    Returns:
+        Any: Imported object.
+
+    Raises:
+        ImportError: If module cannot be imported or object is not defined in module.
+    """
+    module_name, _, object_name = path.partition(":")
+    if not object_name:
+        raise ImportError(
+            f"Path {path} is invalid - expected format `package.module:ObjectName`."
+        )
+    module = importlib.import_module(module_name)
+    try:
+        return getattr(module, object_name)
+    except AttributeError as error:
+        raise ImportError(
+            f"Module {module_name} does not define {object_name}."
+        ) from error
+
+
+class LazyModelTypes(MutableMapping):
+    """Mapping of model types into model classes, which holds paths to classes and imports
+    each of them only once the class is requested for the first time - such that model
+    families (and their heavy dependencies) not in use are never imported.
+
+    Mapping may also hold classes directly (for instance, registered by the user in runtime).
+    Class which cannot be imported (for example, due to missing optional dependencies) is
+    reported with `ModelNotRecognisedError`.
+    """
+
+    def __init__(self, model_types: Dict[Hashable, Union[str, type]]):
+        self._model_types = dict(model_types)
+        self._lock = Lock()
+
+    def __getitem__(self, model_type: Hashable) -> type:
+        model_class = self._model_types[model_type]
+        if not isinstance(model_class, str):
+            return model_class
+        with self._lock:
+            model_class = self._model_types[model_type]
+            if not isinstance(model_class, str):
+                return model_class
+            logger.debug(f"Importing {model_class} for model type: {model_type}")
+            try:
+                imported_class = import_object(path=model_class)
+            except ImportError as error:
+                raise ModelNotRecognisedError(
+                    f"Model type {model_type} is not available - could not import "
+                    f"{model_class}: {error}"
+                ) from error
+            self._model_types[model_type] = imported_class
+            return imported_class
+
+    def __setitem__(self, model_type: Hashable, model_class: Union[str, type]) -> None:
+        with self._lock:
+            self._model_types[model_type] = model_class
+
+    def __delitem__(self, model_type: Hashable) -> None:
+        with self._lock:
+            del self._model_types[model_type]
+
+    def __contains__(self, model_type: object) -> bool:
+        return model_type in self._model_types
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._model_types))
+
+    def __len__(self) -> int:
+        return len(self._model_types)
+
+    def is_imported(self, model_type: Hashable) -> bool:
+        return not isinstance(self._model_types.get(model_type, ""), str)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._model_types})"
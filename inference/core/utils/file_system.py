@@ -1,7 +1,9 @@
 import json
 import os.path
 import re
-from typing import List, Optional, Union
+from contextlib import contextmanager
+from typing import IO, Generator, List, Optional, Union
+from uuid import uuid4
 
 
 def read_text_file(
@@ -32,7 +34,7 @@ def dump_json(
 ) -> None:
     ensure_write_is_allowed(path=path, allow_override=allow_override)
     ensure_parent_dir_exists(path=path)
-    with open(path, "w") as f:
+    with atomic_open(path=path, mode="w") as f:
         json.dump(content, fp=f, **kwargs)
 
 
@@ -44,17 +46,35 @@ def dump_text_lines(
 ) -> None:
     ensure_write_is_allowed(path=path, allow_override=allow_override)
     ensure_parent_dir_exists(path=path)
-    with open(path, "w") as f:
+    with atomic_open(path=path, mode="w") as f:
         f.write(lines_connector.join(content))
 
 
 def dump_bytes(path: str, content: bytes, allow_override: bool = False) -> None:
     ensure_write_is_allowed(path=path, allow_override=allow_override)
     ensure_parent_dir_exists(path=path)
-    with open(path, "wb") as f:
+    with atomic_open(path=path, mode="wb") as f:
         f.write(content)
 
 
+@contextmanager
+def atomic_open(path: str, mode: str = "w") -> Generator[IO, None, None]:
+    """Opens temporary file in the directory of `path`, which is moved into `path` once
+    written successfully - such that readers never see partially written file (for instance,
+    when the process is killed in the middle of the write)."""
+    temporary_path = f"{path}.{uuid4().hex}.tmp"
+    try:
+        with open(temporary_path, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
 def ensure_parent_dir_exists(path: str) -> None:
     absolute_path = os.path.abspath(path)
     parent_dir = os.path.dirname(absolute_path)
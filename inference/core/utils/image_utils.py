@@ -33,6 +33,8 @@ from inference.core.exceptions import (
     InvalidImageTypeDeclared,
     InvalidNumpyInput,
 )
+from inference.core.managers.inference_metrics import InferenceStage
+from inference.core.models.tracing import inference_stage
 from inference.core.utils.function import deprecated
 from inference.core.utils.requests import api_key_safe_raise_for_status
 
@@ -88,17 +90,18 @@ def load_image(
         disable_preproc_auto_orient=disable_preproc_auto_orient
     )
     value, image_type = extract_image_payload_and_type(value=value)
-    if image_type is not None:
-        np_image, is_bgr = load_image_with_known_type(
-            value=value,
-            image_type=image_type,
-            cv_imread_flags=cv_imread_flags,
-        )
-    else:
-        np_image, is_bgr = load_image_with_inferred_type(
-            value, cv_imread_flags=cv_imread_flags
-        )
-    np_image = convert_gray_image_to_bgr(image=np_image)
+    with inference_stage(InferenceStage.DECODE):
+        if image_type is not None:
+            np_image, is_bgr = load_image_with_known_type(
+                value=value,
+                image_type=image_type,
+                cv_imread_flags=cv_imread_flags,
+            )
+        else:
+            np_image, is_bgr = load_image_with_inferred_type(
+                value, cv_imread_flags=cv_imread_flags
+            )
+        np_image = convert_gray_image_to_bgr(image=np_image)
     logger.debug(f"Loaded inference image. Shape: {getattr(np_image, 'shape', None)}")
     return np_image, is_bgr
 
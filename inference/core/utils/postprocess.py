@@ -25,6 +25,24 @@ def cosine_similarity(a: np.ndarray, b: np.ndarray) -> Union[np.number, np.ndarr
     return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
 
 
+def cosine_similarity_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Compute cosine similarities between all pairs of rows of two matrices.
+
+    Args:
+        a (np.ndarray): Matrix of shape (N, D).
+        b (np.ndarray): Matrix of shape (M, D).
+
+    Returns:
+        np.ndarray: Matrix of shape (N, M) with cosine similarity between a[i] and b[j].
+    """
+    a = np.atleast_2d(a)
+    b = np.atleast_2d(b)
+    a_norm = a / np.linalg.norm(a, axis=-1, keepdims=True)
+    b_norm = b / np.linalg.norm(b, axis=-1, keepdims=True)
+    return a_norm @ b_norm.T
+
+
 def masks2poly(masks: np.ndarray) -> List[np.ndarray]:
     """Converts binary masks to polygonal segments.
 
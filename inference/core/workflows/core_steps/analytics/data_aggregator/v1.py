@@ -343,6 +343,10 @@ class DataAggregatorBlockV1(WorkflowBlock):
         self._aggregation_start_timestamp = datetime.now()
         self._runs = 0
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
@@ -92,6 +92,10 @@ class LineCounterBlockV1(WorkflowBlock):
     def __init__(self):
         self._batch_of_line_zones: Dict[str, sv.LineZone] = {}
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return LineCounterManifest
@@ -97,6 +97,10 @@ class LineCounterBlockV2(WorkflowBlock):
     def __init__(self):
         self._batch_of_line_zones: Dict[str, sv.LineZone] = {}
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return LineCounterManifest
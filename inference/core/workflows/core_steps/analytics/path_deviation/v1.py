@@ -95,6 +95,10 @@ class PathDeviationAnalyticsBlockV1(WorkflowBlock):
             str, Dict[Union[int, str], List[Tuple[float, float]]]
         ] = {}
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return PathDeviationManifest
@@ -109,6 +109,10 @@ class TimeInZoneBlockV1(WorkflowBlock):
         self._batch_of_tracked_ids_in_zone: Dict[str, Dict[Union[int, str], float]] = {}
         self._batch_of_polygon_zones: Dict[str, sv.PolygonZone] = {}
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return TimeInZoneManifest
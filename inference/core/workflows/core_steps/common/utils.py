@@ -8,7 +8,10 @@ import numpy as np
 import supervision as sv
 from supervision.config import CLASS_NAME_DATA_FIELD
 
-from inference.core.entities.requests.clip import ClipCompareRequest
+from inference.core.entities.requests.clip import (
+    ClipCompareRequest,
+    ClipImageEmbeddingRequest,
+)
 from inference.core.entities.requests.cogvlm import CogVLMInferenceRequest
 from inference.core.entities.requests.doctr import DoctrOCRInferenceRequest
 from inference.core.entities.requests.sam2 import Sam2InferenceRequest
@@ -55,6 +58,7 @@ def load_core_model(
     inference_request: Union[
         DoctrOCRInferenceRequest,
         ClipCompareRequest,
+        ClipImageEmbeddingRequest,
         CogVLMInferenceRequest,
         YOLOWorldInferenceRequest,
         Sam2InferenceRequest,
@@ -86,6 +86,10 @@ class RateLimiterBlockV1(WorkflowBlock):
         super().__init__()
         self._last_executed_at: Optional[datetime] = None
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return RateLimiterManifest
@@ -0,0 +1,244 @@
+from typing import List, Literal, Optional, Type, Union
+from uuid import uuid4
+
+import numpy as np
+from pydantic import ConfigDict, Field
+
+from inference.core.embedding_index import embedding_index
+from inference.core.embedding_index.operations import (
+    embed_images,
+    get_collections_namespace,
+)
+from inference.core.entities.requests.clip import ClipImageEmbeddingRequest
+from inference.core.env import (
+    HOSTED_CORE_MODEL_URL,
+    LOCAL_INFERENCE_API_URL,
+    WORKFLOWS_REMOTE_API_TARGET,
+)
+from inference.core.managers.base import ModelManager
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.core_steps.common.utils import load_core_model
+from inference.core.workflows.execution_engine.entities.base import (
+    Batch,
+    OutputDefinition,
+    WorkflowImageData,
+)
+from inference.core.workflows.execution_engine.entities.types import (
+    BOOLEAN_KIND,
+    FLOAT_KIND,
+    FLOAT_ZERO_TO_ONE_KIND,
+    INTEGER_KIND,
+    LIST_OF_VALUES_KIND,
+    STRING_KIND,
+    ImageInputField,
+    StepOutputImageSelector,
+    WorkflowImageSelector,
+    WorkflowParameterSelector,
+)
+from inference.core.workflows.prototypes.block import (
+    BlockResult,
+    WorkflowBlock,
+    WorkflowBlockManifest,
+)
+from inference_sdk import InferenceHTTPClient
+
+LONG_DESCRIPTION = """
+Search and populate collection of the local embedding index with OpenAI CLIP embeddings
+of images.
+
+The block embeds each image with CLIP and finds the most similar images stored in the
+collection (cosine similarity of embeddings). In `add` mode every image is stored in the
+collection, in `deduplicate` mode only images which are not near-duplicates of images
+already stored (similarity below `similarity_threshold`) - which is useful to filter
+redundant frames before sending them for labeling. In `search` mode the collection is
+not modified.
+
+Collections are kept on the disk of the server running the Workflow and persist across
+runs. Collection is created on the first use and is visible only within the workspace of
+the API key the Workflow runs with.
+"""
+
+
+class BlockManifest(WorkflowBlockManifest):
+    model_config = ConfigDict(
+        json_schema_extra={
+            "name": "CLIP Embedding Index",
+            "version": "v1",
+            "short_description": "Find similar images and near-duplicates with CLIP embeddings.",
+            "long_description": LONG_DESCRIPTION,
+            "license": "Apache-2.0",
+            "block_type": "model",
+        }
+    )
+    type: Literal["roboflow_core/clip_embedding_index@v1"]
+    images: Union[WorkflowImageSelector, StepOutputImageSelector] = ImageInputField
+    collection: Union[WorkflowParameterSelector(kind=[STRING_KIND]), str] = Field(
+        description="Name of the collection of embedding index",
+        examples=["frames", "$inputs.collection"],
+    )
+    mode: Literal["search", "add", "deduplicate"] = Field(
+        default="search",
+        description="`search` - only search the collection, `add` - add each image, "
+        "`deduplicate` - add only images which are not near-duplicates of stored ones",
+        examples=["deduplicate"],
+    )
+    top_k: Union[WorkflowParameterSelector(kind=[INTEGER_KIND]), int] = Field(
+        default=5,
+        description="Number of the most similar images returned",
+        examples=[5, "$inputs.top_k"],
+    )
+    similarity_threshold: Union[
+        WorkflowParameterSelector(kind=[FLOAT_ZERO_TO_ONE_KIND]), float
+    ] = Field(
+        default=0.95,
+        description="Similarity from which image is considered near-duplicate of stored one",
+        examples=[0.95, "$inputs.similarity_threshold"],
+    )
+    version: Union[
+        Literal[
+            "RN101",
+            "RN50",
+            "RN50x16",
+            "RN50x4",
+            "RN50x64",
+            "ViT-B-16",
+            "ViT-B-32",
+            "ViT-L-14-336px",
+            "ViT-L-14",
+        ],
+        WorkflowParameterSelector(kind=[STRING_KIND]),
+    ] = Field(
+        default="ViT-B-16",
+        description="Variant of CLIP model",
+        examples=["ViT-B-16", "$inputs.variant"],
+    )
+
+    @classmethod
+    def accepts_batch_input(cls) -> bool:
+        return True
+
+    @classmethod
+    def describe_outputs(cls) -> List[OutputDefinition]:
+        return [
+            OutputDefinition(name="matches", kind=[LIST_OF_VALUES_KIND]),
+            OutputDefinition(name="max_similarity", kind=[FLOAT_KIND]),
+            OutputDefinition(name="is_duplicate", kind=[BOOLEAN_KIND]),
+            OutputDefinition(name="embedding_id", kind=[STRING_KIND]),
+        ]
+
+    @classmethod
+    def get_execution_engine_compatibility(cls) -> Optional[str]:
+        return ">=1.0.0,<2.0.0"
+
+
+class ClipEmbeddingIndexBlockV1(WorkflowBlock):
+
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        api_key: Optional[str],
+        step_execution_mode: StepExecutionMode,
+    ):
+        self._model_manager = model_manager
+        self._api_key = api_key
+        self._step_execution_mode = step_execution_mode
+
+    @classmethod
+    def get_init_parameters(cls) -> List[str]:
+        return ["model_manager", "api_key", "step_execution_mode"]
+
+    @classmethod
+    def get_manifest(cls) -> Type[WorkflowBlockManifest]:
+        return BlockManifest
+
+    def run(
+        self,
+        images: Batch[WorkflowImageData],
+        collection: str,
+        mode: Literal["search", "add", "deduplicate"],
+        top_k: int,
+        similarity_threshold: float,
+        version: str,
+    ) -> BlockResult:
+        if self._step_execution_mode is StepExecutionMode.LOCAL:
+            embeddings = self.embed_images_locally(images=images, version=version)
+        elif self._step_execution_mode is StepExecutionMode.REMOTE:
+            embeddings = self.embed_images_remotely(images=images, version=version)
+        else:
+            raise ValueError(
+                f"Unknown step execution mode: {self._step_execution_mode}"
+            )
+        model_id = f"clip/{version}"
+        index_collection = embedding_index.get_or_create_collection(
+            name=collection,
+            model_id=model_id,
+            dimension=embeddings.shape[1],
+            namespace=get_collections_namespace(api_key=self._api_key),
+        )
+        results = []
+        # images are processed one by one - such that near-duplicates within the batch
+        # are detected as well
+        for embedding in embeddings:
+            matches = index_collection.search(embeddings=embedding, top_k=top_k)[0]
+            max_similarity = matches[0].similarity if matches else None
+            is_duplicate = (
+                max_similarity is not None and max_similarity >= similarity_threshold
+            )
+            embedding_id = None
+            if mode == "add" or (mode == "deduplicate" and not is_duplicate):
+                embedding_id = uuid4().hex
+                index_collection.add(ids=[embedding_id], embeddings=embedding)
+            results.append(
+                {
+                    "matches": [
+                        {"id": match.id, "similarity": match.similarity}
+                        for match in matches
+                    ],
+                    "max_similarity": max_similarity,
+                    "is_duplicate": is_duplicate,
+                    "embedding_id": embedding_id,
+                }
+            )
+        return results
+
+    def embed_images_locally(
+        self, images: Batch[WorkflowImageData], version: str
+    ) -> np.ndarray:
+        inference_images = [
+            image.to_inference_format(numpy_preferred=True) for image in images
+        ]
+        inference_request = ClipImageEmbeddingRequest(
+            clip_version_id=version,
+            image=inference_images,
+            api_key=self._api_key,
+        )
+        clip_model_id = load_core_model(
+            model_manager=self._model_manager,
+            inference_request=inference_request,
+            core_model="clip",
+        )
+        return embed_images(
+            clip_model=self._model_manager[clip_model_id], images=inference_images
+        )
+
+    def embed_images_remotely(
+        self, images: Batch[WorkflowImageData], version: str
+    ) -> np.ndarray:
+        api_url = (
+            LOCAL_INFERENCE_API_URL
+            if WORKFLOWS_REMOTE_API_TARGET != "hosted"
+            else HOSTED_CORE_MODEL_URL
+        )
+        client = InferenceHTTPClient(
+            api_url=api_url,
+            api_key=self._api_key,
+        )
+        if WORKFLOWS_REMOTE_API_TARGET == "hosted":
+            client.select_api_v0()
+        embeddings = []
+        for image in images:
+            result = client.get_clip_image_embeddings(
+                inference_input=image.numpy_image, clip_version=version
+            )
+            embeddings.append(np.array(result["embeddings"][0], dtype=np.float32))
+        return np.stack(embeddings, axis=0)
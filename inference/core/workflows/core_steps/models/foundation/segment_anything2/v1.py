@@ -6,9 +6,9 @@ from pydantic import ConfigDict, Field
 
 from inference.core.entities.requests.sam2 import (
     Box,
+    Sam2BatchSegmentationRequest,
     Sam2Prompt,
     Sam2PromptSet,
-    Sam2SegmentationRequest,
 )
 from inference.core.entities.responses.inference import (
     InferenceResponseImage,
@@ -190,11 +190,14 @@ class SegmentAnything2BlockV1(WorkflowBlock):
         multimask_output: bool,
     ) -> BlockResult:
 
-        predictions = []
         if boxes is None:
             boxes = [None] * len(images)
 
-        for single_image, boxes_for_image in zip(images, boxes):
+        prompt_sets = []
+        prompts_class_ids: List[List[Optional[int]]] = []
+        prompts_class_names: List[List[str]] = []
+        prompts_detection_ids: List[List[Optional[str]]] = []
+        for boxes_for_image in boxes:
             prompt_class_ids: List[Optional[int]] = []
             prompt_class_names: List[str] = []
             prompt_detection_ids: List[Optional[str]] = []
@@ -219,25 +222,46 @@ class SegmentAnything2BlockV1(WorkflowBlock):
                         )
                     )
                     prompts.append(prompt)
-            inference_request = Sam2SegmentationRequest(
-                image=single_image.to_inference_format(numpy_preferred=True),
-                sam2_version_id=version,
-                api_key=self._api_key,
-                source="workflow-execution",
-                prompts=Sam2PromptSet(prompts=prompts),
-                threshold=threshold,
-                multimask_output=multimask_output,
-            )
-            sam_model_id = load_core_model(
-                model_manager=self._model_manager,
-                inference_request=inference_request,
-                core_model="sam2",
-            )
-
-            sam2_segmentation_response = self._model_manager.infer_from_request_sync(
-                sam_model_id, inference_request
-            )
+            prompt_sets.append(Sam2PromptSet(prompts=prompts))
+            prompts_class_ids.append(prompt_class_ids)
+            prompts_class_names.append(prompt_class_names)
+            prompts_detection_ids.append(prompt_detection_ids)
+        # all images go in single request - such that image encoder and mask decoder
+        # run on batches of images and prompts
+        inference_request = Sam2BatchSegmentationRequest(
+            images=[
+                single_image.to_inference_format(numpy_preferred=True)
+                for single_image in images
+            ],
+            sam2_version_id=version,
+            api_key=self._api_key,
+            source="workflow-execution",
+            prompts=prompt_sets,
+            multimask_output=multimask_output,
+        )
+        sam_model_id = load_core_model(
+            model_manager=self._model_manager,
+            inference_request=inference_request,
+            core_model="sam2",
+        )
+        sam2_segmentation_responses = self._model_manager.infer_from_request_sync(
+            sam_model_id, inference_request
+        )
 
+        predictions = []
+        for (
+            single_image,
+            sam2_segmentation_response,
+            prompt_class_ids,
+            prompt_class_names,
+            prompt_detection_ids,
+        ) in zip(
+            images,
+            sam2_segmentation_responses,
+            prompts_class_ids,
+            prompts_class_names,
+            prompts_detection_ids,
+        ):
             prediction = convert_sam2_segmentation_response_to_inference_instances_seg_response(
                 sam2_segmentation_predictions=sam2_segmentation_response.predictions,
                 image=single_image,
@@ -322,6 +322,10 @@ class EmailNotificationBlockV1(WorkflowBlock):
     def get_init_parameters(cls) -> List[str]:
         return ["background_tasks", "thread_pool_executor"]
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
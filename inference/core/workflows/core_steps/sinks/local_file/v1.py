@@ -163,6 +163,10 @@ class LocalFileSinkBlockV1(WorkflowBlock):
     def get_init_parameters(cls) -> List[str]:
         return ["allow_access_to_file_system", "allowed_write_directory"]
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
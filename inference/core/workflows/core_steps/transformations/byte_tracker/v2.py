@@ -113,6 +113,10 @@ class ByteTrackerBlockV2(WorkflowBlock):
     ):
         self._trackers: Dict[str, sv.ByteTrack] = {}
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return ByteTrackerBlockManifest
@@ -139,6 +139,10 @@ class ByteTrackerBlockV3(WorkflowBlock):
         self._trackers: Dict[str, sv.ByteTrack] = {}
         self._per_video_cache: Dict[str, InstanceCache] = {}
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return ByteTrackerBlockManifest
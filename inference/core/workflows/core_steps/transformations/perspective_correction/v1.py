@@ -343,6 +343,10 @@ class PerspectiveCorrectionBlockV1(WorkflowBlock):
     def __init__(self):
         self.perspective_transformers: List[np.array] = []
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return PerspectiveCorrectionManifest
@@ -94,6 +94,10 @@ class StabilizeTrackedDetectionsBlockV1(WorkflowBlock):
         ] = {}
         self._batch_of_kalman_filters: Dict[Union[int, str], VelocityKalmanFilter] = {}
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
@@ -89,6 +89,10 @@ class TraceVisualizationBlockV1(ColorableVisualizationBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return TraceManifest
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
@@ -12,6 +12,9 @@ from inference.core.workflows.execution_engine.entities.engine import (
     BaseExecutionEngine,
 )
 from inference.core.workflows.execution_engine.profiling.core import WorkflowsProfiler
+from inference.core.workflows.execution_engine.v1.compiler.cache import (
+    CompiledWorkflowsCache,
+)
 from inference.core.workflows.execution_engine.v1.core import (
     EXECUTION_ENGINE_V1_VERSION,
     ExecutionEngineV1,
@@ -37,6 +40,7 @@ class ExecutionEngine(BaseExecutionEngine):
         prevent_local_images_loading: bool = False,
         workflow_id: Optional[str] = None,
         profiler: Optional[WorkflowsProfiler] = None,
+        compiled_workflows_cache: Optional[CompiledWorkflowsCache] = None,
     ) -> "ExecutionEngine":
         requested_engine_version = retrieve_requested_execution_engine_version(
             workflow_definition=workflow_definition,
@@ -51,6 +55,7 @@ class ExecutionEngine(BaseExecutionEngine):
             prevent_local_images_loading=prevent_local_images_loading,
             workflow_id=workflow_id,
             profiler=profiler,
+            compiled_workflows_cache=compiled_workflows_cache,
         )
         return cls(engine=engine)
 
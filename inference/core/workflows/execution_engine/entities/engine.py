@@ -16,6 +16,7 @@ class BaseExecutionEngine(ABC):
         prevent_local_images_loading: bool = False,
         workflow_id: Optional[str] = None,
         profiler: Optional[WorkflowsProfiler] = None,
+        compiled_workflows_cache: Optional[Any] = None,
     ) -> "BaseExecutionEngine":
         pass
 
@@ -1,9 +1,24 @@
 import hashlib
-from collections import deque
+import json
+from collections import OrderedDict, deque
+from enum import Enum
 from threading import Lock
-from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from inference.core.workflows.errors import WorkflowEnvironmentConfigurationError
+from inference.core.workflows.execution_engine.v1.compiler.entities import (
+    InitialisedStep,
+)
 
 V = TypeVar("V")
 
@@ -56,3 +71,134 @@ class BasicWorkflowsCache(Generic[V]):
                 del self._cache[to_pop]
             self._keys_buffer.append(key)
             self._cache[key] = value
+
+
+class CompiledWorkflowsCache:
+    """
+    LRU cache of initialised steps of compiled workflows - letting the same workflow
+    run many times (for instance in subsequent HTTP requests) without instantiating
+    all of its blocks again, which preserves warm state of blocks (like annotators caches).
+
+    Entries are keyed by hash of workflow definition, Execution Engine version and
+    fingerprint of init parameters. Init parameters listed as `request_scoped_init_parameters`
+    (like FastAPI background tasks) are excluded from the fingerprint - instead, steps
+    of blocks depending on them are never cached and get initialised for each compilation.
+    The same applies to blocks declaring that they hold state between runs
+    (`WorkflowBlock.holds_state_between_runs()`) - such that state of trackers or counters
+    never leaks between compilations. Non-primitive init parameters (like model manager)
+    are fingerprinted by identity.
+
+    Cached steps may be used by many workflow executions at the same time - only blocks
+    which do not hold state between runs are cached.
+
+    Thread safe thanks to thread lock on all operations.
+    """
+
+    def __init__(
+        self,
+        cache_size: int,
+        request_scoped_init_parameters: Optional[Iterable[str]] = None,
+    ):
+        self._cache_size = max(cache_size, 1)
+        self._request_scoped_init_parameters = set(request_scoped_init_parameters or [])
+        self._entries: "OrderedDict[str, Tuple[str, Dict[str, InitialisedStep]]]" = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def get_hash_key(
+        self,
+        workflow_definition: dict,
+        init_parameters: Dict[str, Any],
+        execution_engine_version: Any,
+    ) -> str:
+        init_parameters_fingerprint = [
+            f"{name}={fingerprint_init_parameter(value=value)}"
+            for name, value in sorted(init_parameters.items())
+            if name not in self._request_scoped_init_parameters
+        ]
+        hash_chunks = [
+            hash_workflow_definition(workflow_definition=workflow_definition),
+            str(execution_engine_version),
+            *init_parameters_fingerprint,
+        ]
+        return hashlib.md5("<|>".join(hash_chunks).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Dict[str, InitialisedStep]:
+        with self._lock:
+            if key not in self._entries:
+                return {}
+            self._entries.move_to_end(key)
+            return dict(self._entries[key][1])
+
+    def cache(
+        self,
+        key: str,
+        workflow_definition: dict,
+        steps: Iterable[InitialisedStep],
+    ) -> None:
+        reusable_steps = {
+            step.manifest.name: step
+            for step in steps
+            if self.is_step_reusable(step=step)
+        }
+        definition_hash = hash_workflow_definition(
+            workflow_definition=workflow_definition
+        )
+        with self._lock:
+            self._entries[key] = (definition_hash, reusable_steps)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._cache_size:
+                self._entries.popitem(last=False)
+
+    def is_step_reusable(self, step: InitialisedStep) -> bool:
+        block_class = step.block_specification.block_class
+        if block_class.holds_state_between_runs():
+            return False
+        block_source = step.block_specification.block_source
+        for init_parameter in block_class.get_init_parameters():
+            if (
+                init_parameter in self._request_scoped_init_parameters
+                or f"{block_source}.{init_parameter}"
+                in self._request_scoped_init_parameters
+            ):
+                return False
+        return True
+
+    def invalidate(self, workflow_definition: Optional[dict] = None) -> None:
+        """
+        Removes entries of given workflow definition (regardless of init parameters),
+        or all entries if definition is not given.
+        """
+        with self._lock:
+            if workflow_definition is None:
+                self._entries.clear()
+                return None
+            definition_hash = hash_workflow_definition(
+                workflow_definition=workflow_definition
+            )
+            to_remove = [
+                key
+                for key, (entry_definition_hash, _) in self._entries.items()
+                if entry_definition_hash == definition_hash
+            ]
+            for key in to_remove:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def hash_workflow_definition(workflow_definition: dict) -> str:
+    return hashlib.md5(
+        json.dumps(workflow_definition, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def fingerprint_init_parameter(value: Any) -> str:
+    if isinstance(value, Enum):
+        value = value.value
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return f"{type(value).__name__}:{value}"
+    return f"{type(value).__module__}.{type(value).__qualname__}@{id(value)}"
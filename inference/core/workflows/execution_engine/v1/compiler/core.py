@@ -17,6 +17,7 @@ from inference.core.workflows.execution_engine.profiling.core import (
 )
 from inference.core.workflows.execution_engine.v1.compiler.cache import (
     BasicWorkflowsCache,
+    CompiledWorkflowsCache,
 )
 from inference.core.workflows.execution_engine.v1.compiler.entities import (
     BlockSpecification,
@@ -78,19 +79,35 @@ def compile_workflow(
     init_parameters: Dict[str, Union[Any, Callable[[None], Any]]],
     execution_engine_version: Optional[Version] = None,
     profiler: Optional[WorkflowsProfiler] = None,
+    compiled_workflows_cache: Optional[CompiledWorkflowsCache] = None,
 ) -> CompiledWorkflow:
     graph_compilation_results = compile_workflow_graph(
         workflow_definition=workflow_definition,
         execution_engine_version=execution_engine_version,
         profiler=profiler,
     )
+    reusable_steps = {}
+    if compiled_workflows_cache is not None:
+        cache_key = compiled_workflows_cache.get_hash_key(
+            workflow_definition=workflow_definition,
+            init_parameters=init_parameters,
+            execution_engine_version=execution_engine_version,
+        )
+        reusable_steps = compiled_workflows_cache.get(key=cache_key)
     steps = initialise_steps(
         steps_manifest=graph_compilation_results.parsed_workflow_definition.steps,
         available_blocks=graph_compilation_results.available_blocks,
         explicit_init_parameters=init_parameters,
         initializers=graph_compilation_results.initializers,
         profiler=profiler,
+        reusable_steps=reusable_steps,
     )
+    if compiled_workflows_cache is not None and not reusable_steps:
+        compiled_workflows_cache.cache(
+            key=cache_key,
+            workflow_definition=workflow_definition,
+            steps=steps,
+        )
     input_substitutions = collect_input_substitutions(
         workflow_definition=graph_compilation_results.parsed_workflow_definition,
     )
@@ -123,6 +140,11 @@ def compile_workflow_graph(
         ensure_dynamic_blocks_allowed(
             dynamic_blocks_definitions=dynamic_blocks_definitions
         )
+        if profiler is not None:
+            profiler.notify_event(
+                name="workflow_graph_compilation_cache_hit",
+                categories=["execution_engine_operation"],
+            )
         return cached_value
     statically_defined_blocks = load_workflow_blocks(
         execution_engine_version=execution_engine_version,
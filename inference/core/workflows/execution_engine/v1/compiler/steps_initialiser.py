@@ -26,7 +26,10 @@ def initialise_steps(
     explicit_init_parameters: Dict[str, Union[Any, Callable[[None], Any]]],
     initializers: Dict[str, Union[Any, Callable[[None], Any]]],
     profiler: Optional[WorkflowsProfiler] = None,
+    reusable_steps: Optional[Dict[str, InitialisedStep]] = None,
 ) -> List[InitialisedStep]:
+    if reusable_steps is None:
+        reusable_steps = {}
     available_blocks_by_manifest_class = {
         block.manifest_class: block for block in available_blocks
     }
@@ -39,6 +42,20 @@ def initialise_steps(
                 context="workflow_compilation | steps_initialisation",
             )
         block_specification = available_blocks_by_manifest_class[type(step_manifest)]
+        reusable_step = reusable_steps.get(step_manifest.name)
+        if (
+            reusable_step is not None
+            and reusable_step.block_specification.block_class
+            is block_specification.block_class
+        ):
+            initialised_steps.append(
+                InitialisedStep(
+                    block_specification=block_specification,
+                    manifest=step_manifest,
+                    step=reusable_step.step,
+                )
+            )
+            continue
         initialised_step = initialise_step(
             step_manifest=step_manifest,
             block_specification=block_specification,
@@ -9,6 +9,9 @@ from inference.core.workflows.execution_engine.profiling.core import (
     NullWorkflowsProfiler,
     WorkflowsProfiler,
 )
+from inference.core.workflows.execution_engine.v1.compiler.cache import (
+    CompiledWorkflowsCache,
+)
 from inference.core.workflows.execution_engine.v1.compiler.core import compile_workflow
 from inference.core.workflows.execution_engine.v1.compiler.entities import (
     CompiledWorkflow,
@@ -35,6 +38,7 @@ class ExecutionEngineV1(BaseExecutionEngine):
         prevent_local_images_loading: bool = False,
         workflow_id: Optional[str] = None,
         profiler: Optional[WorkflowsProfiler] = None,
+        compiled_workflows_cache: Optional[CompiledWorkflowsCache] = None,
     ) -> "ExecutionEngineV1":
         if init_parameters is None:
             init_parameters = {}
@@ -45,6 +49,7 @@ class ExecutionEngineV1(BaseExecutionEngine):
             init_parameters=init_parameters,
             execution_engine_version=EXECUTION_ENGINE_V1_VERSION,
             profiler=profiler,
+            compiled_workflows_cache=compiled_workflows_cache,
         )
         return cls(
             compiled_workflow=compiled_workflow,
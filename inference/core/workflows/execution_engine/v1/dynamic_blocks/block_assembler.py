@@ -1,10 +1,15 @@
+import json
 from copy import deepcopy
+from functools import partial
 from typing import Any, Dict, List, Literal, Optional, Tuple, Type, Union
 from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, create_model
 
-from inference.core.env import ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS
+from inference.core.env import (
+    ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS,
+    WORKFLOWS_DYNAMIC_BLOCKS_CACHE_SIZE,
+)
 from inference.core.workflows.errors import (
     DynamicBlockError,
     WorkflowEnvironmentConfigurationError,
@@ -26,9 +31,13 @@ from inference.core.workflows.execution_engine.introspection.utils import (
     get_full_type_name,
 )
 from inference.core.workflows.execution_engine.profiling.core import (
+    NullWorkflowsProfiler,
     WorkflowsProfiler,
     execution_phase,
 )
+from inference.core.workflows.execution_engine.v1.compiler.cache import (
+    BasicWorkflowsCache,
+)
 from inference.core.workflows.execution_engine.v1.compiler.entities import (
     BlockSpecification,
 )
@@ -46,6 +55,21 @@ from inference.core.workflows.execution_engine.v1.dynamic_blocks.entities import
 )
 from inference.core.workflows.prototypes.block import WorkflowBlockManifest
 
+# Assembling dynamic block requires building pydantic manifest and executing
+# custom Python code - compiled blocks are cached by content of their definitions,
+# such that the same block used in many workflow compilations (for instance in
+# subsequent HTTP requests) is assembled once. Note that module-level state of custom
+# code is shared among all workflows using identical block definition.
+DYNAMIC_BLOCKS_CACHE = BasicWorkflowsCache[BlockSpecification](
+    cache_size=WORKFLOWS_DYNAMIC_BLOCKS_CACHE_SIZE,
+    hash_functions=[
+        (
+            "dynamic_block_definition",
+            partial(json.dumps, sort_keys=True),
+        ),
+    ],
+)
+
 
 @execution_phase(
     name="dynamic_blocks_compilation",
@@ -57,22 +81,43 @@ def compile_dynamic_blocks(
     if not dynamic_blocks_definitions:
         return []
     ensure_dynamic_blocks_allowed(dynamic_blocks_definitions=dynamic_blocks_definitions)
-    all_defined_kinds = load_all_defined_kinds()
-    kinds_lookup = {kind.name: kind for kind in all_defined_kinds}
-    dynamic_blocks = [
-        DynamicBlockDefinition.model_validate(dynamic_block)
-        for dynamic_block in dynamic_blocks_definitions
-    ]
+    if profiler is None:
+        profiler = NullWorkflowsProfiler.init()
+    kinds_lookup = None
     compiled_blocks = []
-    for dynamic_block in dynamic_blocks:
-        block_specification = create_dynamic_block_specification(
-            dynamic_block_definition=dynamic_block,
-            kinds_lookup=kinds_lookup,
-        )
+    for dynamic_block in dynamic_blocks_definitions:
+        key = DYNAMIC_BLOCKS_CACHE.get_hash_key(dynamic_block_definition=dynamic_block)
+        block_specification = DYNAMIC_BLOCKS_CACHE.get(key=key)
+        with profiler.profile_execution_phase(
+            name="dynamic_block_assembly",
+            categories=["execution_engine_operation"],
+            metadata={
+                "block_type": get_declared_block_type(dynamic_block=dynamic_block),
+                "cache_hit": block_specification is not None,
+            },
+        ):
+            if block_specification is None:
+                if kinds_lookup is None:
+                    all_defined_kinds = load_all_defined_kinds()
+                    kinds_lookup = {kind.name: kind for kind in all_defined_kinds}
+                block_specification = create_dynamic_block_specification(
+                    dynamic_block_definition=DynamicBlockDefinition.model_validate(
+                        dynamic_block
+                    ),
+                    kinds_lookup=kinds_lookup,
+                )
+                DYNAMIC_BLOCKS_CACHE.cache(key=key, value=block_specification)
         compiled_blocks.append(block_specification)
     return compiled_blocks
 
 
+def get_declared_block_type(dynamic_block: dict) -> Optional[str]:
+    manifest = dynamic_block.get("manifest")
+    if not isinstance(manifest, dict):
+        return None
+    return manifest.get("block_type")
+
+
 def ensure_dynamic_blocks_allowed(dynamic_blocks_definitions: List[dict]) -> None:
     if dynamic_blocks_definitions and not ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS:
         raise WorkflowEnvironmentConfigurationError(
@@ -78,6 +78,11 @@ def assembly_custom_python_block(
     def get_init_parameters(cls) -> List[str]:
         return []
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        # custom code may keep arbitrary state in results of init function
+        return True
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return manifest
@@ -88,6 +93,7 @@ def assembly_custom_python_block(
         {
             "__init__": constructor,
             "get_init_parameters": get_init_parameters,
+            "holds_state_between_runs": holds_state_between_runs,
             "get_manifest": get_manifest,
             "run": run,
         },
@@ -1,8 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Type, Union
 
-from openai import BaseModel
-from pydantic import ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from inference.core.workflows.errors import BlockInterfaceError
 from inference.core.workflows.execution_engine.entities.base import OutputDefinition
@@ -21,6 +20,7 @@ BlockResult = Union[
 class WorkflowBlockManifest(BaseModel, ABC):
     model_config = ConfigDict(
         validate_assignment=True,
+        extra="allow",
     )
 
     type: str
@@ -72,6 +72,15 @@ class WorkflowBlock(ABC):
     def get_init_parameters(cls) -> List[str]:
         return []
 
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        """
+        Blocks which keep state in their instances (trackers, counters, cooldowns, etc.)
+        must declare that - their steps are never re-used among different compilations
+        of the same workflow (see `CompiledWorkflowsCache`).
+        """
+        return False
+
     @classmethod
     @abstractmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
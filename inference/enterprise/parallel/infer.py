@@ -80,6 +80,9 @@ class InferServer:
         while True:
             model_id, images, batch, preproc_return_metadatas = self.batch_queue.get()
             outputs = self.model_manager.predict(model_id, images)
+            # outputs are written by another thread - with IOBinding enabled, next batch
+            # of the same shape would overwrite buffers they are bound to
+            outputs = tuple(np.copy(output) for output in outputs)
             for output, b, metadata in zip(
                 zip(*outputs), batch, preproc_return_metadatas
             ):
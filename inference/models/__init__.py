@@ -1,3 +1,6 @@
+import importlib
+from typing import Any, Dict, List
+
 from inference.core.env import (
     CORE_MODEL_CLIP_ENABLED,
     CORE_MODEL_COGVLM_ENABLED,
@@ -10,85 +13,64 @@ from inference.core.env import (
     CORE_MODELS_ENABLED,
 )
 
+# Model classes exposed by the package are imported on first access (PEP 562), such that
+# `import inference.models` does not import all model families with their dependencies.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "LoRAPaliGemma": "inference.models.paligemma",
+    "PaliGemma": "inference.models.paligemma",
+    "Florence2": "inference.models.florence2",
+    "LoRAFlorence2": "inference.models.florence2",
+    "TrOCR": "inference.models.trocr",
+    "VitClassification": "inference.models.vit",
+    "YOLACT": "inference.models.yolact",
+    "YOLONASObjectDetection": "inference.models.yolonas",
+    "YOLOv5InstanceSegmentation": "inference.models.yolov5",
+    "YOLOv5ObjectDetection": "inference.models.yolov5",
+    "YOLOv7InstanceSegmentation": "inference.models.yolov7",
+    "YOLOv8Classification": "inference.models.yolov8",
+    "YOLOv8InstanceSegmentation": "inference.models.yolov8",
+    "YOLOv8KeypointsDetection": "inference.models.yolov8",
+    "YOLOv8ObjectDetection": "inference.models.yolov8",
+    "YOLOv9ObjectDetection": "inference.models.yolov9",
+    "YOLOv10ObjectDetection": "inference.models.yolov10",
+    "YOLOv11InstanceSegmentation": "inference.models.yolov11",
+    "YOLOv11KeypointsDetection": "inference.models.yolov11",
+    "YOLOv11ObjectDetection": "inference.models.yolov11",
+}
+
 if CORE_MODELS_ENABLED:
     if CORE_MODEL_CLIP_ENABLED:
-        try:
-            from inference.models.clip import Clip
-        except:
-            pass
-
+        _LAZY_ATTRIBUTES["Clip"] = "inference.models.clip"
     if CORE_MODEL_GAZE_ENABLED:
-        try:
-            from inference.models.gaze import Gaze
-        except:
-            pass
-
+        _LAZY_ATTRIBUTES["Gaze"] = "inference.models.gaze"
     if CORE_MODEL_SAM_ENABLED:
-        try:
-            from inference.models.sam import SegmentAnything
-        except:
-            pass
-
+        _LAZY_ATTRIBUTES["SegmentAnything"] = "inference.models.sam"
     if CORE_MODEL_SAM2_ENABLED:
-        try:
-            from inference.models.sam2 import SegmentAnything2
-        except:
-            pass
-
+        _LAZY_ATTRIBUTES["SegmentAnything2"] = "inference.models.sam2"
     if CORE_MODEL_DOCTR_ENABLED:
-        try:
-            from inference.models.doctr import DocTR
-        except:
-            pass
-
+        _LAZY_ATTRIBUTES["DocTR"] = "inference.models.doctr"
     if CORE_MODEL_GROUNDINGDINO_ENABLED:
-        try:
-            from inference.models.grounding_dino import GroundingDINO
-        except:
-            pass
-
+        _LAZY_ATTRIBUTES["GroundingDINO"] = "inference.models.grounding_dino"
     if CORE_MODEL_COGVLM_ENABLED:
-        try:
-            from inference.models.cogvlm import CogVLM
-        except:
-            pass
-
+        _LAZY_ATTRIBUTES["CogVLM"] = "inference.models.cogvlm"
     if CORE_MODEL_YOLO_WORLD_ENABLED:
-        try:
-            from inference.models.yolo_world import YOLOWorld
-        except:
-            pass
+        _LAZY_ATTRIBUTES["YOLOWorld"] = "inference.models.yolo_world"
 
-try:
-    from inference.models.paligemma import LoRAPaliGemma, PaliGemma
-except:
-    pass
 
-try:
-    from inference.models.florence2 import Florence2, LoRAFlorence2
-except:
-    pass
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+    except ImportError as error:
+        # optional model families are not available when their dependencies are missing
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r} ({error})"
+        ) from error
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
 
-try:
-    from inference.models.trocr import TrOCR
-except:
-    pass
 
-from inference.models.vit import VitClassification
-from inference.models.yolact import YOLACT
-from inference.models.yolonas import YOLONASObjectDetection
-from inference.models.yolov5 import YOLOv5InstanceSegmentation, YOLOv5ObjectDetection
-from inference.models.yolov7 import YOLOv7InstanceSegmentation
-from inference.models.yolov8 import (
-    YOLOv8Classification,
-    YOLOv8InstanceSegmentation,
-    YOLOv8KeypointsDetection,
-    YOLOv8ObjectDetection,
-)
-from inference.models.yolov9 import YOLOv9ObjectDetection
-from inference.models.yolov10 import YOLOv10ObjectDetection
-from inference.models.yolov11 import (
-    YOLOv11InstanceSegmentation,
-    YOLOv11KeypointsDetection,
-    YOLOv11ObjectDetection,
-)
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -6,6 +6,7 @@ import numpy as np
 import onnxruntime
 from PIL import Image
 
+from inference.core.cache.embeddings import EmbeddingsCache
 from inference.core.entities.requests.clip import (
     ClipCompareRequest,
     ClipImageEmbeddingRequest,
@@ -21,6 +22,7 @@ from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.env import (
     CLIP_MAX_BATCH_SIZE,
     CLIP_MODEL_ID,
+    CLIP_TEXT_EMBEDDINGS_CACHE_SIZE,
     ONNXRUNTIME_EXECUTION_PROVIDERS,
     REQUIRED_ONNX_PROVIDERS,
     TENSORRT_CACHE_PATH,
@@ -29,9 +31,15 @@ from inference.core.exceptions import OnnxProviderNotAvailable
 from inference.core.models.roboflow import OnnxRoboflowCoreModel
 from inference.core.models.types import PreprocessReturnMetadata
 from inference.core.models.utils.batching import create_batches
+from inference.core.models.utils.onnx_session import create_inference_session
 from inference.core.utils.image_utils import load_image_rgb
 from inference.core.utils.onnx import get_onnxruntime_execution_providers
-from inference.core.utils.postprocess import cosine_similarity
+from inference.core.utils.postprocess import cosine_similarity_matrix
+
+# shared by all CLIP models - keys include model ID (CLIP version)
+clip_text_embeddings_cache = EmbeddingsCache(
+    max_entries=CLIP_TEXT_EMBEDDINGS_CACHE_SIZE
+)
 
 
 class Clip(OnnxRoboflowCoreModel):
@@ -62,14 +70,16 @@ class Clip(OnnxRoboflowCoreModel):
         super().__init__(*args, model_id=model_id, **kwargs)
         # Create an ONNX Runtime Session with a list of execution providers in priority order. ORT attempts to load providers until one is successful. This keeps the code across devices identical.
         self.log("Creating inference sessions")
-        self.visual_onnx_session = onnxruntime.InferenceSession(
-            self.cache_file("visual.onnx"),
+        self.visual_onnx_session = create_inference_session(
+            model_path=self.cache_file("visual.onnx"),
             providers=self.onnxruntime_execution_providers,
+            model_id=self.endpoint,
         )
 
-        self.textual_onnx_session = onnxruntime.InferenceSession(
-            self.cache_file("textual.onnx"),
+        self.textual_onnx_session = create_inference_session(
+            model_path=self.cache_file("textual.onnx"),
             providers=self.onnxruntime_execution_providers,
+            model_id=self.endpoint,
         )
 
         if REQUIRED_ONNX_PROVIDERS:
@@ -109,7 +119,7 @@ class Clip(OnnxRoboflowCoreModel):
 
         Raises:
             ValueError: If subject_type or prompt_type is neither "image" nor "text".
-            ValueError: If the number of prompts exceeds the maximum batch size.
+            ValueError: If the number of image prompts exceeds the maximum batch size.
         """
 
         if subject_type == "image":
@@ -131,12 +141,11 @@ class Clip(OnnxRoboflowCoreModel):
                 prompt = [prompt]
             prompt_obj = "list"
 
-        if len(prompt) > CLIP_MAX_BATCH_SIZE:
-            raise ValueError(
-                f"The maximum number of prompts that can be compared at once is {CLIP_MAX_BATCH_SIZE}"
-            )
-
         if prompt_type == "image":
+            if len(prompt) > CLIP_MAX_BATCH_SIZE:
+                raise ValueError(
+                    f"The maximum number of prompts that can be compared at once is {CLIP_MAX_BATCH_SIZE}"
+                )
             prompt_embeddings = self.embed_image(prompt)
         elif prompt_type == "text":
             prompt_embeddings = self.embed_text(prompt)
@@ -145,9 +154,12 @@ class Clip(OnnxRoboflowCoreModel):
                 "prompt_type must be either 'image' or 'text', but got {request.prompt_type}"
             )
 
-        similarities = [
-            cosine_similarity(subject_embeddings, p) for p in prompt_embeddings
-        ]
+        # similarities of all subjects (rows) and prompts (columns) in one product
+        similarities = cosine_similarity_matrix(subject_embeddings, prompt_embeddings)
+        if len(similarities) == 1:
+            similarities = similarities[0].tolist()
+        else:
+            similarities = similarities.T.tolist()
 
         if prompt_obj == "dict":
             similarities = dict(zip(prompt_keys, similarities))
@@ -258,12 +270,21 @@ class Clip(OnnxRoboflowCoreModel):
             ValueError: If the number of text strings in the list exceeds the maximum batch size.
 
         Notes:
-            The function utilizes an ONNX session to compute embeddings and measures the embedding time with perf_counter.
+            Embeddings are cached per CLIP version and text (see `CLIP_TEXT_EMBEDDINGS_CACHE_SIZE`) - only
+            texts missing in cache are embedded, in batches.
         """
         if isinstance(text, list):
             texts = text
         else:
             texts = [text]
+        return clip_text_embeddings_cache.get_or_compute(
+            keys=[(self.endpoint, t) for t in texts],
+            compute=lambda missing: self._embed_texts(
+                texts=[texts[i] for i in missing]
+            ),
+        )
+
+    def _embed_texts(self, texts: List[str]) -> np.ndarray:
         results = []
         for texts_batch in create_batches(
             sequence=texts, batch_size=CLIP_MAX_BATCH_SIZE
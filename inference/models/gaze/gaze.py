@@ -28,6 +28,7 @@ from inference.core.env import (
 )
 from inference.core.exceptions import OnnxProviderNotAvailable
 from inference.core.models.roboflow import OnnxRoboflowCoreModel
+from inference.core.models.utils.onnx_session import create_inference_session
 from inference.core.utils.image_utils import load_image_rgb
 from inference.models.gaze.l2cs import L2CS
 
@@ -52,8 +53,9 @@ class Gaze(OnnxRoboflowCoreModel):
 
         # TODO: convert face detector (TensorflowLite) to ONNX model
 
-        self.gaze_onnx_session = onnxruntime.InferenceSession(
-            self.cache_file("L2CSNet_gaze360_resnet50_90bins.onnx"),
+        self.gaze_onnx_session = create_inference_session(
+            model_path=self.cache_file("L2CSNet_gaze360_resnet50_90bins.onnx"),
+            model_id=self.endpoint,
             providers=[
                 (
                     "TensorrtExecutionProvider",
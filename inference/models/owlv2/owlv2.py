@@ -1,7 +1,8 @@
 import hashlib
 import os
-from collections import defaultdict
-from typing import Dict, List, NewType
+from collections import OrderedDict, defaultdict
+from threading import Lock
+from typing import Any, Dict, List, NewType, Optional, Tuple
 
 import numpy as np
 import torch
@@ -10,20 +11,43 @@ from PIL import Image
 from transformers import Owlv2ForObjectDetection, Owlv2Processor
 from transformers.models.owlv2.modeling_owlv2 import box_iou
 
+from inference.core.cache.tensors import (
+    TensorsCache,
+    numpy_to_tensors,
+    tensors_to_numpy,
+)
 from inference.core.entities.responses.inference import (
     InferenceResponseImage,
     ObjectDetectionInferenceResponse,
     ObjectDetectionPrediction,
 )
-from inference.core.env import DEVICE
+from inference.core.env import (
+    DEVICE,
+    OWLV2_IMAGE_CACHE_MEMORY_MB,
+    OWLV2_IMAGE_CACHE_SIZE,
+    OWLV2_IMAGE_EMBEDDINGS_CACHE_DIR,
+    OWLV2_IMAGE_EMBEDDINGS_CACHE_MAX_MB,
+    OWLV2_MAX_PROMPT_SETS,
+    OWLV2_QUERY_EMBEDDINGS_CACHE_SIZE,
+)
+from inference.core.exceptions import OwlV2PromptSetNotFoundError
 from inference.core.models.roboflow import (
     DEFAULT_COLOR_PALETTE,
     RoboflowCoreModel,
     draw_detection_predictions,
 )
-from inference.core.utils.image_utils import load_image_rgb
+from inference.core.utils.image_utils import (
+    ImageType,
+    extract_image_payload_and_type,
+    load_image_bgr,
+    load_image_rgb,
+)
 
 Hash = NewType("Hash", str)
+ImageEmbeddings = Tuple[torch.Tensor, ...]
+ClassEmbeddings = Dict[str, Optional[torch.Tensor]]
+PromptSetKey = Tuple[Optional[str], str]
+QUERY_EMBEDDINGS_CACHE_MAX_BYTES = 64 * 1024**2
 if DEVICE is None:
     DEVICE = "cuda:0" if torch.cuda.is_available() else "cpu"
 
@@ -37,23 +61,63 @@ def to_corners(box):
     return torch.stack([x1, y1, x2, y2], dim=-1)
 
 
-from collections import OrderedDict
-
-
-class LimitedSizeDict(OrderedDict):
-    def __init__(self, *args, **kwds):
-        self.size_limit = kwds.pop("size_limit", None)
-        OrderedDict.__init__(self, *args, **kwds)
-        self._check_size_limit()
-
-    def __setitem__(self, key, value):
-        OrderedDict.__setitem__(self, key, value)
-        self._check_size_limit()
-
-    def _check_size_limit(self):
-        if self.size_limit is not None:
-            while len(self) > self.size_limit:
-                self.popitem(last=False)
+def hash_training_data(training_data: List[dict]) -> Hash:
+    """Hash of training data - computed from image payloads, without decoding images. Content
+    behind URLs and file paths may change, so such images must be loaded first (see
+    `load_referenced_images`)."""
+    digest = hashlib.sha256()
+    for train_image_dict in training_data:
+        _update_digest_with_image(digest=digest, image=train_image_dict["image"])
+        for box in train_image_dict["boxes"]:
+            coords = box["cls"], box["x"], box["y"], box["w"], box["h"]
+            digest.update(repr(coords).encode("utf-8"))
+        digest.update(b"|")
+    return Hash(digest.hexdigest())
+
+
+def load_referenced_images(training_data: List[dict]) -> List[dict]:
+    """Loads images of training data given by URL or file path, such that they are hashed by
+    content. Images are loaded in BGR, like images of other types are decoded."""
+    return [
+        (
+            {**train_image_dict, "image": load_image_bgr(train_image_dict["image"])}
+            if _is_image_reference(train_image_dict["image"])
+            else train_image_dict
+        )
+        for train_image_dict in training_data
+    ]
+
+
+def _is_image_reference(image: Any) -> bool:
+    payload, image_type = extract_image_payload_and_type(image)
+    if image_type is not None:
+        return image_type is ImageType.URL
+    return isinstance(payload, str) and (
+        payload.startswith("http") or os.path.isfile(payload)
+    )
+
+
+def _get_prompt_set_key(api_key: Optional[str], prompt_set_id: str) -> PromptSetKey:
+    # prompt sets are scoped by API key (kept only as hash)
+    api_key_hash = (
+        hashlib.sha256(api_key.encode("utf-8")).hexdigest() if api_key else None
+    )
+    return api_key_hash, prompt_set_id
+
+
+def _update_digest_with_image(digest: Any, image: Any) -> None:
+    if isinstance(image, dict):
+        digest.update(repr(image.get("type")).encode("utf-8"))
+        image = image.get("value")
+    if isinstance(image, Image.Image):
+        image = np.asarray(image)
+    if isinstance(image, np.ndarray):
+        digest.update(repr(image.shape).encode("utf-8"))
+        digest.update(np.ascontiguousarray(image).tobytes())
+    elif isinstance(image, bytes):
+        digest.update(image)
+    else:
+        digest.update(repr(image).encode("utf-8"))
 
 
 class OwlV2(RoboflowCoreModel):
@@ -65,9 +129,28 @@ class OwlV2(RoboflowCoreModel):
         hf_id = os.path.join("google", self.version_id)
         self.processor = Owlv2Processor.from_pretrained(hf_id)
         self.model = Owlv2ForObjectDetection.from_pretrained(hf_id).eval().to(DEVICE)
-        self.image_embed_cache = LimitedSizeDict(
-            size_limit=50
-        )  # NOTE: this should have a max size
+        self.image_embed_cache = TensorsCache(
+            name=f"{self.endpoint}/image_embeddings",
+            max_bytes=int(OWLV2_IMAGE_CACHE_MEMORY_MB * 1024**2),
+            max_entries=OWLV2_IMAGE_CACHE_SIZE,
+            spill_dir=OWLV2_IMAGE_EMBEDDINGS_CACHE_DIR,
+            spill_max_bytes=int(OWLV2_IMAGE_EMBEDDINGS_CACHE_MAX_MB * 1024**2),
+            spill_persistent=True,
+            to_host=tensors_to_numpy,
+            # persisted embeddings are restored as list
+            from_host=lambda value: tuple(numpy_to_tensors(value, device=DEVICE)),
+        )
+        # query embeddings of each class, keyed by hash of training data
+        self.query_embed_cache = TensorsCache(
+            name=f"{self.endpoint}/query_embeddings",
+            max_bytes=QUERY_EMBEDDINGS_CACHE_MAX_BYTES,
+            max_entries=OWLV2_QUERY_EMBEDDINGS_CACHE_SIZE,
+        )
+        # query embeddings registered under prompt set ID, least recently used first
+        self.prompt_sets: "OrderedDict[PromptSetKey, Tuple[Hash, ClassEmbeddings]]" = (
+            OrderedDict()
+        )
+        self._prompt_sets_lock = Lock()
 
     def draw_predictions(
         self,
@@ -99,13 +182,19 @@ class OwlV2(RoboflowCoreModel):
         # Download from huggingface
         pass
 
-    @torch.no_grad()
     def embed_image(self, image: Image.Image) -> Hash:
-        image_hash = hashlib.sha256(np.array(image).tobytes()).hexdigest()
+        image_hash, _ = self._embed_image(image)
+        return image_hash
 
-        if (image_embeds := self.image_embed_cache.get(image_hash)) is not None:
-            return image_hash
+    def _embed_image(self, image: Image.Image) -> Tuple[Hash, ImageEmbeddings]:
+        image_hash = Hash(hashlib.sha256(np.array(image).tobytes()).hexdigest())
+        image_embeddings = self.image_embed_cache.get_or_compute(
+            key=image_hash, compute=lambda: self._compute_image_embeddings(image)
+        )
+        return image_hash, image_embeddings
 
+    @torch.no_grad()
+    def _compute_image_embeddings(self, image: Image.Image) -> ImageEmbeddings:
         pixel_values = self.processor(
             images=image, return_tensors="pt"
         ).pixel_values.to(DEVICE)
@@ -127,7 +216,7 @@ class OwlV2(RoboflowCoreModel):
         )
         objectness = objectness.sigmoid()
 
-        self.image_embed_cache[image_hash] = (
+        return (
             objectness.squeeze(0),
             boxes.squeeze(0),
             image_class_embeds.squeeze(0),
@@ -135,18 +224,21 @@ class OwlV2(RoboflowCoreModel):
             logit_scale.squeeze(0).squeeze(1),
         )
 
-        return image_hash
-
-    def get_query_embedding(self, query_spec: Dict[Hash, List[List[int]]]):
+    def get_query_embedding(
+        self,
+        query_spec: Dict[Hash, List[List[int]]],
+        image_embeddings: Optional[Dict[Hash, ImageEmbeddings]] = None,
+    ):
         # NOTE: for now we're handling each image seperately
         query_embeds = []
         for image_hash, query_boxes in query_spec.items():
-            try:
-                objectness, image_boxes, image_class_embeds, _, _ = (
-                    self.image_embed_cache[image_hash]
-                )
-            except KeyError as error:
-                raise KeyError("We didn't embed the image first!") from error
+            if image_embeddings is not None and image_hash in image_embeddings:
+                embeddings = image_embeddings[image_hash]
+            else:
+                embeddings = self.image_embed_cache.get(image_hash)
+            if embeddings is None:
+                raise KeyError("We didn't embed the image first!")
+            objectness, image_boxes, image_class_embeds, _, _ = embeddings
 
             query_boxes_tensor = torch.tensor(
                 query_boxes, dtype=torch.float, device=image_boxes.device
@@ -171,8 +263,18 @@ class OwlV2(RoboflowCoreModel):
         return query
 
     def infer_from_embed(self, image_hash: Hash, query_embeddings, confidence):
+        image_embeddings = self.image_embed_cache.get(image_hash)
+        if image_embeddings is None:
+            raise KeyError("We didn't embed the image first!")
+        return self.infer_from_embeddings(
+            image_embeddings, query_embeddings, confidence
+        )
+
+    def infer_from_embeddings(
+        self, image_embeddings: ImageEmbeddings, query_embeddings, confidence
+    ):
         objectness, image_boxes, image_class_embeds, logit_shift, logit_scale = (
-            self.image_embed_cache[image_hash]
+            image_embeddings
         )
         predicted_boxes = []
         predicted_classes = []
@@ -211,12 +313,68 @@ class OwlV2(RoboflowCoreModel):
             for c, (x, y, w, h), score in zip(pred_classes, pred_boxes, pred_scores)
         ]
 
-    def infer(self, image, training_data, confidence=0.99, **kwargs):
+    def register_prompt_set(
+        self,
+        prompt_set_id: str,
+        training_data: List[dict],
+        api_key: Optional[str] = None,
+    ) -> ClassEmbeddings:
+        """Registers query embeddings of training data under `prompt_set_id` (scoped by API
+        key), such that following requests may refer to them by ID. Returns the embeddings.
+        """
+        training_data = load_referenced_images(training_data)
+        training_data_hash = hash_training_data(training_data)
+        class_embeddings = self.query_embed_cache.get_or_compute(
+            key=training_data_hash,
+            compute=lambda: self.compute_class_embeddings(training_data),
+        )
+        # only embeddings are kept - training data (including images) is not retained
+        prompt_set_key = _get_prompt_set_key(api_key, prompt_set_id)
+        with self._prompt_sets_lock:
+            self.prompt_sets[prompt_set_key] = (training_data_hash, class_embeddings)
+            self.prompt_sets.move_to_end(prompt_set_key)
+            while len(self.prompt_sets) > OWLV2_MAX_PROMPT_SETS:
+                self.prompt_sets.popitem(last=False)
+        return class_embeddings
+
+    def get_class_embeddings(
+        self,
+        training_data: Optional[List[dict]] = None,
+        prompt_set_id: Optional[str] = None,
+        api_key: Optional[str] = None,
+    ) -> ClassEmbeddings:
+        if training_data is not None and prompt_set_id is not None:
+            return self.register_prompt_set(
+                prompt_set_id=prompt_set_id,
+                training_data=training_data,
+                api_key=api_key,
+            )
+        if training_data is not None:
+            training_data = load_referenced_images(training_data)
+            return self.query_embed_cache.get_or_compute(
+                key=hash_training_data(training_data),
+                compute=lambda: self.compute_class_embeddings(training_data),
+            )
+        prompt_set_key = _get_prompt_set_key(api_key, prompt_set_id)
+        with self._prompt_sets_lock:
+            prompt_set = self.prompt_sets.get(prompt_set_key)
+            if prompt_set is not None:
+                self.prompt_sets.move_to_end(prompt_set_key)
+        if prompt_set is None:
+            raise OwlV2PromptSetNotFoundError(
+                f"Prompt set {prompt_set_id} is not registered"
+            )
+        _, class_embeddings = prompt_set
+        return class_embeddings
+
+    def compute_class_embeddings(self, training_data: List[dict]) -> ClassEmbeddings:
         class_to_query_spec = defaultdict(lambda: defaultdict(list))
+        image_embeddings = {}
         for train_image_dict in training_data:
             boxes, train_image = train_image_dict["boxes"], train_image_dict["image"]
             train_image = load_image_rgb(train_image)
-            image_hash = self.embed_image(train_image)
+            image_hash, embeddings = self._embed_image(train_image)
+            image_embeddings[image_hash] = embeddings
             for box in boxes:
                 class_name = box["cls"]
                 coords = box["x"], box["y"], box["w"], box["h"]
@@ -225,8 +383,22 @@ class OwlV2(RoboflowCoreModel):
 
         my_class_to_embeddings_dict = dict()
         for class_name, query_spec in class_to_query_spec.items():
-            class_embedding = self.get_query_embedding(query_spec)
+            class_embedding = self.get_query_embedding(query_spec, image_embeddings)
             my_class_to_embeddings_dict[class_name] = class_embedding
+        return my_class_to_embeddings_dict
+
+    def infer(
+        self,
+        image,
+        training_data=None,
+        confidence=0.99,
+        prompt_set_id=None,
+        api_key=None,
+        **kwargs,
+    ):
+        my_class_to_embeddings_dict = self.get_class_embeddings(
+            training_data=training_data, prompt_set_id=prompt_set_id, api_key=api_key
+        )
 
         if not isinstance(image, list):
             images = [image]
@@ -238,9 +410,9 @@ class OwlV2(RoboflowCoreModel):
         for image in images:
             image = load_image_rgb(image)
             image_sizes.append(image.shape[:2][::-1])
-            image_hash = self.embed_image(image)
-            result = self.infer_from_embed(
-                image_hash, my_class_to_embeddings_dict, confidence
+            _, image_embeddings = self._embed_image(image)
+            result = self.infer_from_embeddings(
+                image_embeddings, my_class_to_embeddings_dict, confidence
             )
             results.append(result)
         return self.make_response(
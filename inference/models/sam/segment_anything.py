@@ -1,15 +1,16 @@
 import base64
 from io import BytesIO
+from threading import Lock
 from time import perf_counter
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
-import onnxruntime
 import rasterio.features
 import torch
 from segment_anything import SamPredictor, sam_model_registry
 from shapely.geometry import Polygon as ShapelyPolygon
 
+from inference.core.cache.tensors import TensorsCache
 from inference.core.entities.requests.inference import InferenceRequestImage
 from inference.core.entities.requests.sam import (
     SamEmbeddingRequest,
@@ -20,8 +21,15 @@ from inference.core.entities.responses.sam import (
     SamEmbeddingResponse,
     SamSegmentationResponse,
 )
-from inference.core.env import SAM_MAX_EMBEDDING_CACHE_SIZE, SAM_VERSION_ID
+from inference.core.env import (
+    SAM_EMBEDDING_CACHE_SPILL_DIR,
+    SAM_EMBEDDING_CACHE_SPILL_MAX_MB,
+    SAM_MAX_EMBEDDING_CACHE_MEMORY_MB,
+    SAM_MAX_EMBEDDING_CACHE_SIZE,
+    SAM_VERSION_ID,
+)
 from inference.core.models.roboflow import RoboflowCoreModel
+from inference.core.models.utils.onnx_session import create_inference_session
 from inference.core.utils.image_utils import load_image_rgb
 from inference.core.utils.postprocess import masks2poly
 
@@ -33,11 +41,8 @@ class SegmentAnything(RoboflowCoreModel):
         sam: The segmentation model.
         predictor: The predictor for the segmentation model.
         ort_session: ONNX runtime inference session.
-        embedding_cache: Cache for embeddings.
-        image_size_cache: Cache for image sizes.
-        embedding_cache_keys: Keys for the embedding cache.
+        embedding_cache: Cache for embeddings and image sizes.
         low_res_logits_cache: Cache for low resolution logits.
-        segmentation_cache_keys: Keys for the segmentation cache.
     """
 
     def __init__(self, *args, model_id: str = f"sam/{SAM_VERSION_ID}", **kwargs):
@@ -53,20 +58,28 @@ class SegmentAnything(RoboflowCoreModel):
         )
         self.sam.to(device="cuda" if torch.cuda.is_available() else "cpu")
         self.predictor = SamPredictor(self.sam)
-        self.ort_session = onnxruntime.InferenceSession(
-            self.cache_file("decoder.onnx"),
+        self.ort_session = create_inference_session(
+            model_path=self.cache_file("decoder.onnx"),
+            model_id=self.endpoint,
             providers=[
                 "CUDAExecutionProvider",
                 "OpenVINOExecutionProvider",
                 "CPUExecutionProvider",
             ],
         )
-        self.embedding_cache = {}
-        self.image_size_cache = {}
-        self.embedding_cache_keys = []
-
-        self.low_res_logits_cache = {}
-        self.segmentation_cache_keys = []
+        self.embedding_cache = TensorsCache(
+            name=f"{self.endpoint}/embeddings",
+            max_bytes=int(SAM_MAX_EMBEDDING_CACHE_MEMORY_MB * 1024**2),
+            max_entries=SAM_MAX_EMBEDDING_CACHE_SIZE,
+            spill_dir=SAM_EMBEDDING_CACHE_SPILL_DIR,
+            spill_max_bytes=int(SAM_EMBEDDING_CACHE_SPILL_MAX_MB * 1024**2),
+        )
+        self.low_res_logits_cache = TensorsCache(
+            name=f"{self.endpoint}/low_res_logits",
+            max_bytes=int(SAM_MAX_EMBEDDING_CACHE_MEMORY_MB * 1024**2),
+            max_entries=SAM_MAX_EMBEDDING_CACHE_SIZE,
+        )
+        self._predictor_lock = Lock()
         self.task_type = "unsupervised-segmentation"
 
     def get_infer_bucket_file_list(self) -> List[str]:
@@ -94,31 +107,27 @@ class SegmentAnything(RoboflowCoreModel):
 
         Notes:
             - Embeddings and image sizes are cached to improve performance on repeated requests for the same image.
-            - The cache has a maximum size defined by SAM_MAX_EMBEDDING_CACHE_SIZE. When the cache exceeds this size,
-              the oldest entries are removed.
+            - The cache is bounded by SAM_MAX_EMBEDDING_CACHE_SIZE entries and SAM_MAX_EMBEDDING_CACHE_MEMORY_MB.
+              When the cache exceeds these bounds, the least recently used entries are removed. Concurrent
+              requests for the same image_id compute the embedding once.
 
         Example:
             >>> img_array = ... # some image array
             >>> embed_image(img_array, image_id="sample123")
             (array([...]), (224, 224))
         """
-        if image_id and image_id in self.embedding_cache:
-            return (
-                self.embedding_cache[image_id],
-                self.image_size_cache[image_id],
-            )
+        if not image_id:
+            return self._embed_image(image=image)
+        return self.embedding_cache.get_or_compute(
+            key=image_id, compute=lambda: self._embed_image(image=image)
+        )
+
+    def _embed_image(self, image: Any) -> Tuple[np.ndarray, Tuple[int, int]]:
         img_in = self.preproc_image(image)
-        self.predictor.set_image(img_in)
-        embedding = self.predictor.get_image_embedding().cpu().numpy()
-        if image_id:
-            self.embedding_cache[image_id] = embedding
-            self.image_size_cache[image_id] = img_in.shape[:2]
-            self.embedding_cache_keys.append(image_id)
-            if len(self.embedding_cache_keys) > SAM_MAX_EMBEDDING_CACHE_SIZE:
-                cache_key = self.embedding_cache_keys.pop(0)
-                del self.embedding_cache[cache_key]
-                del self.image_size_cache[cache_key]
-        return (embedding, img_in.shape[:2])
+        with self._predictor_lock:
+            self.predictor.set_image(img_in)
+            embedding = self.predictor.get_image_embedding().cpu().numpy()
+        return embedding, img_in.shape[:2]
 
     def infer_from_request(self, request: SamInferenceRequest):
         """Performs inference based on the request type.
@@ -266,12 +275,11 @@ class SegmentAnything(RoboflowCoreModel):
         point_labels = np.expand_dims(point_labels, axis=0)
 
         if has_mask_input:
-            if (
-                image_id
-                and image_id in self.low_res_logits_cache
-                and use_mask_input_cache
-            ):
-                mask_input = self.low_res_logits_cache[image_id]
+            cached_mask_input = None
+            if image_id and use_mask_input_cache:
+                cached_mask_input = self.low_res_logits_cache.get(image_id)
+            if cached_mask_input is not None:
+                mask_input = cached_mask_input
             elif not mask_input and (
                 not image_id or image_id not in self.low_res_logits_cache
             ):
@@ -306,12 +314,7 @@ class SegmentAnything(RoboflowCoreModel):
         }
         masks, _, low_res_logits = self.ort_session.run(None, ort_inputs)
         if image_id:
-            self.low_res_logits_cache[image_id] = low_res_logits
-            if image_id not in self.segmentation_cache_keys:
-                self.segmentation_cache_keys.append(image_id)
-            if len(self.segmentation_cache_keys) > SAM_MAX_EMBEDDING_CACHE_SIZE:
-                cache_key = self.segmentation_cache_keys.pop(0)
-                del self.low_res_logits_cache[cache_key]
+            self.low_res_logits_cache.put(key=image_id, value=low_res_logits)
         masks = masks[0]
         low_res_masks = low_res_logits[0]
 
@@ -1,6 +1,8 @@
 import copy
 import hashlib
+from functools import partial
 from io import BytesIO
+from threading import Lock
 from time import perf_counter
 from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
 
@@ -16,8 +18,15 @@ sam2.utils.misc.get_sdp_backends = lambda z: [
 from sam2.build_sam import build_sam2
 from sam2.sam2_image_predictor import SAM2ImagePredictor
 
+from inference.core.cache.tensors import (
+    TensorsCache,
+    map_leaves,
+    numpy_to_tensors,
+    tensors_to_numpy,
+)
 from inference.core.entities.requests.inference import InferenceRequestImage
 from inference.core.entities.requests.sam2 import (
+    Sam2BatchSegmentationRequest,
     Sam2EmbeddingRequest,
     Sam2InferenceRequest,
     Sam2Prompt,
@@ -32,11 +41,18 @@ from inference.core.entities.responses.sam2 import (
 from inference.core.env import (
     DEVICE,
     DISABLE_SAM2_LOGITS_CACHE,
+    SAM2_MAX_BATCH_SIZE,
+    SAM2_MAX_EMBEDDING_CACHE_MEMORY_MB,
     SAM2_MAX_EMBEDDING_CACHE_SIZE,
+    SAM2_MAX_LOGITS_CACHE_MEMORY_MB,
     SAM2_MAX_LOGITS_CACHE_SIZE,
+    SAM2_MAX_PROMPTS_BATCH_SIZE,
     SAM2_VERSION_ID,
+    SAM_EMBEDDING_CACHE_SPILL_DIR,
+    SAM_EMBEDDING_CACHE_SPILL_MAX_MB,
 )
 from inference.core.models.roboflow import RoboflowCoreModel
+from inference.core.models.utils.batching import create_batches
 from inference.core.utils.image_utils import load_image_rgb
 from inference.core.utils.postprocess import masks2multipoly
 
@@ -56,9 +72,8 @@ class SegmentAnything2(RoboflowCoreModel):
         sam: The segmentation model.
         predictor: The predictor for the segmentation model.
         ort_session: ONNX runtime inference session.
-        embedding_cache: Cache for embeddings.
-        image_size_cache: Cache for image sizes.
-        embedding_cache_keys: Keys for the embedding cache.
+        embedding_cache: Cache for embeddings and image sizes.
+        low_res_logits_cache: Cache for low resolution logits of prompts.
 
     """
 
@@ -91,11 +106,21 @@ class SegmentAnything2(RoboflowCoreModel):
 
         self.predictor = SAM2ImagePredictor(self.sam)
 
-        self.embedding_cache = {}
-        self.image_size_cache = {}
-        self.embedding_cache_keys = []
-        self.low_res_logits_cache: Dict[Tuple[str, str], LogitsCacheType] = {}
-        self.low_res_logits_cache_keys = []
+        self.embedding_cache = TensorsCache(
+            name=f"{self.endpoint}/embeddings",
+            max_bytes=int(SAM2_MAX_EMBEDDING_CACHE_MEMORY_MB * 1024**2),
+            max_entries=embedding_cache_size,
+            spill_dir=SAM_EMBEDDING_CACHE_SPILL_DIR,
+            spill_max_bytes=int(SAM_EMBEDDING_CACHE_SPILL_MAX_MB * 1024**2),
+            to_host=tensors_to_numpy,
+            from_host=partial(numpy_to_tensors, device=DEVICE),
+        )
+        self.low_res_logits_cache = TensorsCache(
+            name=f"{self.endpoint}/low_res_logits",
+            max_bytes=int(SAM2_MAX_LOGITS_CACHE_MEMORY_MB * 1024**2),
+            max_entries=low_res_logits_cache_size,
+        )
+        self._predictor_lock = Lock()
 
         self.task_type = "unsupervised-segmentation"
 
@@ -137,38 +162,27 @@ class SegmentAnything2(RoboflowCoreModel):
             >>> embed_image(img_array, image_id="sample123")
             (array([...]), (224, 224))
         """
-        if image_id and image_id in self.embedding_cache:
-            return (
-                self.embedding_cache[image_id],
-                self.image_size_cache[image_id],
-                image_id,
+        if image_id:
+            embedding_dict, image_size = self.embedding_cache.get_or_compute(
+                key=image_id,
+                compute=lambda: self._embed_image(img_in=self.preproc_image(image)),
             )
+            return embedding_dict, image_size, image_id
 
         img_in = self.preproc_image(image)
-        if image_id is None:
-            image_id = hashlib.md5(img_in.tobytes()).hexdigest()[:12]
-
-        if image_id in self.embedding_cache:
-            return (
-                self.embedding_cache[image_id],
-                self.image_size_cache[image_id],
-                image_id,
-            )
+        image_id = hashlib.md5(img_in.tobytes()).hexdigest()[:12]
+        embedding_dict, image_size = self.embedding_cache.get_or_compute(
+            key=image_id, compute=lambda: self._embed_image(img_in=img_in)
+        )
+        return embedding_dict, image_size, image_id
 
-        with torch.inference_mode():
+    def _embed_image(
+        self, img_in: np.ndarray
+    ) -> Tuple[Dict[str, Any], Tuple[int, int]]:
+        with self._predictor_lock, torch.inference_mode():
             self.predictor.set_image(img_in)
             embedding_dict = self.predictor._features
-
-        self.embedding_cache[image_id] = embedding_dict
-        self.image_size_cache[image_id] = img_in.shape[:2]
-        if image_id in self.embedding_cache_keys:
-            self.embedding_cache_keys.remove(image_id)
-        self.embedding_cache_keys.append(image_id)
-        if len(self.embedding_cache_keys) > self.embedding_cache_size:
-            cache_key = self.embedding_cache_keys.pop(0)
-            del self.embedding_cache[cache_key]
-            del self.image_size_cache[cache_key]
-        return (embedding_dict, img_in.shape[:2], image_id)
+        return embedding_dict, img_in.shape[:2]
 
     def infer_from_request(self, request: Sam2InferenceRequest):
         """Performs inference based on the request type.
@@ -177,7 +191,7 @@ class SegmentAnything2(RoboflowCoreModel):
             request (SamInferenceRequest): The inference request.
 
         Returns:
-            Union[SamEmbeddingResponse, SamSegmentationResponse]: The inference response.
+            Union[SamEmbeddingResponse, SamSegmentationResponse, List[SamSegmentationResponse]]: The inference response.
         """
         t1 = perf_counter()
         if isinstance(request, Sam2EmbeddingRequest):
@@ -203,7 +217,24 @@ class SegmentAnything2(RoboflowCoreModel):
                 return binary_data
             else:
                 raise ValueError(f"Invalid format {request.format}")
-
+        elif isinstance(request, Sam2BatchSegmentationRequest):
+            results = self.segment_images(
+                images=request.images,
+                image_ids=request.image_ids,
+                prompts=request.prompts,
+                multimask_output=request.multimask_output,
+                save_logits_to_cache=request.save_logits_to_cache,
+                load_logits_from_cache=request.load_logits_from_cache,
+            )
+            return [
+                turn_segmentation_results_into_api_response(
+                    masks=masks,
+                    scores=scores,
+                    mask_threshold=self.predictor.mask_threshold,
+                    inference_start_timestamp=t1,
+                )
+                for masks, scores, _ in results
+            ]
         else:
             raise ValueError(f"Invalid request type {type(request)}")
 
@@ -263,45 +294,213 @@ class SegmentAnything2(RoboflowCoreModel):
             - The cache has a maximum size defined by SAM_MAX_EMBEDDING_CACHE_SIZE. When the cache exceeds this size,
               the oldest entries are removed.
         """
+        return self.segment_images(
+            images=[image],
+            image_ids=[image_id],
+            prompts=[prompts],
+            multimask_output=multimask_output,
+            mask_inputs=[mask_input],
+            save_logits_to_cache=save_logits_to_cache,
+            load_logits_from_cache=load_logits_from_cache,
+        )[0]
+
+    def segment_images(
+        self,
+        images: List[Optional[InferenceRequestImage]],
+        image_ids: Optional[List[Optional[str]]] = None,
+        prompts: Optional[List[Optional[Union[Sam2PromptSet, dict]]]] = None,
+        multimask_output: Optional[bool] = True,
+        mask_inputs: Optional[
+            List[Optional[Union[np.ndarray, List[List[List[float]]]]]]
+        ] = None,
+        save_logits_to_cache: bool = False,
+        load_logits_from_cache: bool = False,
+    ) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Segments batch of images, each with its own prompt set (and optionally mask input). Images
+        missing in embeddings cache are embedded together (up to SAM2_MAX_BATCH_SIZE at once) and
+        prompts of each image are decoded together (up to SAM2_MAX_PROMPTS_BATCH_SIZE at once).
+
+        Returns:
+            List[Tuple[np.ndarray, np.ndarray, np.ndarray]]: results of `segment_image(...)` for each image.
+
+        Raises:
+            ValueError: If necessary inputs are missing or inconsistent.
+        """
+        image_ids = image_ids or [None] * len(images)
+        prompts = prompts or [None] * len(images)
+        mask_inputs = mask_inputs or [None] * len(images)
+        if not len(images) == len(image_ids) == len(prompts) == len(mask_inputs):
+            raise ValueError(
+                f"Got {len(images)} images, {len(image_ids)} image ids, {len(prompts)} "
+                f"prompt sets and {len(mask_inputs)} mask inputs - must be equal"
+            )
         load_logits_from_cache = (
             load_logits_from_cache and not DISABLE_SAM2_LOGITS_CACHE
         )
         save_logits_to_cache = save_logits_to_cache and not DISABLE_SAM2_LOGITS_CACHE
-        with torch.inference_mode():
+        for image, image_id in zip(images, image_ids):
             if image is None and not image_id:
                 raise ValueError("Must provide either image or  cached image_id")
             elif image_id and image is None and image_id not in self.embedding_cache:
                 raise ValueError(
                     f"Image ID {image_id} not in embedding cache, must provide the image or embeddings"
                 )
-            embedding, original_image_size, image_id = self.embed_image(
-                image=image, image_id=image_id
+        results = []
+        with torch.inference_mode():
+            embeddings = self.embed_images(images=images, image_ids=image_ids)
+            for (
+                (embedding, original_image_size, image_id),
+                image_prompts,
+                mask_input,
+            ) in zip(embeddings, prompts, mask_inputs):
+                if image_prompts is None:
+                    prompt_set = Sam2PromptSet()
+                elif type(image_prompts) is dict:
+                    prompt_set = Sam2PromptSet(**image_prompts)
+                else:
+                    prompt_set = image_prompts
+                if mask_input is None and load_logits_from_cache:
+                    mask_input = maybe_load_low_res_logits_from_cache(
+                        image_id, prompt_set, self.low_res_logits_cache
+                    )
+                masks, scores, low_resolution_logits = self._decode_prompt_set(
+                    embedding=embedding,
+                    original_image_size=original_image_size,
+                    prompt_set=prompt_set,
+                    mask_input=mask_input,
+                    multimask_output=multimask_output,
+                )
+                if save_logits_to_cache:
+                    self.add_low_res_logits_to_cache(
+                        low_resolution_logits, image_id, prompt_set
+                    )
+                results.append((masks, scores, low_resolution_logits))
+        return results
+
+    def embed_images(
+        self,
+        images: List[Optional[InferenceRequestImage]],
+        image_ids: Optional[List[Optional[str]]] = None,
+    ) -> List[Tuple[Dict[str, Any], Tuple[int, int], str]]:
+        """Embeds batch of images (see `embed_image(...)`) - images missing in cache are embedded
+        together, in batches of SAM2_MAX_BATCH_SIZE. Images being embedded by concurrent
+        requests are awaited instead of embedded again."""
+        image_ids = image_ids or [None] * len(images)
+        if len(images) == 1:
+            return [self.embed_image(image=images[0], image_id=image_ids[0])]
+        # images with ids are preprocessed only when missing in cache
+        keys, images_by_key, preprocessed = [], {}, {}
+        for image, image_id in zip(images, image_ids):
+            if not image_id:
+                img_in = self.preproc_image(image)
+                image_id = hashlib.md5(img_in.tobytes()).hexdigest()[:12]
+                preprocessed.setdefault(image_id, img_in)
+            images_by_key.setdefault(image_id, image)
+            keys.append(image_id)
+
+        def embed_missing(
+            missing_keys: List[str],
+        ) -> List[Tuple[Dict[str, Any], Tuple[int, int]]]:
+            embedded = []
+            for batch in create_batches(
+                sequence=missing_keys, batch_size=SAM2_MAX_BATCH_SIZE
+            ):
+                embedded.extend(
+                    self._embed_images_batch(
+                        images=[
+                            (
+                                preprocessed[key]
+                                if key in preprocessed
+                                else self.preproc_image(images_by_key[key])
+                            )
+                            for key in batch
+                        ]
+                    )
+                )
+            return embedded
+
+        embeddings = self.embedding_cache.get_or_compute_many(
+            keys=keys, compute=embed_missing
+        )
+        return [
+            (embedding_dict, image_size, image_id)
+            for (embedding_dict, image_size), image_id in zip(embeddings, keys)
+        ]
+
+    def _embed_images_batch(
+        self, images: List[np.ndarray]
+    ) -> List[Tuple[Dict[str, Any], Tuple[int, int]]]:
+        if len(images) == 1:
+            return [self._embed_image(img_in=images[0])]
+        with self._predictor_lock, torch.inference_mode():
+            self.predictor.set_image_batch(images)
+            features = self.predictor._features
+        # features of each image are cloned - not to retain the whole batch in cache
+        return [
+            (
+                map_leaves(features, lambda tensor: tensor[i : i + 1].clone()),
+                img_in.shape[:2],
             )
+            for i, img_in in enumerate(images)
+        ]
 
+    def _decode_prompt_set(
+        self,
+        embedding: Dict[str, Any],
+        original_image_size: Tuple[int, int],
+        prompt_set: Sam2PromptSet,
+        mask_input: Optional[Union[np.ndarray, List[List[List[float]]]]],
+        multimask_output: bool,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        prompts = prompt_set.prompts or []
+        if len(prompts) <= SAM2_MAX_PROMPTS_BATCH_SIZE:
+            return self._decode(
+                embedding=embedding,
+                original_image_size=original_image_size,
+                args=prompt_set.to_sam2_inputs(),
+                mask_input=mask_input,
+                multimask_output=multimask_output,
+            )
+        if mask_input is not None:
+            mask_input = np.asarray(mask_input)
+        results = []
+        for start in range(0, len(prompts), SAM2_MAX_PROMPTS_BATCH_SIZE):
+            end = start + SAM2_MAX_PROMPTS_BATCH_SIZE
+            results.append(
+                self._decode(
+                    embedding=embedding,
+                    original_image_size=original_image_size,
+                    args=Sam2PromptSet(prompts=prompts[start:end]).to_sam2_inputs(),
+                    mask_input=(
+                        mask_input[start:end] if mask_input is not None else None
+                    ),
+                    multimask_output=multimask_output,
+                )
+            )
+        masks, scores, low_resolution_logits = zip(*results)
+        return (
+            np.concatenate(masks, axis=0),
+            np.concatenate(scores, axis=0),
+            np.concatenate(low_resolution_logits, axis=0),
+        )
+
+    def _decode(
+        self,
+        embedding: Dict[str, Any],
+        original_image_size: Tuple[int, int],
+        args: Dict[str, Any],
+        mask_input: Optional[Union[np.ndarray, List[List[List[float]]]]],
+        multimask_output: bool,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        args = pad_points(args)
+        if not any(args.values()):
+            args = {"point_coords": [[0, 0]], "point_labels": [-1], "box": None}
+        with self._predictor_lock:
             self.predictor._is_image_set = True
             self.predictor._features = embedding
             self.predictor._orig_hw = [original_image_size]
             self.predictor._is_batch = False
-            args = dict()
-            prompt_set: Sam2PromptSet
-            if prompts:
-                if type(prompts) is dict:
-                    prompt_set = Sam2PromptSet(**prompts)
-                    args = prompt_set.to_sam2_inputs()
-                else:
-                    prompt_set = prompts
-                    args = prompts.to_sam2_inputs()
-            else:
-                prompt_set = Sam2PromptSet()
-
-            if mask_input is None and load_logits_from_cache:
-                mask_input = maybe_load_low_res_logits_from_cache(
-                    image_id, prompt_set, self.low_res_logits_cache
-                )
-
-            args = pad_points(args)
-            if not any(args.values()):
-                args = {"point_coords": [[0, 0]], "point_labels": [-1], "box": None}
             masks, scores, low_resolution_logits = self.predictor.predict(
                 mask_input=mask_input,
                 multimask_output=multimask_output,
@@ -309,34 +508,20 @@ class SegmentAnything2(RoboflowCoreModel):
                 normalize_coords=True,
                 **args,
             )
-            masks, scores, low_resolution_logits = choose_most_confident_sam_prediction(
-                masks=masks,
-                scores=scores,
-                low_resolution_logits=low_resolution_logits,
-            )
-
-            if save_logits_to_cache:
-                self.add_low_res_logits_to_cache(
-                    low_resolution_logits, image_id, prompt_set
-                )
-
-            return masks, scores, low_resolution_logits
+        return choose_most_confident_sam_prediction(
+            masks=masks,
+            scores=scores,
+            low_resolution_logits=low_resolution_logits,
+        )
 
     def add_low_res_logits_to_cache(
         self, logits: np.ndarray, image_id: str, prompt_set: Sam2PromptSet
     ) -> None:
         logits = logits[:, None, :, :]
         prompt_id = hash_prompt_set(image_id, prompt_set)
-        self.low_res_logits_cache[prompt_id] = {
-            "logits": logits,
-            "prompt_set": prompt_set,
-        }
-        if prompt_id in self.low_res_logits_cache_keys:
-            self.low_res_logits_cache_keys.remove(prompt_id)
-        self.low_res_logits_cache_keys.append(prompt_id)
-        if len(self.low_res_logits_cache_keys) > self.low_res_logits_cache_size:
-            cache_key = self.low_res_logits_cache_keys.pop(0)
-            del self.low_res_logits_cache[cache_key]
+        self.low_res_logits_cache.put(
+            key=prompt_id, value={"logits": logits, "prompt_set": prompt_set}
+        )
 
 
 def hash_prompt_set(image_id: str, prompt_set: Sam2PromptSet) -> Tuple[str, str]:
@@ -349,7 +534,7 @@ def hash_prompt_set(image_id: str, prompt_set: Sam2PromptSet) -> Tuple[str, str]
 def maybe_load_low_res_logits_from_cache(
     image_id: str,
     prompt_set: Sam2PromptSet,
-    cache: Dict[Tuple[str, str], LogitsCacheType],
+    cache: Union[TensorsCache, Dict[Tuple[str, str], LogitsCacheType]],
 ) -> Optional[np.ndarray]:
     "Loads prior masks from the cache by searching over possibel prior prompts."
     prompts = prompt_set.prompts
@@ -362,13 +547,13 @@ def maybe_load_low_res_logits_from_cache(
 def find_prior_prompt_in_cache(
     initial_prompt_set: Sam2PromptSet,
     image_id: str,
-    cache: Dict[Tuple[str, str], LogitsCacheType],
+    cache: Union[TensorsCache, Dict[Tuple[str, str], LogitsCacheType]],
 ) -> Optional[np.ndarray]:
     """
     Performs search over the cache to see if prior used prompts are subset of this one.
     """
 
-    logits_for_image = [cache[k] for k in cache if k[0] == image_id]
+    logits_for_image = [v for k, v in cache.items() if k[0] == image_id]
     maxed_size = 0
     best_match: Optional[np.ndarray] = None
     desired_size = initial_prompt_set.num_points() - 1
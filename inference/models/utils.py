@@ -1,350 +1,350 @@
-from inference.core.env import API_KEY, API_KEY_ENV_NAMES
-from inference.core.exceptions import MissingApiKeyError
-from inference.core.models.base import Model
-from inference.core.models.stubs import (
-    ClassificationModelStub,
-    InstanceSegmentationModelStub,
-    KeypointsDetectionModelStub,
-    ObjectDetectionModelStub,
+from inference.core.env import (
+    API_KEY,
+    CORE_MODEL_CLIP_ENABLED,
+    CORE_MODEL_COGVLM_ENABLED,
+    CORE_MODEL_DOCTR_ENABLED,
+    CORE_MODEL_GAZE_ENABLED,
+    CORE_MODEL_GROUNDINGDINO_ENABLED,
+    CORE_MODEL_SAM2_ENABLED,
+    CORE_MODEL_SAM_ENABLED,
+    CORE_MODEL_YOLO_WORLD_ENABLED,
+    CORE_MODELS_ENABLED,
 )
+from inference.core.models.base import Model
+from inference.core.registries.lazy import LazyModelTypes
 from inference.core.registries.roboflow import get_model_type
-from inference.core.utils.function import deprecated
-from inference.models import (
-    YOLACT,
-    VitClassification,
-    YOLONASObjectDetection,
-    YOLOv5InstanceSegmentation,
-    YOLOv5ObjectDetection,
-    YOLOv7InstanceSegmentation,
-    YOLOv8Classification,
-    YOLOv8InstanceSegmentation,
-    YOLOv8ObjectDetection,
-    YOLOv9ObjectDetection,
-    YOLOv10ObjectDetection,
-    YOLOv11InstanceSegmentation,
-    YOLOv11ObjectDetection,
+
+# Model classes are referenced by import paths - model family is imported only once its
+# model type is requested for the first time (see `LazyModelTypes`).
+CLASSIFICATION_STUB = "inference.core.models.stubs:ClassificationModelStub"
+OBJECT_DETECTION_STUB = "inference.core.models.stubs:ObjectDetectionModelStub"
+INSTANCE_SEGMENTATION_STUB = "inference.core.models.stubs:InstanceSegmentationModelStub"
+KEYPOINTS_DETECTION_STUB = "inference.core.models.stubs:KeypointsDetectionModelStub"
+VIT_CLASSIFICATION = "inference.models.vit.vit_classification:VitClassification"
+YOLACT_INSTANCE_SEGMENTATION = (
+    "inference.models.yolact.yolact_instance_segmentation:YOLACT"
 )
-from inference.models.yolov8.yolov8_keypoints_detection import YOLOv8KeypointsDetection
-from inference.models.yolov11.yolov11_keypoints_detection import (
-    YOLOv11KeypointsDetection,
+YOLONAS_OBJECT_DETECTION = (
+    "inference.models.yolonas.yolonas_object_detection:YOLONASObjectDetection"
 )
+YOLOV5_OBJECT_DETECTION = (
+    "inference.models.yolov5.yolov5_object_detection:YOLOv5ObjectDetection"
+)
+YOLOV5_INSTANCE_SEGMENTATION = (
+    "inference.models.yolov5.yolov5_instance_segmentation:YOLOv5InstanceSegmentation"
+)
+YOLOV7_INSTANCE_SEGMENTATION = (
+    "inference.models.yolov7.yolov7_instance_segmentation:YOLOv7InstanceSegmentation"
+)
+YOLOV8_CLASSIFICATION = (
+    "inference.models.yolov8.yolov8_classification:YOLOv8Classification"
+)
+YOLOV8_OBJECT_DETECTION = (
+    "inference.models.yolov8.yolov8_object_detection:YOLOv8ObjectDetection"
+)
+YOLOV8_INSTANCE_SEGMENTATION = (
+    "inference.models.yolov8.yolov8_instance_segmentation:YOLOv8InstanceSegmentation"
+)
+YOLOV8_KEYPOINTS_DETECTION = (
+    "inference.models.yolov8.yolov8_keypoints_detection:YOLOv8KeypointsDetection"
+)
+YOLOV9_OBJECT_DETECTION = (
+    "inference.models.yolov9.yolov9_object_detection:YOLOv9ObjectDetection"
+)
+YOLOV10_OBJECT_DETECTION = (
+    "inference.models.yolov10.yolov10_object_detection:YOLOv10ObjectDetection"
+)
+YOLOV11_OBJECT_DETECTION = (
+    "inference.models.yolov11.yolov11_object_detection:YOLOv11ObjectDetection"
+)
+YOLOV11_INSTANCE_SEGMENTATION = (
+    "inference.models.yolov11.yolov11_instance_segmentation:YOLOv11InstanceSegmentation"
+)
+YOLOV11_KEYPOINTS_DETECTION = (
+    "inference.models.yolov11.yolov11_keypoints_detection:YOLOv11KeypointsDetection"
+)
+PALIGEMMA = "inference.models.paligemma.paligemma:PaliGemma"
+LORA_PALIGEMMA = "inference.models.paligemma.paligemma:LoRAPaliGemma"
+FLORENCE2 = "inference.models.florence2.florence2:Florence2"
+LORA_FLORENCE2 = "inference.models.florence2.florence2:LoRAFlorence2"
 
-ROBOFLOW_MODEL_TYPES = {
-    ("classification", "stub"): ClassificationModelStub,
-    ("classification", "vit"): VitClassification,
-    ("classification", "yolov8"): YOLOv8Classification,
-    ("classification", "yolov8n"): YOLOv8Classification,
-    ("classification", "yolov8s"): YOLOv8Classification,
-    ("classification", "yolov8m"): YOLOv8Classification,
-    ("classification", "yolov8l"): YOLOv8Classification,
-    ("classification", "yolov8x"): YOLOv8Classification,
-    ("object-detection", "stub"): ObjectDetectionModelStub,
-    ("object-detection", "yolov5"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov5v2s"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov5v6n"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov5v6s"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov5v6m"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov5v6l"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov5v6x"): YOLOv5ObjectDetection,
-    ("object-detection", "yolov9"): YOLOv9ObjectDetection,
-    ("object-detection", "yolov8"): YOLOv8ObjectDetection,
-    ("object-detection", "yolov8s"): YOLOv8ObjectDetection,
-    ("object-detection", "yolov8n"): YOLOv8ObjectDetection,
-    ("object-detection", "yolov8s"): YOLOv8ObjectDetection,
-    ("object-detection", "yolov8m"): YOLOv8ObjectDetection,
-    ("object-detection", "yolov8l"): YOLOv8ObjectDetection,
-    ("object-detection", "yolov8x"): YOLOv8ObjectDetection,
-    ("object-detection", "yolo_nas_s"): YOLONASObjectDetection,
-    ("object-detection", "yolo_nas_m"): YOLONASObjectDetection,
-    ("object-detection", "yolo_nas_l"): YOLONASObjectDetection,
-    ("object-detection", "yolov10"): YOLOv10ObjectDetection,
-    ("object-detection", "yolov10s"): YOLOv10ObjectDetection,
-    ("object-detection", "yolov10n"): YOLOv10ObjectDetection,
-    ("object-detection", "yolov10b"): YOLOv10ObjectDetection,
-    ("object-detection", "yolov10m"): YOLOv10ObjectDetection,
-    ("object-detection", "yolov10l"): YOLOv10ObjectDetection,
-    ("object-detection", "yolov10x"): YOLOv10ObjectDetection,
-    ("object-detection", "yolov11"): YOLOv11ObjectDetection,
-    ("object-detection", "yolov11s"): YOLOv11ObjectDetection,
-    ("object-detection", "yolov11n"): YOLOv11ObjectDetection,
-    ("object-detection", "yolov11b"): YOLOv11ObjectDetection,
-    ("object-detection", "yolov11m"): YOLOv11ObjectDetection,
-    ("object-detection", "yolov11l"): YOLOv11ObjectDetection,
-    ("object-detection", "yolov11x"): YOLOv11ObjectDetection,
-    (
-        "instance-segmentation",
-        "yolov11n",
-    ): YOLOv11InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov11s",
-    ): YOLOv11InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov11m",
-    ): YOLOv11InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov11l",
-    ): YOLOv11InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov11x",
-    ): YOLOv11InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov11n-seg",
-    ): YOLOv11InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov11s-seg",
-    ): YOLOv11InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov11m-seg",
-    ): YOLOv11InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov11l-seg",
-    ): YOLOv11InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov11x-seg",
-    ): YOLOv11InstanceSegmentation,
-    ("keypoint-detection", "yolov11n"): YOLOv11KeypointsDetection,
-    ("keypoint-detection", "yolov11s"): YOLOv11KeypointsDetection,
-    ("keypoint-detection", "yolov11m"): YOLOv11KeypointsDetection,
-    ("keypoint-detection", "yolov11l"): YOLOv11KeypointsDetection,
-    ("keypoint-detection", "yolov11x"): YOLOv11KeypointsDetection,
-    ("keypoint-detection", "yolov11n-pose"): YOLOv11KeypointsDetection,
-    ("keypoint-detection", "yolov11s-pose"): YOLOv11KeypointsDetection,
-    ("keypoint-detection", "yolov11m-pose"): YOLOv11KeypointsDetection,
-    ("keypoint-detection", "yolov11l-pose"): YOLOv11KeypointsDetection,
-    ("keypoint-detection", "yolov11x-pose"): YOLOv11KeypointsDetection,
-    ("instance-segmentation", "stub"): InstanceSegmentationModelStub,
-    (
-        "instance-segmentation",
-        "yolov5-seg",
-    ): YOLOv5InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov5n-seg",
-    ): YOLOv5InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov5s-seg",
-    ): YOLOv5InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov5m-seg",
-    ): YOLOv5InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov5l-seg",
-    ): YOLOv5InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov5x-seg",
-    ): YOLOv5InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolact",
-    ): YOLACT,
-    (
-        "instance-segmentation",
-        "yolov7-seg",
-    ): YOLOv7InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8n",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8s",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8m",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8l",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8x",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8n-seg",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8s-seg",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8m-seg",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8l-seg",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8x-seg",
-    ): YOLOv8InstanceSegmentation,
-    (
-        "instance-segmentation",
-        "yolov8-seg",
-    ): YOLOv8InstanceSegmentation,
-    ("keypoint-detection", "stub"): KeypointsDetectionModelStub,
-    ("keypoint-detection", "yolov8"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8n"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8s"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8m"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8l"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8x"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8n-pose"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8s-pose"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8m-pose"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8l-pose"): YOLOv8KeypointsDetection,
-    ("keypoint-detection", "yolov8x-pose"): YOLOv8KeypointsDetection,
-}
-
-try:
-    from inference.models import LoRAPaliGemma, PaliGemma
+ROBOFLOW_MODEL_TYPES = LazyModelTypes(
+    {
+        ("classification", "stub"): CLASSIFICATION_STUB,
+        ("classification", "vit"): VIT_CLASSIFICATION,
+        ("classification", "yolov8"): YOLOV8_CLASSIFICATION,
+        ("classification", "yolov8n"): YOLOV8_CLASSIFICATION,
+        ("classification", "yolov8s"): YOLOV8_CLASSIFICATION,
+        ("classification", "yolov8m"): YOLOV8_CLASSIFICATION,
+        ("classification", "yolov8l"): YOLOV8_CLASSIFICATION,
+        ("classification", "yolov8x"): YOLOV8_CLASSIFICATION,
+        ("object-detection", "stub"): OBJECT_DETECTION_STUB,
+        ("object-detection", "yolov5"): YOLOV5_OBJECT_DETECTION,
+        ("object-detection", "yolov5v2s"): YOLOV5_OBJECT_DETECTION,
+        ("object-detection", "yolov5v6n"): YOLOV5_OBJECT_DETECTION,
+        ("object-detection", "yolov5v6s"): YOLOV5_OBJECT_DETECTION,
+        ("object-detection", "yolov5v6m"): YOLOV5_OBJECT_DETECTION,
+        ("object-detection", "yolov5v6l"): YOLOV5_OBJECT_DETECTION,
+        ("object-detection", "yolov5v6x"): YOLOV5_OBJECT_DETECTION,
+        ("object-detection", "yolov9"): YOLOV9_OBJECT_DETECTION,
+        ("object-detection", "yolov8"): YOLOV8_OBJECT_DETECTION,
+        ("object-detection", "yolov8s"): YOLOV8_OBJECT_DETECTION,
+        ("object-detection", "yolov8n"): YOLOV8_OBJECT_DETECTION,
+        ("object-detection", "yolov8s"): YOLOV8_OBJECT_DETECTION,
+        ("object-detection", "yolov8m"): YOLOV8_OBJECT_DETECTION,
+        ("object-detection", "yolov8l"): YOLOV8_OBJECT_DETECTION,
+        ("object-detection", "yolov8x"): YOLOV8_OBJECT_DETECTION,
+        ("object-detection", "yolo_nas_s"): YOLONAS_OBJECT_DETECTION,
+        ("object-detection", "yolo_nas_m"): YOLONAS_OBJECT_DETECTION,
+        ("object-detection", "yolo_nas_l"): YOLONAS_OBJECT_DETECTION,
+        ("object-detection", "yolov10"): YOLOV10_OBJECT_DETECTION,
+        ("object-detection", "yolov10s"): YOLOV10_OBJECT_DETECTION,
+        ("object-detection", "yolov10n"): YOLOV10_OBJECT_DETECTION,
+        ("object-detection", "yolov10b"): YOLOV10_OBJECT_DETECTION,
+        ("object-detection", "yolov10m"): YOLOV10_OBJECT_DETECTION,
+        ("object-detection", "yolov10l"): YOLOV10_OBJECT_DETECTION,
+        ("object-detection", "yolov10x"): YOLOV10_OBJECT_DETECTION,
+        ("object-detection", "yolov11"): YOLOV11_OBJECT_DETECTION,
+        ("object-detection", "yolov11s"): YOLOV11_OBJECT_DETECTION,
+        ("object-detection", "yolov11n"): YOLOV11_OBJECT_DETECTION,
+        ("object-detection", "yolov11b"): YOLOV11_OBJECT_DETECTION,
+        ("object-detection", "yolov11m"): YOLOV11_OBJECT_DETECTION,
+        ("object-detection", "yolov11l"): YOLOV11_OBJECT_DETECTION,
+        ("object-detection", "yolov11x"): YOLOV11_OBJECT_DETECTION,
+        (
+            "instance-segmentation",
+            "yolov11n",
+        ): YOLOV11_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov11s",
+        ): YOLOV11_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov11m",
+        ): YOLOV11_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov11l",
+        ): YOLOV11_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov11x",
+        ): YOLOV11_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov11n-seg",
+        ): YOLOV11_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov11s-seg",
+        ): YOLOV11_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov11m-seg",
+        ): YOLOV11_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov11l-seg",
+        ): YOLOV11_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov11x-seg",
+        ): YOLOV11_INSTANCE_SEGMENTATION,
+        ("keypoint-detection", "yolov11n"): YOLOV11_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov11s"): YOLOV11_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov11m"): YOLOV11_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov11l"): YOLOV11_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov11x"): YOLOV11_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov11n-pose"): YOLOV11_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov11s-pose"): YOLOV11_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov11m-pose"): YOLOV11_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov11l-pose"): YOLOV11_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov11x-pose"): YOLOV11_KEYPOINTS_DETECTION,
+        ("instance-segmentation", "stub"): INSTANCE_SEGMENTATION_STUB,
+        (
+            "instance-segmentation",
+            "yolov5-seg",
+        ): YOLOV5_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov5n-seg",
+        ): YOLOV5_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov5s-seg",
+        ): YOLOV5_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov5m-seg",
+        ): YOLOV5_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov5l-seg",
+        ): YOLOV5_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov5x-seg",
+        ): YOLOV5_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolact",
+        ): YOLACT_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov7-seg",
+        ): YOLOV7_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov8n",
+        ): YOLOV8_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov8",
+        ): YOLOV8_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov8s",
+        ): YOLOV8_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov8m",
+        ): YOLOV8_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov8l",
+        ): YOLOV8_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov8x",
+        ): YOLOV8_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov8n-seg",
+        ): YOLOV8_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov8s-seg",
+        ): YOLOV8_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov8m-seg",
+        ): YOLOV8_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov8l-seg",
+        ): YOLOV8_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov8x-seg",
+        ): YOLOV8_INSTANCE_SEGMENTATION,
+        (
+            "instance-segmentation",
+            "yolov8-seg",
+        ): YOLOV8_INSTANCE_SEGMENTATION,
+        ("keypoint-detection", "stub"): KEYPOINTS_DETECTION_STUB,
+        ("keypoint-detection", "yolov8"): YOLOV8_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov8n"): YOLOV8_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov8s"): YOLOV8_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov8m"): YOLOV8_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov8l"): YOLOV8_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov8x"): YOLOV8_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov8n-pose"): YOLOV8_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov8s-pose"): YOLOV8_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov8m-pose"): YOLOV8_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov8l-pose"): YOLOV8_KEYPOINTS_DETECTION,
+        ("keypoint-detection", "yolov8x-pose"): YOLOV8_KEYPOINTS_DETECTION,
+    }
+)
 
-    paligemma_models = {
+ROBOFLOW_MODEL_TYPES.update(
+    {
         (
             "object-detection",
             "paligemma-3b-pt-224",
-        ): PaliGemma,  # TODO: change when we have a new project type
-        ("object-detection", "paligemma-3b-pt-448"): PaliGemma,
-        ("object-detection", "paligemma-3b-pt-896"): PaliGemma,
+        ): PALIGEMMA,  # TODO: change when we have a new project type
+        ("object-detection", "paligemma-3b-pt-448"): PALIGEMMA,
+        ("object-detection", "paligemma-3b-pt-896"): PALIGEMMA,
         (
             "instance-segmentation",
             "paligemma-3b-pt-224",
-        ): PaliGemma,  # TODO: change when we have a new project type
-        ("instance-segmentation", "paligemma-3b-pt-448"): PaliGemma,
-        ("instance-segmentation", "paligemma-3b-pt-896"): PaliGemma,
+        ): PALIGEMMA,  # TODO: change when we have a new project type
+        ("instance-segmentation", "paligemma-3b-pt-448"): PALIGEMMA,
+        ("instance-segmentation", "paligemma-3b-pt-896"): PALIGEMMA,
         (
             "object-detection",
             "paligemma-3b-pt-224-peft",
-        ): LoRAPaliGemma,  # TODO: change when we have a new project type
-        ("object-detection", "paligemma-3b-pt-448-peft"): LoRAPaliGemma,
-        ("object-detection", "paligemma-3b-pt-896-peft"): LoRAPaliGemma,
+        ): LORA_PALIGEMMA,  # TODO: change when we have a new project type
+        ("object-detection", "paligemma-3b-pt-448-peft"): LORA_PALIGEMMA,
+        ("object-detection", "paligemma-3b-pt-896-peft"): LORA_PALIGEMMA,
         (
             "instance-segmentation",
             "paligemma-3b-pt-224-peft",
-        ): LoRAPaliGemma,  # TODO: change when we have a new project type
-        ("instance-segmentation", "paligemma-3b-pt-448-peft"): LoRAPaliGemma,
-        ("instance-segmentation", "paligemma-3b-pt-896-peft"): LoRAPaliGemma,
+        ): LORA_PALIGEMMA,  # TODO: change when we have a new project type
+        ("instance-segmentation", "paligemma-3b-pt-448-peft"): LORA_PALIGEMMA,
+        ("instance-segmentation", "paligemma-3b-pt-896-peft"): LORA_PALIGEMMA,
     }
-    ROBOFLOW_MODEL_TYPES.update(paligemma_models)
-except:
-    pass
-
-try:
-    from inference.models import Florence2, LoRAFlorence2
-
-    florence2_models = {
+)
+ROBOFLOW_MODEL_TYPES.update(
+    {
         (
             "object-detection",
             "florence-2-base",
-        ): Florence2,  # TODO: change when we have a new project type
-        ("object-detection", "florence-2-large"): Florence2,
+        ): FLORENCE2,  # TODO: change when we have a new project type
+        ("object-detection", "florence-2-large"): FLORENCE2,
         (
             "instance-segmentation",
             "florence-2-base",
-        ): Florence2,  # TODO: change when we have a new project type
-        ("instance-segmentation", "florence-2-large"): Florence2,
+        ): FLORENCE2,  # TODO: change when we have a new project type
+        ("instance-segmentation", "florence-2-large"): FLORENCE2,
         (
             "object-detection",
             "florence-2-base-peft",
-        ): LoRAFlorence2,  # TODO: change when we have a new project type
-        ("object-detection", "florence-2-large-peft"): LoRAFlorence2,
+        ): LORA_FLORENCE2,  # TODO: change when we have a new project type
+        ("object-detection", "florence-2-large-peft"): LORA_FLORENCE2,
         (
             "instance-segmentation",
             "florence-2-base-peft",
-        ): LoRAFlorence2,  # TODO: change when we have a new project type
-        ("instance-segmentation", "florence-2-large-peft"): LoRAFlorence2,
+        ): LORA_FLORENCE2,  # TODO: change when we have a new project type
+        ("instance-segmentation", "florence-2-large-peft"): LORA_FLORENCE2,
     }
-    ROBOFLOW_MODEL_TYPES.update(florence2_models)
-except:
-    pass
-try:
-    from inference.models import SegmentAnything
-
-    ROBOFLOW_MODEL_TYPES[("embed", "sam")] = SegmentAnything
-except:
-    pass
-try:
-    from inference.models import SegmentAnything2
-
-    ROBOFLOW_MODEL_TYPES[("embed", "sam2")] = SegmentAnything2
-except:
-    pass
-
-try:
-    from inference.models import Clip
-
-    ROBOFLOW_MODEL_TYPES[("embed", "clip")] = Clip
-except:
-    pass
-
-try:
-    from inference.models.owlv2.owlv2 import OwlV2
-
-    ROBOFLOW_MODEL_TYPES[("object-detection", "owlv2")] = OwlV2
-except:
-    pass
-
-try:
-    from inference.models import Gaze
-
-    ROBOFLOW_MODEL_TYPES[("gaze", "l2cs")] = Gaze
-except:
-    pass
-
-try:
-    from inference.models import DocTR
-
-    ROBOFLOW_MODEL_TYPES[("ocr", "doctr")] = DocTR
-except:
-    pass
-
-try:
-    from inference.models import TrOCR
-
-    ROBOFLOW_MODEL_TYPES[("ocr", "trocr")] = TrOCR
-except:
-    pass
-
-try:
-    from inference.models import GroundingDINO
-
-    ROBOFLOW_MODEL_TYPES[("object-detection", "grounding-dino")] = GroundingDINO
-except:
-    pass
-
-try:
-    from inference.models import CogVLM
-
-    ROBOFLOW_MODEL_TYPES[("llm", "cogvlm")] = CogVLM
-except:
-    pass
-
-try:
-    from inference.models import YOLOWorld
+)
+ROBOFLOW_MODEL_TYPES[("object-detection", "owlv2")] = (
+    "inference.models.owlv2.owlv2:OwlV2"
+)
+ROBOFLOW_MODEL_TYPES[("ocr", "trocr")] = "inference.models.trocr.trocr:TrOCR"
 
-    ROBOFLOW_MODEL_TYPES[("object-detection", "yolo-world")] = YOLOWorld
-except:
-    pass
+if CORE_MODELS_ENABLED:
+    if CORE_MODEL_SAM_ENABLED:
+        ROBOFLOW_MODEL_TYPES[("embed", "sam")] = (
+            "inference.models.sam.segment_anything:SegmentAnything"
+        )
+    if CORE_MODEL_SAM2_ENABLED:
+        ROBOFLOW_MODEL_TYPES[("embed", "sam2")] = (
+            "inference.models.sam2.segment_anything2:SegmentAnything2"
+        )
+    if CORE_MODEL_CLIP_ENABLED:
+        ROBOFLOW_MODEL_TYPES[("embed", "clip")] = (
+            "inference.models.clip.clip_model:Clip"
+        )
+    if CORE_MODEL_GAZE_ENABLED:
+        ROBOFLOW_MODEL_TYPES[("gaze", "l2cs")] = "inference.models.gaze.gaze:Gaze"
+    if CORE_MODEL_DOCTR_ENABLED:
+        ROBOFLOW_MODEL_TYPES[("ocr", "doctr")] = (
+            "inference.models.doctr.doctr_model:DocTR"
+        )
+    if CORE_MODEL_GROUNDINGDINO_ENABLED:
+        ROBOFLOW_MODEL_TYPES[("object-detection", "grounding-dino")] = (
+            "inference.models.grounding_dino.grounding_dino:GroundingDINO"
+        )
+    if CORE_MODEL_COGVLM_ENABLED:
+        ROBOFLOW_MODEL_TYPES[("llm", "cogvlm")] = (
+            "inference.models.cogvlm.cogvlm:CogVLM"
+        )
+    if CORE_MODEL_YOLO_WORLD_ENABLED:
+        ROBOFLOW_MODEL_TYPES[("object-detection", "yolo-world")] = (
+            "inference.models.yolo_world.yolo_world:YOLOWorld"
+        )
 
 
 def get_model(model_id, api_key=API_KEY, **kwargs) -> Model:
@@ -5,10 +5,12 @@ import typer
 from typing_extensions import Annotated
 
 from inference_cli.lib.benchmark.dataset import PREDEFINED_DATASETS
+from inference_cli.lib.benchmark.load_profiles import LoadProfile
 from inference_cli.lib.benchmark_adapter import (
     run_infer_api_speed_benchmark,
     run_python_package_speed_benchmark,
     run_workflow_api_speed_benchmark,
+    run_workflow_python_package_speed_benchmark,
 )
 
 benchmark_app = typer.Typer(help="Commands for running inference benchmarks.")
@@ -136,6 +138,31 @@ def api_speed(
             help="Boolean flag to decide on auto `yes` answer given on user input required.",
         ),
     ] = False,
+    load_profile: Annotated[
+        LoadProfile,
+        typer.Option(
+            "--load-profile",
+            "-lp",
+            help="Load profile: `closed-loop` (clients / rps options), `open-loop` (Poisson arrivals "
+            "at `--rps`, regardless of responses) or `concurrency-sweep` (closed-loop phases with "
+            "concurrency doubled up to `--max-concurrency`, to find the knee of throughput / latency curve)",
+        ),
+    ] = LoadProfile.CLOSED_LOOP,
+    max_concurrency: Annotated[
+        int,
+        typer.Option(
+            "--max-concurrency",
+            help="Maximum concurrency of `concurrency-sweep` load profile",
+        ),
+    ] = 32,
+    max_in_flight: Annotated[
+        int,
+        typer.Option(
+            "--max-in-flight",
+            help="Limit of pending requests in `open-loop` load profile - requests above the "
+            "limit are queued (and the queueing is reflected in response time)",
+        ),
+    ] = 256,
 ):
     if "roboflow.com" in host and not proceed_automatically:
         proceed = input(
@@ -158,6 +185,9 @@ def api_speed(
                 model_configuration=model_configuration,
                 output_location=output_location,
                 enforce_legacy_endpoints=enforce_legacy_endpoints,
+                load_profile=load_profile,
+                max_concurrency=max_concurrency,
+                max_in_flight=max_in_flight,
             )
         else:
             if workflow_specification:
@@ -179,6 +209,9 @@ def api_speed(
                 api_key=api_key,
                 model_configuration=model_configuration,
                 output_location=output_location,
+                load_profile=load_profile,
+                max_concurrency=max_concurrency,
+                max_in_flight=max_in_flight,
             )
     except Exception as error:
         typer.echo(f"Command failed. Cause: {error}")
@@ -188,13 +221,13 @@ def api_speed(
 @benchmark_app.command()
 def python_package_speed(
     model_id: Annotated[
-        str,
+        Optional[str],
         typer.Option(
             "--model_id",
             "-m",
             help="Model ID in format project/version.",
         ),
-    ],
+    ] = None,
     dataset_reference: Annotated[
         str,
         typer.Option(
@@ -239,8 +272,96 @@ def python_package_speed(
             help="Location where to save the result (path to file or directory)",
         ),
     ] = None,
+    workflow_specification_path: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow-specification-path",
+            "-wsp",
+            help="Path to JSON file with Workflow specification - enables benchmark of Workflow "
+            "executed in-process (instead of a single model)",
+        ),
+    ] = None,
+    workspace_name: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workspace-name",
+            "-wn",
+            help="Workspace Name (used with `--workflow-id` to benchmark Workflow from Roboflow platform).",
+        ),
+    ] = None,
+    workflow_id: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow-id",
+            "-wid",
+            help="Workflow ID (used with `--workspace-name` to benchmark Workflow from Roboflow platform).",
+        ),
+    ] = None,
+    workflow_parameters: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow-parameters",
+            "-wp",
+            help="JSON document with additional Workflow parameters",
+        ),
+    ] = None,
+    image_input_name: Annotated[
+        str,
+        typer.Option(
+            "--image-input-name",
+            help="Name of Workflow input that images should be passed into",
+        ),
+    ] = "image",
+    workflow_batch_sizes: Annotated[
+        str,
+        typer.Option(
+            "--workflow-batch-sizes",
+            help="Comma-separated batch sizes of Workflow benchmark",
+        ),
+    ] = "1",
+    max_concurrent_steps: Annotated[
+        str,
+        typer.Option(
+            "--max-concurrent-steps",
+            help="Comma-separated values of Execution Engine `max_concurrent_steps` to benchmark",
+        ),
+    ] = "1",
+    compare_quantization: Annotated[
+        Optional[str],
+        typer.Option(
+            "--compare-quantization",
+            "-cq",
+            help="INT8 quantization (`dynamic` or `static`) of the model served on CPU - "
+            "if given, FP32 and quantized variants of the model are benchmarked and compared",
+        ),
+    ] = None,
 ):
     try:
+        if workflow_specification_path or workflow_id:
+            run_workflow_python_package_speed_benchmark(
+                dataset_reference=dataset_reference,
+                workflow_specification_path=workflow_specification_path,
+                workspace_name=workspace_name,
+                workflow_id=workflow_id,
+                workflow_parameters=(
+                    json.loads(workflow_parameters) if workflow_parameters else None
+                ),
+                image_input_name=image_input_name,
+                warm_up_runs=warm_up_inferences,
+                benchmark_runs=benchmark_inferences,
+                batch_sizes=[int(e) for e in workflow_batch_sizes.split(",")],
+                max_concurrent_steps_values=[
+                    int(e) for e in max_concurrent_steps.split(",")
+                ],
+                api_key=api_key,
+                output_location=output_location,
+            )
+            return None
+        if model_id is None:
+            raise ValueError(
+                "Either model ID or Workflow (`--workflow-specification-path` or "
+                "`--workspace-name` and `--workflow-id`) must be given."
+            )
         run_python_package_speed_benchmark(
             model_id=model_id,
             dataset_reference=dataset_reference,
@@ -250,6 +371,7 @@ def python_package_speed(
             api_key=api_key,
             model_configuration=model_configuration,
             output_location=output_location,
+            compare_quantization=compare_quantization,
         )
     except KeyboardInterrupt:
         print("Benchmark interrupted.")
@@ -0,0 +1,348 @@
+import random
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from threading import Lock, Thread
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import requests
+
+from inference_cli.lib.benchmark.results_gathering import (
+    LatencyHistogram,
+    LoadProfileStatistics,
+    PhaseStatistics,
+)
+from inference_sdk import InferenceHTTPClient
+
+
+class LoadProfile(str, Enum):
+    CLOSED_LOOP = "closed-loop"
+    OPEN_LOOP = "open-loop"
+    CONCURRENCY_SWEEP = "concurrency-sweep"
+
+
+class PhaseResultsRecorder:
+    """
+    Thread-safe recorder of requests made in single phase of benchmark. Service time is
+    measured from the moment when request was actually sent, response time - from the moment
+    when it should be sent according to load profile (which exposes queueing on the client
+    side, hidden by coordinated omission otherwise).
+    """
+
+    def __init__(self, expected_interval: Optional[float] = None):
+        self._expected_interval = expected_interval
+        self.service_time = LatencyHistogram()
+        self.response_time = LatencyHistogram()
+        self._errors: Dict[str, int] = defaultdict(int)
+        self._lock = Lock()
+
+    def register_request(
+        self, intended_start: float, start: float, end: float, error: Optional[str]
+    ) -> None:
+        self.service_time.record(latency=end - start)
+        self.response_time.record(
+            latency=end - intended_start, expected_interval=self._expected_interval
+        )
+        if error is not None:
+            with self._lock:
+                self._errors[error] += 1
+
+    def summarise(
+        self,
+        phase: str,
+        duration: float,
+        request_batch_size: int,
+        concurrency: Optional[int] = None,
+        target_requests_per_second: Optional[float] = None,
+    ) -> PhaseStatistics:
+        requests_made = self.service_time.total_count
+        with self._lock:
+            error_status_codes = dict(self._errors)
+        return PhaseStatistics(
+            phase=phase,
+            concurrency=concurrency,
+            target_requests_per_second=target_requests_per_second,
+            requests_made=requests_made,
+            images_processed=requests_made * request_batch_size,
+            errors=sum(error_status_codes.values()),
+            error_status_codes=error_status_codes,
+            duration_s=round(duration, 3),
+            requests_per_second=requests_made / duration if duration > 0 else 0.0,
+            images_per_second=(
+                requests_made * request_batch_size / duration if duration > 0 else 0.0
+            ),
+            service_time=self.service_time.to_dict(),
+            response_time=self.response_time.to_dict(),
+        )
+
+
+def prepare_infer_api_request(
+    client: InferenceHTTPClient,
+    images: List[np.ndarray],
+    request_batch_size: int,
+) -> Callable[[], None]:
+    while len(images) < request_batch_size:
+        images = images + images
+
+    def send_request() -> None:
+        _ = client.infer(random.sample(images, request_batch_size))
+
+    return send_request
+
+
+def prepare_workflow_api_request(
+    client: InferenceHTTPClient,
+    images: List[np.ndarray],
+    request_batch_size: int,
+    workspace_name: Optional[str],
+    workflow_id: Optional[str],
+    workflow_specification: Optional[dict],
+    workflow_parameters: Optional[dict],
+) -> Callable[[], None]:
+    while len(images) < request_batch_size:
+        images = images + images
+    kwargs = {}
+    if workflow_parameters:
+        kwargs["parameters"] = workflow_parameters
+    if workspace_name and workflow_id:
+        kwargs["workspace_name"] = workspace_name
+        kwargs["workflow_id"] = workflow_id
+    else:
+        kwargs["specification"] = workflow_specification
+
+    def send_request() -> None:
+        _ = client.run_workflow(
+            images={"image": random.sample(images, request_batch_size)}, **kwargs
+        )
+
+    return send_request
+
+
+def execute_timed_request(
+    request_function: Callable[[], None],
+    recorder: Optional[PhaseResultsRecorder],
+    intended_start: Optional[float] = None,
+) -> None:
+    start = time.monotonic()
+    if intended_start is None:
+        intended_start = start
+    error = None
+    try:
+        request_function()
+    except Exception as exc:
+        error = exc.__class__.__name__
+        if isinstance(exc, requests.exceptions.HTTPError):
+            error = str(exc.response.status_code)
+    end = time.monotonic()
+    if recorder is not None:
+        recorder.register_request(
+            intended_start=intended_start, start=start, end=end, error=error
+        )
+
+
+def run_open_loop_phase(
+    request_function: Callable[[], None],
+    requests_per_second: float,
+    requests_number: int,
+    max_in_flight: int,
+    recorder: Optional[PhaseResultsRecorder],
+    seed: Optional[int] = None,
+) -> float:
+    """
+    Sends `requests_number` requests with Poisson arrivals at `requests_per_second` rate -
+    regardless of how many previous requests are still in-flight (open-loop), such that slow
+    responses do not slow down the load. When `max_in_flight` requests are pending, next ones
+    wait in the queue, which is reflected in response time. Returns phase duration.
+    """
+    generator = random.Random(seed)
+    start = time.monotonic()
+    intended_start = start
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        for _ in range(requests_number):
+            intended_start += generator.expovariate(requests_per_second)
+            delay = intended_start - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(
+                execute_timed_request,
+                request_function=request_function,
+                recorder=recorder,
+                intended_start=intended_start,
+            )
+    return time.monotonic() - start
+
+
+def run_closed_loop_phase(
+    request_function: Callable[[], None],
+    concurrency: int,
+    requests_number: int,
+    recorder: Optional[PhaseResultsRecorder],
+) -> float:
+    """
+    Runs `concurrency` clients, each sending next request once previous one is completed,
+    until `requests_number` requests are made. Returns phase duration.
+    """
+    remaining_requests = [requests_number]
+    lock = Lock()
+
+    def run_client() -> None:
+        while True:
+            with lock:
+                if remaining_requests[0] <= 0:
+                    return None
+                remaining_requests[0] -= 1
+            execute_timed_request(request_function=request_function, recorder=recorder)
+
+    start = time.monotonic()
+    clients = [Thread(target=run_client) for _ in range(concurrency)]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    return time.monotonic() - start
+
+
+def run_open_loop_benchmark(
+    request_function: Callable[[], None],
+    requests_per_second: float,
+    warm_up_requests: int,
+    benchmark_requests: int,
+    request_batch_size: int,
+    max_in_flight: int,
+) -> LoadProfileStatistics:
+    if warm_up_requests > 0:
+        run_open_loop_phase(
+            request_function=request_function,
+            requests_per_second=requests_per_second,
+            requests_number=warm_up_requests,
+            max_in_flight=max_in_flight,
+            recorder=None,
+        )
+    recorder = PhaseResultsRecorder()
+    duration = run_open_loop_phase(
+        request_function=request_function,
+        requests_per_second=requests_per_second,
+        requests_number=benchmark_requests,
+        max_in_flight=max_in_flight,
+        recorder=recorder,
+    )
+    phase_statistics = recorder.summarise(
+        phase=f"open-loop@{requests_per_second}rps",
+        duration=duration,
+        request_batch_size=request_batch_size,
+        target_requests_per_second=requests_per_second,
+    )
+    print(phase_statistics.to_string())
+    return LoadProfileStatistics(
+        load_profile=LoadProfile.OPEN_LOOP.value,
+        phases=[phase_statistics],
+    )
+
+
+def run_concurrency_sweep_benchmark(
+    request_function: Callable[[], None],
+    max_concurrency: int,
+    warm_up_requests: int,
+    benchmark_requests: int,
+    request_batch_size: int,
+    knee_tolerance: float = 0.05,
+) -> LoadProfileStatistics:
+    """
+    Runs closed-loop phases with concurrency doubled from 1 up to `max_concurrency`, each
+    preceded by its own warm-up, and finds the knee of throughput / latency curve.
+    Response time is corrected for coordinated omission with expected interval between
+    requests of each client estimated as mean latency of the phase warm-up.
+    """
+    phases = []
+    for concurrency in get_concurrency_levels(max_concurrency=max_concurrency):
+        warm_up_recorder = PhaseResultsRecorder()
+        if warm_up_requests > 0:
+            run_closed_loop_phase(
+                request_function=request_function,
+                concurrency=concurrency,
+                requests_number=warm_up_requests,
+                recorder=warm_up_recorder,
+            )
+        expected_interval = warm_up_recorder.service_time.to_dict()["mean_ms"] / 1000
+        recorder = PhaseResultsRecorder(expected_interval=expected_interval or None)
+        duration = run_closed_loop_phase(
+            request_function=request_function,
+            concurrency=concurrency,
+            requests_number=benchmark_requests,
+            recorder=recorder,
+        )
+        phase_statistics = recorder.summarise(
+            phase=f"concurrency={concurrency}",
+            duration=duration,
+            request_batch_size=request_batch_size,
+            concurrency=concurrency,
+        )
+        print(phase_statistics.to_string())
+        phases.append(phase_statistics)
+    knee_concurrency = find_throughput_knee(phases=phases, tolerance=knee_tolerance)
+    print(f"Knee of throughput / latency curve at concurrency={knee_concurrency}")
+    return LoadProfileStatistics(
+        load_profile=LoadProfile.CONCURRENCY_SWEEP.value,
+        phases=phases,
+        knee_concurrency=knee_concurrency,
+    )
+
+
+def get_concurrency_levels(max_concurrency: int) -> List[int]:
+    levels, concurrency = [], 1
+    while concurrency < max_concurrency:
+        levels.append(concurrency)
+        concurrency *= 2
+    levels.append(max_concurrency)
+    return levels
+
+
+def find_throughput_knee(
+    phases: List[PhaseStatistics], tolerance: float = 0.05
+) -> Optional[int]:
+    """
+    Returns the lowest concurrency reaching `1 - tolerance` of the maximum observed
+    throughput - going above it only adds latency.
+    """
+    phases = [p for p in phases if p.concurrency is not None]
+    if not phases:
+        return None
+    max_throughput = max(p.requests_per_second for p in phases)
+    for phase in sorted(phases, key=lambda p: p.concurrency):
+        if phase.requests_per_second >= (1 - tolerance) * max_throughput:
+            return phase.concurrency
+    return None
+
+
+def run_load_profile_benchmark(
+    request_function: Callable[[], None],
+    load_profile: LoadProfile,
+    warm_up_requests: int,
+    benchmark_requests: int,
+    request_batch_size: int,
+    requests_per_second: Optional[float],
+    max_concurrency: int,
+    max_in_flight: int,
+) -> LoadProfileStatistics:
+    if load_profile is LoadProfile.OPEN_LOOP:
+        if requests_per_second is None:
+            raise ValueError("Open-loop load profile requires target RPS to be given.")
+        return run_open_loop_benchmark(
+            request_function=request_function,
+            requests_per_second=requests_per_second,
+            warm_up_requests=warm_up_requests,
+            benchmark_requests=benchmark_requests,
+            request_batch_size=request_batch_size,
+            max_in_flight=max_in_flight,
+        )
+    if load_profile is LoadProfile.CONCURRENCY_SWEEP:
+        return run_concurrency_sweep_benchmark(
+            request_function=request_function,
+            max_concurrency=max_concurrency,
+            warm_up_requests=warm_up_requests,
+            benchmark_requests=benchmark_requests,
+            request_batch_size=request_batch_size,
+        )
+    raise ValueError(f"Load profile {load_profile.value} is not supported.")
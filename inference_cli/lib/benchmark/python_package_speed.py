@@ -1,19 +1,36 @@
+import gc
 import random
 import subprocess
+import sys
 import time
-from typing import Any, Dict, List, Optional
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
 
 import numpy as np
 from supervision.utils.file import read_yaml_file
 from tqdm import tqdm
 
-from inference_cli.lib.benchmark.results_gathering import ResultsCollector
+from inference_cli.lib.benchmark.results_gathering import (
+    ResultsCollector,
+    WorkflowBenchmarkStatistics,
+    WorkflowConfigurationStatistics,
+)
 from inference_cli.lib.exceptions import InferencePackageMissingError
 
 try:
     from inference import get_model
     from inference.core.models.base import Model
+    from inference.core.models.utils.onnx_session import (
+        OnnxSessionConfig,
+        set_onnx_session_config,
+    )
     from inference.core.registries.roboflow import get_model_type
+    from inference.core.workflows.execution_engine.core import ExecutionEngine
+    from inference.core.workflows.execution_engine.profiling.core import (
+        BaseWorkflowsProfiler,
+    )
+    from inference.models.aliases import resolve_roboflow_model_alias
 except Exception as error:
     print(
         "You need to have `inference` package installed. Do you want the package to be installed? [YES/no]"
@@ -31,6 +48,14 @@ except Exception as error:
             f"Installation of package failed. Cause: {inner_error}"
         ) from inner_error
 
+try:
+    import resource
+except ImportError:
+    # not available on Windows - peak RSS is not reported there
+    resource = None
+
+STEP_PHASES = {"step_execution", "step_code_execution", "step_input_assembly"}
+
 
 def run_python_package_speed_benchmark(
     model_id: str,
@@ -41,7 +66,14 @@ def run_python_package_speed_benchmark(
     batch_size: int = 1,
     api_key: Optional[str] = None,
     model_configuration: Optional[str] = None,
-) -> None:
+    quantization: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Benchmarks the model loaded in-process. `quantization` (`none`, `dynamic` or `static`)
+    overrides INT8 quantization of the model served on CPU - returned is the quantization
+    the model is actually served with (as quantized model falls back to FP32 when failing
+    validation).
+    """
     inference_configuration = {}
     if model_configuration is not None:
         inference_configuration = read_yaml_file(file_path=model_configuration)
@@ -49,13 +81,26 @@ def run_python_package_speed_benchmark(
         f"Inference will be executed with the following parameters: {inference_configuration}"
     )
     model_type = get_model_type(model_id, api_key=api_key)
-    model = get_model(model_id=model_id, api_key=api_key)
+    if quantization is not None:
+        set_onnx_session_config(
+            model_id=resolve_roboflow_model_alias(model_id=model_id),
+            config=OnnxSessionConfig(quantization=quantization),
+        )
+    try:
+        model = get_model(model_id=model_id, api_key=api_key)
+    finally:
+        if quantization is not None:
+            set_onnx_session_config(
+                model_id=resolve_roboflow_model_alias(model_id=model_id), config=None
+            )
+    served_quantization = getattr(model, "quantization", None)
     model_batch_size = getattr(model, "batch_size", None)
     input_height = getattr(model, "img_size_h", None)
     input_width = getattr(model, "img_size_w", None)
     print(
         f"Model details | task_type={model_type[0]} | model_type={model_type[1]} | "
-        f"batch_size={model_batch_size} | input_height={input_height} | input_width={input_width}"
+        f"batch_size={model_batch_size} | input_height={input_height} | input_width={input_width} | "
+        f"quantization={served_quantization}"
     )
     run_model_warm_up(
         model=model,
@@ -71,6 +116,7 @@ def run_python_package_speed_benchmark(
         benchmark_inferences=benchmark_inferences,
         batch_size=batch_size,
     )
+    return served_quantization
 
 
 def run_model_warm_up(
@@ -108,3 +154,179 @@ def run_benchmark(
             )
     finally:
         results_collector.stop_benchmark()
+
+
+def run_workflow_python_package_speed_benchmark(
+    workflow_specification: dict,
+    images: List[np.ndarray],
+    warm_up_runs: int = 10,
+    benchmark_runs: int = 100,
+    batch_sizes: Optional[List[int]] = None,
+    max_concurrent_steps_values: Optional[List[int]] = None,
+    workflow_parameters: Optional[Dict[str, Any]] = None,
+    image_input_name: str = "image",
+    api_key: Optional[str] = None,
+    allocation_profile_runs: int = 10,
+) -> WorkflowBenchmarkStatistics:
+    """
+    Benchmarks Workflow executed in-process by Execution Engine, for each combination of
+    batch size and `max_concurrent_steps`. Besides latency / throughput, per-step timings
+    are aggregated from Workflows profiler traces, and memory usage is reported - peak RSS
+    of the process (which never decreases, so is reported cumulatively) as well as
+    `tracemalloc` statistics gathered in separate runs (not to disturb measured timings).
+    """
+    # importing here as it requires `inference` core library
+    from inference_cli.lib.workflows.local_execution import (
+        initialise_execution_engine,
+        initialise_model_manager,
+    )
+
+    batch_sizes = batch_sizes or [1]
+    max_concurrent_steps_values = max_concurrent_steps_values or [1]
+    model_manager = initialise_model_manager()
+    configurations = []
+    for batch_size in batch_sizes:
+        for max_concurrent_steps in max_concurrent_steps_values:
+            print(
+                f"Benchmarking Workflow | batch_size={batch_size} | "
+                f"max_concurrent_steps={max_concurrent_steps}"
+            )
+            profiler = BaseWorkflowsProfiler.init(
+                max_runs_in_buffer=warm_up_runs + benchmark_runs + 1
+            )
+            execution_engine = initialise_execution_engine(
+                workflow_specification=workflow_specification,
+                api_key=api_key,
+                model_manager=model_manager,
+                max_concurrent_steps=max_concurrent_steps,
+                profiler=profiler,
+            )
+            run_workflow = _prepare_workflow_runner(
+                execution_engine=execution_engine,
+                images=images,
+                batch_size=batch_size,
+                workflow_parameters=workflow_parameters,
+                image_input_name=image_input_name,
+            )
+            for _ in tqdm(range(warm_up_runs), desc="Warming up Workflow..."):
+                run_workflow()
+            benchmark_start_ts = round(time.monotonic() * 10**6)
+            results_collector = ResultsCollector()
+            results_collector.start_benchmark()
+            try:
+                for _ in tqdm(range(benchmark_runs), desc="Running Workflow..."):
+                    start = time.time()
+                    run_workflow()
+                    results_collector.register_inference_duration(
+                        batch_size=batch_size, duration=time.time() - start
+                    )
+            finally:
+                results_collector.stop_benchmark()
+            inference_statistics = results_collector.get_statistics()
+            print(inference_statistics.to_string())
+            configurations.append(
+                WorkflowConfigurationStatistics(
+                    batch_size=batch_size,
+                    max_concurrent_steps=max_concurrent_steps,
+                    inference_statistics=inference_statistics,
+                    step_timings=aggregate_step_timings(
+                        trace=profiler.export_trace(),
+                        since_ts=benchmark_start_ts,
+                    ),
+                    peak_rss_mb=get_peak_rss_mb(),
+                    allocations=profile_allocations(
+                        run_workflow=run_workflow,
+                        runs=allocation_profile_runs,
+                    ),
+                )
+            )
+    return WorkflowBenchmarkStatistics(configurations=configurations)
+
+
+def _prepare_workflow_runner(
+    execution_engine: ExecutionEngine,
+    images: List[np.ndarray],
+    batch_size: int,
+    workflow_parameters: Optional[Dict[str, Any]],
+    image_input_name: str,
+) -> Callable[[], None]:
+    while len(images) < batch_size:
+        images = images + images
+
+    def run_workflow() -> None:
+        runtime_parameters = dict(workflow_parameters or {})
+        runtime_parameters[image_input_name] = random.sample(images, batch_size)
+        _ = execution_engine.run(runtime_parameters=runtime_parameters)
+
+    return run_workflow
+
+
+def aggregate_step_timings(
+    trace: List[dict], since_ts: int = 0
+) -> Dict[str, Dict[str, dict]]:
+    """
+    Aggregates durations of complete events (`ph`="X") of step-related execution phases
+    recorded by Workflows profiler after `since_ts` (monotonic timestamp in microseconds) -
+    by step and phase.
+    """
+    durations = defaultdict(lambda: defaultdict(list))
+    for event in trace:
+        if event.get("ph") != "X" or event.get("ts", 0) < since_ts:
+            continue
+        if event["name"] not in STEP_PHASES:
+            continue
+        args = event.get("args", {})
+        step = args.get("step") or args.get("step_selector")
+        if step is None:
+            continue
+        durations[step][event["name"]].append(event["dur"] / 1000)
+    result = {}
+    for step, phases in durations.items():
+        result[step] = {}
+        for phase, phase_durations in phases.items():
+            result[step][phase] = {
+                "count": len(phase_durations),
+                "total_ms": round(sum(phase_durations), 3),
+                "avg_ms": round(float(np.average(phase_durations)), 3),
+                "p50_ms": round(float(np.percentile(phase_durations, 50)), 3),
+                "p99_ms": round(float(np.percentile(phase_durations, 99)), 3),
+            }
+    return result
+
+
+def get_peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # reported in bytes on macOS and in kilobytes on Linux
+        return round(max_rss / 2**20, 2)
+    return round(max_rss / 2**10, 2)
+
+
+def profile_allocations(run_workflow: Callable[[], None], runs: int) -> dict:
+    if runs <= 0:
+        return {}
+    gc.collect()
+    gc_collections_before = sum(stats["collections"] for stats in gc.get_stats())
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        for _ in range(runs):
+            run_workflow()
+        _, peak_traced_memory = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocated_blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    gc_collections = (
+        sum(stats["collections"] for stats in gc.get_stats()) - gc_collections_before
+    )
+    gc.collect()
+    return {
+        "runs": runs,
+        "peak_traced_memory_mb": round(peak_traced_memory / 2**20, 3),
+        "live_blocks_allocated_during_runs": allocated_blocks,
+        "allocated_blocks_delta": sys.getallocatedblocks() - blocks_before,
+        "gc_collections": gc_collections,
+    }
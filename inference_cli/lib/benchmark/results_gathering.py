@@ -2,6 +2,7 @@ from collections import defaultdict
 from copy import copy
 from dataclasses import dataclass
 from datetime import datetime
+from threading import Lock
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
@@ -128,3 +129,187 @@ class ResultsCollector:
                 f"{exc}: {count}" for exc, count in error_status_codes.items()
             ),
         )
+
+
+HISTOGRAM_PERCENTILES = (50.0, 75.0, 90.0, 95.0, 99.0, 99.9, 99.99)
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram - values (recorded with microsecond resolution) are counted in
+    log-linear buckets: each power of two is split into 2^`sub_bucket_bits` linear
+    sub-buckets, which bounds the relative error of reported values (below 0.8% with
+    default settings) regardless of the magnitude, while memory stays constant.
+    Histograms recorded in different runs have the same buckets layout and can be merged.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        self._sub_bucket_bits = sub_bucket_bits
+        self._sub_bucket_count = 2**sub_bucket_bits
+        self._counts: Dict[int, int] = defaultdict(int)
+        self._total_count = 0
+        self._total_value = 0
+        self._min_value: Optional[int] = None
+        self._max_value: Optional[int] = None
+        self._lock = Lock()
+
+    @property
+    def total_count(self) -> int:
+        return self._total_count
+
+    def record(self, latency: float, expected_interval: Optional[float] = None) -> None:
+        """
+        Records latency (in seconds). When `expected_interval` (in seconds) is given, the
+        coordinated omission is corrected the same way as in HdrHistogram - latency longer
+        than expected interval between requests means that requests which should be sent
+        in the meantime were held back, so values they would observe (latency - interval,
+        latency - 2 * interval, ...) are recorded as well.
+        """
+        value = max(int(round(latency * 10**6)), 0)
+        with self._lock:
+            self._record_value(value=value)
+            if expected_interval is None or expected_interval <= 0:
+                return None
+            interval = int(round(expected_interval * 10**6))
+            if interval == 0:
+                return None
+            missing_value = value - interval
+            while missing_value >= interval:
+                self._record_value(value=missing_value)
+                missing_value -= interval
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other._sub_bucket_bits != self._sub_bucket_bits:
+            raise ValueError("Could not merge histograms with different precision.")
+        with self._lock:
+            for bucket, count in other._counts.items():
+                self._counts[bucket] += count
+            self._total_count += other._total_count
+            self._total_value += other._total_value
+            for value in (other._min_value, other._max_value):
+                if value is not None:
+                    self._update_min_max(value=value)
+
+    def percentile(self, percentile: float) -> float:
+        """Returns value (in seconds) at given percentile (0-100)."""
+        with self._lock:
+            if self._total_count == 0:
+                return 0.0
+            target_count = max(int(round(percentile / 100 * self._total_count)), 1)
+            cumulative_count = 0
+            for bucket in sorted(self._counts):
+                cumulative_count += self._counts[bucket]
+                if cumulative_count >= target_count:
+                    value = min(self._bucket_upper_bound(bucket), self._max_value)
+                    return value / 10**6
+            return self._max_value / 10**6
+
+    def to_dict(self) -> dict:
+        percentiles = {
+            f"p{percentile:g}": round(self.percentile(percentile) * 1000, 3)
+            for percentile in HISTOGRAM_PERCENTILES
+        }
+        with self._lock:
+            count = self._total_count
+            buckets = [
+                [
+                    round(self._bucket_upper_bound(bucket) / 1000, 3),
+                    self._counts[bucket],
+                ]
+                for bucket in sorted(self._counts)
+            ]
+            mean_ms = self._total_value / count / 1000 if count else 0.0
+            return {
+                "count": count,
+                "min_ms": round((self._min_value or 0) / 1000, 3),
+                "max_ms": round((self._max_value or 0) / 1000, 3),
+                "mean_ms": round(mean_ms, 3),
+                "percentiles_ms": percentiles,
+                "sub_bucket_bits": self._sub_bucket_bits,
+                "buckets_upper_bound_ms_and_count": buckets,
+            }
+
+    def _record_value(self, value: int) -> None:
+        self._counts[self._bucket_index(value)] += 1
+        self._total_count += 1
+        self._total_value += value
+        self._update_min_max(value=value)
+
+    def _update_min_max(self, value: int) -> None:
+        if self._min_value is None or value < self._min_value:
+            self._min_value = value
+        if self._max_value is None or value > self._max_value:
+            self._max_value = value
+
+    def _bucket_index(self, value: int) -> int:
+        if value < 2 * self._sub_bucket_count:
+            return value
+        shift = value.bit_length() - self._sub_bucket_bits - 1
+        return shift * self._sub_bucket_count + (value >> shift)
+
+    def _bucket_upper_bound(self, bucket: int) -> int:
+        if bucket < 2 * self._sub_bucket_count:
+            return bucket
+        shift = bucket // self._sub_bucket_count - 1
+        mantissa = bucket - shift * self._sub_bucket_count
+        return ((mantissa + 1) << shift) - 1
+
+
+@dataclass(frozen=True)
+class PhaseStatistics:
+    phase: str
+    concurrency: Optional[int]
+    target_requests_per_second: Optional[float]
+    requests_made: int
+    images_processed: int
+    errors: int
+    error_status_codes: Dict[str, int]
+    duration_s: float
+    requests_per_second: float
+    images_per_second: float
+    service_time: dict
+    response_time: dict
+
+    def to_string(self) -> str:
+        service_percentiles = self.service_time["percentiles_ms"]
+        response_percentiles = self.response_time["percentiles_ms"]
+        return (
+            f"{self.phase}\t| rps: {round(self.requests_per_second, 1)}\t| "
+            f"p50: {service_percentiles['p50']}ms\t| p99: {service_percentiles['p99']}ms\t| "
+            f"p99 (corrected): {response_percentiles['p99']}ms\t| "
+            f"%err: {round(self.errors / max(self.requests_made, 1) * 100, 2)}"
+        )
+
+
+@dataclass(frozen=True)
+class LoadProfileStatistics:
+    load_profile: str
+    phases: List[PhaseStatistics]
+    knee_concurrency: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class WorkflowConfigurationStatistics:
+    batch_size: int
+    max_concurrent_steps: int
+    inference_statistics: InferenceStatistics
+    step_timings: Dict[str, Dict[str, dict]]
+    peak_rss_mb: Optional[float]
+    allocations: dict
+
+
+@dataclass(frozen=True)
+class WorkflowBenchmarkStatistics:
+    configurations: List[WorkflowConfigurationStatistics]
+
+
+@dataclass(frozen=True)
+class ModelVariantStatistics:
+    variant: str
+    quantization: Optional[str]
+    inference_statistics: InferenceStatistics
+
+
+@dataclass(frozen=True)
+class ModelVariantsBenchmarkStatistics:
+    variants: List[ModelVariantStatistics]
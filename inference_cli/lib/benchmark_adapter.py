@@ -2,7 +2,7 @@ import os.path
 from dataclasses import asdict
 from datetime import datetime
 from threading import Thread
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from inference_cli.lib.benchmark.api_speed import (
     coordinate_infer_api_speed_benchmark,
@@ -10,10 +10,20 @@ from inference_cli.lib.benchmark.api_speed import (
     display_benchmark_statistics,
 )
 from inference_cli.lib.benchmark.dataset import load_dataset_images
+from inference_cli.lib.benchmark.load_profiles import (
+    LoadProfile,
+    prepare_infer_api_request,
+    prepare_workflow_api_request,
+    run_load_profile_benchmark,
+)
 from inference_cli.lib.benchmark.platform import retrieve_platform_specifics
 from inference_cli.lib.benchmark.results_gathering import (
     InferenceStatistics,
+    LoadProfileStatistics,
+    ModelVariantsBenchmarkStatistics,
+    ModelVariantStatistics,
     ResultsCollector,
+    WorkflowBenchmarkStatistics,
 )
 from inference_cli.lib.utils import dump_json, initialise_client
 
@@ -31,6 +41,9 @@ def run_infer_api_speed_benchmark(
     model_configuration: Optional[str] = None,
     output_location: Optional[str] = None,
     enforce_legacy_endpoints: bool = False,
+    load_profile: LoadProfile = LoadProfile.CLOSED_LOOP,
+    max_concurrency: int = 32,
+    max_in_flight: int = 256,
 ) -> None:
     dataset_images = load_dataset_images(
         dataset_reference=dataset_reference,
@@ -46,16 +59,32 @@ def run_infer_api_speed_benchmark(
     client.select_model(model_id=model_id)
     if enforce_legacy_endpoints:
         client.select_api_v0()
-    benchmark_results = coordinate_infer_api_speed_benchmark(
-        client=client,
-        images=dataset_images,
-        model_id=model_id,
-        warm_up_requests=warm_up_requests,
-        benchmark_requests=benchmark_requests,
-        request_batch_size=request_batch_size,
-        number_of_clients=number_of_clients,
-        requests_per_second=requests_per_second,
-    )
+    if load_profile is LoadProfile.CLOSED_LOOP:
+        benchmark_results = coordinate_infer_api_speed_benchmark(
+            client=client,
+            images=dataset_images,
+            model_id=model_id,
+            warm_up_requests=warm_up_requests,
+            benchmark_requests=benchmark_requests,
+            request_batch_size=request_batch_size,
+            number_of_clients=number_of_clients,
+            requests_per_second=requests_per_second,
+        )
+    else:
+        benchmark_results = run_load_profile_benchmark(
+            request_function=prepare_infer_api_request(
+                client=client,
+                images=dataset_images,
+                request_batch_size=request_batch_size,
+            ),
+            load_profile=load_profile,
+            warm_up_requests=warm_up_requests,
+            benchmark_requests=benchmark_requests,
+            request_batch_size=request_batch_size,
+            requests_per_second=requests_per_second,
+            max_concurrency=max_concurrency,
+            max_in_flight=max_in_flight,
+        )
     if output_location is None:
         return None
     benchmark_parameters = {
@@ -68,6 +97,9 @@ def run_infer_api_speed_benchmark(
         "number_of_clients": number_of_clients,
         "requests_per_second": requests_per_second,
         "model_configuration": model_configuration,
+        "load_profile": load_profile.value,
+        "max_concurrency": max_concurrency,
+        "max_in_flight": max_in_flight,
     }
     dump_benchmark_results(
         output_location=output_location,
@@ -91,6 +123,9 @@ def run_workflow_api_speed_benchmark(
     api_key: Optional[str] = None,
     model_configuration: Optional[str] = None,
     output_location: Optional[str] = None,
+    load_profile: LoadProfile = LoadProfile.CLOSED_LOOP,
+    max_concurrency: int = 32,
+    max_in_flight: int = 256,
 ) -> None:
     dataset_images = load_dataset_images(
         dataset_reference=dataset_reference,
@@ -103,18 +138,38 @@ def run_workflow_api_speed_benchmark(
         max_concurrent_requests=1,
         max_batch_size=request_batch_size,
     )
-    benchmark_results = coordinate_workflow_api_speed_benchmark(
-        client=client,
-        images=dataset_images,
-        workspace_name=workspace_name,
-        workflow_id=workflow_id,
-        workflow_specification=workflow_specification,
-        workflow_parameters=workflow_parameters,
-        benchmark_requests=benchmark_requests,
-        request_batch_size=request_batch_size,
-        number_of_clients=number_of_clients,
-        requests_per_second=requests_per_second,
-    )
+    if load_profile is LoadProfile.CLOSED_LOOP:
+        benchmark_results = coordinate_workflow_api_speed_benchmark(
+            client=client,
+            images=dataset_images,
+            workspace_name=workspace_name,
+            workflow_id=workflow_id,
+            workflow_specification=workflow_specification,
+            workflow_parameters=workflow_parameters,
+            benchmark_requests=benchmark_requests,
+            request_batch_size=request_batch_size,
+            number_of_clients=number_of_clients,
+            requests_per_second=requests_per_second,
+        )
+    else:
+        benchmark_results = run_load_profile_benchmark(
+            request_function=prepare_workflow_api_request(
+                client=client,
+                images=dataset_images,
+                request_batch_size=request_batch_size,
+                workspace_name=workspace_name,
+                workflow_id=workflow_id,
+                workflow_specification=workflow_specification,
+                workflow_parameters=workflow_parameters,
+            ),
+            load_profile=load_profile,
+            warm_up_requests=warm_up_requests,
+            benchmark_requests=benchmark_requests,
+            request_batch_size=request_batch_size,
+            requests_per_second=requests_per_second,
+            max_concurrency=max_concurrency,
+            max_in_flight=max_in_flight,
+        )
     if output_location is None:
         return None
     benchmark_parameters = {
@@ -126,6 +181,9 @@ def run_workflow_api_speed_benchmark(
         "number_of_clients": number_of_clients,
         "requests_per_second": requests_per_second,
         "model_configuration": model_configuration,
+        "load_profile": load_profile.value,
+        "max_concurrency": max_concurrency,
+        "max_in_flight": max_in_flight,
     }
     if workflow_id and workspace_name:
         benchmark_parameters["workflow_id"] = workflow_id
@@ -148,6 +206,7 @@ def run_python_package_speed_benchmark(
     api_key: Optional[str] = None,
     model_configuration: Optional[str] = None,
     output_location: Optional[str] = None,
+    compare_quantization: Optional[str] = None,
 ) -> None:
     # importing here not to affect other entrypoints by missing `inference` core library
     from inference_cli.lib.benchmark.python_package_speed import (
@@ -159,23 +218,44 @@ def run_python_package_speed_benchmark(
     )
     image_sizes = {i.shape[:2] for i in dataset_images}
     print(f"Detected images dimensions: {image_sizes}")
-    results_collector = ResultsCollector()
-    statistics_display_thread = Thread(
-        target=display_benchmark_statistics, args=(results_collector,)
-    )
-    statistics_display_thread.start()
-    run_python_package_speed_benchmark(
-        model_id=model_id,
-        images=dataset_images,
-        results_collector=results_collector,
-        warm_up_inferences=warm_up_inferences,
-        benchmark_inferences=benchmark_inferences,
-        batch_size=batch_size,
-        api_key=api_key,
-        model_configuration=model_configuration,
-    )
-    benchmark_results = results_collector.get_statistics()
-    statistics_display_thread.join()
+    variants = {None: None}
+    if compare_quantization is not None:
+        variants = {"fp32": "none", "int8": compare_quantization}
+    variants_statistics = []
+    for variant, quantization in variants.items():
+        if variant is not None:
+            print(f"Benchmarking {variant} variant of the model")
+        results_collector = ResultsCollector()
+        statistics_display_thread = Thread(
+            target=display_benchmark_statistics, args=(results_collector,)
+        )
+        statistics_display_thread.start()
+        served_quantization = run_python_package_speed_benchmark(
+            model_id=model_id,
+            images=dataset_images,
+            results_collector=results_collector,
+            warm_up_inferences=warm_up_inferences,
+            benchmark_inferences=benchmark_inferences,
+            batch_size=batch_size,
+            api_key=api_key,
+            model_configuration=model_configuration,
+            quantization=quantization,
+        )
+        statistics_display_thread.join()
+        variants_statistics.append(
+            ModelVariantStatistics(
+                variant=variant,
+                quantization=served_quantization,
+                inference_statistics=results_collector.get_statistics(),
+            )
+        )
+    if compare_quantization is not None:
+        benchmark_results = ModelVariantsBenchmarkStatistics(
+            variants=variants_statistics
+        )
+        print(format_model_variants_comparison(statistics=benchmark_results))
+    else:
+        benchmark_results = variants_statistics[0].inference_statistics
     if output_location is None:
         return None
     benchmark_parameters = {
@@ -186,6 +266,97 @@ def run_python_package_speed_benchmark(
         "batch_size": batch_size,
         "model_configuration": model_configuration,
     }
+    if compare_quantization is not None:
+        benchmark_parameters["compare_quantization"] = compare_quantization
+    dump_benchmark_results(
+        output_location=output_location,
+        benchmark_parameters=benchmark_parameters,
+        benchmark_results=benchmark_results,
+    )
+
+
+def format_model_variants_comparison(
+    statistics: ModelVariantsBenchmarkStatistics,
+) -> str:
+    lines = []
+    for variant in statistics.variants:
+        served = variant.quantization or "none (FP32)"
+        lines.append(
+            f"{variant.variant}\t| served quantization: {served}\t| "
+            f"{variant.inference_statistics.to_string()}"
+        )
+    baseline, candidate = statistics.variants[0], statistics.variants[-1]
+    if candidate.quantization is None:
+        lines.append(
+            "Quantized model was not served (see logs) - both variants ran FP32 model"
+        )
+    else:
+        speedup = baseline.inference_statistics.average_inference_latency_ms / max(
+            candidate.inference_statistics.average_inference_latency_ms, 1e-6
+        )
+        lines.append(
+            f"{candidate.variant} speedup over {baseline.variant}: {speedup:.2f}x"
+        )
+    return "\n".join(lines)
+
+
+def run_workflow_python_package_speed_benchmark(
+    dataset_reference: str,
+    workflow_specification_path: Optional[str] = None,
+    workspace_name: Optional[str] = None,
+    workflow_id: Optional[str] = None,
+    workflow_parameters: Optional[Dict[str, Any]] = None,
+    image_input_name: str = "image",
+    warm_up_runs: int = 10,
+    benchmark_runs: int = 100,
+    batch_sizes: Optional[List[int]] = None,
+    max_concurrent_steps_values: Optional[List[int]] = None,
+    api_key: Optional[str] = None,
+    output_location: Optional[str] = None,
+) -> None:
+    # importing here not to affect other entrypoints by missing `inference` core library
+    from inference_cli.lib.benchmark.python_package_speed import (
+        run_workflow_python_package_speed_benchmark,
+    )
+    from inference_cli.lib.workflows.local_execution import (
+        retrieve_workflow_specification,
+    )
+
+    workflow_specification = retrieve_workflow_specification(
+        workflow_specification_path=workflow_specification_path,
+        workspace_name=workspace_name,
+        workflow_id=workflow_id,
+        api_key=api_key,
+    )
+    dataset_images = load_dataset_images(
+        dataset_reference=dataset_reference,
+    )
+    image_sizes = {i.shape[:2] for i in dataset_images}
+    print(f"Detected images dimensions: {image_sizes}")
+    benchmark_results = run_workflow_python_package_speed_benchmark(
+        workflow_specification=workflow_specification,
+        images=dataset_images,
+        warm_up_runs=warm_up_runs,
+        benchmark_runs=benchmark_runs,
+        batch_sizes=batch_sizes,
+        max_concurrent_steps_values=max_concurrent_steps_values,
+        workflow_parameters=workflow_parameters,
+        image_input_name=image_input_name,
+        api_key=api_key,
+    )
+    if output_location is None:
+        return None
+    benchmark_parameters = {
+        "datetime": datetime.now().isoformat(),
+        "dataset_reference": dataset_reference,
+        "workflow_id": workflow_id or "locally defined",
+        "workflow_specification_path": workflow_specification_path,
+        "benchmark_runs": benchmark_runs,
+        "batch_sizes": batch_sizes,
+        "max_concurrent_steps_values": max_concurrent_steps_values,
+    }
+    if workspace_name:
+        benchmark_parameters["workspace_name"] = workspace_name
     dump_benchmark_results(
         output_location=output_location,
         benchmark_parameters=benchmark_parameters,
@@ -196,7 +367,12 @@ def run_python_package_speed_benchmark(
 def dump_benchmark_results(
     output_location: str,
     benchmark_parameters: dict,
-    benchmark_results: InferenceStatistics,
+    benchmark_results: Union[
+        InferenceStatistics,
+        LoadProfileStatistics,
+        ModelVariantsBenchmarkStatistics,
+        WorkflowBenchmarkStatistics,
+    ],
 ) -> None:
     platform_specifics = retrieve_platform_specifics()
     if os.path.isdir(output_location):
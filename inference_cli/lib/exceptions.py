@@ -12,3 +12,7 @@ class DatasetLoadingError(CLIError):
 
 class InferencePackageMissingError(CLIError):
     pass
+
+
+class WorkflowsProcessingError(CLIError):
+    pass
@@ -1,8 +1,21 @@
 import base64
 import os.path
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from functools import partial
 from glob import glob
-from typing import Callable, List, Optional, Union
+from queue import Queue
+from threading import BoundedSemaphore, Thread
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import cv2
 import numpy as np
@@ -35,7 +48,10 @@ from inference_cli.lib.env import ROBOFLOW_API_KEY
 from inference_cli.lib.logger import CLI_LOGGER
 from inference_cli.lib.utils import dump_json, initialise_client
 from inference_sdk.http.utils.encoding import bytes_to_opencv_image
-from inference_sdk.http.utils.loaders import load_image_from_string
+from inference_sdk.http.utils.loaders import (
+    load_directory_inference_input,
+    load_image_from_string,
+)
 
 CONFIGS_DIR_PATH = os.path.abspath(
     os.path.join(
@@ -88,6 +104,10 @@ def infer(
     visualise: bool,
     visualisation_config: Optional[str],
     model_configuration: Optional[str],
+    concurrent_requests: int = 1,
+    writers: int = 2,
+    prefetch: int = 16,
+    ordered: bool = True,
 ) -> None:
     if api_key is None:
         api_key = ROBOFLOW_API_KEY
@@ -104,6 +124,23 @@ def infer(
             model_configuration=model_configuration,
         )
         return None
+    if os.path.isdir(input_reference) and concurrent_requests > 1:
+        infer_on_directory_concurrently(
+            input_reference=input_reference,
+            model_id=model_id,
+            api_key=api_key,
+            host=host,
+            output_location=output_location,
+            display=display,
+            visualise=visualise,
+            visualisation_config=visualisation_config,
+            model_configuration=model_configuration,
+            concurrent_requests=concurrent_requests,
+            writers=writers,
+            prefetch=prefetch,
+            ordered=ordered,
+        )
+        return None
     if os.path.isdir(input_reference):
         infer_on_directory(
             input_reference=input_reference,
@@ -256,6 +293,191 @@ def infer_on_directory(
                 )
 
 
+def infer_on_directory_concurrently(
+    input_reference: str,
+    model_id: str,
+    api_key: Optional[str],
+    host: str,
+    output_location: Optional[str],
+    display: bool,
+    visualise: bool,
+    visualisation_config: Optional[str],
+    model_configuration: Optional[str],
+    concurrent_requests: int,
+    writers: int,
+    prefetch: int,
+    ordered: bool,
+) -> None:
+    """
+    Variant of `infer_on_directory(...)` overlapping all stages of processing - images are
+    decoded by prefetching loader thread, up to `concurrent_requests` requests are in-flight
+    at the same time and predictions / visualisations are saved by pool of `writers` threads.
+    Visualisation and display happen in the main thread, in order of received results - which
+    is order of loaded images if `ordered=True` (required for stateful visualisations - like
+    tracking) or order of completion otherwise.
+    """
+    if not is_something_to_do(
+        output_location=output_location, display=display, visualise=visualise
+    ):
+        print(
+            "Inference from directory requires `output_location` to be given or both "
+            "`display` and `visualise` options to be requested."
+        )
+        return None
+    client = initialise_client(
+        host=host,
+        api_key=api_key,
+        model_configuration=model_configuration,
+    )
+    on_frame_visualise = None
+    if visualise:
+        on_frame_visualise = build_visualisation_callback(
+            visualisation_config=visualisation_config,
+        )
+    images = prefetch_images(
+        images=load_directory_inference_input(
+            directory_path=input_reference,
+            image_extensions=client.inference_configuration.image_extensions_for_directory_scan,
+        ),
+        prefetch=prefetch,
+    )
+    with ThreadPoolExecutor(
+        max_workers=concurrent_requests
+    ) as inference_executor, BackgroundWriter(max_workers=writers) as writer:
+        results = infer_concurrently(
+            images=images,
+            infer_function=partial(client.infer, model_id=model_id),
+            executor=inference_executor,
+            max_in_flight=concurrent_requests,
+            ordered=ordered,
+        )
+        for reference, frame, prediction in tqdm(
+            results,
+            desc=f"Inference from directory: {input_reference}",
+        ):
+            visualised = None
+            if visualise:
+                visualised = on_frame_visualise(frame, prediction)
+            if display and visualised is not None:
+                cv2.imshow("Visualisation", visualised)
+                cv2.waitKey(1)
+            if output_location is not None:
+                writer.submit(
+                    save_prediction,
+                    reference=reference,
+                    prediction=prediction,
+                    output_location=output_location,
+                )
+                if visualised is not None:
+                    writer.submit(
+                        save_visualisation_image,
+                        reference=reference,
+                        visualisation=visualised,
+                        output_location=output_location,
+                    )
+    if display:
+        cv2.destroyAllWindows()
+
+
+def prefetch_images(
+    images: Iterable[Tuple[Union[str, int], np.ndarray]],
+    prefetch: int,
+) -> Generator[Tuple[Union[str, int], np.ndarray], None, None]:
+    """
+    Decodes images in background thread, keeping at most `prefetch` images ready to be
+    consumed. Errors raised by loader are re-raised in the consumer.
+    """
+    buffer = Queue(maxsize=max(prefetch, 1))
+    end_of_images = object()
+
+    def load() -> None:
+        try:
+            for image in images:
+                buffer.put(image)
+        except Exception as error:
+            buffer.put(error)
+        buffer.put(end_of_images)
+
+    Thread(target=load, daemon=True).start()
+    while True:
+        element = buffer.get()
+        if element is end_of_images:
+            return None
+        if isinstance(element, Exception):
+            raise element
+        yield element
+
+
+def infer_concurrently(
+    images: Iterable[Tuple[Union[str, int], np.ndarray]],
+    infer_function: Callable[[np.ndarray], dict],
+    executor: ThreadPoolExecutor,
+    max_in_flight: int,
+    ordered: bool,
+) -> Generator[Tuple[Union[str, int], np.ndarray, dict], None, None]:
+    """
+    Keeps up to `max_in_flight` inference requests running in `executor` - next image is
+    submitted as soon as any request is completed. Results are yielded in the order of
+    `images` if `ordered=True`, otherwise in order of completion (such that a slow request
+    does not hold back the following ones).
+    """
+    images = iter(images)
+    in_flight: Dict[Future, Tuple[Union[str, int], np.ndarray]] = {}
+    images_exhausted = False
+    while True:
+        while not images_exhausted and len(in_flight) < max_in_flight:
+            try:
+                reference, frame = next(images)
+            except StopIteration:
+                images_exhausted = True
+                break
+            in_flight[executor.submit(infer_function, frame)] = (reference, frame)
+        if not in_flight:
+            return None
+        if ordered:
+            # dicts preserve insertion order - the first one is the oldest request
+            done = [next(iter(in_flight))]
+        else:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            reference, frame = in_flight.pop(future)
+            yield reference, frame, future.result()
+
+
+class BackgroundWriter:
+    """
+    Pool of threads saving results. At most `max_pending` writes may wait for execution -
+    further submissions block, such that memory is bounded when writes are slower than
+    inference. First error raised by any of the writes is re-raised on exit.
+    """
+
+    def __init__(self, max_workers: int, max_pending: Optional[int] = None):
+        if max_pending is None:
+            max_pending = 4 * max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max(max_workers, 1))
+        self._pending_writes = BoundedSemaphore(value=max(max_pending, 1))
+        self._errors: List[Exception] = []
+
+    def submit(self, write_function: Callable[..., Any], **kwargs) -> None:
+        self._pending_writes.acquire()
+        future = self._executor.submit(write_function, **kwargs)
+        future.add_done_callback(self._on_write_completed)
+
+    def _on_write_completed(self, future: Future) -> None:
+        self._pending_writes.release()
+        error = future.exception()
+        if error is not None:
+            self._errors.append(error)
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self._executor.shutdown(wait=True)
+        if exc_type is None and self._errors:
+            raise self._errors[0]
+
+
 def infer_on_image(
     input_reference: str,
     model_id: str,
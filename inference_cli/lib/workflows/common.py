@@ -0,0 +1,192 @@
+import csv
+import json
+import os
+from typing import Any, Dict, List, Optional, Set, TextIO
+
+import numpy as np
+
+from inference_cli.lib.utils import dump_json
+from inference_cli.lib.workflows.entities import (
+    OutputFileType,
+    ProcessingResult,
+    ProcessingStatistics,
+)
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".webp", ".tif", ".tiff"}
+PROGRESS_LOG_FILE_NAME = "progress.log"
+FAILURES_FILE_NAME = "failures.jsonl"
+STATISTICS_FILE_NAME = "processing_statistics.json"
+RESULTS_FILE_NAME = "workflow_results"
+
+
+def discover_images(directory: str) -> List[str]:
+    """
+    Returns paths of images in directory (recursively), relative to the directory, sorted -
+    such that the order is stable between runs.
+    """
+    result = []
+    for root, _, file_names in os.walk(directory):
+        for file_name in file_names:
+            if os.path.splitext(file_name)[1].lower() not in IMAGE_EXTENSIONS:
+                continue
+            result.append(os.path.relpath(os.path.join(root, file_name), directory))
+    return sorted(result)
+
+
+class ProgressLog:
+    """
+    Append-only log of references (images or video frames) which results were already
+    saved - used to skip them once interrupted job is resumed. Entry is written only after
+    the result, so interruption may at worst cause single result to be processed twice.
+    """
+
+    def __init__(self, path: str, resume: bool):
+        self._path = path
+        self._processed: Set[str] = set()
+        if resume and os.path.exists(path):
+            with open(path, "r") as f:
+                self._processed = {line.strip() for line in f if line.strip()}
+        self._file: TextIO = open(path, "a" if resume else "w")
+
+    def is_processed(self, reference: str) -> bool:
+        return reference in self._processed
+
+    def mark_processed(self, reference: str) -> None:
+        self._processed.add(reference)
+        self._file.write(f"{reference}\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __len__(self) -> int:
+        return len(self._processed)
+
+
+class ResultsWriter:
+    """
+    Streams results into JSONL (one JSON document per line) or CSV file (one column per workflow
+    output, non-scalar values being JSON-serialised) - flushing after each entry.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        output_file_type: OutputFileType,
+        reference_column: str,
+        output_names: List[str],
+        resume: bool,
+    ):
+        self._output_file_type = output_file_type
+        self._reference_column = reference_column
+        self._columns = [reference_column] + output_names
+        append = resume and os.path.exists(path) and os.path.getsize(path) > 0
+        self._file: TextIO = open(path, "a" if append else "w", newline="")
+        self._csv_writer = None
+        if output_file_type is OutputFileType.CSV:
+            self._csv_writer = csv.DictWriter(
+                self._file, fieldnames=self._columns, extrasaction="ignore"
+            )
+            if not append:
+                self._csv_writer.writeheader()
+
+    def write(self, reference: str, result: Dict[str, Any]) -> None:
+        entry = {self._reference_column: reference}
+        entry.update(result)
+        if self._csv_writer is None:
+            self._file.write(json.dumps(entry, default=_serialise_unknown) + "\n")
+        else:
+            self._csv_writer.writerow(
+                {
+                    column: _to_csv_value(value=entry.get(column))
+                    for column in self._columns
+                }
+            )
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def get_results_file_path(
+    output_directory: str, output_file_type: OutputFileType
+) -> str:
+    return os.path.join(
+        output_directory, f"{RESULTS_FILE_NAME}.{output_file_type.value}"
+    )
+
+
+def save_failure(output_directory: str, processing_result: ProcessingResult) -> None:
+    path = os.path.join(output_directory, FAILURES_FILE_NAME)
+    with open(path, "a") as f:
+        f.write(
+            json.dumps(
+                {
+                    "reference": processing_result.reference,
+                    "error": processing_result.error,
+                }
+            )
+            + "\n"
+        )
+
+
+def reset_failures(output_directory: str) -> None:
+    path = os.path.join(output_directory, FAILURES_FILE_NAME)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def summarise_processing(
+    latencies: List[float],
+    failed: int,
+    skipped: int,
+    duration: float,
+) -> ProcessingStatistics:
+    processed = len(latencies)
+    if processed == 0:
+        latencies = [0.0]
+    return ProcessingStatistics(
+        processed=processed,
+        failed=failed,
+        skipped=skipped,
+        duration=duration,
+        throughput=processed / duration if duration > 0 else 0.0,
+        latency_avg=float(np.average(latencies)),
+        latency_p50=float(np.percentile(latencies, 50)),
+        latency_p90=float(np.percentile(latencies, 90)),
+        latency_p99=float(np.percentile(latencies, 99)),
+    )
+
+
+def report_statistics(
+    statistics: ProcessingStatistics, output_directory: Optional[str]
+) -> None:
+    print(
+        f"Processed: {statistics.processed} | failed: {statistics.failed} | "
+        f"skipped (already processed): {statistics.skipped} | "
+        f"duration: {round(statistics.duration, 2)}s | "
+        f"throughput: {round(statistics.throughput, 2)}/s\n"
+        f"Latency [ms] - avg: {round(statistics.latency_avg * 1000, 2)} | "
+        f"p50: {round(statistics.latency_p50 * 1000, 2)} | "
+        f"p90: {round(statistics.latency_p90 * 1000, 2)} | "
+        f"p99: {round(statistics.latency_p99 * 1000, 2)}"
+    )
+    if output_directory is not None:
+        dump_json(
+            path=os.path.join(output_directory, STATISTICS_FILE_NAME),
+            content=statistics.to_dict(),
+        )
+
+
+def _to_csv_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return json.dumps(value, default=_serialise_unknown)
+
+
+def _serialise_unknown(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class OutputFileType(str, Enum):
+    JSONL = "jsonl"
+    CSV = "csv"
+
+
+@dataclass(frozen=True)
+class ProcessingResult:
+    reference: str
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+    latency: float
+
+
+@dataclass(frozen=True)
+class ProcessingStatistics:
+    processed: int
+    failed: int
+    skipped: int
+    duration: float
+    throughput: float
+    latency_avg: float
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+
+    def to_dict(self) -> dict:
+        return {
+            "processed": self.processed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "duration": self.duration,
+            "throughput": self.throughput,
+            "latency_avg": self.latency_avg,
+            "latency_p50": self.latency_p50,
+            "latency_p90": self.latency_p90,
+            "latency_p99": self.latency_p99,
+        }
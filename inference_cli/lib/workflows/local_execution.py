@@ -0,0 +1,146 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+from inference_cli.lib.exceptions import (
+    InferencePackageMissingError,
+    WorkflowsProcessingError,
+)
+
+try:
+    from inference.core.cache import cache
+    from inference.core.env import MAX_ACTIVE_MODELS
+    from inference.core.interfaces.http.orjson_utils import (
+        serialise_single_workflow_result_element,
+    )
+    from inference.core.managers.active_learning import (
+        BackgroundTaskActiveLearningManager,
+    )
+    from inference.core.managers.base import ModelManager
+    from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+    from inference.core.registries.roboflow import RoboflowModelRegistry
+    from inference.core.roboflow_api import get_workflow_specification
+    from inference.core.workflows.execution_engine.core import ExecutionEngine
+    from inference.core.workflows.execution_engine.entities.base import (
+        WorkflowImageData,
+    )
+    from inference.core.workflows.execution_engine.profiling.core import (
+        WorkflowsProfiler,
+    )
+    from inference.models.utils import ROBOFLOW_MODEL_TYPES
+except ImportError as error:
+    raise InferencePackageMissingError(
+        "You need to install `inference` package to use this feature. Run `pip install inference`"
+    ) from error
+
+
+def retrieve_workflow_specification(
+    workflow_specification_path: Optional[str],
+    workspace_name: Optional[str],
+    workflow_id: Optional[str],
+    api_key: Optional[str],
+) -> dict:
+    if workflow_specification_path is not None:
+        with open(workflow_specification_path, "r") as f:
+            return json.load(f)
+    if workspace_name is None or workflow_id is None:
+        raise WorkflowsProcessingError(
+            "Either path to Workflow specification or (`workspace_name`, `workflow_id`) pair must be given."
+        )
+    if api_key is None:
+        raise WorkflowsProcessingError(
+            "Roboflow API key is required to fetch Workflow definition from Roboflow platform."
+        )
+    return get_workflow_specification(
+        api_key=api_key,
+        workspace_id=workspace_name,
+        workflow_id=workflow_id,
+    )
+
+
+def get_workflow_output_names(workflow_specification: dict) -> List[str]:
+    return [output["name"] for output in workflow_specification.get("outputs", [])]
+
+
+def initialise_model_manager() -> ModelManager:
+    model_registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
+    model_manager = BackgroundTaskActiveLearningManager(
+        model_registry=model_registry, cache=cache
+    )
+    return WithFixedSizeCache(
+        model_manager,
+        max_size=MAX_ACTIVE_MODELS,
+    )
+
+
+def initialise_execution_engine(
+    workflow_specification: dict,
+    api_key: Optional[str],
+    workflows_thread_pool_workers: int = 4,
+    model_manager: Optional[ModelManager] = None,
+    max_concurrent_steps: int = 1,
+    profiler: Optional[WorkflowsProfiler] = None,
+) -> ExecutionEngine:
+    if model_manager is None:
+        model_manager = initialise_model_manager()
+    workflow_init_parameters = {
+        "workflows_core.model_manager": model_manager,
+        "workflows_core.api_key": api_key,
+        "workflows_core.thread_pool_executor": ThreadPoolExecutor(
+            max_workers=workflows_thread_pool_workers
+        ),
+    }
+    return ExecutionEngine.init(
+        workflow_definition=workflow_specification,
+        init_parameters=workflow_init_parameters,
+        max_concurrent_steps=max_concurrent_steps,
+        profiler=profiler,
+    )
+
+
+def serialise_result(
+    result: Dict[str, Any],
+    output_directory: str,
+    reference: str,
+    save_image_outputs: bool,
+) -> Dict[str, Any]:
+    """
+    Serialises result of Workflow execution for single input image. Images returned directly
+    as Workflow outputs are saved in `<output_directory>/<output_name>/` directory (replaced
+    with path to saved file in serialised result) if `save_image_outputs` is set - otherwise
+    they are excluded from the result.
+    """
+    image_outputs = [
+        name for name, value in result.items() if isinstance(value, WorkflowImageData)
+    ]
+    serialised = serialise_single_workflow_result_element(
+        result_element=result,
+        excluded_fields=image_outputs,
+    )
+    if not save_image_outputs:
+        return serialised
+    for output_name in image_outputs:
+        serialised[output_name] = save_image_output(
+            image=result[output_name].numpy_image,
+            output_directory=output_directory,
+            output_name=output_name,
+            reference=reference,
+        )
+    return serialised
+
+
+def save_image_output(
+    image: np.ndarray,
+    output_directory: str,
+    output_name: str,
+    reference: str,
+) -> str:
+    reference_stem = os.path.splitext(reference)[0]
+    target_path = os.path.join(output_directory, output_name, f"{reference_stem}.jpg")
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    cv2.imwrite(target_path, image)
+    return target_path
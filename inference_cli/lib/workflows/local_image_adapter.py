@@ -0,0 +1,185 @@
+import multiprocessing
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+import cv2
+from tqdm import tqdm
+
+from inference_cli.lib.workflows.common import (
+    PROGRESS_LOG_FILE_NAME,
+    ProgressLog,
+    ResultsWriter,
+    discover_images,
+    get_results_file_path,
+    report_statistics,
+    reset_failures,
+    save_failure,
+    summarise_processing,
+)
+from inference_cli.lib.workflows.entities import (
+    OutputFileType,
+    ProcessingResult,
+    ProcessingStatistics,
+)
+from inference_cli.lib.workflows.local_execution import (
+    get_workflow_output_names,
+    initialise_execution_engine,
+    serialise_result,
+)
+
+# state of the worker process (or of the main process, if processing is not parallelised)
+WORKER_STATE: Dict[str, Any] = {}
+
+
+def process_image_directory_with_workflow(
+    input_directory: str,
+    output_directory: str,
+    workflow_specification: dict,
+    image_input_name: str = "image",
+    workflow_parameters: Optional[Dict[str, Any]] = None,
+    api_key: Optional[str] = None,
+    output_file_type: OutputFileType = OutputFileType.JSONL,
+    processes: int = 1,
+    save_image_outputs: bool = False,
+    resume: bool = True,
+) -> ProcessingStatistics:
+    """
+    Runs Workflow (using in-process Execution Engine) against all images from directory
+    (recursively), using pool of `processes` worker processes - each holding its own
+    Execution Engine (and models). Results are streamed into single JSONL / CSV file in
+    `output_directory`, processed images are recorded in progress log - such that
+    interrupted job started again with `resume=True` skips them. Images which could not
+    be processed are reported in `failures.jsonl` and retried when job is resumed.
+    """
+    os.makedirs(output_directory, exist_ok=True)
+    images = discover_images(directory=input_directory)
+    progress_log = ProgressLog(
+        path=os.path.join(output_directory, PROGRESS_LOG_FILE_NAME),
+        resume=resume,
+    )
+    pending_images = [i for i in images if not progress_log.is_processed(i)]
+    skipped = len(images) - len(pending_images)
+    reset_failures(output_directory=output_directory)
+    results_writer = ResultsWriter(
+        path=get_results_file_path(
+            output_directory=output_directory, output_file_type=output_file_type
+        ),
+        output_file_type=output_file_type,
+        reference_column="image",
+        output_names=get_workflow_output_names(
+            workflow_specification=workflow_specification
+        ),
+        resume=resume,
+    )
+    worker_parameters = {
+        "input_directory": input_directory,
+        "output_directory": output_directory,
+        "workflow_specification": workflow_specification,
+        "image_input_name": image_input_name,
+        "workflow_parameters": workflow_parameters or {},
+        "api_key": api_key,
+        "save_image_outputs": save_image_outputs,
+    }
+    print(
+        f"Found {len(images)} images, {skipped} already processed. "
+        f"Processing {len(pending_images)} images with {processes} process(es)."
+    )
+    latencies, failed = [], 0
+    start = time.monotonic()
+    try:
+        for processing_result in tqdm(
+            _process_images(
+                images=pending_images,
+                processes=processes,
+                worker_parameters=worker_parameters,
+            ),
+            total=len(pending_images),
+            desc=f"Processing images from {input_directory}",
+        ):
+            if processing_result.error is not None:
+                failed += 1
+                save_failure(
+                    output_directory=output_directory,
+                    processing_result=processing_result,
+                )
+                continue
+            results_writer.write(
+                reference=processing_result.reference,
+                result=processing_result.result,
+            )
+            progress_log.mark_processed(reference=processing_result.reference)
+            latencies.append(processing_result.latency)
+    finally:
+        results_writer.close()
+        progress_log.close()
+    statistics = summarise_processing(
+        latencies=latencies,
+        failed=failed,
+        skipped=skipped,
+        duration=time.monotonic() - start,
+    )
+    report_statistics(statistics=statistics, output_directory=output_directory)
+    return statistics
+
+
+def _process_images(
+    images: List[str],
+    processes: int,
+    worker_parameters: Dict[str, Any],
+) -> Iterable[ProcessingResult]:
+    if not images:
+        return None
+    if processes <= 1:
+        _initialise_worker(worker_parameters=worker_parameters)
+        for image in images:
+            yield _process_image(reference=image)
+        return None
+    # spawn - not to inherit state of inference libraries (thread pools, sessions) with fork
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(
+        processes=processes,
+        initializer=_initialise_worker,
+        initargs=(worker_parameters,),
+    ) as pool:
+        yield from pool.imap_unordered(_process_image, images)
+
+
+def _initialise_worker(worker_parameters: Dict[str, Any]) -> None:
+    WORKER_STATE.update(worker_parameters)
+    WORKER_STATE["execution_engine"] = initialise_execution_engine(
+        workflow_specification=worker_parameters["workflow_specification"],
+        api_key=worker_parameters["api_key"],
+    )
+
+
+def _process_image(reference: str) -> ProcessingResult:
+    start = time.monotonic()
+    try:
+        image = cv2.imread(os.path.join(WORKER_STATE["input_directory"], reference))
+        if image is None:
+            raise ValueError(f"Could not decode image {reference}")
+        runtime_parameters = dict(WORKER_STATE["workflow_parameters"])
+        runtime_parameters[WORKER_STATE["image_input_name"]] = image
+        result = WORKER_STATE["execution_engine"].run(
+            runtime_parameters=runtime_parameters
+        )
+        serialised_result = serialise_result(
+            result=result[0],
+            output_directory=WORKER_STATE["output_directory"],
+            reference=reference,
+            save_image_outputs=WORKER_STATE["save_image_outputs"],
+        )
+        return ProcessingResult(
+            reference=reference,
+            result=serialised_result,
+            error=None,
+            latency=time.monotonic() - start,
+        )
+    except Exception as error:
+        return ProcessingResult(
+            reference=reference,
+            result=None,
+            error=f"{error.__class__.__name__}: {error}",
+            latency=time.monotonic() - start,
+        )
@@ -0,0 +1,134 @@
+import os
+import time
+from typing import Any, Dict, Optional
+
+from tqdm import tqdm
+
+from inference_cli.lib.exceptions import InferencePackageMissingError
+from inference_cli.lib.workflows.common import (
+    PROGRESS_LOG_FILE_NAME,
+    ProgressLog,
+    ResultsWriter,
+    get_results_file_path,
+    report_statistics,
+    reset_failures,
+    save_failure,
+    summarise_processing,
+)
+from inference_cli.lib.workflows.entities import (
+    OutputFileType,
+    ProcessingResult,
+    ProcessingStatistics,
+)
+from inference_cli.lib.workflows.local_execution import (
+    get_workflow_output_names,
+    initialise_execution_engine,
+    serialise_result,
+)
+
+try:
+    from inference.core.interfaces.camera.utils import get_video_frames_generator
+    from inference.core.interfaces.stream.model_handlers.workflows import (
+        WorkflowRunner,
+    )
+except ImportError as error:
+    raise InferencePackageMissingError(
+        "You need to install `inference` package to use this feature. Run `pip install inference`"
+    ) from error
+
+
+def process_video_with_workflow(
+    input_video_path: str,
+    output_directory: str,
+    workflow_specification: dict,
+    image_input_name: str = "image",
+    video_metadata_input_name: str = "video_metadata",
+    workflow_parameters: Optional[Dict[str, Any]] = None,
+    api_key: Optional[str] = None,
+    output_file_type: OutputFileType = OutputFileType.JSONL,
+    save_image_outputs: bool = False,
+    resume: bool = True,
+    max_fps: Optional[float] = None,
+) -> ProcessingStatistics:
+    """
+    Runs Workflow (using in-process Execution Engine) against frames of video file. Frames are
+    processed sequentially in a single process - Workflows may contain stateful blocks (like
+    trackers) which require frames in order. When job is resumed, frames already recorded
+    in progress log are decoded, but not processed again (state of stateful blocks is
+    re-created from the first processed frame).
+    """
+    os.makedirs(output_directory, exist_ok=True)
+    progress_log = ProgressLog(
+        path=os.path.join(output_directory, PROGRESS_LOG_FILE_NAME),
+        resume=resume,
+    )
+    skipped = len(progress_log)
+    reset_failures(output_directory=output_directory)
+    results_writer = ResultsWriter(
+        path=get_results_file_path(
+            output_directory=output_directory, output_file_type=output_file_type
+        ),
+        output_file_type=output_file_type,
+        reference_column="frame_id",
+        output_names=get_workflow_output_names(
+            workflow_specification=workflow_specification
+        ),
+        resume=resume,
+    )
+    execution_engine = initialise_execution_engine(
+        workflow_specification=workflow_specification,
+        api_key=api_key,
+    )
+    workflow_runner = WorkflowRunner()
+    video_name = os.path.splitext(os.path.basename(input_video_path))[0]
+    latencies, failed = [], 0
+    start = time.monotonic()
+    try:
+        for video_frame in tqdm(
+            get_video_frames_generator(video=input_video_path, max_fps=max_fps),
+            desc=f"Processing frames of {input_video_path}",
+        ):
+            reference = str(video_frame.frame_id)
+            if progress_log.is_processed(reference):
+                continue
+            processing_start = time.monotonic()
+            try:
+                result = workflow_runner.run_workflow(
+                    video_frames=[video_frame],
+                    workflows_parameters=dict(workflow_parameters or {}),
+                    execution_engine=execution_engine,
+                    image_input_name=image_input_name,
+                    video_metadata_input_name=video_metadata_input_name,
+                )
+                serialised_result = serialise_result(
+                    result=result[0],
+                    output_directory=output_directory,
+                    reference=f"{video_name}_{reference}",
+                    save_image_outputs=save_image_outputs,
+                )
+            except Exception as error:
+                failed += 1
+                save_failure(
+                    output_directory=output_directory,
+                    processing_result=ProcessingResult(
+                        reference=reference,
+                        result=None,
+                        error=f"{error.__class__.__name__}: {error}",
+                        latency=time.monotonic() - processing_start,
+                    ),
+                )
+                continue
+            latencies.append(time.monotonic() - processing_start)
+            results_writer.write(reference=reference, result=serialised_result)
+            progress_log.mark_processed(reference=reference)
+    finally:
+        results_writer.close()
+        progress_log.close()
+    statistics = summarise_processing(
+        latencies=latencies,
+        failed=failed,
+        skipped=skipped,
+        duration=time.monotonic() - start,
+    )
+    report_statistics(statistics=statistics, output_directory=output_directory)
+    return statistics
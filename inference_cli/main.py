@@ -7,11 +7,13 @@ import inference_cli.lib
 from inference_cli.benchmark import benchmark_app
 from inference_cli.cloud import cloud_app
 from inference_cli.server import server_app
+from inference_cli.workflows import workflows_app
 
 app = typer.Typer()
 app.add_typer(server_app, name="server")
 app.add_typer(cloud_app, name="cloud")
 app.add_typer(benchmark_app, name="benchmark")
+app.add_typer(workflows_app, name="workflows")
 
 
 def version_callback(value: bool):
@@ -111,6 +113,37 @@ def infer(
             "--model_config", "-mc", help="Location of yaml file with model config"
         ),
     ] = None,
+    concurrent_requests: Annotated[
+        int,
+        typer.Option(
+            "--concurrent_requests",
+            "-cr",
+            help="Number of in-flight requests when running inference against directory of images "
+            "(values above 1 enable concurrent processing)",
+        ),
+    ] = 1,
+    writers: Annotated[
+        int,
+        typer.Option(
+            "--writers",
+            help="Number of threads saving predictions and visualisations in concurrent processing",
+        ),
+    ] = 2,
+    prefetch: Annotated[
+        int,
+        typer.Option(
+            "--prefetch",
+            help="Number of images decoded ahead of requests in concurrent processing",
+        ),
+    ] = 16,
+    ordered: Annotated[
+        bool,
+        typer.Option(
+            "--ordered/--unordered",
+            help="Boolean flag to decide if results of concurrent processing should be handled in order "
+            "of images (required for tracking in visualisation) or in order of completion",
+        ),
+    ] = True,
 ):
     typer.echo(
         f"Running inference on {input_reference}, using model: {model_id}, and host: {host}"
@@ -126,6 +159,10 @@ def infer(
             visualise=visualise,
             visualisation_config=visualisation_config,
             model_configuration=model_config,
+            concurrent_requests=concurrent_requests,
+            writers=writers,
+            prefetch=prefetch,
+            ordered=ordered,
         )
     except Exception as error:
         typer.echo(f"Command failed. Cause: {error}")
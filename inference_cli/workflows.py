@@ -0,0 +1,281 @@
+import json
+from typing import Optional
+
+import typer
+from typing_extensions import Annotated
+
+from inference_cli.lib.env import ROBOFLOW_API_KEY
+from inference_cli.lib.workflows.entities import OutputFileType
+
+workflows_app = typer.Typer(
+    help="Commands for running Workflows locally against images and videos."
+)
+
+
+@workflows_app.command()
+def process_images_directory(
+    input_directory: Annotated[
+        str,
+        typer.Option(
+            "--input-directory",
+            "-i",
+            help="Path to directory with images (searched recursively)",
+        ),
+    ],
+    output_directory: Annotated[
+        str,
+        typer.Option(
+            "--output-dir",
+            "-o",
+            help="Path to directory where results, progress log and statistics will be saved",
+        ),
+    ],
+    workflow_specification_path: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow-specification-path",
+            "-wsp",
+            help="Path to JSON file with Workflow specification",
+        ),
+    ] = None,
+    workspace_name: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workspace-name",
+            "-wn",
+            help="Workspace Name (used with `--workflow-id` to fetch Workflow from Roboflow platform).",
+        ),
+    ] = None,
+    workflow_id: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow-id",
+            "-wid",
+            help="Workflow ID (used with `--workspace-name` to fetch Workflow from Roboflow platform).",
+        ),
+    ] = None,
+    workflow_parameters: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow-parameters",
+            "-wp",
+            help="JSON document with additional Workflow parameters",
+        ),
+    ] = None,
+    image_input_name: Annotated[
+        str,
+        typer.Option(
+            "--image-input-name",
+            help="Name of Workflow input that images should be passed into",
+        ),
+    ] = "image",
+    api_key: Annotated[
+        Optional[str],
+        typer.Option(
+            "--api-key",
+            "-a",
+            help="Roboflow API key for your workspace. If not given - env variable `ROBOFLOW_API_KEY` will be used",
+        ),
+    ] = None,
+    processes: Annotated[
+        int,
+        typer.Option(
+            "--processes",
+            "-p",
+            help="Number of worker processes - each holding its own Execution Engine and models",
+        ),
+    ] = 1,
+    output_file_type: Annotated[
+        OutputFileType,
+        typer.Option(
+            "--output-file-type",
+            help="Format of file with results",
+        ),
+    ] = OutputFileType.JSONL,
+    save_image_outputs: Annotated[
+        bool,
+        typer.Option(
+            "--save-image-outputs/--no-save-image-outputs",
+            help="Boolean flag to decide if images returned as Workflow outputs should be saved",
+        ),
+    ] = False,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume/--no-resume",
+            help="Boolean flag to decide if images already processed (according to progress log in "
+            "output directory) should be skipped",
+        ),
+    ] = True,
+):
+    try:
+        # importing here not to affect other entrypoints by missing `inference` core library
+        from inference_cli.lib.workflows.local_execution import (
+            retrieve_workflow_specification,
+        )
+        from inference_cli.lib.workflows.local_image_adapter import (
+            process_image_directory_with_workflow,
+        )
+
+        api_key = api_key or ROBOFLOW_API_KEY
+        workflow_specification = retrieve_workflow_specification(
+            workflow_specification_path=workflow_specification_path,
+            workspace_name=workspace_name,
+            workflow_id=workflow_id,
+            api_key=api_key,
+        )
+        process_image_directory_with_workflow(
+            input_directory=input_directory,
+            output_directory=output_directory,
+            workflow_specification=workflow_specification,
+            image_input_name=image_input_name,
+            workflow_parameters=(
+                json.loads(workflow_parameters) if workflow_parameters else None
+            ),
+            api_key=api_key,
+            output_file_type=output_file_type,
+            processes=processes,
+            save_image_outputs=save_image_outputs,
+            resume=resume,
+        )
+    except Exception as error:
+        typer.echo(f"Command failed. Cause: {error}")
+        raise typer.Exit(code=1)
+
+
+@workflows_app.command()
+def process_video(
+    video_path: Annotated[
+        str,
+        typer.Option(
+            "--video-path",
+            "-i",
+            help="Path to video file",
+        ),
+    ],
+    output_directory: Annotated[
+        str,
+        typer.Option(
+            "--output-dir",
+            "-o",
+            help="Path to directory where results, progress log and statistics will be saved",
+        ),
+    ],
+    workflow_specification_path: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow-specification-path",
+            "-wsp",
+            help="Path to JSON file with Workflow specification",
+        ),
+    ] = None,
+    workspace_name: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workspace-name",
+            "-wn",
+            help="Workspace Name (used with `--workflow-id` to fetch Workflow from Roboflow platform).",
+        ),
+    ] = None,
+    workflow_id: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow-id",
+            "-wid",
+            help="Workflow ID (used with `--workspace-name` to fetch Workflow from Roboflow platform).",
+        ),
+    ] = None,
+    workflow_parameters: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow-parameters",
+            "-wp",
+            help="JSON document with additional Workflow parameters",
+        ),
+    ] = None,
+    image_input_name: Annotated[
+        str,
+        typer.Option(
+            "--image-input-name",
+            help="Name of Workflow input that video frames should be passed into",
+        ),
+    ] = "image",
+    video_metadata_input_name: Annotated[
+        str,
+        typer.Option(
+            "--video-metadata-input-name",
+            help="Name of Workflow input that video metadata should be passed into",
+        ),
+    ] = "video_metadata",
+    max_fps: Annotated[
+        Optional[float],
+        typer.Option(
+            "--max-fps",
+            help="Limit of FPS of processed video (frames are sub-sampled if set)",
+        ),
+    ] = None,
+    api_key: Annotated[
+        Optional[str],
+        typer.Option(
+            "--api-key",
+            "-a",
+            help="Roboflow API key for your workspace. If not given - env variable `ROBOFLOW_API_KEY` will be used",
+        ),
+    ] = None,
+    output_file_type: Annotated[
+        OutputFileType,
+        typer.Option(
+            "--output-file-type",
+            help="Format of file with results",
+        ),
+    ] = OutputFileType.JSONL,
+    save_image_outputs: Annotated[
+        bool,
+        typer.Option(
+            "--save-image-outputs/--no-save-image-outputs",
+            help="Boolean flag to decide if images returned as Workflow outputs should be saved",
+        ),
+    ] = False,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume/--no-resume",
+            help="Boolean flag to decide if frames already processed (according to progress log in "
+            "output directory) should be skipped",
+        ),
+    ] = True,
+):
+    try:
+        # importing here not to affect other entrypoints by missing `inference` core library
+        from inference_cli.lib.workflows.local_execution import (
+            retrieve_workflow_specification,
+        )
+        from inference_cli.lib.workflows.video_adapter import (
+            process_video_with_workflow,
+        )
+
+        api_key = api_key or ROBOFLOW_API_KEY
+        workflow_specification = retrieve_workflow_specification(
+            workflow_specification_path=workflow_specification_path,
+            workspace_name=workspace_name,
+            workflow_id=workflow_id,
+            api_key=api_key,
+        )
+        process_video_with_workflow(
+            input_video_path=video_path,
+            output_directory=output_directory,
+            workflow_specification=workflow_specification,
+            image_input_name=image_input_name,
+            video_metadata_input_name=video_metadata_input_name,
+            workflow_parameters=(
+                json.loads(workflow_parameters) if workflow_parameters else None
+            ),
+            api_key=api_key,
+            output_file_type=output_file_type,
+            save_image_outputs=save_image_outputs,
+            resume=resume,
+            max_fps=max_fps,
+        )
+    except Exception as error:
+        typer.echo(f"Command failed. Cause: {error}")
+        raise typer.Exit(code=1)
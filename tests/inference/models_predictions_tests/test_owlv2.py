@@ -1,5 +1,8 @@
+import pytest
+
 from inference.core.entities.requests.owlv2 import OwlV2InferenceRequest
 from inference.core.entities.responses.inference import ObjectDetectionInferenceResponse
+from inference.core.exceptions import OwlV2PromptSetNotFoundError
 from inference.models.owlv2.owlv2 import OwlV2
 
 
@@ -21,3 +24,35 @@ def test_owlv2():
 
     response = OwlV2().infer_from_request(request)
     assert abs(221.4 - response.predictions[0].x) < 0.1
+
+
+def test_owlv2_reuses_registered_prompt_set():
+    image = {
+        "type": "url",
+        "value": "https://media.roboflow.com/inference/seawithdock.jpeg",
+    }
+    model = OwlV2()
+    model.infer_from_request(
+        OwlV2InferenceRequest(
+            api_key="some-key",
+            image=image,
+            training_data=[
+                {
+                    "image": image,
+                    "boxes": [{"x": 223, "y": 306, "w": 40, "h": 226, "cls": "post"}],
+                }
+            ],
+            prompt_set_id="posts",
+        )
+    )
+
+    response = model.infer_from_request(
+        OwlV2InferenceRequest(api_key="some-key", image=image, prompt_set_id="posts")
+    )
+    assert abs(221.4 - response.predictions[0].x) < 0.1
+    with pytest.raises(OwlV2PromptSetNotFoundError):
+        _ = model.infer_from_request(
+            OwlV2InferenceRequest(
+                api_key="other-key", image=image, prompt_set_id="posts"
+            )
+        )
@@ -0,0 +1,290 @@
+import base64
+import hashlib
+import json
+import os.path
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Generator, List, Optional, Set, Tuple
+
+import pytest
+
+from inference.core.cache.downloads import (
+    PARTIAL_FILE_SUFFIX,
+    PROGRESS_FILE_SUFFIX,
+    Checksum,
+    download_file,
+    get_checksum_from_headers,
+)
+from inference.core.exceptions import ModelArtefactError
+
+CONTENT = bytes(range(256)) * 40
+RANGE_PATTERN = re.compile(r"bytes=(\d+)-(\d+)")
+
+
+class StubServerState:
+    def __init__(self) -> None:
+        self.content = CONTENT
+        self.supports_ranges = True
+        self.etag = '"v1"'
+        self.goog_hash: Optional[str] = None
+        self.failing_ranges: Set[Tuple[int, int]] = set()
+        self.requested_ranges: List[Tuple[int, int]] = []
+        self.lock = threading.Lock()
+
+
+class StubServer:
+    def __init__(self, server: ThreadingHTTPServer, state: StubServerState) -> None:
+        self.state = state
+        self.url = f"http://127.0.0.1:{server.server_port}/weights.onnx"
+
+
+def create_handler(state: StubServerState) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            match = RANGE_PATTERN.match(self.headers.get("Range", ""))
+            if not state.supports_ranges or match is None:
+                self._respond(status=200, body=state.content)
+                return None
+            start, end = int(match.group(1)), int(match.group(2))
+            with state.lock:
+                state.requested_ranges.append((start, end))
+            if (start, end) in state.failing_ranges:
+                self._respond(status=404, body=b"")
+                return None
+            end = min(end, len(state.content) - 1)
+            self._respond(
+                status=206,
+                body=state.content[start : end + 1],
+                headers={"Content-Range": f"bytes {start}-{end}/{len(state.content)}"},
+            )
+
+        def _respond(self, status: int, body: bytes, headers: dict = None) -> None:
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", state.etag)
+            if state.goog_hash:
+                self.send_header("x-goog-hash", state.goog_hash)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    return Handler
+
+
+@pytest.fixture()
+def stub_server() -> Generator[StubServer, None, None]:
+    state = StubServerState()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), create_handler(state=state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield StubServer(server=server, state=state)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_download_file_when_server_supports_range_requests(
+    stub_server: StubServer, empty_local_dir: str
+) -> None:
+    # given
+    target_path = os.path.join(empty_local_dir, "model", "weights.onnx")
+
+    # when
+    download_file(
+        url=stub_server.url, target_path=target_path, chunk_size=1000, max_workers=4
+    )
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == CONTENT
+    assert os.listdir(os.path.dirname(target_path)) == ["weights.onnx"]
+    assert sorted(stub_server.state.requested_ranges) == [(0, 0)] + [
+        (start, min(start + 999, len(CONTENT) - 1))
+        for start in range(0, len(CONTENT), 1000)
+    ]
+
+
+def test_download_file_when_server_does_not_support_range_requests(
+    stub_server: StubServer, empty_local_dir: str
+) -> None:
+    # given
+    stub_server.state.supports_ranges = False
+    target_path = os.path.join(empty_local_dir, "weights.onnx")
+
+    # when
+    download_file(url=stub_server.url, target_path=target_path, chunk_size=1000)
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == CONTENT
+    assert os.listdir(empty_local_dir) == ["weights.onnx"]
+
+
+def test_download_file_when_chunk_fails_then_partial_download_is_kept(
+    stub_server: StubServer, empty_local_dir: str
+) -> None:
+    # given
+    stub_server.state.failing_ranges = {(3000, 3999)}
+    target_path = os.path.join(empty_local_dir, "weights.onnx")
+
+    # when
+    with pytest.raises(ModelArtefactError):
+        download_file(
+            url=stub_server.url,
+            target_path=target_path,
+            chunk_size=1000,
+            max_workers=1,
+            retries=0,
+        )
+
+    # then
+    assert not os.path.exists(target_path)
+    with open(target_path + PROGRESS_FILE_SUFFIX) as f:
+        progress = json.load(f)
+    assert {0, 1, 2}.issubset(progress["completed_chunks"])
+    assert 3 not in progress["completed_chunks"]
+    assert os.path.getsize(target_path + PARTIAL_FILE_SUFFIX) == len(CONTENT)
+
+
+def test_download_file_when_interrupted_download_is_resumed(
+    stub_server: StubServer, empty_local_dir: str
+) -> None:
+    # given
+    stub_server.state.failing_ranges = {(3000, 3999)}
+    target_path = os.path.join(empty_local_dir, "weights.onnx")
+    with pytest.raises(ModelArtefactError):
+        download_file(
+            url=stub_server.url,
+            target_path=target_path,
+            chunk_size=1000,
+            max_workers=1,
+            retries=0,
+        )
+    stub_server.state.failing_ranges = set()
+    stub_server.state.requested_ranges = []
+
+    # when
+    download_file(
+        url=stub_server.url, target_path=target_path, chunk_size=1000, max_workers=1
+    )
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == CONTENT
+    assert os.listdir(empty_local_dir) == ["weights.onnx"]
+    assert (0, 999) not in stub_server.state.requested_ranges
+    assert (3000, 3999) in stub_server.state.requested_ranges
+
+
+def test_download_file_when_content_changed_since_interrupted_download(
+    stub_server: StubServer, empty_local_dir: str
+) -> None:
+    # given
+    stub_server.state.failing_ranges = {(3000, 3999)}
+    target_path = os.path.join(empty_local_dir, "weights.onnx")
+    with pytest.raises(ModelArtefactError):
+        download_file(
+            url=stub_server.url,
+            target_path=target_path,
+            chunk_size=1000,
+            max_workers=1,
+            retries=0,
+        )
+    stub_server.state.failing_ranges = set()
+    stub_server.state.requested_ranges = []
+    stub_server.state.etag = '"v2"'
+    stub_server.state.content = CONTENT[::-1]
+
+    # when
+    download_file(
+        url=stub_server.url, target_path=target_path, chunk_size=1000, max_workers=1
+    )
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == CONTENT[::-1]
+    assert (0, 999) in stub_server.state.requested_ranges
+
+
+def test_download_file_when_expected_checksum_matches(
+    stub_server: StubServer, empty_local_dir: str
+) -> None:
+    # given
+    target_path = os.path.join(empty_local_dir, "weights.onnx")
+    checksum = Checksum(
+        algorithm="sha256", hex_digest=hashlib.sha256(CONTENT).hexdigest()
+    )
+
+    # when
+    download_file(
+        url=stub_server.url,
+        target_path=target_path,
+        expected_checksum=checksum,
+        chunk_size=1000,
+    )
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == CONTENT
+
+
+def test_download_file_when_checksum_reported_by_server_does_not_match(
+    stub_server: StubServer, empty_local_dir: str
+) -> None:
+    # given
+    invalid_md5 = base64.b64encode(hashlib.md5(b"other").digest()).decode()
+    stub_server.state.goog_hash = f"crc32c=AAAAAA==,md5={invalid_md5}"
+    target_path = os.path.join(empty_local_dir, "weights.onnx")
+
+    # when
+    with pytest.raises(ModelArtefactError):
+        download_file(url=stub_server.url, target_path=target_path, chunk_size=1000)
+
+    # then
+    assert os.listdir(empty_local_dir) == []
+
+
+def test_get_checksum_from_headers_when_goog_hash_given() -> None:
+    # given
+    md5 = hashlib.md5(CONTENT)
+    headers = {
+        "x-goog-hash": f"crc32c=n03x6A==, md5={base64.b64encode(md5.digest()).decode()}"
+    }
+
+    # when
+    result = get_checksum_from_headers(headers=headers, whole_content=False)
+
+    # then
+    assert result == Checksum(algorithm="md5", hex_digest=md5.hexdigest())
+
+
+def test_get_checksum_from_headers_when_content_md5_of_partial_content_given() -> None:
+    # given
+    headers = {"Content-MD5": base64.b64encode(hashlib.md5(b"a").digest()).decode()}
+
+    # when
+    result = get_checksum_from_headers(headers=headers, whole_content=False)
+
+    # then
+    assert result is None
+
+
+def test_checksum_from_string_when_valid_value_given() -> None:
+    # when
+    result = Checksum.from_string("SHA256:ABCD")
+
+    # then
+    assert result == Checksum(algorithm="sha256", hex_digest="abcd")
+
+
+@pytest.mark.parametrize("value", ["abcd", "crc32:abcd", "md5:"])
+def test_checksum_from_string_when_invalid_value_given(value: str) -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = Checksum.from_string(value)
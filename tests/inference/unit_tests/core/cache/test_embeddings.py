@@ -0,0 +1,85 @@
+from typing import List
+
+import numpy as np
+import pytest
+
+from inference.core.cache.embeddings import EmbeddingsCache
+
+
+class _Embedder:
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.calls = []
+
+    def __call__(self, missing: List[int]) -> np.ndarray:
+        self.calls.append([self.texts[i] for i in missing])
+        return np.array([[len(self.texts[i]), 1.0] for i in missing])
+
+
+def test_embeddings_cache_computes_only_missing_embeddings() -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=10)
+    _ = cache.get_or_compute(keys=[("clip/1", "cat")], compute=_Embedder(texts=["cat"]))
+    texts = ["cat", "horse", "cat", "dog"]
+    embedder = _Embedder(texts=texts)
+
+    # when
+    result = cache.get_or_compute(
+        keys=[("clip/1", text) for text in texts], compute=embedder
+    )
+
+    # then
+    assert embedder.calls == [["horse", "dog"]]
+    assert np.allclose(result, np.array([[3, 1], [5, 1], [3, 1], [3, 1]]))
+    assert cache.hits == 2
+    assert cache.misses == 3
+    assert len(cache) == 3
+
+
+def test_embeddings_cache_distinguishes_models() -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=10)
+    _ = cache.get_or_compute(keys=[("clip/1", "cat")], compute=_Embedder(texts=["cat"]))
+    embedder = _Embedder(texts=["cat"])
+
+    # when
+    _ = cache.get_or_compute(keys=[("clip/2", "cat")], compute=embedder)
+
+    # then
+    assert embedder.calls == [["cat"]]
+
+
+def test_embeddings_cache_drops_least_recently_used_entries() -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=2)
+    for text in ["a", "b"]:
+        _ = cache.get_or_compute(keys=[text], compute=_Embedder(texts=[text]))
+    _ = cache.get_or_compute(keys=["a"], compute=_Embedder(texts=["a"]))
+    _ = cache.get_or_compute(keys=["c"], compute=_Embedder(texts=["c"]))
+    embedder = _Embedder(texts=["a", "b"])
+
+    # when
+    _ = cache.get_or_compute(keys=["a", "b"], compute=embedder)
+
+    # then
+    assert embedder.calls == [["b"]]
+
+
+def test_embeddings_cache_when_disabled() -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=0)
+    embedder = _Embedder(texts=["a"])
+
+    # when
+    _ = cache.get_or_compute(keys=["a"], compute=embedder)
+    _ = cache.get_or_compute(keys=["a"], compute=embedder)
+
+    # then
+    assert embedder.calls == [["a"], ["a"]]
+    assert len(cache) == 0
+
+
+def test_embeddings_cache_when_size_is_invalid() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = EmbeddingsCache(max_entries=-1)
@@ -0,0 +1,133 @@
+import time
+from threading import Thread
+
+from inference.core.cache.memory import MemoryCache, SortedSet
+
+
+def test_sorted_set_keeps_members_with_duplicated_scores() -> None:
+    # given
+    sorted_set = SortedSet()
+
+    # when
+    sorted_set.add(value="c", score=3.0)
+    sorted_set.add(value="a", score=1.0)
+    sorted_set.add(value="b1", score=2.0)
+    sorted_set.add(value="b2", score=2.0)
+
+    # then
+    assert sorted_set.range_by_score(min=0, max=10) == [
+        ("a", 1.0),
+        ("b1", 2.0),
+        ("b2", 2.0),
+        ("c", 3.0),
+    ], "Members with the same score expected to be kept in insertion order"
+    assert sorted_set.range_by_score(min=2.0, max=2.0) == [("b1", 2.0), ("b2", 2.0)]
+    assert sorted_set.range_by_score(min=5, max=1) == []
+
+
+def test_sorted_set_remove_specific_member() -> None:
+    # given
+    sorted_set = SortedSet()
+    _ = sorted_set.add(value="first", score=1.0)
+    second = sorted_set.add(value="second", score=1.0)
+
+    # when
+    result = sorted_set.remove(score=1.0, sequence=second)
+    repeated_result = sorted_set.remove(score=1.0, sequence=second)
+
+    # then
+    assert result is True
+    assert repeated_result is False
+    assert sorted_set.range_by_score(min=0, max=2) == [("first", 1.0)]
+
+
+def test_memory_cache_zadd_does_not_overwrite_members_with_the_same_score() -> None:
+    # given
+    cache = MemoryCache()
+
+    # when
+    cache.zadd("key", value={"id": 1}, score=10.0)
+    cache.zadd("key", value={"id": 2}, score=10.0)
+    cache.zadd("key", value={"id": 0}, score=5.0)
+
+    # then
+    assert cache.zrangebyscore("key") == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert cache.zrangebyscore("key", min=6, max=11, withscores=True) == [
+        ({"id": 1}, 10.0),
+        ({"id": 2}, 10.0),
+    ]
+    assert cache.zrangebyscore("other") == []
+
+
+def test_memory_cache_zremrangebyscore() -> None:
+    # given
+    cache = MemoryCache()
+    for score in range(10):
+        cache.zadd("key", value=score, score=score)
+
+    # when
+    result = cache.zremrangebyscore("key", min=2, max=5)
+
+    # then
+    assert result == 4
+    assert cache.zrangebyscore("key") == [0, 1, 6, 7, 8, 9]
+    assert cache.zremrangebyscore("other") == 0
+
+
+def test_memory_cache_expiration_of_keys_and_sorted_set_members() -> None:
+    # given
+    cache = MemoryCache(lock_stripes=2)
+    cache.set("expiring", "value", expire=0.01)
+    cache.set("refreshed", "value", expire=0.01)
+    cache.set("refreshed", "value", expire=100)
+    cache.set("persistent", "value")
+    cache.zadd("zset", value="expiring", score=1.0, expire=0.01)
+    cache.zadd("zset", value="persistent", score=1.0, expire=100)
+    cache.zadd("expiring_zset", value="expiring", score=1.0, expire=0.01)
+
+    # when
+    time.sleep(0.02)
+    cache._remove_expired_entries(now=time.time())
+
+    # then
+    assert "expiring" not in cache.cache
+    assert cache.get("refreshed") == "value"
+    assert cache.get("persistent") == "value"
+    assert cache.zrangebyscore("zset") == ["persistent"]
+    assert "expiring_zset" not in cache.cache
+
+
+def test_memory_cache_get_when_key_expired_before_expiration_loop_run() -> None:
+    # given
+    cache = MemoryCache()
+    cache.set("key", "value", expire=0.01)
+
+    # when
+    time.sleep(0.02)
+    result = cache.get("key")
+
+    # then
+    assert result is None
+
+
+def test_memory_cache_concurrent_zadd() -> None:
+    # given
+    cache = MemoryCache(lock_stripes=4)
+
+    def add_members(thread_id: int) -> None:
+        for i in range(1000):
+            cache.zadd(f"key_{thread_id % 2}", value=(thread_id, i), score=float(i))
+
+    threads = [Thread(target=add_members, args=(i,)) for i in range(8)]
+
+    # when
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then
+    assert len(cache.zrangebyscore("key_0")) == 4000
+    assert len(cache.zrangebyscore("key_1")) == 4000
+    scores = [score for _, score in cache.zrangebyscore("key_0", withscores=True)]
+    assert scores == sorted(scores)
@@ -0,0 +1,327 @@
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from inference.core.cache.tensors import (
+    TensorsCache,
+    estimate_size,
+    numpy_to_tensors,
+    tensors_to_numpy,
+)
+
+
+def test_tensors_cache_evicts_least_recently_used_entries() -> None:
+    # given
+    cache = TensorsCache(name="test/bytes", max_bytes=3 * 400)
+    for key in ["a", "b", "c"]:
+        cache.put(key=key, value=np.zeros((100,), dtype=np.float32))
+    _ = cache.get("a")
+
+    # when
+    cache.put(key="d", value=np.zeros((100,), dtype=np.float32))
+
+    # then
+    assert [key for key, _ in cache.items()] == ["c", "a", "d"]
+    assert "b" not in cache
+    stats = cache.stats()
+    assert stats.size_bytes == 1200
+    assert stats.evictions == 1
+
+
+def test_tensors_cache_evicts_entries_when_max_entries_exceeded() -> None:
+    # given
+    cache = TensorsCache(name="test/entries", max_bytes=10**6, max_entries=2)
+
+    # when
+    for key in ["a", "b", "c"]:
+        cache.put(key=key, value=(np.zeros((2,)), (10, 20)))
+
+    # then
+    assert [key for key, _ in cache.items()] == ["b", "c"]
+    assert cache.get("c")[1] == (10, 20)
+
+
+def test_tensors_cache_accounts_replaced_entries() -> None:
+    # given
+    cache = TensorsCache(name="test/replace", max_bytes=10**6)
+    cache.put(key="a", value=np.zeros((100,), dtype=np.float32))
+
+    # when
+    cache.put(key="a", value={"x": [np.zeros((10,), dtype=np.float32)]})
+
+    # then
+    assert len(cache) == 1
+    assert cache.stats().size_bytes == 40
+
+
+def test_tensors_cache_computes_missing_entries_once() -> None:
+    # given
+    cache = TensorsCache(name="test/compute", max_bytes=10**6)
+    calls = []
+
+    def compute() -> np.ndarray:
+        calls.append(1)
+        return np.ones((3,))
+
+    # when
+    first = cache.get_or_compute(key="a", compute=compute)
+    second = cache.get_or_compute(key="a", compute=compute)
+
+    # then
+    assert len(calls) == 1
+    assert first is second
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_tensors_cache_coalesces_concurrent_computations_of_the_same_key() -> None:
+    # given
+    cache = TensorsCache(name="test/coalesce", max_bytes=10**6)
+    calls = []
+    results = []
+
+    def compute() -> np.ndarray:
+        calls.append(1)
+        time.sleep(0.1)
+        return np.ones((3,))
+
+    def request() -> None:
+        results.append(cache.get_or_compute(key="a", compute=compute))
+
+    # when
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then
+    assert len(calls) == 1
+    assert len(results) == 4
+    assert cache.stats().coalesced == 3
+
+
+def test_tensors_cache_computes_missing_entries_of_batch_in_single_call() -> None:
+    # given
+    cache = TensorsCache(name="test/compute-many", max_bytes=10**6)
+    cache.put(key="a", value=np.zeros((3,)))
+    calls = []
+
+    def compute(keys: list) -> list:
+        calls.append(keys)
+        return [np.full((3,), i + 1) for i, _ in enumerate(keys)]
+
+    # when
+    result = cache.get_or_compute_many(keys=["a", "b", "c", "b"], compute=compute)
+
+    # then
+    assert calls == [["b", "c"]]
+    assert [value[0] for value in result] == [0, 1, 2, 1]
+    assert "b" in cache and "c" in cache
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_tensors_cache_coalesces_concurrent_batch_computations() -> None:
+    # given
+    cache = TensorsCache(name="test/coalesce-many", max_bytes=10**6)
+    computed_keys = []
+    results = []
+
+    def compute(keys: list) -> list:
+        computed_keys.extend(keys)
+        time.sleep(0.1)
+        return [np.ones((3,)) for _ in keys]
+
+    def request(keys: list) -> None:
+        results.append(cache.get_or_compute_many(keys=keys, compute=compute))
+
+    # when
+    threads = [
+        threading.Thread(target=request, args=(keys,))
+        for keys in [["a", "b"], ["b", "a"], ["a", "c"], ["c", "b"]]
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then
+    assert sorted(computed_keys) == ["a", "b", "c"]
+    assert len(results) == 4
+    assert all(len(result) == 2 for result in results)
+
+
+def test_tensors_cache_propagates_error_of_computation_to_waiting_requests() -> None:
+    # given
+    cache = TensorsCache(name="test/error", max_bytes=10**6)
+
+    def compute() -> np.ndarray:
+        raise RuntimeError()
+
+    # when
+    with pytest.raises(RuntimeError):
+        _ = cache.get_or_compute(key="a", compute=compute)
+
+    # then
+    assert "a" not in cache
+    assert cache.get_or_compute(key="a", compute=lambda: np.ones((1,))) is not None
+
+
+def test_tensors_cache_restores_evicted_entries_from_spill(
+    empty_local_dir: str,
+) -> None:
+    # given
+    cache = TensorsCache(
+        name="sam/vit_h/embeddings",
+        max_bytes=10**6,
+        max_entries=1,
+        spill_dir=empty_local_dir,
+        spill_max_bytes=10**6,
+    )
+    embedding = np.random.random((4, 8)).astype(np.float32)
+    cache.put(key="a", value=(embedding, (10, 20)))
+
+    # when
+    cache.put(key="b", value=(np.zeros((4, 8), dtype=np.float32), (1, 1)))
+    result = cache.get_or_compute(key="a", compute=lambda: pytest.fail("computed"))
+
+    # then
+    restored_embedding, image_size = result
+    assert restored_embedding.dtype == np.float32
+    assert np.allclose(restored_embedding, embedding, atol=1e-3)
+    assert image_size == (10, 20)
+    stats = cache.stats()
+    assert stats.spill_hits == 1
+    assert stats.spilled_entries == 2
+    assert stats.spilled_bytes == 2 * 4 * 8 * 2
+
+
+def test_tensors_cache_drops_spilled_entries_exceeding_spill_bound(
+    empty_local_dir: str,
+) -> None:
+    # given
+    cache = TensorsCache(
+        name="test/spill-bound",
+        max_bytes=0,
+        spill_dir=empty_local_dir,
+        spill_max_bytes=2 * 64,
+    )
+
+    # when
+    for key in ["a", "b", "c"]:
+        cache.put(key=key, value=np.zeros((32,), dtype=np.float32))
+
+    # then
+    assert "a" not in cache
+    assert "b" in cache and "c" in cache
+    spill_directory = os.path.join(empty_local_dir, os.listdir(empty_local_dir)[0])
+    assert len(os.listdir(spill_directory)) == 2
+
+
+def test_tensors_cache_with_persistent_spill_restores_entries_after_restart(
+    empty_local_dir: str,
+) -> None:
+    # given
+    embedding = np.random.random((4, 8)).astype(np.float32)
+    cache = TensorsCache(
+        name="owlv2/image_embeddings",
+        max_bytes=10**6,
+        spill_dir=empty_local_dir,
+        spill_max_bytes=10**6,
+        spill_persistent=True,
+    )
+    cache.put(key="a", value={"embedding": embedding, "size": 10})
+    del cache
+
+    # when
+    restarted_cache = TensorsCache(
+        name="owlv2/image_embeddings",
+        max_bytes=10**6,
+        spill_dir=empty_local_dir,
+        spill_max_bytes=10**6,
+        spill_persistent=True,
+    )
+    result = restarted_cache.get_or_compute(
+        key="a", compute=lambda: pytest.fail("computed")
+    )
+
+    # then
+    assert result["size"] == 10
+    assert result["embedding"].dtype == np.float32
+    assert np.allclose(result["embedding"], embedding, atol=1e-3)
+    assert restarted_cache.stats().spill_hits == 1
+
+
+def test_tensors_cache_with_persistent_spill_keeps_spill_within_bound(
+    empty_local_dir: str,
+) -> None:
+    # given
+    cache = TensorsCache(
+        name="test/persistent",
+        max_bytes=10**6,
+        spill_dir=empty_local_dir,
+        spill_max_bytes=2 * 64,
+        spill_persistent=True,
+    )
+
+    # when
+    for key in ["a", "b", "c"]:
+        cache.put(key=key, value=np.zeros((32,), dtype=np.float32))
+    restarted_cache = TensorsCache(
+        name="test/persistent",
+        max_bytes=10**6,
+        spill_dir=empty_local_dir,
+        spill_max_bytes=64,
+        spill_persistent=True,
+    )
+
+    # then
+    assert "a" not in restarted_cache
+    assert "b" not in restarted_cache
+    assert "c" in restarted_cache
+    spill_directory = os.path.join(empty_local_dir, "test_persistent")
+    assert sorted(
+        os.path.splitext(file_name)[1] for file_name in os.listdir(spill_directory)
+    ) == [".json", ".npy"]
+
+
+def test_tensors_cache_rejects_negative_bounds() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = TensorsCache(name="test/invalid", max_bytes=-1)
+
+
+def test_estimate_size_of_nested_values() -> None:
+    # given
+    value = {
+        "image_embed": np.zeros((2, 2), dtype=np.float32),
+        "high_res_feats": [np.zeros((4,), dtype=np.float16), np.zeros((1,))],
+        "size": (10, 20),
+    }
+
+    # when
+    result = estimate_size(value)
+
+    # then
+    assert result == 16 + 8 + 8
+
+
+def test_tensors_to_numpy_and_back() -> None:
+    # given
+    torch = pytest.importorskip("torch")
+    value = (torch.ones((2, 3), dtype=torch.float16), {"size": 10})
+
+    # when
+    on_host = tensors_to_numpy(value)
+    result = numpy_to_tensors(list(on_host), device="cpu")
+
+    # then
+    assert isinstance(on_host[0], np.ndarray)
+    assert on_host[0].dtype == np.float32
+    assert isinstance(result[0], torch.Tensor)
+    assert torch.equal(result[0], torch.ones((2, 3)))
+    assert result[1] == {"size": 10}
@@ -0,0 +1,273 @@
+import os
+from threading import Thread
+
+import numpy as np
+import pytest
+
+from inference.core.embedding_index.collection import EmbeddingCollection
+from inference.core.embedding_index.index import EmbeddingIndex
+from inference.core.embedding_index.storage import VectorsStorage
+from inference.core.exceptions import (
+    EmbeddingCollectionNotFoundError,
+    InvalidEmbeddingIndexRequestError,
+)
+
+
+def _create_collection(
+    directory: str, dimension: int = 8, ivf_min_vectors: int = 10000
+) -> EmbeddingCollection:
+    storage = VectorsStorage.create(
+        directory=os.path.join(directory, "collection"),
+        dimension=dimension,
+        model_id="clip/1",
+    )
+    return EmbeddingCollection(
+        name="collection",
+        storage=storage,
+        ivf_lists=16,
+        ivf_probes=4,
+        ivf_min_vectors=ivf_min_vectors,
+    )
+
+
+def test_collection_search_returns_most_similar_embeddings(
+    empty_local_dir: str,
+) -> None:
+    # given
+    collection = _create_collection(directory=empty_local_dir, dimension=2)
+    collection.add(
+        ids=["right", "up", "diagonal"],
+        embeddings=np.array([[2.0, 0.0], [0.0, 3.0], [1.0, 1.0]]),
+    )
+
+    # when
+    result = collection.search(embeddings=np.array([1.0, 0.1]), top_k=2)
+
+    # then
+    assert len(result) == 1
+    assert [match.id for match in result[0]] == ["right", "diagonal"]
+    assert abs(result[0][0].similarity - 0.995) < 1e-3
+
+
+def test_collection_search_respects_min_similarity(empty_local_dir: str) -> None:
+    # given
+    collection = _create_collection(directory=empty_local_dir, dimension=2)
+    collection.add(
+        ids=["right", "up"],
+        embeddings=np.array([[1.0, 0.0], [0.0, 1.0]]),
+    )
+
+    # when
+    result = collection.search(
+        embeddings=np.array([1.0, 0.0]), top_k=2, min_similarity=0.5
+    )
+
+    # then
+    assert [match.id for match in result[0]] == ["right"]
+
+
+def test_collection_search_skips_deleted_and_replaced_embeddings(
+    empty_local_dir: str,
+) -> None:
+    # given
+    collection = _create_collection(directory=empty_local_dir, dimension=2)
+    collection.add(
+        ids=["a", "b", "c"],
+        embeddings=np.array([[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]]),
+    )
+    _ = collection.search(embeddings=np.array([1.0, 0.0]))
+
+    # when
+    collection.delete(ids=["a"])
+    collection.add(ids=["b"], embeddings=np.array([[0.0, 1.0]]))
+    result = collection.search(embeddings=np.array([1.0, 0.0]), top_k=3)
+
+    # then
+    assert len(collection) == 2
+    assert sorted(match.id for match in result[0]) == ["b", "c"]
+    assert all(abs(match.similarity) < 1e-3 for match in result[0])
+
+
+def test_collection_add_rejects_duplicated_ids(empty_local_dir: str) -> None:
+    # given
+    collection = _create_collection(directory=empty_local_dir, dimension=2)
+
+    # when
+    with pytest.raises(InvalidEmbeddingIndexRequestError):
+        collection.add(ids=["a", "a"], embeddings=np.ones((2, 2)))
+
+
+def test_collection_search_rejects_queries_of_invalid_dimension(
+    empty_local_dir: str,
+) -> None:
+    # given
+    collection = _create_collection(directory=empty_local_dir, dimension=2)
+
+    # when
+    with pytest.raises(InvalidEmbeddingIndexRequestError):
+        _ = collection.search(embeddings=np.ones((1, 3)))
+
+
+def test_collection_approximate_search_finds_nearest_neighbours_of_large_collection(
+    empty_local_dir: str,
+) -> None:
+    # given
+    random_state = np.random.RandomState(42)
+    clusters = random_state.normal(size=(16, 8))
+    embeddings = np.repeat(clusters, 64, axis=0) + 0.05 * random_state.normal(
+        size=(1024, 8)
+    )
+    collection = _create_collection(directory=empty_local_dir, ivf_min_vectors=512)
+    collection.add(ids=[str(i) for i in range(1024)], embeddings=embeddings)
+    queries = embeddings[::97]
+
+    # when
+    approximate = collection.search(embeddings=queries, top_k=5)
+    exact = collection.search(embeddings=queries, top_k=5, exact=True)
+
+    # then
+    assert len(collection._index.lists_sizes()) == 16
+    for approximate_matches, exact_matches in zip(approximate, exact):
+        assert approximate_matches[0] == exact_matches[0]
+        assert approximate_matches[0].similarity > 0.999
+
+
+def test_index_reopens_persisted_collection(empty_local_dir: str) -> None:
+    # given
+    index = EmbeddingIndex(root_dir=empty_local_dir)
+    collection = index.get_or_create_collection(
+        name="frames", model_id="clip/1", dimension=2
+    )
+    collection.add(ids=["a"], embeddings=np.array([[1.0, 0.0]]))
+    collection.close()
+
+    # when
+    result = EmbeddingIndex(root_dir=empty_local_dir).get_collection(name="frames")
+
+    # then
+    assert result.ids() == ["a"]
+    assert result.search(embeddings=np.array([1.0, 0.0]))[0][0].id == "a"
+    assert index.list_collections() == ["frames"]
+
+
+def test_index_rejects_collection_of_other_model(empty_local_dir: str) -> None:
+    # given
+    index = EmbeddingIndex(root_dir=empty_local_dir)
+    _ = index.get_or_create_collection(name="frames", model_id="clip/1", dimension=2)
+
+    # when
+    with pytest.raises(InvalidEmbeddingIndexRequestError):
+        _ = index.get_or_create_collection(
+            name="frames", model_id="clip/2", dimension=2
+        )
+
+
+def test_index_rejects_invalid_collection_name(empty_local_dir: str) -> None:
+    # given
+    index = EmbeddingIndex(root_dir=empty_local_dir)
+
+    # when
+    with pytest.raises(InvalidEmbeddingIndexRequestError):
+        _ = index.get_or_create_collection(
+            name="../frames", model_id="clip/1", dimension=2
+        )
+
+
+def test_index_rejects_collection_name_with_trailing_newline(
+    empty_local_dir: str,
+) -> None:
+    # given
+    index = EmbeddingIndex(root_dir=empty_local_dir)
+
+    # when
+    with pytest.raises(InvalidEmbeddingIndexRequestError):
+        _ = index.get_or_create_collection(
+            name="frames\n", model_id="clip/1", dimension=2
+        )
+    with pytest.raises(InvalidEmbeddingIndexRequestError):
+        _ = index.get_collection(name="frames", namespace="workspace\n")
+
+
+def test_index_raises_when_collection_does_not_exist(empty_local_dir: str) -> None:
+    # given
+    index = EmbeddingIndex(root_dir=empty_local_dir)
+
+    # when
+    with pytest.raises(EmbeddingCollectionNotFoundError):
+        _ = index.get_collection(name="frames")
+
+
+def test_index_drops_collection(empty_local_dir: str) -> None:
+    # given
+    index = EmbeddingIndex(root_dir=empty_local_dir)
+    _ = index.get_or_create_collection(name="frames", model_id="clip/1", dimension=2)
+
+    # when
+    index.drop_collection(name="frames")
+
+    # then
+    assert index.list_collections() == []
+    with pytest.raises(EmbeddingCollectionNotFoundError):
+        _ = index.get_collection(name="frames")
+
+
+def test_index_drops_collection_once_operations_in_flight_are_finished(
+    empty_local_dir: str,
+) -> None:
+    # given
+    index = EmbeddingIndex(root_dir=empty_local_dir)
+    collection = index.get_or_create_collection(
+        name="frames", model_id="clip/1", dimension=2
+    )
+    collection.add(ids=["a"], embeddings=np.array([[1.0, 0.0]]))
+    drop_thread = Thread(target=index.drop_collection, kwargs={"name": "frames"})
+
+    # when
+    with collection._lock:
+        # operation in flight
+        drop_thread.start()
+        drop_thread.join(timeout=0.1)
+        dropped_during_operation = not drop_thread.is_alive()
+        result = collection.search(embeddings=np.array([1.0, 0.0]))
+    drop_thread.join()
+
+    # then
+    assert dropped_during_operation is False
+    assert [[match.id for match in matches] for matches in result] == [["a"]]
+    assert index.list_collections() == []
+    with pytest.raises(EmbeddingCollectionNotFoundError):
+        _ = collection.search(embeddings=np.array([1.0, 0.0]))
+
+
+def test_index_separates_collections_of_different_namespaces(
+    empty_local_dir: str,
+) -> None:
+    # given
+    index = EmbeddingIndex(root_dir=empty_local_dir)
+    collection = index.get_or_create_collection(
+        name="frames", model_id="clip/1", dimension=2, namespace="workspace-a"
+    )
+    collection.add(ids=["a"], embeddings=np.array([[1.0, 0.0]]))
+
+    # when
+    with pytest.raises(EmbeddingCollectionNotFoundError):
+        _ = index.get_collection(name="frames", namespace="workspace-b")
+    with pytest.raises(EmbeddingCollectionNotFoundError):
+        _ = index.get_collection(name="frames")
+    result = EmbeddingIndex(root_dir=empty_local_dir).get_collection(
+        name="frames", namespace="workspace-a"
+    )
+
+    # then
+    assert result.ids() == ["a"]
+    assert index.list_collections(namespace="workspace-a") == ["frames"]
+    assert index.list_collections() == []
+
+
+def test_index_rejects_invalid_namespace(empty_local_dir: str) -> None:
+    # given
+    index = EmbeddingIndex(root_dir=empty_local_dir)
+
+    # when
+    with pytest.raises(InvalidEmbeddingIndexRequestError):
+        _ = index.get_collection(name="frames", namespace="../workspace")
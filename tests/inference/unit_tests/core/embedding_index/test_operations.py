@@ -0,0 +1,31 @@
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+
+from inference.core.embedding_index import operations
+from inference.core.embedding_index.operations import get_collections_namespace
+from inference.core.exceptions import MissingApiKeyError
+
+
+def test_get_collections_namespace_when_api_key_is_missing() -> None:
+    # when
+    with pytest.raises(MissingApiKeyError):
+        _ = get_collections_namespace(api_key=None)
+
+
+@mock.patch.object(operations, "get_roboflow_workspace")
+def test_get_collections_namespace_resolves_workspace_of_api_key_once(
+    get_roboflow_workspace_mock: MagicMock,
+) -> None:
+    # given
+    get_roboflow_workspace_mock.return_value = "my-workspace"
+
+    # when
+    results = [
+        get_collections_namespace(api_key="namespace-test-key") for _ in range(2)
+    ]
+
+    # then
+    assert results == ["my-workspace", "my-workspace"]
+    get_roboflow_workspace_mock.assert_called_once_with(api_key="namespace-test-key")
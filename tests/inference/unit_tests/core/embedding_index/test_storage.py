@@ -0,0 +1,89 @@
+import os
+
+import numpy as np
+
+from inference.core.embedding_index.storage import IDS_LOG_FILE, VectorsStorage
+
+
+def test_storage_persists_vectors_and_ids(empty_local_dir: str) -> None:
+    # given
+    directory = os.path.join(empty_local_dir, "collection")
+    storage = VectorsStorage.create(directory=directory, dimension=2, model_id="clip/1")
+    storage.add(ids=["a", "b"], vectors=np.array([[1.0, 0.0], [0.0, 1.0]]))
+    storage.close()
+
+    # when
+    result = VectorsStorage.open(directory=directory)
+
+    # then
+    assert result.model_id == "clip/1"
+    assert result.dimension == 2
+    assert result.ids() == ["a", "b"]
+    assert np.allclose(result.vectors, [[1.0, 0.0], [0.0, 1.0]])
+
+
+def test_storage_replaces_vectors_of_existing_ids(empty_local_dir: str) -> None:
+    # given
+    directory = os.path.join(empty_local_dir, "collection")
+    storage = VectorsStorage.create(directory=directory, dimension=2, model_id="clip/1")
+    storage.add(ids=["a", "b"], vectors=np.array([[1.0, 0.0], [0.0, 1.0]]))
+
+    # when
+    storage.add(ids=["a"], vectors=np.array([[0.0, 1.0]]))
+
+    # then
+    assert storage.size == 2
+    assert storage.rows == 3
+    assert storage.alive.tolist() == [False, True, True]
+    assert storage.row_id(2) == "a"
+
+
+def test_storage_deletes_ids_persistently(empty_local_dir: str) -> None:
+    # given
+    directory = os.path.join(empty_local_dir, "collection")
+    storage = VectorsStorage.create(directory=directory, dimension=2, model_id="clip/1")
+    storage.add(ids=["a", "b"], vectors=np.array([[1.0, 0.0], [0.0, 1.0]]))
+
+    # when
+    deleted = storage.delete(ids=["a", "unknown"])
+    storage.close()
+    result = VectorsStorage.open(directory=directory)
+
+    # then
+    assert deleted == 1
+    assert result.ids() == ["b"]
+    assert "a" not in result
+
+
+def test_storage_compaction_drops_dead_rows(empty_local_dir: str) -> None:
+    # given
+    directory = os.path.join(empty_local_dir, "collection")
+    storage = VectorsStorage.create(directory=directory, dimension=2, model_id="clip/1")
+    storage.add(ids=["a", "b", "c"], vectors=np.eye(3)[:, :2])
+    storage.delete(ids=["a"])
+
+    # when
+    storage.compact()
+    storage.close()
+    result = VectorsStorage.open(directory=directory)
+
+    # then
+    assert result.rows == 2
+    assert result.ids() == ["b", "c"]
+    assert np.allclose(result.vectors, [[0.0, 1.0], [0.0, 0.0]])
+
+
+def test_storage_ignores_torn_last_line_of_ids_log(empty_local_dir: str) -> None:
+    # given
+    directory = os.path.join(empty_local_dir, "collection")
+    storage = VectorsStorage.create(directory=directory, dimension=2, model_id="clip/1")
+    storage.add(ids=["a"], vectors=np.array([[1.0, 0.0]]))
+    storage.close()
+    with open(os.path.join(directory, IDS_LOG_FILE), "a") as f:
+        f.write('["add", "b"')
+
+    # when
+    result = VectorsStorage.open(directory=directory)
+
+    # then
+    assert result.ids() == ["a"]
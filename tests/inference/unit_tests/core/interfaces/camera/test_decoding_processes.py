@@ -0,0 +1,190 @@
+import numpy as np
+import pytest
+
+from inference.core.interfaces.camera.decoding_processes import (
+    SharedMemoryFrameRing,
+    VideoDecodingProcessPool,
+    load_frame_from_shared_memory,
+)
+from inference.core.interfaces.camera.exceptions import (
+    DecodingWorkerError,
+    SourceConnectionError,
+)
+from inference.core.interfaces.camera.utils import multiplex_videos
+from inference.core.interfaces.camera.video_source import (
+    CV2VideoFrameProducer,
+    VideoFrameProducerBackend,
+    VideoSource,
+)
+
+
+def test_shared_memory_frame_ring_round_trip() -> None:
+    # given
+    ring = SharedMemoryFrameRing.create(slot_size=3 * 4 * 3, slots=2)
+    first_image = np.ones((3, 4, 3), dtype=np.uint8)
+    second_image = np.ones((2, 4, 3), dtype=np.uint8) * 2
+
+    try:
+        # when
+        first_metadata = ring.write(image=first_image)
+        second_metadata = ring.write(image=second_image)
+        first_result = load_frame_from_shared_memory(
+            shm=ring._shm, metadata=first_metadata
+        )
+        second_result = load_frame_from_shared_memory(
+            shm=ring._shm, metadata=second_metadata
+        )
+    finally:
+        ring.release()
+
+    # then
+    assert first_metadata.slot == 0, "First frame must land in first slot"
+    assert second_metadata.slot == 1, "Second frame must land in second slot"
+    assert np.allclose(first_result, first_image)
+    assert np.allclose(second_result, second_image)
+
+
+def test_shared_memory_frame_ring_fits() -> None:
+    # given
+    ring = SharedMemoryFrameRing.create(slot_size=12, slots=1)
+
+    try:
+        # when
+        fitting = ring.fits(image=np.zeros((2, 2, 3), dtype=np.uint8))
+        not_fitting = ring.fits(image=np.zeros((3, 2, 3), dtype=np.uint8))
+    finally:
+        ring.release()
+
+    # then
+    assert fitting is True
+    assert not_fitting is False
+
+
+def test_video_decoding_process_pool_init_when_invalid_number_of_workers_given() -> (
+    None
+):
+    # when
+    with pytest.raises(ValueError):
+        _ = VideoDecodingProcessPool.init(workers=0)
+
+
+@pytest.mark.timeout(90)
+def test_video_decoding_process_pool_decodes_the_same_frames_as_in_process_decoding(
+    local_video_path: str,
+) -> None:
+    # given
+    pool = VideoDecodingProcessPool.init(workers=1)
+    expected_producer = CV2VideoFrameProducer(local_video_path)
+
+    try:
+        # when
+        producer = pool.create_producer(video_reference=local_video_path)
+        properties = producer.discover_source_properties()
+        results = []
+        for _ in range(5):
+            assert producer.grab() is True
+            results.append(producer.retrieve())
+        producer.release()
+    finally:
+        pool.shutdown()
+
+    # then
+    assert properties == expected_producer.discover_source_properties()
+    for success, image in results:
+        assert success is True
+        _ = expected_producer.grab()
+        _, expected_image = expected_producer.retrieve()
+        assert np.allclose(image, expected_image)
+    expected_producer.release()
+
+
+@pytest.mark.timeout(90)
+def test_video_source_consumes_video_decoded_in_worker_processes(
+    local_video_path: str,
+) -> None:
+    # given
+    pool = VideoDecodingProcessPool.init(workers=2)
+    sources = [
+        VideoSource.init(
+            video_reference=pool.producer_factory(video_reference=local_video_path),
+            source_id=i,
+        )
+        for i in range(2)
+    ]
+
+    try:
+        # when
+        for source in sources:
+            source.start()
+        frames_by_source = {0: 0, 1: 0}
+        for batch in multiplex_videos(videos=sources):
+            for frame in batch:
+                frames_by_source[frame.source_id] += 1
+        metadata = sources[0].describe_source()
+    finally:
+        pool.shutdown()
+
+    # then
+    assert frames_by_source == {
+        0: 431,
+        1: 431,
+    }, "All frames of video file must be consumed from both sources"
+    assert metadata.source_reference == local_video_path
+
+
+@pytest.mark.timeout(90)
+def test_video_source_fails_to_start_when_worker_cannot_open_source() -> None:
+    # given
+    pool = VideoDecodingProcessPool.init(workers=1)
+    source = VideoSource.init(
+        video_reference=pool.producer_factory(video_reference="/invalid/video.mp4")
+    )
+
+    try:
+        # when
+        with pytest.raises(SourceConnectionError):
+            source.start()
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.timeout(90)
+def test_video_decoding_process_pool_does_not_create_producers_after_shutdown(
+    local_video_path: str,
+) -> None:
+    # given
+    pool = VideoDecodingProcessPool.init(workers=1)
+    pool.shutdown()
+
+    # when
+    with pytest.raises(DecodingWorkerError):
+        _ = pool.create_producer(video_reference=local_video_path)
+
+
+@pytest.mark.timeout(90)
+def test_video_decoding_process_pool_passes_presentation_timestamps_of_pyav_producer(
+    local_video_path: str,
+) -> None:
+    # given
+    pool = VideoDecodingProcessPool.init(workers=1)
+
+    try:
+        # when
+        producer = pool.create_producer(
+            video_reference=local_video_path,
+            backend=VideoFrameProducerBackend.PYAV,
+        )
+        timestamps = []
+        for _ in range(3):
+            assert producer.grab() is True
+            timestamps.append(producer.retrieve_presentation_timestamp())
+        success, image = producer.retrieve()
+        producer.release()
+    finally:
+        pool.shutdown()
+
+    # then
+    assert success is True
+    assert image.shape == (240, 426, 3)
+    assert all(timestamp is not None for timestamp in timestamps)
+    assert abs((timestamps[2] - timestamps[0]).total_seconds() - 2 / 30) < 1e-3
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from inference.core.interfaces.camera.frames_registry import (
+    FullResolutionFramesRegistry,
+)
+
+
+def test_full_resolution_frames_registry_when_invalid_capacity_given() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = FullResolutionFramesRegistry(capacity=0)
+
+
+def test_full_resolution_frames_registry_retains_only_requested_frames() -> None:
+    # given
+    registry = FullResolutionFramesRegistry(capacity=4)
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+    registry.request(source_id=1, frames=2)
+
+    # when
+    offer_results = [
+        registry.offer(source_id=1, frame_id=i, image=image) for i in range(3)
+    ]
+    other_source_result = registry.offer(source_id=2, frame_id=0, image=image)
+
+    # then
+    assert offer_results == [True, True, False]
+    assert other_source_result is False
+    assert registry.pending_requests(source_id=1) == 0
+    assert registry.retrieve(source_id=1, frame_id=0) is image
+    assert registry.retrieve(source_id=1, frame_id=1) is image
+    assert registry.retrieve(source_id=1, frame_id=2) is None
+    assert (
+        registry.retrieve(source_id=1, frame_id=0) is None
+    ), "Frame can only be retrieved once"
+
+
+def test_full_resolution_frames_registry_drops_oldest_frames_above_capacity() -> None:
+    # given
+    registry = FullResolutionFramesRegistry(capacity=2)
+    registry.request(source_id=None, frames=3)
+
+    # when
+    for i in range(3):
+        registry.offer(source_id=None, frame_id=i, image=np.ones((2, 2)) * i)
+
+    # then
+    assert registry.retrieve(source_id=None, frame_id=0) is None
+    assert registry.retrieve(source_id=None, frame_id=1) is not None
+    assert registry.retrieve(source_id=None, frame_id=2) is not None
@@ -0,0 +1,112 @@
+import numpy as np
+
+from inference.core.interfaces.camera.pyav_producer import PyAVVideoFrameProducer
+from inference.core.interfaces.camera.utils import get_video_frames_generator
+from inference.core.interfaces.camera.video_source import (
+    CV2VideoFrameProducer,
+    VideoFrameProducerBackend,
+    VideoSource,
+)
+
+
+def test_pyav_producer_discover_source_properties_when_local_file_given(
+    local_video_path: str,
+) -> None:
+    # given
+    producer = PyAVVideoFrameProducer(local_video_path)
+
+    # when
+    result = producer.discover_source_properties()
+    producer.release()
+
+    # then
+    assert result.width == 426
+    assert result.height == 240
+    assert result.total_frames == 431
+    assert result.is_file is True
+    assert abs(result.fps - 30) < 1e-5
+
+
+def test_pyav_producer_when_invalid_video_reference_given() -> None:
+    # given
+    producer = PyAVVideoFrameProducer("/invalid/video.mp4")
+
+    # when
+    is_opened = producer.isOpened()
+    grab_result = producer.grab()
+    retrieve_result = producer.retrieve()
+
+    # then
+    assert is_opened is False
+    assert grab_result is False
+    assert retrieve_result == (False, None)
+
+
+def test_pyav_producer_decodes_frames_close_to_cv2_producer(
+    local_video_path: str,
+) -> None:
+    # given
+    producer = PyAVVideoFrameProducer(local_video_path, codec_threads=2)
+    expected_producer = CV2VideoFrameProducer(local_video_path)
+
+    # when
+    results = []
+    for _ in range(5):
+        assert producer.grab() is True
+        results.append(producer.retrieve())
+    producer.release()
+
+    # then
+    for success, image in results:
+        assert success is True
+        _ = expected_producer.grab()
+        _, expected_image = expected_producer.retrieve()
+        assert image.shape == expected_image.shape
+        difference = np.abs(image.astype(np.int16) - expected_image.astype(np.int16))
+        assert difference.mean() < 3, "Colour conversion may differ only slightly"
+    expected_producer.release()
+
+
+def test_pyav_producer_reports_monotonic_presentation_timestamps(
+    local_video_path: str,
+) -> None:
+    # given
+    producer = PyAVVideoFrameProducer(local_video_path)
+
+    # when
+    timestamps = []
+    while producer.grab():
+        timestamps.append(producer.retrieve_presentation_timestamp())
+    producer.release()
+
+    # then
+    assert len(timestamps) == 431
+    differences = [
+        (second - first).total_seconds()
+        for first, second in zip(timestamps, timestamps[1:])
+    ]
+    assert all(
+        abs(difference - 1 / 30) < 1e-3 for difference in differences
+    ), "Timestamps must follow 30fps PTS of video file"
+
+
+def test_video_source_with_pyav_backend_consumes_all_frames_with_pts_timestamps(
+    local_video_path: str,
+) -> None:
+    # given
+    source = VideoSource.init(
+        video_reference=local_video_path,
+        frame_producer_backend=VideoFrameProducerBackend.PYAV,
+    )
+
+    # when
+    source.start()
+    frames = list(get_video_frames_generator(video=source))
+    source.terminate()
+
+    # then
+    assert len(frames) == 431
+    assert frames[0].image.shape == (240, 426, 3)
+    assert [f.frame_id for f in frames] == list(range(1, 432))
+    elapsed = (frames[-1].frame_timestamp - frames[0].frame_timestamp).total_seconds()
+    assert abs(elapsed - 430 / 30) < 1e-3, "Timestamps must be taken from PTS"
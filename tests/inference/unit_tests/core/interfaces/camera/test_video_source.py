@@ -20,6 +20,9 @@ from inference.core.interfaces.camera.exceptions import (
     SourceConnectionError,
     StreamOperationNotAllowedError,
 )
+from inference.core.interfaces.camera.frames_registry import (
+    FullResolutionFramesRegistry,
+)
 from inference.core.interfaces.camera.video_source import (
     BufferConsumptionStrategy,
     BufferFillingStrategy,
@@ -30,6 +33,7 @@ from inference.core.interfaces.camera.video_source import (
     VideoConsumer,
     VideoSource,
     decode_video_frame_to_buffer,
+    downscale_frame,
     drop_single_frame_from_buffer,
     get_fps_if_tick_happens_now,
     get_from_queue,
@@ -739,6 +743,83 @@ def test_decode_video_frame_to_buffer_when_frame_could_be_retrieved() -> None:
     ), "Decoded frame must be saved into buffer"
 
 
+def test_decode_video_frame_to_buffer_when_frame_max_dimension_is_exceeded() -> None:
+    # given
+    video = MagicMock()
+    image = np.zeros((200, 400, 3), dtype=np.uint8)
+    video.retrieve.return_value = (True, image)
+    fps_monitor = sv.FPSMonitor()
+    buffer = Queue()
+    registry = FullResolutionFramesRegistry(capacity=2)
+    registry.request(source_id=3)
+
+    # when
+    result = decode_video_frame_to_buffer(
+        frame_timestamp=datetime.now(),
+        frame_id=1,
+        video=video,
+        buffer=buffer,
+        decoding_pace_monitor=fps_monitor,
+        source_id=3,
+        frame_max_dimension=100,
+        full_resolution_frames_registry=registry,
+    )
+
+    # then
+    assert result is True, "Success status on decoding must be denoted"
+    video_frame = buffer.get_nowait()
+    assert video_frame.image.shape == (50, 100, 3), "Frame must be downscaled"
+    assert abs(video_frame.scaling_factor - 0.25) < 1e-5
+    assert (
+        registry.retrieve(source_id=3, frame_id=1) is image
+    ), "Requested frame must be retained in original resolution"
+
+
+def test_decode_video_frame_to_buffer_when_frame_max_dimension_is_not_exceeded() -> (
+    None
+):
+    # given
+    video = MagicMock()
+    image = np.zeros((200, 400, 3), dtype=np.uint8)
+    video.retrieve.return_value = (True, image)
+    fps_monitor = sv.FPSMonitor()
+    buffer = Queue()
+    registry = FullResolutionFramesRegistry(capacity=2)
+
+    # when
+    result = decode_video_frame_to_buffer(
+        frame_timestamp=datetime.now(),
+        frame_id=1,
+        video=video,
+        buffer=buffer,
+        decoding_pace_monitor=fps_monitor,
+        source_id=3,
+        frame_max_dimension=400,
+        full_resolution_frames_registry=registry,
+    )
+
+    # then
+    assert result is True, "Success status on decoding must be denoted"
+    video_frame = buffer.get_nowait()
+    assert video_frame.image is image, "Frame must not be copied"
+    assert video_frame.scaling_factor is None
+    assert (
+        registry.retrieve(source_id=3, frame_id=1) is None
+    ), "Frame not requested must not be retained"
+
+
+def test_downscale_frame_keeps_aspect_ratio() -> None:
+    # given
+    image = np.zeros((2160, 3840, 3), dtype=np.uint8)
+
+    # when
+    result, scaling_factor = downscale_frame(image=image, max_dimension=640)
+
+    # then
+    assert result.shape == (360, 640, 3)
+    assert abs(scaling_factor - 1 / 6) < 1e-5
+
+
 def test_stream_consumption_when_frame_cannot_be_grabbed() -> None:
     # given
     consumer = VideoConsumer.init(
@@ -1,10 +1,13 @@
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 
 from inference.core.exceptions import InferenceModelNotFound
+from inference.core.managers import base
 from inference.core.managers.base import ModelManager
 from inference.core.managers.entities import ModelDescription
+from inference.core.managers.inference_metrics import inference_metrics
 
 
 def test_add_model_when_model_already_loaded() -> None:
@@ -102,6 +105,55 @@ async def test_infer_from_request_when_model_is_available_but_exception_raised()
     model_manager._models["some/1"].infer_from_request.assert_called_once_with(request)
 
 
+@pytest.mark.asyncio
+async def test_infer_from_request_records_inference_metrics() -> None:
+    # given
+    model_registry = MagicMock()
+    model_manager = ModelManager(model_registry=model_registry)
+    model_mock = MagicMock()
+    model_mock.infer_from_request.side_effect = [MagicMock(), ValueError()]
+    model_manager._models = {"metrics/1": model_mock}
+    request = MagicMock()
+
+    # when
+    _ = await model_manager.infer_from_request(model_id="metrics/1", request=request)
+    with pytest.raises(ValueError):
+        _ = await model_manager.infer_from_request(
+            model_id="metrics/1", request=request
+        )
+
+    # then
+    result = inference_metrics.get_window_metrics(model_id="metrics/1", window=60)
+    assert result.num_inferences == 1
+    assert result.num_errors == 1
+
+
+@pytest.mark.asyncio
+@mock.patch.object(base, "DISABLE_INFERENCE_CACHE", False)
+@mock.patch.object(base, "cache")
+async def test_infer_from_request_records_failure_after_inference_only_as_error(
+    cache_mock: MagicMock,
+) -> None:
+    # given
+    cache_mock.zadd.side_effect = [RuntimeError(), None, None]
+    model_registry = MagicMock()
+    model_manager = ModelManager(model_registry=model_registry)
+    model_manager._models = {"metrics-failure/1": MagicMock()}
+
+    # when
+    with pytest.raises(RuntimeError):
+        _ = await model_manager.infer_from_request(
+            model_id="metrics-failure/1", request=MagicMock()
+        )
+
+    # then
+    result = inference_metrics.get_window_metrics(
+        model_id="metrics-failure/1", window=60
+    )
+    assert result.num_inferences == 0
+    assert result.num_errors == 1
+
+
 def test_make_response_when_model_available() -> None:
     # given
     model_registry = MagicMock()
@@ -358,10 +410,12 @@ def test_model_manager_describe_models() -> None:
     model_1.batch_size = 12
     model_1.img_size_w = 640
     model_1.img_size_h = 480
+    model_1.session_load_time = 0.5
     model_2.task_type = "instance-segmentation"
     model_2.batch_size = 1
     model_2.img_size_w = 480
     model_2.img_size_h = 480
+    model_2.session_load_time = None
     model_manager._models = {"some/1": model_1, "some/2": model_2}
 
     # when
@@ -375,6 +429,7 @@ def test_model_manager_describe_models() -> None:
             batch_size=12,
             input_width=640,
             input_height=480,
+            session_load_time=0.5,
         ),
         ModelDescription(
             model_id="some/2",
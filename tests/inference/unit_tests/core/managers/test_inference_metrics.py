@@ -0,0 +1,151 @@
+from threading import Thread
+
+import pytest
+
+from inference.core.managers.inference_metrics import (
+    Histogram,
+    InferenceMetricsRegistry,
+    InferenceStage,
+    SlidingWindow,
+    model_context,
+)
+
+
+def test_histogram_snapshot_contains_cumulative_counts() -> None:
+    # given
+    histogram = Histogram(bounds=(0.1, 1.0))
+
+    # when
+    for value in [0.05, 0.1, 0.5, 2.0]:
+        histogram.observe(value)
+    result = histogram.snapshot()
+
+    # then
+    assert result.buckets == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+    assert result.count == 4
+    assert abs(result.sum - 2.65) < 1e-6
+
+
+def test_sliding_window_summarises_only_requests_within_window() -> None:
+    # given
+    window = SlidingWindow(size=10)
+    window.record(now=100.5, duration=1.0, error=False)
+    window.record(now=105.5, duration=2.0, error=False)
+    window.record(now=108.2, duration=0.0, error=True)
+    window.record(now=109.9, duration=3.0, error=False)
+
+    # when
+    result = window.summarise(now=110.0, window=5)
+
+    # then
+    assert result.num_inferences == 2
+    assert result.num_errors == 1
+    assert abs(result.avg_inference_time - 2.5) < 1e-6
+
+
+def test_sliding_window_drops_slots_overwritten_by_later_seconds() -> None:
+    # given
+    window = SlidingWindow(size=10)
+    window.record(now=100.5, duration=1.0, error=False)
+
+    # when
+    window.record(now=110.5, duration=3.0, error=False)
+    result = window.summarise(now=111.0, window=60)
+
+    # then
+    assert result.num_inferences == 1
+    assert abs(result.avg_inference_time - 3.0) < 1e-6
+
+
+def test_registry_window_metrics_when_model_not_registered() -> None:
+    # given
+    registry = InferenceMetricsRegistry(window_size=10)
+
+    # when
+    result = registry.get_window_metrics(model_id="some/1", window=10)
+
+    # then
+    assert result.to_dict() == {
+        "num_inferences": 0,
+        "avg_inference_time": 0,
+        "num_errors": 0,
+    }
+
+
+def test_registry_records_requests_and_errors() -> None:
+    # given
+    registry = InferenceMetricsRegistry(window_size=10)
+
+    # when
+    registry.record_request(model_id="some/1", duration=0.2)
+    registry.record_request(model_id="some/1", duration=0.4)
+    registry.record_request(model_id="some/1", duration=5.0, error=True)
+    registry.record_request(model_id="other/1", duration=0.1)
+    result = registry.to_dict(window=10)
+
+    # then
+    assert set(result.keys()) == {"some/1", "other/1"}
+    assert result["some/1"]["requests_total"] == 3
+    assert result["some/1"]["errors_total"] == 1
+    assert result["some/1"]["window"]["num_inferences"] == 2
+    assert result["some/1"]["window"]["num_errors"] == 1
+    assert abs(result["some/1"]["window"]["avg_inference_time"] - 0.3) < 1e-6
+
+
+def test_stage_timer_uses_model_from_context() -> None:
+    # given
+    registry = InferenceMetricsRegistry(window_size=10)
+
+    # when
+    with model_context(model_id="some/1"):
+        with registry.stage_timer(InferenceStage.PREDICT):
+            pass
+        with registry.stage_timer(InferenceStage.SERIALISE, model_id="other/1"):
+            pass
+    with registry.stage_timer(InferenceStage.PREDICT):
+        pass
+
+    # then
+    assert registry.models() == ["some/1", "other/1"]
+    some_model_stages = registry.get_model_metrics("some/1").stages_snapshot()
+    assert list(some_model_stages.keys()) == ["predict"]
+    assert some_model_stages["predict"].count == 1
+    other_model_stages = registry.get_model_metrics("other/1").stages_snapshot()
+    assert list(other_model_stages.keys()) == ["serialise"]
+
+
+def test_stage_timer_records_stage_when_error_raised() -> None:
+    # given
+    registry = InferenceMetricsRegistry(window_size=10)
+
+    # when
+    with pytest.raises(ValueError):
+        with registry.stage_timer(InferenceStage.DECODE, model_id="some/1"):
+            raise ValueError()
+
+    # then
+    stages = registry.get_model_metrics("some/1").stages_snapshot()
+    assert stages["decode"].count == 1
+
+
+def test_registry_concurrent_updates() -> None:
+    # given
+    registry = InferenceMetricsRegistry(window_size=10)
+
+    def record() -> None:
+        for _ in range(1000):
+            registry.record_request(model_id="some/1", duration=0.1)
+            registry.observe_stage(model_id="some/1", stage="predict", duration=0.1)
+
+    threads = [Thread(target=record) for _ in range(8)]
+
+    # when
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then
+    model_metrics = registry.get_model_metrics("some/1")
+    assert model_metrics.requests == 8000
+    assert model_metrics.stages_snapshot()["predict"].count == 8000
@@ -0,0 +1,132 @@
+from typing import List, Optional, Tuple
+from unittest.mock import MagicMock
+
+from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+from inference.core.managers.entities import ModelPrefetchState, PrefetchStatus
+from inference.core.managers.prefetch import ModelsPrefetcher
+from inference.core.models.roboflow import RoboflowInferenceModel
+
+
+class StubModel(RoboflowInferenceModel):
+    prefetched: List[Tuple[str, Optional[str]]] = []
+
+    @classmethod
+    def prefetch_artefacts(cls, model_id: str, api_key: Optional[str] = None) -> None:
+        if model_id.startswith("broken"):
+            raise ValueError("download failed")
+        cls.prefetched.append((model_id, api_key))
+
+
+def create_model_manager() -> MagicMock:
+    model_manager = MagicMock()
+    model_manager.model_registry.get_model.return_value = StubModel
+    return model_manager
+
+
+def test_prefetch_downloads_artefacts_and_loads_models() -> None:
+    # given
+    StubModel.prefetched = []
+    model_manager = create_model_manager()
+    prefetcher = ModelsPrefetcher(model_manager=model_manager)
+
+    # when
+    result = prefetcher.prefetch(model_ids=["a/1", "b/2", "a/1"], api_key="my-key")
+
+    # then
+    assert result == [
+        ModelPrefetchState(model_id="a/1", status=PrefetchStatus.READY),
+        ModelPrefetchState(model_id="b/2", status=PrefetchStatus.READY),
+    ]
+    assert sorted(StubModel.prefetched) == [("a/1", "my-key"), ("b/2", "my-key")]
+    assert [c.kwargs for c in model_manager.add_model.call_args_list] == [
+        {"model_id": "a/1", "api_key": "my-key"},
+        {"model_id": "b/2", "api_key": "my-key"},
+    ]
+    assert prefetcher.is_ready() is True
+
+
+def test_prefetch_when_models_are_not_to_be_loaded() -> None:
+    # given
+    StubModel.prefetched = []
+    model_manager = create_model_manager()
+    prefetcher = ModelsPrefetcher(model_manager=model_manager, load_models=False)
+
+    # when
+    result = prefetcher.prefetch(model_ids=["a/1"], api_key="my-key")
+
+    # then
+    assert result == [
+        ModelPrefetchState(model_id="a/1", status=PrefetchStatus.DOWNLOADED)
+    ]
+    model_manager.add_model.assert_not_called()
+    assert prefetcher.is_ready() is True
+
+
+def test_prefetch_when_download_fails_then_model_is_still_loaded() -> None:
+    # given
+    StubModel.prefetched = []
+    model_manager = create_model_manager()
+    prefetcher = ModelsPrefetcher(model_manager=model_manager)
+
+    # when
+    result = prefetcher.prefetch(model_ids=["broken/1"], api_key="my-key")
+
+    # then
+    assert result == [
+        ModelPrefetchState(model_id="broken/1", status=PrefetchStatus.READY)
+    ]
+    model_manager.add_model.assert_called_once()
+
+
+def test_prefetch_when_model_loading_fails() -> None:
+    # given
+    StubModel.prefetched = []
+    model_manager = create_model_manager()
+    model_manager.add_model.side_effect = ValueError("invalid weights")
+    prefetcher = ModelsPrefetcher(model_manager=model_manager)
+
+    # when
+    result = prefetcher.prefetch(model_ids=["a/1"], api_key="my-key")
+
+    # then
+    assert result == [
+        ModelPrefetchState(
+            model_id="a/1", status=PrefetchStatus.FAILED, error="invalid weights"
+        )
+    ]
+    assert prefetcher.is_ready() is True
+
+
+def test_prefetch_with_custom_model_loader_and_decorated_model_manager() -> None:
+    # given
+    StubModel.prefetched = []
+    model_manager = create_model_manager()
+    loaded = []
+    prefetcher = ModelsPrefetcher(
+        model_manager=WithFixedSizeCache(model_manager, max_size=8),
+        model_loader=lambda model_id, api_key: loaded.append(model_id),
+    )
+
+    # when
+    _ = prefetcher.prefetch(model_ids=["a/1"], api_key="my-key")
+
+    # then
+    assert StubModel.prefetched == [("a/1", "my-key")]
+    assert loaded == ["a/1"]
+    model_manager.add_model.assert_not_called()
+
+
+def test_prefetch_in_background_reports_models_until_finished() -> None:
+    # given
+    StubModel.prefetched = []
+    prefetcher = ModelsPrefetcher(model_manager=create_model_manager())
+
+    # when
+    thread = prefetcher.prefetch_in_background(model_ids=["a/1"], api_key="my-key")
+    thread.join(timeout=5.0)
+
+    # then
+    assert prefetcher.describe() == [
+        ModelPrefetchState(model_id="a/1", status=PrefetchStatus.READY)
+    ]
+    assert prefetcher.is_ready() is True
@@ -0,0 +1,119 @@
+from unittest.mock import MagicMock
+
+from inference.core.cache.tensors import TensorsCacheStats
+from inference.core.managers.inference_metrics import InferenceMetricsRegistry
+from inference.core.managers.prometheus import CustomCollector
+from inference.core.models.utils.session_pool import ReplicaStats, SessionPoolStats
+
+
+def test_custom_collector_reports_metrics_from_registry() -> None:
+    # given
+    registry = InferenceMetricsRegistry(window_size=60)
+    registry.record_request(model_id="some/1", duration=0.5)
+    registry.record_request(model_id="some/1", duration=1.5)
+    registry.record_request(model_id="some/1", duration=0.1, error=True)
+    registry.observe_stage(model_id="some/1", stage="predict", duration=0.02)
+    model_manager = MagicMock()
+    model_manager.models.return_value = ["some/1", "not-used/1"]
+    collector = CustomCollector(model_manager=model_manager, metrics_registry=registry)
+
+    # when
+    result = {family.name: family for family in collector.collect()}
+
+    # then
+    assert result["num_inferences_some_1"].samples[0].value == 2
+    assert result["avg_inference_time_some_1"].samples[0].value == 1.0
+    assert result["num_errors_some_1"].samples[0].value == 1
+    assert result["num_inferences_not_used_1"].samples[0].value == 0
+    assert result["num_inferences_total"].samples[0].value == 2
+    requests_samples = result["inference_requests"].samples
+    assert [(s.labels, s.value) for s in requests_samples] == [
+        ({"model_id": "some/1"}, 3)
+    ]
+    histogram_samples = {
+        (s.name, s.labels.get("le")): s.value
+        for s in result["inference_stage_duration_seconds"].samples
+    }
+    assert histogram_samples[("inference_stage_duration_seconds_bucket", "0.01")] == 0
+    assert histogram_samples[("inference_stage_duration_seconds_bucket", "0.025")] == 1
+    assert histogram_samples[("inference_stage_duration_seconds_count", None)] == 1
+
+
+def test_custom_collector_reports_session_replicas_utilisation() -> None:
+    # given
+    model_manager = MagicMock()
+    model_manager.models.return_value = []
+    collector = CustomCollector(
+        model_manager=model_manager,
+        metrics_registry=InferenceMetricsRegistry(window_size=60),
+        session_pools_stats_provider=lambda: {
+            "some/1": SessionPoolStats(
+                model_id="some/1",
+                replicas=[
+                    ReplicaStats(
+                        replica_id=0, in_flight=2, requests=10, busy_seconds=1.5
+                    ),
+                    ReplicaStats(
+                        replica_id=3, in_flight=0, requests=4, busy_seconds=0.5
+                    ),
+                ],
+                max_replicas=4,
+            )
+        },
+    )
+
+    # when
+    result = {family.name: family for family in collector.collect()}
+
+    # then
+    assert result["onnx_session_replicas"].samples[0].value == 2
+    assert result["onnx_session_max_replicas"].samples[0].value == 4
+    in_flight_samples = result["onnx_session_replica_in_flight_requests"].samples
+    assert [(s.labels["replica"], s.value) for s in in_flight_samples] == [
+        ("0", 2),
+        ("3", 0),
+    ]
+    busy_samples = result["onnx_session_replica_busy_seconds"].samples
+    assert [(s.labels["replica"], s.value) for s in busy_samples] == [
+        ("0", 1.5),
+        ("3", 0.5),
+    ]
+
+
+def test_custom_collector_reports_tensors_caches_utilisation() -> None:
+    # given
+    model_manager = MagicMock()
+    model_manager.models.return_value = []
+    collector = CustomCollector(
+        model_manager=model_manager,
+        metrics_registry=InferenceMetricsRegistry(window_size=60),
+        session_pools_stats_provider=lambda: {},
+        tensors_caches_stats_provider=lambda: {
+            "sam2/hiera_large/embeddings": TensorsCacheStats(
+                name="sam2/hiera_large/embeddings",
+                entries=3,
+                size_bytes=1024,
+                max_bytes=4096,
+                hits=10,
+                misses=3,
+                coalesced=2,
+                evictions=1,
+                spilled_entries=1,
+                spilled_bytes=256,
+                spill_hits=1,
+            )
+        },
+    )
+
+    # when
+    result = {family.name: family for family in collector.collect()}
+
+    # then
+    assert result["tensors_cache_bytes"].samples[0].value == 1024
+    assert result["tensors_cache_bytes"].samples[0].labels == {
+        "cache": "sam2/hiera_large/embeddings"
+    }
+    assert result["tensors_cache_hits"].samples[0].value == 10
+    assert result["tensors_cache_misses"].samples[0].value == 3
+    assert result["tensors_cache_coalesced_requests"].samples[0].value == 2
+    assert result["tensors_cache_spilled_bytes"].samples[0].value == 256
@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from inference.core.models.classification_base import (
+    ClassificationBaseOnnxRoboflowInferenceModel,
+)
+
+
+@pytest.fixture()
+def classification_model() -> ClassificationBaseOnnxRoboflowInferenceModel:
+    model = ClassificationBaseOnnxRoboflowInferenceModel.__new__(
+        ClassificationBaseOnnxRoboflowInferenceModel
+    )
+    model.preprocess = lambda image: (np.ones((1, 3, 4, 4), dtype=np.float32), {})
+    model._release_io_binding_buffers = MagicMock()
+    return model
+
+
+def test_get_model_output_shape_releases_io_binding_buffers(
+    classification_model: ClassificationBaseOnnxRoboflowInferenceModel,
+) -> None:
+    # given
+    classification_model.predict = lambda image: (
+        np.ones((1, 1, 1, 3), dtype=np.float32),
+    )
+
+    # when
+    result = classification_model.get_model_output_shape()
+
+    # then
+    assert result == (1, 1, 1, 1, 3)
+    classification_model._release_io_binding_buffers.assert_called_once()
+
+
+def test_get_model_output_shape_releases_io_binding_buffers_when_prediction_fails(
+    classification_model: ClassificationBaseOnnxRoboflowInferenceModel,
+) -> None:
+    # given
+    classification_model.predict = MagicMock(side_effect=RuntimeError())
+
+    # when
+    with pytest.raises(RuntimeError):
+        _ = classification_model.get_model_output_shape()
+
+    # then
+    classification_model._release_io_binding_buffers.assert_called_once()
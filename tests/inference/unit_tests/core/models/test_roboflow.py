@@ -1,19 +1,35 @@
 import json
-from typing import Optional
+import os.path
+import shutil
+from typing import Generator, Optional
 from unittest import mock
 from unittest.mock import MagicMock
 
+import cv2
+import numpy as np
 import pytest
+from onnxruntime.datasets import get_example
 
+from inference.core.entities.responses.inference import (
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+    ObjectDetectionPrediction,
+)
 from inference.core.exceptions import ModelArtefactError
 from inference.core.models import roboflow
 from inference.core.models.roboflow import (
+    OnnxRoboflowInferenceModel,
     class_mapping_not_available_in_environment,
     color_mapping_available_in_environment,
     get_class_names_from_environment_file,
     get_color_mapping_from_environment,
     is_model_artefacts_bucket_available,
 )
+from inference.core.models.utils.onnx_session import (
+    OnnxSessionConfig,
+    create_inference_session,
+)
+from inference.core.utils.file_system import read_json
 
 
 @mock.patch.object(roboflow, "AWS_ACCESS_KEY_ID", None)
@@ -194,3 +210,309 @@ def test_get_class_names_from_environment_file() -> None:
         "class_k",
         "class_l",
     ]
+
+
+@pytest.fixture()
+def quantizable_model(
+    empty_local_dir: str,
+) -> Generator[OnnxRoboflowInferenceModel, None, None]:
+    model_path = os.path.join(empty_local_dir, "weights.onnx")
+    shutil.copyfile(get_example("sigmoid.onnx"), model_path)
+    calibration_dir = os.path.join(empty_local_dir, "calibration")
+    os.makedirs(calibration_dir)
+    cv2.imwrite(
+        os.path.join(calibration_dir, "image.jpg"),
+        np.zeros((32, 32, 3), dtype=np.uint8),
+    )
+    model = OnnxRoboflowInferenceModel.__new__(OnnxRoboflowInferenceModel)
+    model.endpoint = "some/1"
+    model.task_type = "object-detection"
+    model.cache_file = lambda f: os.path.join(empty_local_dir, f)
+    model.onnxruntime_execution_providers = ["CPUExecutionProvider"]
+    model.onnx_session = create_inference_session(
+        model_path=model_path, providers=model.onnxruntime_execution_providers
+    )
+    model.onnx_model_path = model_path
+    model.input_name = "x"
+    model.quantization = None
+    model.io_binding_runner = None
+    model.onnx_session_pool = None
+    with mock.patch.object(
+        roboflow, "ONNXRUNTIME_QUANTIZATION_CALIBRATION_DIR", calibration_dir
+    ):
+        yield model
+
+
+def _mock_model_detections(
+    model: OnnxRoboflowInferenceModel, fp32_box: list, int8_box: list
+) -> None:
+    fp32_session = model.onnx_session
+
+    def infer(image: np.ndarray, **kwargs) -> list:
+        x_min, y_min, x_max, y_max = (
+            fp32_box if model.onnx_session is fp32_session else int8_box
+        )
+        prediction = ObjectDetectionPrediction(
+            **{
+                "x": (x_min + x_max) / 2,
+                "y": (y_min + y_max) / 2,
+                "width": x_max - x_min,
+                "height": y_max - y_min,
+                "confidence": 0.9,
+                "class": "a",
+                "class_id": 0,
+            }
+        )
+        return [
+            ObjectDetectionInferenceResponse(
+                predictions=[prediction],
+                image=InferenceResponseImage(width=32, height=32),
+            )
+        ]
+
+    model.infer = infer
+
+
+def _copy_model(model_path: str, quantized_model_path: str, **kwargs) -> None:
+    shutil.copyfile(model_path, quantized_model_path)
+
+
+@mock.patch.object(
+    roboflow,
+    "get_onnx_session_config",
+    return_value=OnnxSessionConfig(quantization="dynamic"),
+)
+@mock.patch.object(roboflow, "quantize_model", side_effect=_copy_model)
+def test_initialize_quantized_model_when_quantized_model_passes_validation(
+    quantize_model_mock: MagicMock,
+    _: MagicMock,
+    quantizable_model: OnnxRoboflowInferenceModel,
+) -> None:
+    # given
+    fp32_session = quantizable_model.onnx_session
+    _mock_model_detections(
+        model=quantizable_model, fp32_box=[0, 0, 10, 10], int8_box=[0, 0, 10, 10]
+    )
+
+    # when
+    quantizable_model.initialize_quantized_model()
+
+    # then
+    quantize_model_mock.assert_called_once()
+    assert quantize_model_mock.call_args.kwargs["mode"] == "dynamic"
+    assert quantizable_model.quantization == "dynamic"
+    assert quantizable_model.onnx_session is not fp32_session
+    assert os.path.isfile(quantizable_model.cache_file("weights.int8-dynamic.onnx"))
+
+
+@mock.patch.object(
+    roboflow,
+    "get_onnx_session_config",
+    return_value=OnnxSessionConfig(quantization="dynamic"),
+)
+@mock.patch.object(roboflow, "quantize_model", side_effect=_copy_model)
+def test_initialize_quantized_model_when_validation_result_is_cached(
+    quantize_model_mock: MagicMock,
+    _: MagicMock,
+    quantizable_model: OnnxRoboflowInferenceModel,
+) -> None:
+    # given
+    fp32_session = quantizable_model.onnx_session
+    _mock_model_detections(
+        model=quantizable_model, fp32_box=[0, 0, 10, 10], int8_box=[0, 0, 10, 10]
+    )
+    quantizable_model.initialize_quantized_model()
+    quantizable_model.onnx_session = fp32_session
+    quantizable_model.quantization = None
+
+    # when
+    quantizable_model.initialize_quantized_model()
+
+    # then
+    quantize_model_mock.assert_called_once()
+    assert quantizable_model.quantization == "dynamic"
+    assert quantizable_model.onnx_session is not fp32_session
+
+
+@mock.patch.object(roboflow, "ONNXRUNTIME_QUANTIZATION_MAX_MAP_DRIFT", 0.1)
+@mock.patch.object(
+    roboflow,
+    "get_onnx_session_config",
+    return_value=OnnxSessionConfig(quantization="static"),
+)
+@mock.patch.object(roboflow, "quantize_model", side_effect=_copy_model)
+def test_initialize_quantized_model_when_map_drift_exceeds_threshold(
+    quantize_model_mock: MagicMock,
+    _: MagicMock,
+    quantizable_model: OnnxRoboflowInferenceModel,
+) -> None:
+    # given
+    fp32_session = quantizable_model.onnx_session
+    quantizable_model.preprocess = lambda image: (
+        np.ones((3, 4, 5), dtype=np.float32),
+        {},
+    )
+    _mock_model_detections(
+        model=quantizable_model, fp32_box=[0, 0, 10, 10], int8_box=[20, 20, 30, 30]
+    )
+
+    # when
+    quantizable_model.initialize_quantized_model()
+
+    # then
+    assert len(quantize_model_mock.call_args.kwargs["calibration_inputs"]) == 1
+    assert quantizable_model.quantization is None
+    assert quantizable_model.onnx_session is fp32_session
+    report = read_json(
+        quantizable_model.cache_file("weights.int8-static.onnx") + ".json"
+    )
+    assert report["map_drift"] == 1.0
+
+
+@mock.patch.object(
+    roboflow,
+    "get_onnx_session_config",
+    return_value=OnnxSessionConfig(quantization="dynamic"),
+)
+@mock.patch.object(roboflow, "quantize_model", side_effect=ImportError("no onnx"))
+def test_initialize_quantized_model_when_quantization_fails(
+    _: MagicMock,
+    __: MagicMock,
+    quantizable_model: OnnxRoboflowInferenceModel,
+) -> None:
+    # given
+    fp32_session = quantizable_model.onnx_session
+
+    # when
+    quantizable_model.initialize_quantized_model()
+
+    # then
+    assert quantizable_model.quantization is None
+    assert quantizable_model.onnx_session is fp32_session
+    assert not os.path.exists(quantizable_model.cache_file("weights.int8-dynamic.onnx"))
+
+
+@mock.patch.object(
+    roboflow,
+    "get_onnx_session_config",
+    return_value=OnnxSessionConfig(quantization="dynamic"),
+)
+@mock.patch.object(roboflow, "quantize_model")
+def test_initialize_quantized_model_when_no_calibration_images_found(
+    quantize_model_mock: MagicMock,
+    _: MagicMock,
+    quantizable_model: OnnxRoboflowInferenceModel,
+) -> None:
+    # given
+    fp32_session = quantizable_model.onnx_session
+    shutil.rmtree(roboflow.ONNXRUNTIME_QUANTIZATION_CALIBRATION_DIR)
+
+    # when
+    quantizable_model.initialize_quantized_model()
+
+    # then
+    quantize_model_mock.assert_not_called()
+    assert quantizable_model.quantization is None
+    assert quantizable_model.onnx_session is fp32_session
+
+
+@mock.patch.object(
+    roboflow,
+    "get_onnx_session_config",
+    return_value=OnnxSessionConfig(quantization="dynamic"),
+)
+@mock.patch.object(roboflow, "quantize_model")
+def test_initialize_quantized_model_when_model_does_not_predict_bounding_boxes(
+    quantize_model_mock: MagicMock,
+    _: MagicMock,
+    quantizable_model: OnnxRoboflowInferenceModel,
+) -> None:
+    # given
+    fp32_session = quantizable_model.onnx_session
+    quantizable_model.task_type = "classification"
+
+    # when
+    quantizable_model.initialize_quantized_model()
+
+    # then
+    quantize_model_mock.assert_not_called()
+    assert quantizable_model.quantization is None
+    assert quantizable_model.onnx_session is fp32_session
+    assert not os.path.exists(
+        quantizable_model.cache_file("weights.int8-dynamic.onnx.json")
+    )
+
+
+@mock.patch.object(roboflow, "get_onnx_session_config")
+@mock.patch.object(roboflow, "quantize_model")
+def test_initialize_quantized_model_when_quantization_not_requested(
+    quantize_model_mock: MagicMock,
+    get_onnx_session_config_mock: MagicMock,
+    quantizable_model: OnnxRoboflowInferenceModel,
+) -> None:
+    # given
+    get_onnx_session_config_mock.return_value = OnnxSessionConfig(quantization="none")
+
+    # when
+    quantizable_model.initialize_quantized_model()
+
+    # then
+    quantize_model_mock.assert_not_called()
+    assert quantizable_model.quantization is None
+
+
+@mock.patch.object(roboflow, "get_onnx_session_config")
+def test_initialize_onnx_session_pool_when_replicas_allowed(
+    get_onnx_session_config_mock: MagicMock,
+    quantizable_model: OnnxRoboflowInferenceModel,
+) -> None:
+    # given
+    get_onnx_session_config_mock.return_value = OnnxSessionConfig(
+        min_replicas=2, max_replicas=3
+    )
+    image = np.ones((3, 4, 5), dtype=np.float32)
+
+    # when
+    quantizable_model.initialize_onnx_session_pool()
+    result = quantizable_model.run_onnx_session(image)
+
+    # then
+    replicas = quantizable_model.onnx_session_pool.replicas()
+    assert len(replicas) == 2
+    assert replicas[0].session is quantizable_model.onnx_session
+    assert quantizable_model.onnx_session_pool.max_replicas == 3
+    assert np.allclose(result[0], 1 / (1 + np.exp(-image)))
+
+
+@mock.patch.object(roboflow, "get_onnx_session_config")
+def test_initialize_onnx_session_pool_when_single_replica_allowed(
+    get_onnx_session_config_mock: MagicMock,
+    quantizable_model: OnnxRoboflowInferenceModel,
+) -> None:
+    # given
+    get_onnx_session_config_mock.return_value = OnnxSessionConfig(max_replicas=1)
+
+    # when
+    quantizable_model.initialize_onnx_session_pool()
+
+    # then
+    assert quantizable_model.onnx_session_pool is None
+
+
+@mock.patch.object(roboflow, "ONNXRUNTIME_IO_BINDING_ENABLED", True)
+def test_get_model_output_shape_releases_io_binding_buffers(
+    quantizable_model: OnnxRoboflowInferenceModel,
+) -> None:
+    # given
+    image = np.ones((3, 4, 5), dtype=np.float32)
+    quantizable_model.preprocess = lambda _: (image, None)
+    quantizable_model.predict = quantizable_model.run_onnx_session
+
+    # when
+    results = [quantizable_model.get_model_output_shape() for _ in range(3)]
+
+    # then
+    assert results == [(3, 4, 5)] * 3
+    runner = quantizable_model.io_binding_runner
+    assert runner.bound_shapes() == {(3, 4, 5)}
+    assert runner._get_thread_leases() == []
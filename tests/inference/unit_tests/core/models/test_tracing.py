@@ -0,0 +1,152 @@
+from typing import Any, Tuple
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from inference.core.managers.inference_metrics import InferenceMetricsRegistry
+from inference.core.models import base, tracing
+from inference.core.models.base import Model
+from inference.core.models.tracing import BaseModelTracer, NullModelTracer
+
+
+def test_null_model_tracer_does_not_record_anything() -> None:
+    # given
+    tracer = NullModelTracer.init()
+
+    # when
+    with tracer.trace_request(model_id="some/1", trace_id="a"):
+        with tracer.stage(name="nms"):
+            pass
+
+    # then
+    assert tracer.export_trace() == []
+
+
+def test_base_model_tracer_does_not_record_stages_outside_of_request_trace() -> None:
+    # given
+    tracer = BaseModelTracer.init(metrics_registry=None)
+
+    # when
+    with tracer.stage(name="nms"):
+        pass
+
+    # then
+    assert tracer.export_trace() == []
+
+
+def test_base_model_tracer_records_stages_of_request_trace() -> None:
+    # given
+    tracer = BaseModelTracer.init(metrics_registry=None)
+
+    # when
+    with tracer.trace_request(model_id="some/1", trace_id="a"):
+        with tracer.stage(name="predict", metadata={"batch_size": 2}):
+            pass
+        with tracer.trace_request(model_id="some/1", trace_id="nested"):
+            with tracer.stage(name="nms"):
+                pass
+    result = tracer.export_trace()
+
+    # then
+    assert [event["name"] for event in result] == [
+        "predict",
+        "nms",
+        "model_inference_request",
+    ], "Stages expected in order of completion, nested request belonging to the outer trace"
+    assert all(event["ph"] == "X" for event in result)
+    assert all(event["args"]["trace_id"] == "a" for event in result)
+    assert all(event["args"]["model_id"] == "some/1" for event in result)
+    assert result[0]["args"]["batch_size"] == 2
+    assert result[2]["ts"] <= result[0]["ts"]
+    assert result[2]["dur"] >= result[0]["dur"]
+
+
+def test_base_model_tracer_marks_stages_that_failed() -> None:
+    # given
+    tracer = BaseModelTracer.init(metrics_registry=None)
+
+    # when
+    with pytest.raises(ValueError):
+        with tracer.trace_request(model_id="some/1", trace_id="a"):
+            with tracer.stage(name="predict"):
+                raise ValueError()
+    result = tracer.export_trace()
+
+    # then
+    assert [event["args"].get("error") for event in result] == [
+        "ValueError",
+        "ValueError",
+    ]
+
+
+def test_base_model_tracer_keeps_bounded_number_of_traces() -> None:
+    # given
+    tracer = BaseModelTracer.init(max_traces_in_buffer=2, metrics_registry=None)
+
+    # when
+    for trace_id in ["a", "b", "c"]:
+        with tracer.trace_request(model_id="some/1", trace_id=trace_id):
+            pass
+
+    # then
+    assert [e["args"]["trace_id"] for e in tracer.export_trace()] == ["b", "c"]
+    assert [e["args"]["trace_id"] for e in tracer.export_trace(trace_id="c")] == ["c"]
+    assert tracer.export_trace(trace_id="a") == []
+
+
+def test_base_model_tracer_reports_custom_stages_to_metrics() -> None:
+    # given
+    registry = InferenceMetricsRegistry(window_size=10)
+    tracer = BaseModelTracer.init(metrics_registry=registry)
+
+    # when
+    with tracer.trace_request(model_id="some/1"):
+        with tracer.stage(name="predict"):
+            pass
+        with tracer.stage(name="nms"):
+            pass
+
+    # then
+    stages = registry.get_model_metrics("some/1").stages_snapshot()
+    assert list(stages.keys()) == [
+        "nms"
+    ], "Only stages not measured by metrics on their own expected to be reported"
+
+
+class DummyModel(Model):
+    def preprocess(self, image: Any, **kwargs) -> Tuple[np.ndarray, dict]:
+        return np.zeros((2, 2)), {}
+
+    def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray, ...]:
+        return (img_in,)
+
+    def postprocess(self, predictions, preprocess_return_metadata, **kwargs) -> Any:
+        return [MagicMock()]
+
+
+def test_model_infer_from_request_is_traced() -> None:
+    # given
+    tracer = BaseModelTracer.init(metrics_registry=None)
+    request = MagicMock()
+    request.dict.return_value = {"image": "some"}
+    request.id = "request-id"
+    request.model_id = "some/1"
+    request.visualize_predictions = False
+
+    # when
+    with mock.patch.object(base, "model_tracer", tracer), mock.patch.object(
+        tracing, "model_tracer", tracer
+    ):
+        _ = DummyModel().infer_from_request(request)
+    result = tracer.export_trace(trace_id="request-id")
+
+    # then
+    assert [event["name"] for event in result] == [
+        "preprocess",
+        "predict",
+        "postprocess",
+        "model_inference_request",
+    ]
+    assert all(event["args"]["model_id"] == "some/1" for event in result)
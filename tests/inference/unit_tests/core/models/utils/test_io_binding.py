@@ -0,0 +1,153 @@
+from threading import Thread
+from unittest.mock import MagicMock
+
+import numpy as np
+import onnxruntime
+import pytest
+from onnxruntime.datasets import get_example
+
+from inference.core.models.utils.io_binding import IOBindingSessionRunner
+
+
+@pytest.fixture()
+def session() -> onnxruntime.InferenceSession:
+    return onnxruntime.InferenceSession(
+        get_example("sigmoid.onnx"), providers=["CPUExecutionProvider"]
+    )
+
+
+def test_io_binding_session_runner_binds_buffers_for_repeated_shape(
+    session: onnxruntime.InferenceSession,
+) -> None:
+    # given
+    runner = IOBindingSessionRunner(session=session)
+    first_input = np.random.rand(3, 4, 5).astype(np.float32)
+    second_input = np.random.rand(3, 4, 5).astype(np.float32)
+
+    # when
+    first_result = runner.run(input_name="x", input_data=first_input)
+    first_result = [r.copy() for r in first_result]
+    second_result = runner.run(input_name="x", input_data=second_input)
+    second_result_buffer = second_result[0]
+    second_result = [r.copy() for r in second_result]
+    third_result = runner.run(input_name="x", input_data=first_input)
+
+    # then
+    assert np.allclose(first_result[0], session.run(None, {"x": first_input})[0])
+    assert np.allclose(second_result[0], session.run(None, {"x": second_input})[0])
+    assert np.allclose(third_result[0], first_result[0])
+    assert third_result[0] is second_result_buffer
+    assert runner.bound_shapes() == {(3, 4, 5)}
+
+
+def test_io_binding_session_runner_does_not_share_leased_buffers_between_threads(
+    session: onnxruntime.InferenceSession,
+) -> None:
+    # given
+    runner = IOBindingSessionRunner(session=session)
+    input_data = np.zeros((3, 4, 5), dtype=np.float32)
+    _ = runner.run(input_name="x", input_data=input_data)
+    main_thread_result = runner.run(input_name="x", input_data=input_data)
+    other_thread_results = []
+
+    # when
+    thread = Thread(
+        target=lambda: other_thread_results.append(
+            runner.run(input_name="x", input_data=np.ones((3, 4, 5), dtype=np.float32))[
+                0
+            ]
+        )
+    )
+    thread.start()
+    thread.join()
+
+    # then
+    assert other_thread_results[0] is not main_thread_result[0]
+    assert np.allclose(main_thread_result[0], 0.5)
+
+
+def test_io_binding_session_runner_reuses_buffers_after_release(
+    session: onnxruntime.InferenceSession,
+) -> None:
+    # given
+    runner = IOBindingSessionRunner(session=session, max_buffers_per_shape=1)
+    input_data = np.zeros((3, 4, 5), dtype=np.float32)
+    _ = runner.run(input_name="x", input_data=input_data)
+    bound_result = runner.run(input_name="x", input_data=input_data)
+
+    # when
+    runner.release()
+    other_thread_results = []
+    thread = Thread(
+        target=lambda: other_thread_results.append(
+            runner.run(input_name="x", input_data=input_data)[0]
+        )
+    )
+    thread.start()
+    thread.join()
+
+    # then
+    assert other_thread_results[0] is bound_result[0]
+
+
+def test_io_binding_session_runner_when_bound_run_fails() -> None:
+    # given
+    session = _create_session_mock()
+    session.run_with_iobinding.side_effect = RuntimeError("invalid dimensions")
+    runner = IOBindingSessionRunner(session=session)
+    input_data = np.zeros((1, 3), dtype=np.float32)
+
+    # when
+    results = [runner.run(input_name="x", input_data=input_data) for _ in range(4)]
+
+    # then
+    assert all(np.allclose(result[0], 1.0) for result in results)
+    assert session.run_with_iobinding.call_count == 1
+    assert session.run.call_count == 4
+    assert runner.bound_shapes() == set()
+
+
+def test_io_binding_session_runner_when_outputs_shape_changes() -> None:
+    # given
+    session = _create_session_mock()
+    session.run.side_effect = [
+        [np.ones((1, 2), dtype=np.float32)],
+        [np.ones((1, 5), dtype=np.float32)],
+    ]
+    runner = IOBindingSessionRunner(session=session, min_shape_occurrences=3)
+    input_data = np.zeros((1, 3), dtype=np.float32)
+    _ = runner.run(input_name="x", input_data=input_data)
+    _ = runner.run(input_name="x", input_data=input_data)
+    session.run.side_effect = None
+
+    # when
+    _ = runner.run(input_name="x", input_data=input_data)
+
+    # then
+    session.run_with_iobinding.assert_not_called()
+    assert session.run.call_count == 3
+
+
+def test_io_binding_session_runner_keeps_buffers_of_recently_used_shapes() -> None:
+    # given
+    session = _create_session_mock()
+    runner = IOBindingSessionRunner(session=session, max_shapes=2)
+
+    # when
+    for batch_size in (1, 2, 3):
+        for _ in range(2):
+            _ = runner.run(
+                input_name="x",
+                input_data=np.zeros((batch_size, 3), dtype=np.float32),
+            )
+
+    # then
+    assert runner.bound_shapes() == {(2, 3), (3, 3)}
+
+
+def _create_session_mock() -> MagicMock:
+    session = MagicMock()
+    session.get_outputs.return_value = [MagicMock()]
+    session.get_outputs.return_value[0].name = "y"
+    session.run.side_effect = lambda _, inputs: [np.ones_like(list(inputs.values())[0])]
+    return session
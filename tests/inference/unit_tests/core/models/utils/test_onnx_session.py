@@ -0,0 +1,365 @@
+import gc
+import glob
+import os.path
+import shutil
+from unittest import mock
+
+import numpy as np
+import onnxruntime
+import pytest
+from onnxruntime.datasets import get_example
+
+from inference.core.exceptions import InvalidEnvironmentVariableError
+from inference.core.models.utils import onnx_session
+from inference.core.models.utils.onnx_session import (
+    CPUCoresPartitioner,
+    OnnxSessionConfig,
+    apply_onnx_session_config,
+    create_inference_session,
+    get_intra_op_thread_affinities,
+    get_onnx_session_config,
+    set_onnx_session_config,
+)
+
+
+def test_onnx_session_config_override() -> None:
+    # given
+    config = OnnxSessionConfig(intra_op_num_threads=4, enable_mem_pattern=True)
+
+    # when
+    result = config.override(
+        OnnxSessionConfig(intra_op_num_threads=2, enable_cpu_mem_arena=False)
+    )
+
+    # then
+    assert result == OnnxSessionConfig(
+        intra_op_num_threads=2, enable_mem_pattern=True, enable_cpu_mem_arena=False
+    )
+
+
+def test_onnx_session_config_from_dict_when_unknown_option_given() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = OnnxSessionConfig.from_dict({"intra_op_threads": 2})
+
+
+def test_onnx_session_config_when_invalid_execution_mode_given() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = OnnxSessionConfig(execution_mode="async")
+
+
+def test_cpu_cores_partitioner_spreads_sessions_across_partitions() -> None:
+    # given
+    partitioner = CPUCoresPartitioner(cores=list(range(8)), cores_per_partition=3)
+
+    # when
+    first = partitioner.acquire()
+    second = partitioner.acquire()
+    third = partitioner.acquire()
+    partitioner.release(partition_id=first[0])
+    fourth = partitioner.acquire()
+
+    # then
+    assert partitioner.partitions == [[0, 1, 2], [3, 4, 5]]
+    assert first == (0, [0, 1, 2])
+    assert second == (1, [3, 4, 5])
+    assert third == (0, [0, 1, 2])
+    assert fourth == (0, [0, 1, 2])
+    assert partitioner.usage() == [2, 1]
+
+
+def test_cpu_cores_partitioner_when_more_cores_per_partition_than_available() -> None:
+    # when
+    partitioner = CPUCoresPartitioner(cores=[0, 1], cores_per_partition=4)
+
+    # then
+    assert partitioner.partitions == [[0, 1]]
+
+
+def test_get_intra_op_thread_affinities() -> None:
+    # when
+    result = get_intra_op_thread_affinities(cores=[4, 5, 6])
+
+    # then
+    assert result == "6;7"
+
+
+def test_apply_onnx_session_config_when_cores_given() -> None:
+    # given
+    session_options = onnxruntime.SessionOptions()
+    config = OnnxSessionConfig(
+        inter_op_num_threads=1,
+        graph_optimization_level="basic",
+        execution_mode="parallel",
+        enable_cpu_mem_arena=False,
+    )
+
+    # when
+    apply_onnx_session_config(
+        session_options=session_options, config=config, cores=[2, 3]
+    )
+
+    # then
+    assert session_options.intra_op_num_threads == 2
+    assert session_options.inter_op_num_threads == 1
+    assert (
+        session_options.graph_optimization_level
+        == onnxruntime.GraphOptimizationLevel.ORT_ENABLE_BASIC
+    )
+    assert session_options.execution_mode == onnxruntime.ExecutionMode.ORT_PARALLEL
+    assert session_options.enable_cpu_mem_arena is False
+    assert (
+        session_options.get_session_config_entry("session.intra_op_thread_affinities")
+        == "4"
+    )
+
+
+@mock.patch.object(onnx_session, "ONNXRUNTIME_CORES_PER_MODEL", 2)
+@mock.patch.object(onnx_session, "ONNXRUNTIME_OPTIMIZED_MODEL_CACHE_ENABLED", False)
+@mock.patch.object(onnx_session, "get_cpu_cores_partitioner")
+@mock.patch.object(onnx_session, "_create_session")
+def test_create_inference_session_when_cores_partitioning_enabled(
+    create_session_mock: mock.MagicMock,
+    get_cpu_cores_partitioner_mock: mock.MagicMock,
+) -> None:
+    # given
+    partitioner = CPUCoresPartitioner(cores=[0, 1, 2, 3], cores_per_partition=2)
+    get_cpu_cores_partitioner_mock.return_value = partitioner
+    create_session_mock.side_effect = lambda **kwargs: mock.MagicMock()
+
+    # when
+    _ = create_inference_session(
+        model_path="model.onnx", providers=["CPUExecutionProvider"]
+    )
+    _ = create_inference_session(
+        model_path="model.onnx", providers=["CPUExecutionProvider"]
+    )
+
+    # then
+    assert [c.kwargs["cores"] for c in create_session_mock.call_args_list] == [
+        [0, 1],
+        [2, 3],
+    ]
+
+
+@mock.patch.object(
+    onnx_session,
+    "ONNXRUNTIME_SESSION_CONFIG",
+    '{"some/1": {"intra_op_num_threads": 3, "inter_op_num_threads": 2}}',
+)
+def test_get_onnx_session_config_resolves_options_by_precedence() -> None:
+    # given
+    set_onnx_session_config(
+        model_id="some/1", config=OnnxSessionConfig(inter_op_num_threads=1)
+    )
+
+    # when
+    try:
+        result = get_onnx_session_config(model_id="some/1")
+        other_model_result = get_onnx_session_config(model_id="other/1")
+    finally:
+        set_onnx_session_config(model_id="some/1", config=None)
+
+    # then
+    assert result.intra_op_num_threads == 3
+    assert result.inter_op_num_threads == 1
+    assert other_model_result == onnx_session.DEFAULT_ONNX_SESSION_CONFIG
+
+
+@mock.patch.object(onnx_session, "ONNXRUNTIME_SESSION_CONFIG", '["invalid"]')
+def test_get_onnx_session_config_when_env_config_is_invalid() -> None:
+    # when
+    with pytest.raises(InvalidEnvironmentVariableError):
+        _ = get_onnx_session_config(model_id="some/1")
+
+
+@pytest.fixture()
+def onnx_model_path(empty_local_dir: str) -> str:
+    model_path = os.path.join(empty_local_dir, "weights.onnx")
+    shutil.copyfile(get_example("sigmoid.onnx"), model_path)
+    return model_path
+
+
+@mock.patch.object(onnx_session, "ONNXRUNTIME_CORES_PER_MODEL", 1)
+@mock.patch.object(onnx_session, "get_cpu_cores_partitioner")
+def test_create_inference_session_releases_partition_when_session_is_disposed(
+    get_cpu_cores_partitioner_mock: mock.MagicMock,
+    onnx_model_path: str,
+) -> None:
+    # given
+    partitioner = CPUCoresPartitioner(cores=[0], cores_per_partition=1)
+    get_cpu_cores_partitioner_mock.return_value = partitioner
+
+    # when
+    session = create_inference_session(
+        model_path=onnx_model_path,
+        providers=["CPUExecutionProvider"],
+        model_id="some/1",
+    )
+    usage_while_session_exists = partitioner.usage()
+    del session
+    gc.collect()
+
+    # then
+    assert usage_while_session_exists == [1]
+    assert partitioner.usage() == [0]
+
+
+def test_create_inference_session_saves_optimized_model_on_first_load(
+    onnx_model_path: str,
+) -> None:
+    # when
+    session = create_inference_session(
+        model_path=onnx_model_path, providers=["CPUExecutionProvider"]
+    )
+
+    # then
+    optimized_models = glob.glob(
+        os.path.join(os.path.dirname(onnx_model_path), "*.optimized.onnx")
+    )
+    assert len(optimized_models) == 1
+    assert os.path.isfile(optimized_models[0] + ".json")
+    assert _run(session=session).shape == (3, 4, 5)
+
+
+def test_create_inference_session_loads_optimized_model_when_available(
+    onnx_model_path: str,
+) -> None:
+    # given
+    _ = create_inference_session(
+        model_path=onnx_model_path, providers=["CPUExecutionProvider"]
+    )
+
+    # when
+    with mock.patch.object(
+        onnx_session, "_create_session", wraps=onnx_session._create_session
+    ) as create_session_mock:
+        session = create_inference_session(
+            model_path=onnx_model_path, providers=["CPUExecutionProvider"]
+        )
+
+    # then
+    create_session_mock.assert_called_once()
+    assert create_session_mock.call_args.kwargs["model_path"].endswith(
+        ".optimized.onnx"
+    )
+    assert (
+        create_session_mock.call_args.kwargs["config"].graph_optimization_level
+        == "disable"
+    )
+    assert _run(session=session).shape == (3, 4, 5)
+
+
+def test_create_inference_session_when_optimized_model_is_corrupted(
+    onnx_model_path: str,
+) -> None:
+    # given
+    _ = create_inference_session(
+        model_path=onnx_model_path, providers=["CPUExecutionProvider"]
+    )
+    optimized_model_path = glob.glob(
+        os.path.join(os.path.dirname(onnx_model_path), "*.optimized.onnx")
+    )[0]
+    size = os.path.getsize(optimized_model_path)
+    with open(optimized_model_path, "wb") as f:
+        f.write(b"\x00" * size)
+
+    # when
+    session = create_inference_session(
+        model_path=onnx_model_path, providers=["CPUExecutionProvider"]
+    )
+
+    # then
+    assert _run(session=session).shape == (3, 4, 5)
+    with open(optimized_model_path, "rb") as f:
+        assert f.read() != b"\x00" * size
+
+
+def test_create_inference_session_when_original_model_changed(
+    onnx_model_path: str,
+) -> None:
+    # given
+    _ = create_inference_session(
+        model_path=onnx_model_path, providers=["CPUExecutionProvider"]
+    )
+    stale_optimized_model_path = glob.glob(
+        os.path.join(os.path.dirname(onnx_model_path), "*.optimized.onnx")
+    )[0]
+    stat = os.stat(onnx_model_path)
+    os.utime(onnx_model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    # when
+    _ = create_inference_session(
+        model_path=onnx_model_path, providers=["CPUExecutionProvider"]
+    )
+
+    # then
+    optimized_models = glob.glob(
+        os.path.join(os.path.dirname(onnx_model_path), "*.optimized.onnx")
+    )
+    assert len(optimized_models) == 2
+    assert stale_optimized_model_path in optimized_models
+
+
+@mock.patch.object(onnx_session, "ONNXRUNTIME_OPTIMIZED_MODEL_CACHE_ENABLED", False)
+def test_create_inference_session_when_optimized_model_cache_disabled(
+    onnx_model_path: str,
+) -> None:
+    # when
+    _ = create_inference_session(
+        model_path=onnx_model_path, providers=["CPUExecutionProvider"]
+    )
+
+    # then
+    assert os.listdir(os.path.dirname(onnx_model_path)) == ["weights.onnx"]
+
+
+def test_create_inference_session_when_tensorrt_requested(
+    onnx_model_path: str,
+) -> None:
+    # when
+    with mock.patch.object(
+        onnx_session, "_create_session", wraps=onnx_session._create_session
+    ) as create_session_mock:
+        _ = create_inference_session(
+            model_path=onnx_model_path,
+            providers=["TensorrtExecutionProvider", "CPUExecutionProvider"],
+        )
+
+    # then
+    assert (
+        create_session_mock.call_args.kwargs["config"].graph_optimization_level
+        == "disable"
+    )
+    assert os.listdir(os.path.dirname(onnx_model_path)) == ["weights.onnx"]
+
+
+@mock.patch.object(onnxruntime, "get_available_providers")
+def test_create_inference_session_when_compiling_execution_provider_available(
+    get_available_providers_mock: mock.MagicMock,
+    onnx_model_path: str,
+) -> None:
+    # given
+    get_available_providers_mock.return_value = [
+        "OpenVINOExecutionProvider",
+        "CPUExecutionProvider",
+    ]
+
+    # when
+    with mock.patch.object(
+        onnx_session, "_create_session", wraps=onnx_session._create_session
+    ) as create_session_mock:
+        _ = create_inference_session(
+            model_path=onnx_model_path,
+            providers=["OpenVINOExecutionProvider", "CPUExecutionProvider"],
+        )
+
+    # then
+    create_session_mock.assert_called_once()
+    assert "optimized_model_filepath" not in create_session_mock.call_args.kwargs
+    assert os.listdir(os.path.dirname(onnx_model_path)) == ["weights.onnx"]
+
+
+def _run(session: onnxruntime.InferenceSession) -> np.ndarray:
+    return session.run(None, {"x": np.ones((3, 4, 5), dtype=np.float32)})[0]
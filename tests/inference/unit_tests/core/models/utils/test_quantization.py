@@ -0,0 +1,249 @@
+import os.path
+
+import cv2
+import numpy as np
+import pytest
+
+from inference.core.entities.responses.inference import (
+    ClassificationInferenceResponse,
+    ClassificationPrediction,
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+    ObjectDetectionPrediction,
+)
+from inference.core.models.utils.quantization import (
+    compute_map_drift,
+    detections_from_responses,
+    get_quantized_model_metadata,
+    get_quantized_model_path,
+    load_calibration_images,
+    load_quantization_report,
+    save_quantization_report,
+)
+
+
+def test_get_quantized_model_path() -> None:
+    # when
+    result = get_quantized_model_path(
+        model_path="/some/cache/coco/3/weights.onnx", mode="dynamic"
+    )
+
+    # then
+    assert result == "/some/cache/coco/3/weights.int8-dynamic.onnx"
+
+
+def test_compute_map_drift_when_detections_are_identical() -> None:
+    # given
+    detections = [
+        np.array([[0, 0, 10, 10, 0.9, 0], [20, 20, 40, 40, 0.6, 1]]),
+        np.empty((0, 6)),
+    ]
+
+    # when
+    result = compute_map_drift(reference=detections, candidate=detections)
+
+    # then
+    assert result == pytest.approx(0.0)
+
+
+def test_compute_map_drift_when_there_are_no_detections() -> None:
+    # when
+    result = compute_map_drift(
+        reference=[np.empty((0, 6))], candidate=[np.empty((0, 6))]
+    )
+
+    # then
+    assert result == 0.0
+
+
+def test_compute_map_drift_when_boxes_are_shifted_slightly() -> None:
+    # given
+    reference = [np.array([[0, 0, 100, 100, 0.9, 0]])]
+    candidate = [np.array([[2, 2, 102, 102, 0.85, 0]])]
+
+    # when
+    result = compute_map_drift(reference=reference, candidate=candidate)
+
+    # then
+    assert result == pytest.approx(0.0)
+
+
+def test_compute_map_drift_when_detections_are_missed_or_misplaced() -> None:
+    # given
+    reference = [
+        np.array([[0, 0, 10, 10, 0.9, 0], [50, 50, 60, 60, 0.8, 0]]),
+        np.array([[0, 0, 10, 10, 0.9, 1]]),
+    ]
+    candidate = [
+        np.array([[0, 0, 10, 10, 0.9, 0]]),
+        np.array([[30, 30, 40, 40, 0.9, 1]]),
+    ]
+
+    # when
+    result = compute_map_drift(reference=reference, candidate=candidate)
+
+    # then
+    # class 0 - AP 0.5 (half of boxes found), class 1 - AP 0.0 (box misplaced)
+    assert result == pytest.approx(0.75)
+
+
+def test_compute_map_drift_when_candidate_detects_extra_class() -> None:
+    # given
+    reference = [np.array([[0, 0, 10, 10, 0.9, 0]])]
+    candidate = [np.array([[0, 0, 10, 10, 0.9, 0], [0, 0, 10, 10, 0.3, 1]])]
+
+    # when
+    result = compute_map_drift(reference=reference, candidate=candidate)
+
+    # then
+    assert result == pytest.approx(0.5)
+
+
+def test_detections_from_responses() -> None:
+    # given
+    response = ObjectDetectionInferenceResponse(
+        predictions=[
+            ObjectDetectionPrediction(
+                **{
+                    "x": 50,
+                    "y": 40,
+                    "width": 20,
+                    "height": 10,
+                    "confidence": 0.7,
+                    "class": "dog",
+                    "class_id": 3,
+                }
+            )
+        ],
+        image=InferenceResponseImage(width=100, height=100),
+    )
+    empty_response = ObjectDetectionInferenceResponse(
+        predictions=[], image=InferenceResponseImage(width=100, height=100)
+    )
+
+    # when
+    result = detections_from_responses(responses=[response, empty_response])
+
+    # then
+    assert len(result) == 2
+    assert np.allclose(result[0], np.array([[40, 35, 60, 45, 0.7, 3]]))
+    assert result[1].shape == (0, 6)
+
+
+def test_detections_from_responses_when_responses_do_not_contain_boxes() -> None:
+    # given
+    response = ClassificationInferenceResponse(
+        image=InferenceResponseImage(width=100, height=100),
+        predictions=[
+            ClassificationPrediction(
+                **{"class": "dog", "class_id": 3, "confidence": 0.9}
+            )
+        ],
+        top="dog",
+        confidence=0.9,
+    )
+
+    # when
+    with pytest.raises(ValueError):
+        _ = detections_from_responses(responses=[response])
+
+
+def test_load_quantization_report_when_report_saved(empty_local_dir: str) -> None:
+    # given
+    model_path = _create_file(os.path.join(empty_local_dir, "weights.onnx"))
+    quantized_model_path = _create_file(
+        get_quantized_model_path(model_path=model_path, mode="dynamic")
+    )
+    metadata = get_quantized_model_metadata(model_path=model_path, mode="dynamic")
+    save_quantization_report(
+        quantized_model_path=quantized_model_path,
+        metadata=metadata,
+        map_drift=0.01,
+        calibration_images=8,
+    )
+
+    # when
+    result = load_quantization_report(
+        quantized_model_path=quantized_model_path, metadata=metadata
+    )
+
+    # then
+    assert result["map_drift"] == 0.01
+    assert result["calibration_images"] == 8
+
+
+def test_load_quantization_report_when_original_model_changed(
+    empty_local_dir: str,
+) -> None:
+    # given
+    model_path = _create_file(os.path.join(empty_local_dir, "weights.onnx"))
+    quantized_model_path = _create_file(
+        get_quantized_model_path(model_path=model_path, mode="dynamic")
+    )
+    save_quantization_report(
+        quantized_model_path=quantized_model_path,
+        metadata=get_quantized_model_metadata(model_path=model_path, mode="dynamic"),
+        map_drift=0.01,
+        calibration_images=8,
+    )
+    _create_file(model_path, content=b"other weights")
+
+    # when
+    result = load_quantization_report(
+        quantized_model_path=quantized_model_path,
+        metadata=get_quantized_model_metadata(model_path=model_path, mode="dynamic"),
+    )
+
+    # then
+    assert result is None
+
+
+def test_load_quantization_report_when_quantized_model_not_saved(
+    empty_local_dir: str,
+) -> None:
+    # given
+    model_path = _create_file(os.path.join(empty_local_dir, "weights.onnx"))
+
+    # when
+    result = load_quantization_report(
+        quantized_model_path=get_quantized_model_path(
+            model_path=model_path, mode="static"
+        ),
+        metadata=get_quantized_model_metadata(model_path=model_path, mode="static"),
+    )
+
+    # then
+    assert result is None
+
+
+def test_load_calibration_images(empty_local_dir: str) -> None:
+    # given
+    model_calibration_dir = os.path.join(empty_local_dir, "model")
+    global_calibration_dir = os.path.join(empty_local_dir, "global")
+    os.makedirs(model_calibration_dir)
+    os.makedirs(global_calibration_dir)
+    image = np.zeros((32, 32, 3), dtype=np.uint8)
+    cv2.imwrite(os.path.join(model_calibration_dir, "a.jpg"), image)
+    _create_file(os.path.join(model_calibration_dir, "notes.txt"))
+    for name in ("b.png", "c.png"):
+        cv2.imwrite(os.path.join(global_calibration_dir, name), image)
+
+    # when
+    result = load_calibration_images(
+        directories=[
+            model_calibration_dir,
+            global_calibration_dir,
+            os.path.join(empty_local_dir, "non_existing"),
+        ],
+        max_images=2,
+    )
+
+    # then
+    assert len(result) == 2
+    assert result[0].shape == (32, 32, 3)
+
+
+def _create_file(path: str, content: bytes = b"weights") -> str:
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
@@ -0,0 +1,279 @@
+from unittest import mock
+from unittest.mock import MagicMock
+
+from inference.core.models.utils import session_pool
+from inference.core.models.utils.onnx_session import OnnxSessionConfig
+from inference.core.models.utils.session_pool import (
+    OnnxSessionPool,
+    ReplicasMemoryBudget,
+    get_max_replicas,
+    get_session_pools_stats,
+    scale_down_idle_session_pools,
+)
+
+
+def test_session_pool_when_min_replicas_requested() -> None:
+    # given
+    session_factory = MagicMock()
+
+    # when
+    pool = OnnxSessionPool(
+        model_id="some/1",
+        primary_session="primary",
+        session_factory=session_factory,
+        min_replicas=3,
+        max_replicas=4,
+        replica_memory_size=10,
+        memory_budget=ReplicasMemoryBudget(max_bytes=100),
+    )
+
+    # then
+    assert len(pool.replicas()) == 3
+    assert pool.replicas()[0].session == "primary"
+    assert session_factory.call_count == 2
+
+
+def test_session_pool_dispatches_requests_to_least_busy_replica() -> None:
+    # given
+    pool = OnnxSessionPool(
+        model_id="some/1",
+        primary_session="primary",
+        session_factory=lambda: "replica",
+        min_replicas=2,
+        max_replicas=2,
+        replica_memory_size=10,
+        memory_budget=ReplicasMemoryBudget(max_bytes=100),
+    )
+
+    # when
+    with pool.replica() as first_replica:
+        with pool.replica() as second_replica:
+            stats = pool.stats()
+        with pool.replica() as third_replica:
+            pass
+
+    # then
+    assert first_replica.session == "primary"
+    assert second_replica.session == "replica"
+    assert third_replica is second_replica
+    assert stats.in_flight == 2
+    assert [replica.requests for replica in pool.stats().replicas] == [1, 2]
+    assert pool.stats().in_flight == 0
+
+
+def test_session_pool_scales_up_when_all_replicas_are_busy() -> None:
+    # given
+    pool = OnnxSessionPool(
+        model_id="some/1",
+        primary_session="primary",
+        session_factory=lambda: "replica",
+        min_replicas=1,
+        max_replicas=2,
+        replica_memory_size=10,
+        scale_up_queue_depth=1,
+        memory_budget=ReplicasMemoryBudget(max_bytes=100),
+    )
+
+    # when
+    with mock.patch.object(session_pool, "Thread") as thread_mock:
+        thread_mock.side_effect = lambda target, daemon: MagicMock(start=target)
+        with pool.replica():
+            with pool.replica():
+                pass
+            with pool.replica():
+                with pool.replica():
+                    pass
+
+    # then
+    assert [replica.session for replica in pool.replicas()] == [
+        "primary",
+        "replica",
+    ]
+    assert thread_mock.call_count == 1
+
+
+def test_session_pool_does_not_scale_up_beyond_memory_budget() -> None:
+    # given
+    memory_budget = ReplicasMemoryBudget(max_bytes=15)
+    pool = OnnxSessionPool(
+        model_id="some/1",
+        primary_session="primary",
+        session_factory=lambda: "replica",
+        min_replicas=4,
+        max_replicas=4,
+        replica_memory_size=10,
+        memory_budget=memory_budget,
+    )
+
+    # then
+    assert len(pool.replicas()) == 2
+    assert memory_budget.reserved_bytes == 10
+
+
+def test_session_pool_releases_memory_budget_when_replica_could_not_be_created() -> (
+    None
+):
+    # given
+    memory_budget = ReplicasMemoryBudget(max_bytes=100)
+
+    # when
+    pool = OnnxSessionPool(
+        model_id="some/1",
+        primary_session="primary",
+        session_factory=MagicMock(side_effect=RuntimeError("Out of memory")),
+        min_replicas=2,
+        max_replicas=2,
+        replica_memory_size=10,
+        memory_budget=memory_budget,
+    )
+
+    # then
+    assert len(pool.replicas()) == 1
+    assert memory_budget.reserved_bytes == 0
+
+
+def test_session_pool_scales_down_idle_replicas() -> None:
+    # given
+    memory_budget = ReplicasMemoryBudget(max_bytes=100)
+    pool = OnnxSessionPool(
+        model_id="some/1",
+        primary_session="primary",
+        session_factory=lambda: "replica",
+        min_replicas=3,
+        max_replicas=3,
+        replica_memory_size=10,
+        idle_timeout=5.0,
+        memory_budget=memory_budget,
+    )
+    pool._min_replicas = 1
+    primary, busy, idle = pool.replicas()
+    busy.start_request(now=0.0)
+    now = idle.last_used + 10.0
+
+    # when
+    pool.scale_down_idle(now=now)
+
+    # then
+    assert pool.replicas() == [primary, busy]
+    assert memory_budget.reserved_bytes == 10
+
+
+def test_session_pool_scales_down_idle_replicas_when_replica_is_leased() -> None:
+    # given
+    pool = OnnxSessionPool(
+        model_id="some/1",
+        primary_session="primary",
+        session_factory=lambda: "replica",
+        min_replicas=3,
+        max_replicas=3,
+        replica_memory_size=10,
+        idle_timeout=0.0,
+        memory_budget=ReplicasMemoryBudget(max_bytes=100),
+    )
+    pool._min_replicas = 1
+
+    # when
+    with pool.replica() as replica:
+        replicas_while_leased = pool.replicas()
+
+    # then
+    assert replica.session == "primary"
+    assert replicas_while_leased == [replica]
+
+
+def test_scale_down_idle_session_pools() -> None:
+    # given
+    memory_budget = ReplicasMemoryBudget(max_bytes=100)
+    pool = OnnxSessionPool(
+        model_id="idle/1",
+        primary_session="primary",
+        session_factory=lambda: "replica",
+        min_replicas=3,
+        max_replicas=3,
+        replica_memory_size=10,
+        idle_timeout=0.0,
+        memory_budget=memory_budget,
+    )
+    pool._min_replicas = 1
+
+    # when
+    scale_down_idle_session_pools()
+
+    # then
+    assert len(pool.replicas()) == 1
+    assert memory_budget.reserved_bytes == 0
+    assert session_pool._idle_replicas_reaper.is_alive()
+    del pool
+
+
+def test_session_pool_returns_memory_budget_when_garbage_collected() -> None:
+    # given
+    memory_budget = ReplicasMemoryBudget(max_bytes=100)
+    pool = OnnxSessionPool(
+        model_id="some/1",
+        primary_session="primary",
+        session_factory=lambda: "replica",
+        min_replicas=3,
+        max_replicas=3,
+        replica_memory_size=10,
+        memory_budget=memory_budget,
+    )
+
+    # when
+    del pool
+
+    # then
+    assert memory_budget.reserved_bytes == 0
+
+
+def test_get_session_pools_stats() -> None:
+    # given
+    pool = OnnxSessionPool(
+        model_id="stats/1",
+        primary_session="primary",
+        session_factory=lambda: "replica",
+        min_replicas=1,
+        max_replicas=2,
+        replica_memory_size=10,
+        memory_budget=ReplicasMemoryBudget(max_bytes=100),
+    )
+
+    # when
+    result = get_session_pools_stats()
+
+    # then
+    assert result["stats/1"].max_replicas == 2
+    assert len(result["stats/1"].replicas) == 1
+    del pool
+
+
+def test_get_max_replicas_when_replicas_not_configured() -> None:
+    # when
+    result = get_max_replicas(config=OnnxSessionConfig())
+
+    # then
+    assert result == 1
+
+
+def test_get_max_replicas_when_number_of_replicas_given() -> None:
+    # when
+    result = get_max_replicas(config=OnnxSessionConfig(max_replicas=3))
+
+    # then
+    assert result == 3
+
+
+@mock.patch.object(session_pool, "get_available_cpu_cores")
+def test_get_max_replicas_when_replicas_auto_sized(
+    get_available_cpu_cores_mock: MagicMock,
+) -> None:
+    # given
+    get_available_cpu_cores_mock.return_value = list(range(8))
+
+    # when
+    result = get_max_replicas(
+        config=OnnxSessionConfig(max_replicas=0, intra_op_num_threads=3)
+    )
+
+    # then
+    assert result == 2
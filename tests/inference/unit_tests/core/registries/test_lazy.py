@@ -0,0 +1,80 @@
+from collections import OrderedDict
+
+import pytest
+
+from inference.core.exceptions import ModelNotRecognisedError
+from inference.core.registries.base import ModelRegistry
+from inference.core.registries.lazy import LazyModelTypes, import_object
+
+
+def test_import_object_when_valid_path_given() -> None:
+    # when
+    result = import_object(path="collections:OrderedDict")
+
+    # then
+    assert result is OrderedDict
+
+
+@pytest.mark.parametrize(
+    "path", ["collections", "collections:NotExisting", "not_existing_module:Class"]
+)
+def test_import_object_when_invalid_path_given(path: str) -> None:
+    # when
+    with pytest.raises(ImportError):
+        _ = import_object(path=path)
+
+
+def test_lazy_model_types_imports_class_on_first_access_only() -> None:
+    # given
+    model_types = LazyModelTypes(
+        {("object-detection", "some"): "collections:OrderedDict"}
+    )
+
+    # when
+    imported_before_access = model_types.is_imported(("object-detection", "some"))
+    result = model_types[("object-detection", "some")]
+
+    # then
+    assert imported_before_access is False
+    assert result is OrderedDict
+    assert model_types.is_imported(("object-detection", "some")) is True
+
+
+def test_lazy_model_types_when_class_registered_directly() -> None:
+    # given
+    model_types = LazyModelTypes({})
+
+    # when
+    model_types[("classification", "custom")] = OrderedDict
+
+    # then
+    assert ("classification", "custom") in model_types
+    assert model_types[("classification", "custom")] is OrderedDict
+    assert len(model_types) == 1
+
+
+def test_lazy_model_types_when_class_cannot_be_imported() -> None:
+    # given
+    model_types = LazyModelTypes({("embed", "missing"): "not_existing_module:Class"})
+
+    # when
+    with pytest.raises(ModelNotRecognisedError):
+        _ = model_types[("embed", "missing")]
+
+    # then
+    assert model_types.is_imported(("embed", "missing")) is False
+
+
+def test_model_registry_backed_by_lazy_model_types() -> None:
+    # given
+    registry = ModelRegistry(
+        registry_dict=LazyModelTypes({"yolov8n": "collections:OrderedDict"})
+    )
+
+    # when
+    result = registry.get_model(model_type="yolov8n", model_id="non-important")
+
+    # then
+    assert result is OrderedDict
+    with pytest.raises(ModelNotRecognisedError):
+        _ = registry.get_model(model_type="yolov5n", model_id="non-important")
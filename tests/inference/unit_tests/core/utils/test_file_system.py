@@ -5,6 +5,7 @@ import pytest
 from humanfriendly.testing import touch
 
 from inference.core.utils.file_system import (
+    atomic_open,
     dump_bytes,
     dump_json,
     dump_text_lines,
@@ -374,6 +375,38 @@ def test_ensure_write_is_allowed_when_file_exists_and_override_not_allowed(
         ensure_write_is_allowed(path=path, allow_override=False)
 
 
+def test_atomic_open_when_write_succeeds(empty_local_dir: str) -> None:
+    # given
+    path = os.path.join(empty_local_dir, "file.txt")
+    with open(path, "w") as f:
+        f.write("old")
+
+    # when
+    with atomic_open(path=path) as f:
+        f.write("new")
+
+    # then
+    assert_text_file_content_correct(file_path=path, content="new")
+    assert os.listdir(empty_local_dir) == ["file.txt"]
+
+
+def test_atomic_open_when_write_fails(empty_local_dir: str) -> None:
+    # given
+    path = os.path.join(empty_local_dir, "file.txt")
+    with open(path, "w") as f:
+        f.write("old")
+
+    # when
+    with pytest.raises(ValueError):
+        with atomic_open(path=path) as f:
+            f.write("partial")
+            raise ValueError("interrupted")
+
+    # then
+    assert_text_file_content_correct(file_path=path, content="old")
+    assert os.listdir(empty_local_dir) == ["file.txt"]
+
+
 def assert_text_file_content_correct(file_path: str, content: str) -> None:
     with open(file_path) as f:
         assert f.read() == content
@@ -9,6 +9,7 @@ from inference.core.utils.postprocess import (
     clip_boxes_coordinates,
     clip_keypoints_coordinates,
     cosine_similarity,
+    cosine_similarity_matrix,
     crop_mask,
     get_static_crop_dimensions,
     post_process_bboxes,
@@ -69,6 +70,29 @@ def test_cosine_similarity_against_semi_aligned_vectors() -> None:
     assert abs(result - np.sqrt(2) / 2) < 1e-5
 
 
+def test_cosine_similarity_matrix() -> None:
+    # given
+    a = np.array([[1, 0], [5, 5]])
+    b = np.array([[0, 1], [-2, 0], [1, 0]])
+
+    # when
+    result = cosine_similarity_matrix(a=a, b=b)
+
+    # then
+    expected = np.array(
+        [[0.0, -1.0, 1.0], [np.sqrt(2) / 2, -np.sqrt(2) / 2, np.sqrt(2) / 2]]
+    )
+    assert np.allclose(result, expected)
+
+
+def test_cosine_similarity_matrix_against_single_vector() -> None:
+    # when
+    result = cosine_similarity_matrix(a=np.array([3, 0]), b=np.array([[1, 0], [0, 2]]))
+
+    # then
+    assert np.allclose(result, np.array([[1.0, 0.0]]))
+
+
 def test_cosine_similarity_against_bunch_of_vectors() -> None:
     # given
     a = np.array([[1, 0], [1, 0], [5, 5]])
@@ -0,0 +1,23 @@
+import os.path
+
+import cv2
+import numpy as np
+
+from inference_cli.lib.benchmark.dataset import load_images
+
+
+def test_load_images_from_local_directory(empty_directory: str) -> None:
+    # given
+    for name in ("a.jpg", "b.png"):
+        cv2.imwrite(
+            os.path.join(empty_directory, name), np.zeros((32, 48, 3), dtype=np.uint8)
+        )
+    with open(os.path.join(empty_directory, "notes.txt"), "w") as f:
+        f.write("not an image")
+
+    # when
+    result = load_images(directory=empty_directory)
+
+    # then
+    assert len(result) == 2
+    assert all(image.shape == (32, 48, 3) for image in result)
@@ -0,0 +1,139 @@
+import threading
+import time
+from dataclasses import replace
+
+from inference_cli.lib.benchmark.load_profiles import (
+    PhaseResultsRecorder,
+    find_throughput_knee,
+    get_concurrency_levels,
+    run_closed_loop_phase,
+    run_open_loop_phase,
+)
+
+
+def test_get_concurrency_levels() -> None:
+    # when
+    result = get_concurrency_levels(max_concurrency=12)
+
+    # then
+    assert result == [1, 2, 4, 8, 12]
+
+
+def _phase_statistics(concurrency: int, requests_per_second: float):
+    recorder = PhaseResultsRecorder()
+    statistics = recorder.summarise(
+        phase=f"concurrency={concurrency}",
+        duration=1.0,
+        request_batch_size=1,
+        concurrency=concurrency,
+    )
+    return replace(statistics, requests_per_second=requests_per_second)
+
+
+def test_find_throughput_knee() -> None:
+    # given
+    phases = [
+        _phase_statistics(concurrency=1, requests_per_second=10),
+        _phase_statistics(concurrency=2, requests_per_second=19),
+        _phase_statistics(concurrency=4, requests_per_second=34),
+        _phase_statistics(concurrency=8, requests_per_second=35),
+        _phase_statistics(concurrency=16, requests_per_second=35.5),
+    ]
+
+    # when
+    result = find_throughput_knee(phases=phases, tolerance=0.05)
+
+    # then
+    assert result == 4
+
+
+def test_run_closed_loop_phase_respects_concurrency_and_requests_number() -> None:
+    # given
+    lock = threading.Lock()
+    in_flight, max_observed_in_flight = 0, 0
+
+    def request_function() -> None:
+        nonlocal in_flight, max_observed_in_flight
+        with lock:
+            in_flight += 1
+            max_observed_in_flight = max(max_observed_in_flight, in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight -= 1
+
+    recorder = PhaseResultsRecorder()
+
+    # when
+    _ = run_closed_loop_phase(
+        request_function=request_function,
+        concurrency=3,
+        requests_number=20,
+        recorder=recorder,
+    )
+
+    # then
+    assert recorder.service_time.total_count == 20
+    assert max_observed_in_flight == 3
+
+
+def test_run_open_loop_phase_does_not_wait_for_slow_responses() -> None:
+    # given
+    recorder = PhaseResultsRecorder()
+
+    def slow_request_function() -> None:
+        time.sleep(0.1)
+
+    # when
+    duration = run_open_loop_phase(
+        request_function=slow_request_function,
+        requests_per_second=200,
+        requests_number=20,
+        max_in_flight=32,
+        recorder=recorder,
+        seed=42,
+    )
+
+    # then
+    assert recorder.service_time.total_count == 20
+    assert duration < 1.0, "Expected requests to be sent without waiting for responses"
+
+
+def test_run_open_loop_phase_reflects_queueing_in_response_time() -> None:
+    # given
+    recorder = PhaseResultsRecorder()
+
+    def slow_request_function() -> None:
+        time.sleep(0.02)
+
+    # when
+    _ = run_open_loop_phase(
+        request_function=slow_request_function,
+        requests_per_second=500,
+        requests_number=20,
+        max_in_flight=1,
+        recorder=recorder,
+        seed=42,
+    )
+
+    # then
+    assert recorder.service_time.percentile(99) < 0.05
+    assert (
+        recorder.response_time.percentile(99) > 0.1
+    ), "Expected time spent in queue (due to in-flight limit) to be included in response time"
+
+
+def test_phase_results_recorder_registers_errors() -> None:
+    # given
+    recorder = PhaseResultsRecorder()
+
+    # when
+    recorder.register_request(intended_start=0.0, start=0.0, end=0.1, error=None)
+    recorder.register_request(intended_start=0.0, start=0.0, end=0.1, error="500")
+    recorder.register_request(intended_start=0.0, start=0.0, end=0.1, error="500")
+    result = recorder.summarise(phase="some", duration=1.0, request_batch_size=2)
+
+    # then
+    assert result.requests_made == 3
+    assert result.images_processed == 6
+    assert result.errors == 2
+    assert result.error_status_codes == {"500": 2}
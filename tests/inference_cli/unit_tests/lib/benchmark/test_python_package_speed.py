@@ -0,0 +1,76 @@
+from inference_cli.lib.benchmark.python_package_speed import (
+    aggregate_step_timings,
+    profile_allocations,
+)
+
+
+def test_aggregate_step_timings() -> None:
+    # given
+    trace = [
+        {"name": "workflow_run", "ph": "B", "ts": 100},
+        {
+            "name": "step_execution",
+            "ph": "X",
+            "ts": 100,
+            "dur": 9000,
+            "args": {"step_selector": "$steps.model"},
+        },
+        {
+            "name": "step_execution",
+            "ph": "X",
+            "ts": 200,
+            "dur": 2000,
+            "args": {"step_selector": "$steps.model"},
+        },
+        {
+            "name": "step_code_execution",
+            "ph": "X",
+            "ts": 210,
+            "dur": 1000,
+            "args": {"step": "$steps.model", "data_size": 1},
+        },
+        {
+            "name": "step_execution",
+            "ph": "X",
+            "ts": 300,
+            "dur": 4000,
+            "args": {"step_selector": "$steps.crop"},
+        },
+        {"name": "outputs_construction", "ph": "X", "ts": 400, "dur": 100},
+    ]
+
+    # when
+    result = aggregate_step_timings(trace=trace, since_ts=150)
+
+    # then
+    assert set(result.keys()) == {"$steps.model", "$steps.crop"}
+    assert (
+        result["$steps.model"]["step_execution"]["count"] == 1
+    ), "Expected events before `since_ts` (warm-up) to be ignored"
+    assert result["$steps.model"]["step_execution"]["avg_ms"] == 2.0
+    assert result["$steps.model"]["step_code_execution"]["total_ms"] == 1.0
+    assert result["$steps.crop"]["step_execution"]["p50_ms"] == 4.0
+
+
+def test_profile_allocations() -> None:
+    # given
+    retained = []
+
+    def run_workflow() -> None:
+        retained.append(bytearray(1024))
+
+    # when
+    result = profile_allocations(run_workflow=run_workflow, runs=5)
+
+    # then
+    assert result["runs"] == 5
+    assert result["peak_traced_memory_mb"] > 0
+    assert result["live_blocks_allocated_during_runs"] >= 5
+
+
+def test_profile_allocations_when_disabled() -> None:
+    # when
+    result = profile_allocations(run_workflow=lambda: None, runs=0)
+
+    # then
+    assert result == {}
@@ -0,0 +1,82 @@
+import random
+
+import numpy as np
+import pytest
+
+from inference_cli.lib.benchmark.results_gathering import LatencyHistogram
+
+
+def test_latency_histogram_percentiles_are_within_precision_bounds() -> None:
+    # given
+    histogram = LatencyHistogram()
+    generator = random.Random(42)
+    values = [generator.uniform(0.001, 2.0) for _ in range(10_000)]
+
+    # when
+    for value in values:
+        histogram.record(latency=value)
+
+    # then
+    for percentile in (50, 90, 99, 99.9):
+        expected = np.percentile(values, percentile)
+        assert histogram.percentile(percentile) == pytest.approx(expected, rel=0.01)
+
+
+def test_latency_histogram_when_no_values_recorded() -> None:
+    # given
+    histogram = LatencyHistogram()
+
+    # when
+    result = histogram.to_dict()
+
+    # then
+    assert result["count"] == 0
+    assert result["percentiles_ms"]["p99"] == 0.0
+
+
+def test_latency_histogram_to_dict() -> None:
+    # given
+    histogram = LatencyHistogram()
+
+    # when
+    for value in (0.01, 0.02, 0.03):
+        histogram.record(latency=value)
+    result = histogram.to_dict()
+
+    # then
+    assert result["count"] == 3
+    assert result["min_ms"] == 10.0
+    assert result["max_ms"] == 30.0
+    assert result["mean_ms"] == 20.0
+    assert sum(count for _, count in result["buckets_upper_bound_ms_and_count"]) == 3
+
+
+def test_latency_histogram_corrects_coordinated_omission() -> None:
+    # given
+    histogram = LatencyHistogram()
+
+    # when
+    histogram.record(latency=0.01, expected_interval=0.01)
+    histogram.record(latency=0.05, expected_interval=0.01)
+
+    # then
+    assert histogram.total_count == 6, (
+        "Expected 50ms latency with 10ms expected interval to imply 4 requests held back "
+        "(with latencies of 40ms, 30ms, 20ms and 10ms)"
+    )
+    assert histogram.percentile(50) == pytest.approx(0.02, rel=0.01)
+
+
+def test_latency_histogram_merge() -> None:
+    # given
+    histogram_a, histogram_b = LatencyHistogram(), LatencyHistogram()
+    histogram_a.record(latency=0.01)
+    histogram_b.record(latency=0.5)
+
+    # when
+    histogram_a.merge(histogram_b)
+
+    # then
+    assert histogram_a.total_count == 2
+    assert histogram_a.percentile(100) == pytest.approx(0.5, rel=0.01)
+    assert histogram_a.to_dict()["min_ms"] == 10.0
@@ -1,12 +1,19 @@
 import json
 import os.path
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator, Tuple
 
 import cv2
 import numpy as np
 import pytest
 
 from inference_cli.lib.infer_adapter import (
+    BackgroundWriter,
+    infer_concurrently,
     is_something_to_do,
+    prefetch_images,
     prepare_target_path,
     save_prediction,
     save_visualisation_image,
@@ -116,3 +123,141 @@ def test_is_something_to_do_when_output_location_is_not_given_and_at_least_one_o
 
     # then
     assert result is False
+
+
+def _generate_images(
+    count: int,
+) -> Generator[Tuple[str, np.ndarray], None, None]:
+    for i in range(count):
+        yield f"{i}.jpg", np.full((4, 4, 3), i, dtype=np.uint8)
+
+
+def test_prefetch_images_yields_all_images_in_order() -> None:
+    # when
+    result = list(prefetch_images(images=_generate_images(count=10), prefetch=2))
+
+    # then
+    assert [reference for reference, _ in result] == [f"{i}.jpg" for i in range(10)]
+    assert [int(image[0, 0, 0]) for _, image in result] == list(range(10))
+
+
+def test_prefetch_images_when_loader_fails() -> None:
+    # given
+    def failing_loader() -> Generator[Tuple[str, np.ndarray], None, None]:
+        yield from _generate_images(count=2)
+        raise IOError("Could not read image")
+
+    images = prefetch_images(images=failing_loader(), prefetch=4)
+
+    # when
+    with pytest.raises(IOError):
+        _ = list(images)
+
+
+def _slow_for_first_image_inference(image: np.ndarray) -> dict:
+    image_id = int(image[0, 0, 0])
+    if image_id == 0:
+        time.sleep(0.2)
+    return {"image_id": image_id}
+
+
+def test_infer_concurrently_when_ordered_results_requested() -> None:
+    # given
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # when
+        result = list(
+            infer_concurrently(
+                images=_generate_images(count=8),
+                infer_function=_slow_for_first_image_inference,
+                executor=executor,
+                max_in_flight=4,
+                ordered=True,
+            )
+        )
+
+    # then
+    assert [reference for reference, _, _ in result] == [f"{i}.jpg" for i in range(8)]
+    assert [prediction["image_id"] for _, _, prediction in result] == list(range(8))
+
+
+def test_infer_concurrently_when_unordered_results_requested() -> None:
+    # given
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # when
+        result = list(
+            infer_concurrently(
+                images=_generate_images(count=8),
+                infer_function=_slow_for_first_image_inference,
+                executor=executor,
+                max_in_flight=4,
+                ordered=False,
+            )
+        )
+
+    # then
+    assert sorted(prediction["image_id"] for _, _, prediction in result) == list(
+        range(8)
+    )
+    assert (
+        result[0][2]["image_id"] != 0
+    ), "Expected slow request not to hold back results of the following ones"
+
+
+def test_infer_concurrently_does_not_exceed_max_in_flight_requests() -> None:
+    # given
+    lock = threading.Lock()
+    in_flight, max_observed_in_flight = 0, 0
+
+    def infer_function(image: np.ndarray) -> dict:
+        nonlocal in_flight, max_observed_in_flight
+        with lock:
+            in_flight += 1
+            max_observed_in_flight = max(max_observed_in_flight, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return {}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # when
+        result = list(
+            infer_concurrently(
+                images=_generate_images(count=20),
+                infer_function=infer_function,
+                executor=executor,
+                max_in_flight=3,
+                ordered=False,
+            )
+        )
+
+    # then
+    assert len(result) == 20
+    assert max_observed_in_flight <= 3
+
+
+def test_background_writer_saves_all_results(empty_directory: str) -> None:
+    # when
+    with BackgroundWriter(max_workers=2, max_pending=1) as writer:
+        for i in range(5):
+            writer.submit(
+                save_prediction,
+                reference=i,
+                prediction={"id": i},
+                output_location=empty_directory,
+            )
+
+    # then
+    assert sorted(os.listdir(empty_directory)) == [
+        f"frame_{str(i).zfill(6)}.json" for i in range(5)
+    ]
+
+
+def test_background_writer_when_write_fails() -> None:
+    # given
+    def failing_write() -> None:
+        raise IOError("Disk full")
+
+    # when
+    with pytest.raises(IOError):
+        with BackgroundWriter(max_workers=2) as writer:
+            writer.submit(failing_write)
@@ -0,0 +1,191 @@
+import csv
+import json
+import os.path
+
+import numpy as np
+import pytest
+
+from inference_cli.lib.workflows.common import (
+    FAILURES_FILE_NAME,
+    ProgressLog,
+    ResultsWriter,
+    discover_images,
+    reset_failures,
+    save_failure,
+    summarise_processing,
+)
+from inference_cli.lib.workflows.entities import OutputFileType, ProcessingResult
+
+
+def _touch(path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w"):
+        pass
+
+
+def test_discover_images_when_nested_directories_and_non_image_files_present(
+    empty_directory: str,
+) -> None:
+    # given
+    _touch(os.path.join(empty_directory, "b.jpg"))
+    _touch(os.path.join(empty_directory, "a.PNG"))
+    _touch(os.path.join(empty_directory, "nested", "c.jpeg"))
+    _touch(os.path.join(empty_directory, "nested", "notes.txt"))
+
+    # when
+    result = discover_images(directory=empty_directory)
+
+    # then
+    assert result == [
+        "a.PNG",
+        "b.jpg",
+        os.path.join("nested", "c.jpeg"),
+    ], "Expected images only, with paths relative to directory, in sorted order"
+
+
+def test_progress_log_when_resumed(empty_directory: str) -> None:
+    # given
+    path = os.path.join(empty_directory, "progress.log")
+    progress_log = ProgressLog(path=path, resume=True)
+    progress_log.mark_processed(reference="a.jpg")
+    progress_log.mark_processed(reference="b.jpg")
+    progress_log.close()
+
+    # when
+    resumed_progress_log = ProgressLog(path=path, resume=True)
+    resumed_progress_log.mark_processed(reference="c.jpg")
+    resumed_progress_log.close()
+
+    # then
+    assert resumed_progress_log.is_processed("a.jpg") is True
+    assert resumed_progress_log.is_processed("c.jpg") is True
+    assert resumed_progress_log.is_processed("d.jpg") is False
+    assert len(resumed_progress_log) == 3
+    with open(path) as f:
+        assert f.read().split() == ["a.jpg", "b.jpg", "c.jpg"]
+
+
+def test_progress_log_when_not_resumed(empty_directory: str) -> None:
+    # given
+    path = os.path.join(empty_directory, "progress.log")
+    progress_log = ProgressLog(path=path, resume=True)
+    progress_log.mark_processed(reference="a.jpg")
+    progress_log.close()
+
+    # when
+    fresh_progress_log = ProgressLog(path=path, resume=False)
+    fresh_progress_log.close()
+
+    # then
+    assert fresh_progress_log.is_processed("a.jpg") is False
+    assert len(fresh_progress_log) == 0
+    assert os.path.getsize(path) == 0, "Expected progress log to be truncated"
+
+
+def test_results_writer_when_jsonl_output_requested(empty_directory: str) -> None:
+    # given
+    path = os.path.join(empty_directory, "results.jsonl")
+    writer = ResultsWriter(
+        path=path,
+        output_file_type=OutputFileType.JSONL,
+        reference_column="image",
+        output_names=["predictions"],
+        resume=False,
+    )
+
+    # when
+    writer.write(reference="a.jpg", result={"predictions": np.array([1, 2])})
+    writer.write(reference="b.jpg", result={"predictions": {"count": np.int64(3)}})
+    writer.close()
+
+    # then
+    with open(path) as f:
+        result = [json.loads(line) for line in f]
+    assert result == [
+        {"image": "a.jpg", "predictions": [1, 2]},
+        {"image": "b.jpg", "predictions": {"count": 3}},
+    ]
+
+
+def test_results_writer_when_csv_output_requested_and_job_resumed(
+    empty_directory: str,
+) -> None:
+    # given
+    path = os.path.join(empty_directory, "results.csv")
+    writer = ResultsWriter(
+        path=path,
+        output_file_type=OutputFileType.CSV,
+        reference_column="image",
+        output_names=["count", "predictions"],
+        resume=True,
+    )
+    writer.write(reference="a.jpg", result={"count": 1, "predictions": [{"x": 1}]})
+    writer.close()
+
+    # when
+    resumed_writer = ResultsWriter(
+        path=path,
+        output_file_type=OutputFileType.CSV,
+        reference_column="image",
+        output_names=["count", "predictions"],
+        resume=True,
+    )
+    resumed_writer.write(reference="b.jpg", result={"count": 0})
+    resumed_writer.close()
+
+    # then
+    with open(path, newline="") as f:
+        result = list(csv.DictReader(f))
+    assert result == [
+        {"image": "a.jpg", "count": "1", "predictions": '[{"x": 1}]'},
+        {"image": "b.jpg", "count": "0", "predictions": ""},
+    ], "Expected single header and non-scalar values serialised to JSON"
+
+
+def test_save_failure_and_reset_failures(empty_directory: str) -> None:
+    # given
+    save_failure(
+        output_directory=empty_directory,
+        processing_result=ProcessingResult(
+            reference="a.jpg", result=None, error="ValueError: broken", latency=0.1
+        ),
+    )
+    path = os.path.join(empty_directory, FAILURES_FILE_NAME)
+
+    # when
+    with open(path) as f:
+        saved_failures = [json.loads(line) for line in f]
+    reset_failures(output_directory=empty_directory)
+
+    # then
+    assert saved_failures == [{"reference": "a.jpg", "error": "ValueError: broken"}]
+    assert not os.path.exists(path)
+
+
+def test_summarise_processing() -> None:
+    # when
+    result = summarise_processing(
+        latencies=[0.1, 0.2, 0.3, 0.4],
+        failed=1,
+        skipped=2,
+        duration=2.0,
+    )
+
+    # then
+    assert result.processed == 4
+    assert result.failed == 1
+    assert result.skipped == 2
+    assert abs(result.throughput - 2.0) < 1e-5
+    assert abs(result.latency_avg - 0.25) < 1e-5
+    assert abs(result.latency_p50 - 0.25) < 1e-5
+    assert result.latency_p99 == pytest.approx(0.397, abs=1e-5)
+
+
+def test_summarise_processing_when_nothing_processed() -> None:
+    # when
+    result = summarise_processing(latencies=[], failed=0, skipped=5, duration=0.0)
+
+    # then
+    assert result.processed == 0
+    assert result.throughput == 0.0
+    assert result.latency_avg == 0.0
@@ -0,0 +1,149 @@
+from pathlib import Path
+from typing import List
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from inference.core.embedding_index.index import EmbeddingIndex
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.core_steps.models.foundation.clip_embedding_index import (
+    v1 as clip_embedding_index_v1,
+)
+from inference.core.workflows.core_steps.models.foundation.clip_embedding_index.v1 import (
+    BlockManifest,
+    ClipEmbeddingIndexBlockV1,
+)
+from inference.core.workflows.execution_engine.entities.base import (
+    ImageParentMetadata,
+    WorkflowImageData,
+)
+
+
+def test_manifest_parsing_when_data_is_valid() -> None:
+    # given
+    data = {
+        "type": "roboflow_core/clip_embedding_index@v1",
+        "name": "some",
+        "images": "$inputs.image",
+        "collection": "$inputs.collection",
+        "mode": "deduplicate",
+        "similarity_threshold": 0.9,
+    }
+
+    # when
+    result = BlockManifest.model_validate(data)
+
+    # then
+    assert result == BlockManifest(
+        type="roboflow_core/clip_embedding_index@v1",
+        name="some",
+        images="$inputs.image",
+        collection="$inputs.collection",
+        mode="deduplicate",
+        top_k=5,
+        similarity_threshold=0.9,
+        version="ViT-B-16",
+    )
+
+
+def test_manifest_parsing_when_mode_is_invalid() -> None:
+    # given
+    data = {
+        "type": "roboflow_core/clip_embedding_index@v1",
+        "name": "some",
+        "images": "$inputs.image",
+        "collection": "frames",
+        "mode": "invalid",
+    }
+
+    # when
+    with pytest.raises(ValidationError):
+        _ = BlockManifest.model_validate(data)
+
+
+def test_manifest_parsing_when_collection_is_missing() -> None:
+    # given
+    data = {
+        "type": "roboflow_core/clip_embedding_index@v1",
+        "name": "some",
+        "images": "$inputs.image",
+    }
+
+    # when
+    with pytest.raises(ValidationError):
+        _ = BlockManifest.model_validate(data)
+
+
+def _create_block(embeddings: np.ndarray) -> ClipEmbeddingIndexBlockV1:
+    model_manager = MagicMock()
+    model_manager.__getitem__.return_value.embed_image.return_value = embeddings
+    return ClipEmbeddingIndexBlockV1(
+        model_manager=model_manager,
+        api_key="my-api-key",
+        step_execution_mode=StepExecutionMode.LOCAL,
+    )
+
+
+def _create_images(count: int) -> List[WorkflowImageData]:
+    return [
+        WorkflowImageData(
+            parent_metadata=ImageParentMetadata(parent_id=f"image_{i}"),
+            numpy_image=np.zeros((10, 10, 3), dtype=np.uint8),
+        )
+        for i in range(count)
+    ]
+
+
+@mock.patch.object(clip_embedding_index_v1, "get_collections_namespace")
+def test_clip_embedding_index_block_deduplicates_and_searches_images(
+    get_collections_namespace_mock: MagicMock,
+    tmp_path: Path,
+) -> None:
+    # given
+    get_collections_namespace_mock.return_value = "my-workspace"
+    index = EmbeddingIndex(root_dir=str(tmp_path))
+    block = _create_block(
+        embeddings=np.array([[1.0, 0.0], [1.0, 0.01], [0.0, 1.0]], dtype=np.float32)
+    )
+
+    # when
+    with mock.patch.object(clip_embedding_index_v1, "embedding_index", index):
+        added = block.run(
+            images=_create_images(count=3),
+            collection="frames",
+            mode="deduplicate",
+            top_k=5,
+            similarity_threshold=0.95,
+            version="ViT-B-16",
+        )
+        search_block = _create_block(
+            embeddings=np.array([[0.1, 1.0]], dtype=np.float32)
+        )
+        found = search_block.run(
+            images=_create_images(count=1),
+            collection="frames",
+            mode="search",
+            top_k=5,
+            similarity_threshold=0.95,
+            version="ViT-B-16",
+        )
+
+    # then
+    assert [result["is_duplicate"] for result in added] == [False, True, False]
+    assert added[0]["max_similarity"] is None
+    assert added[1]["matches"][0]["id"] == added[0]["embedding_id"]
+    assert added[1]["embedding_id"] is None
+    collection = index.get_collection(name="frames", namespace="my-workspace")
+    assert sorted(collection.ids()) == sorted(
+        [added[0]["embedding_id"], added[2]["embedding_id"]]
+    )
+    assert [match["id"] for match in found[0]["matches"]] == [
+        added[2]["embedding_id"],
+        added[0]["embedding_id"],
+    ]
+    assert found[0]["is_duplicate"] is True
+    assert found[0]["embedding_id"] is None
+    assert len(collection) == 2
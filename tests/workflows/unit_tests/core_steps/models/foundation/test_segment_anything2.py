@@ -0,0 +1,78 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import supervision as sv
+
+from inference.core.entities.requests.sam2 import Sam2BatchSegmentationRequest
+from inference.core.entities.responses.sam2 import (
+    Sam2SegmentationPrediction,
+    Sam2SegmentationResponse,
+)
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.core_steps.models.foundation.segment_anything2.v1 import (
+    SegmentAnything2BlockV1,
+)
+from inference.core.workflows.execution_engine.entities.base import (
+    ImageParentMetadata,
+    WorkflowImageData,
+)
+
+
+def test_segment_anything2_block_segments_batch_of_images_in_single_request() -> None:
+    # given
+    images = [
+        WorkflowImageData(
+            parent_metadata=ImageParentMetadata(parent_id=f"image_{i}"),
+            numpy_image=np.zeros((100, 200, 3), dtype=np.uint8),
+        )
+        for i in range(2)
+    ]
+    boxes = [
+        sv.Detections(
+            xyxy=np.array([[10, 10, 50, 50], [60, 20, 100, 80]], dtype=np.float64),
+            confidence=np.array([0.9, 0.8]),
+            class_id=np.array([1, 2]),
+            data={
+                "class_name": np.array(["cat", "dog"]),
+                "detection_id": np.array(["a", "b"]),
+            },
+        ),
+        sv.Detections.empty(),
+    ]
+    model_manager = MagicMock()
+    square = [[10, 10], [50, 10], [50, 50], [10, 50]]
+    model_manager.infer_from_request_sync.return_value = [
+        Sam2SegmentationResponse(
+            predictions=[
+                Sam2SegmentationPrediction(masks=[square], confidence=0.9),
+                Sam2SegmentationPrediction(masks=[square], confidence=0.1),
+            ],
+            time=0.1,
+        ),
+        Sam2SegmentationResponse(predictions=[], time=0.1),
+    ]
+    block = SegmentAnything2BlockV1(
+        model_manager=model_manager,
+        api_key=None,
+        step_execution_mode=StepExecutionMode.LOCAL,
+    )
+
+    # when
+    result = block.run(
+        images=images,
+        boxes=boxes,
+        version="hiera_tiny",
+        threshold=0.5,
+        multimask_output=True,
+    )
+
+    # then
+    assert model_manager.infer_from_request_sync.call_count == 1
+    request = model_manager.infer_from_request_sync.call_args[0][1]
+    assert isinstance(request, Sam2BatchSegmentationRequest)
+    assert len(request.images) == 2
+    assert [len(prompt_set.prompts) for prompt_set in request.prompts] == [2, 0]
+    assert request.prompts[0].prompts[1].box.x == 80
+    assert len(result) == 2
+    assert result[0]["predictions"]["class_name"].tolist() == ["cat"]
+    assert len(result[1]["predictions"]) == 0
@@ -1,9 +1,18 @@
+from typing import List, Type
+from unittest.mock import MagicMock
+
 import pytest
 
 from inference.core.workflows.errors import WorkflowEnvironmentConfigurationError
 from inference.core.workflows.execution_engine.v1.compiler.cache import (
     BasicWorkflowsCache,
+    CompiledWorkflowsCache,
+)
+from inference.core.workflows.execution_engine.v1.compiler.entities import (
+    BlockSpecification,
+    InitialisedStep,
 )
+from inference.core.workflows.prototypes.block import WorkflowBlock
 
 
 def test_cache_when_hash_key_cannot_be_obtained() -> None:
@@ -83,3 +92,167 @@ def test_cache_being_emptied_properly() -> None:
     assert cache.get(key_one) is None
     assert cache.get(key_two) == "my_value_2"
     assert cache.get(key_three) == "my_value_3"
+
+
+class StatelessBlock(WorkflowBlock):
+    @classmethod
+    def get_init_parameters(cls) -> List[str]:
+        return ["model_manager"]
+
+    @classmethod
+    def get_manifest(cls) -> Type:
+        return MagicMock
+
+    def run(self, *args, **kwargs):
+        pass
+
+
+class StatefulBlock(StatelessBlock):
+    @classmethod
+    def holds_state_between_runs(cls) -> bool:
+        return True
+
+
+class RequestScopedBlock(StatelessBlock):
+    @classmethod
+    def get_init_parameters(cls) -> List[str]:
+        return ["background_tasks"]
+
+
+def _initialised_step(name: str, block_class: Type[WorkflowBlock]) -> InitialisedStep:
+    manifest = MagicMock()
+    manifest.name = name
+    return InitialisedStep(
+        block_specification=BlockSpecification(
+            block_source="workflows_core",
+            identifier=block_class.__name__,
+            block_class=block_class,
+            manifest_class=MagicMock,
+        ),
+        manifest=manifest,
+        step=MagicMock(),
+    )
+
+
+def test_compiled_workflows_cache_hash_key_ignores_request_scoped_init_parameters() -> (
+    None
+):
+    # given
+    cache = CompiledWorkflowsCache(
+        cache_size=16,
+        request_scoped_init_parameters=["workflows_core.background_tasks"],
+    )
+    model_manager = object()
+
+    # when
+    first_key = cache.get_hash_key(
+        workflow_definition={"steps": []},
+        init_parameters={
+            "workflows_core.model_manager": model_manager,
+            "workflows_core.background_tasks": object(),
+        },
+        execution_engine_version="1.0.0",
+    )
+    second_key = cache.get_hash_key(
+        workflow_definition={"steps": []},
+        init_parameters={
+            "workflows_core.model_manager": model_manager,
+            "workflows_core.background_tasks": object(),
+        },
+        execution_engine_version="1.0.0",
+    )
+
+    # then
+    assert first_key == second_key
+
+
+def test_compiled_workflows_cache_hash_key_depends_on_init_parameters() -> None:
+    # given
+    cache = CompiledWorkflowsCache(cache_size=16)
+
+    # when
+    first_key = cache.get_hash_key(
+        workflow_definition={"steps": []},
+        init_parameters={"workflows_core.api_key": "a"},
+        execution_engine_version="1.0.0",
+    )
+    second_key = cache.get_hash_key(
+        workflow_definition={"steps": []},
+        init_parameters={"workflows_core.api_key": "b"},
+        execution_engine_version="1.0.0",
+    )
+    third_key = cache.get_hash_key(
+        workflow_definition={"steps": [], "version": "1.1"},
+        init_parameters={"workflows_core.api_key": "a"},
+        execution_engine_version="1.0.0",
+    )
+
+    # then
+    assert len({first_key, second_key, third_key}) == 3
+
+
+def test_compiled_workflows_cache_caches_only_reusable_steps() -> None:
+    # given
+    cache = CompiledWorkflowsCache(
+        cache_size=16,
+        request_scoped_init_parameters=["workflows_core.background_tasks"],
+    )
+    steps = [
+        _initialised_step(name="stateless", block_class=StatelessBlock),
+        _initialised_step(name="stateful", block_class=StatefulBlock),
+        _initialised_step(name="request_scoped", block_class=RequestScopedBlock),
+    ]
+
+    # when
+    cache.cache(key="some", workflow_definition={}, steps=steps)
+    result = cache.get(key="some")
+
+    # then
+    assert result == {"stateless": steps[0]}
+
+
+def test_compiled_workflows_cache_being_emptied_in_lru_order() -> None:
+    # given
+    cache = CompiledWorkflowsCache(cache_size=2)
+    step = _initialised_step(name="stateless", block_class=StatelessBlock)
+
+    # when
+    cache.cache(key="a", workflow_definition={}, steps=[step])
+    cache.cache(key="b", workflow_definition={}, steps=[step])
+    _ = cache.get(key="a")
+    cache.cache(key="c", workflow_definition={}, steps=[step])
+
+    # then
+    assert cache.get(key="a") == {"stateless": step}
+    assert cache.get(key="b") == {}, "Least recently used entry expected to be removed"
+    assert cache.get(key="c") == {"stateless": step}
+
+
+def test_compiled_workflows_cache_invalidation_of_specific_workflow() -> None:
+    # given
+    cache = CompiledWorkflowsCache(cache_size=16)
+    step = _initialised_step(name="stateless", block_class=StatelessBlock)
+    cache.cache(key="a", workflow_definition={"name": "a"}, steps=[step])
+    cache.cache(key="a_other_params", workflow_definition={"name": "a"}, steps=[step])
+    cache.cache(key="b", workflow_definition={"name": "b"}, steps=[step])
+
+    # when
+    cache.invalidate(workflow_definition={"name": "a"})
+
+    # then
+    assert len(cache) == 1
+    assert cache.get(key="b") == {"stateless": step}
+
+
+def test_compiled_workflows_cache_invalidation_of_all_workflows() -> None:
+    # given
+    cache = CompiledWorkflowsCache(cache_size=16)
+    step = _initialised_step(name="stateless", block_class=StatelessBlock)
+    cache.cache(key="a", workflow_definition={"name": "a"}, steps=[step])
+    cache.cache(key="b", workflow_definition={"name": "b"}, steps=[step])
+
+    # when
+    cache.invalidate()
+
+    # then
+    assert len(cache) == 0
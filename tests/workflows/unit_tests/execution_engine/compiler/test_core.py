@@ -1,12 +1,17 @@
 from collections import defaultdict
+from unittest.mock import MagicMock
 
 from inference.core.workflows.execution_engine.entities.base import (
     JsonField,
     WorkflowImage,
     WorkflowParameter,
 )
+from inference.core.workflows.execution_engine.v1.compiler.cache import (
+    CompiledWorkflowsCache,
+)
 from inference.core.workflows.execution_engine.v1.compiler.core import (
     collect_input_substitutions,
+    compile_workflow,
 )
 from inference.core.workflows.execution_engine.v1.compiler.entities import (
     ParsedWorkflowDefinition,
@@ -71,3 +76,144 @@ def test_collect_input_substitutions() -> None:
             "model_id": "model_2",
         },
     }
+
+
+WORKFLOW_WITH_STATEFUL_AND_STATELESS_STEPS = {
+    "version": "1.0",
+    "inputs": [
+        {"type": "WorkflowImage", "name": "image"},
+        {"type": "WorkflowVideoMetadata", "name": "video_metadata"},
+    ],
+    "steps": [
+        {
+            "type": "ObjectDetectionModel",
+            "name": "model",
+            "image": "$inputs.image",
+            "model_id": "yolov8n-640",
+        },
+        {
+            "type": "roboflow_core/byte_tracker@v1",
+            "name": "byte_tracker",
+            "metadata": "$inputs.video_metadata",
+            "detections": "$steps.model.predictions",
+        },
+    ],
+    "outputs": [
+        {
+            "type": "JsonField",
+            "name": "tracked_detections",
+            "selector": "$steps.byte_tracker.tracked_detections",
+        },
+    ],
+}
+
+
+def test_compile_workflow_reuses_only_stateless_steps_when_cache_provided() -> None:
+    # given
+    cache = CompiledWorkflowsCache(
+        cache_size=16,
+        request_scoped_init_parameters=["workflows_core.background_tasks"],
+    )
+    model_manager = MagicMock()
+
+    # when
+    first_result = compile_workflow(
+        workflow_definition=WORKFLOW_WITH_STATEFUL_AND_STATELESS_STEPS,
+        init_parameters={
+            "workflows_core.model_manager": model_manager,
+            "workflows_core.background_tasks": object(),
+        },
+        compiled_workflows_cache=cache,
+    )
+    second_result = compile_workflow(
+        workflow_definition=WORKFLOW_WITH_STATEFUL_AND_STATELESS_STEPS,
+        init_parameters={
+            "workflows_core.model_manager": model_manager,
+            "workflows_core.background_tasks": object(),
+        },
+        compiled_workflows_cache=cache,
+    )
+
+    # then
+    assert (
+        first_result.steps["model"].step is second_result.steps["model"].step
+    ), "Expected stateless step to be re-used"
+    assert (
+        first_result.steps["byte_tracker"].step
+        is not second_result.steps["byte_tracker"].step
+    ), "Expected stateful step to be initialised again"
+    assert (
+        second_result.init_parameters["workflows_core.background_tasks"]
+        is not first_result.init_parameters["workflows_core.background_tasks"]
+    ), "Expected init parameters of current compilation to be exposed"
+
+
+WORKFLOW_WITH_TRACE_VISUALIZATION = {
+    "version": "1.0",
+    "inputs": [{"type": "WorkflowImage", "name": "image"}],
+    "steps": [
+        {
+            "type": "ObjectDetectionModel",
+            "name": "model",
+            "image": "$inputs.image",
+            "model_id": "yolov8n-640",
+        },
+        {
+            "type": "roboflow_core/trace_visualization@v1",
+            "name": "trace",
+            "image": "$inputs.image",
+            "predictions": "$steps.model.predictions",
+        },
+    ],
+    "outputs": [
+        {
+            "type": "JsonField",
+            "name": "image",
+            "selector": "$steps.trace.image",
+        },
+    ],
+}
+
+
+def test_compile_workflow_does_not_reuse_trace_visualization_steps() -> None:
+    # given
+    cache = CompiledWorkflowsCache(cache_size=16)
+    model_manager = MagicMock()
+
+    # when
+    first_result = compile_workflow(
+        workflow_definition=WORKFLOW_WITH_TRACE_VISUALIZATION,
+        init_parameters={"workflows_core.model_manager": model_manager},
+        compiled_workflows_cache=cache,
+    )
+    second_result = compile_workflow(
+        workflow_definition=WORKFLOW_WITH_TRACE_VISUALIZATION,
+        init_parameters={"workflows_core.model_manager": model_manager},
+        compiled_workflows_cache=cache,
+    )
+
+    # then
+    assert (
+        first_result.steps["model"].step is second_result.steps["model"].step
+    ), "Expected stateless step to be re-used"
+    assert (
+        first_result.steps["trace"].step is not second_result.steps["trace"].step
+    ), "Expected trace visualization (holding traces of trackers) to be initialised again"
+
+
+def test_compile_workflow_does_not_reuse_steps_when_cache_not_provided() -> None:
+    # given
+    model_manager = MagicMock()
+
+    # when
+    first_result = compile_workflow(
+        workflow_definition=WORKFLOW_WITH_STATEFUL_AND_STATELESS_STEPS,
+        init_parameters={"workflows_core.model_manager": model_manager},
+    )
+    second_result = compile_workflow(
+        workflow_definition=WORKFLOW_WITH_STATEFUL_AND_STATELESS_STEPS,
+        init_parameters={"workflows_core.model_manager": model_manager},
+    )
+
+    # then
+    assert first_result.steps["model"].step is not second_result.steps["model"].step
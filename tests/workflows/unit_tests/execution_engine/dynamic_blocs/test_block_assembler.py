@@ -15,6 +15,9 @@ from inference.core.workflows.execution_engine.entities.types import (
     WorkflowImageSelector,
     WorkflowParameterSelector,
 )
+from inference.core.workflows.execution_engine.profiling.core import (
+    BaseWorkflowsProfiler,
+)
 from inference.core.workflows.execution_engine.v1.dynamic_blocks import block_assembler
 from inference.core.workflows.execution_engine.v1.dynamic_blocks.block_assembler import (
     build_input_field_metadata,
@@ -22,6 +25,7 @@ from inference.core.workflows.execution_engine.v1.dynamic_blocks.block_assembler
     collect_input_dimensionality_offsets,
     collect_python_types_for_selectors,
     collect_python_types_for_values,
+    compile_dynamic_blocks,
     create_dynamic_block_specification,
     pick_dimensionality_reference_property,
 )
@@ -502,3 +506,78 @@ def test_create_dynamic_block_specification() -> None:
         _ = result.manifest_class.model_validate(
             {"name": "some", "type": "MyBlock", "a": "$steps.some.a", "b": 1}
         )  # error expected - value "b" not a list
+
+
+def _dynamic_block_definition(block_type: str) -> dict:
+    return {
+        "type": "DynamicBlockDefinition",
+        "manifest": {
+            "type": "ManifestDescription",
+            "block_type": block_type,
+            "inputs": {
+                "b": {
+                    "type": "DynamicInputDefinition",
+                    "value_types": ["list"],
+                },
+            },
+            "outputs": {"output": {"type": "DynamicOutputDefinition"}},
+        },
+        "code": {
+            "type": "PythonCode",
+            "run_function_code": PYTHON_CODE,
+        },
+    }
+
+
+@mock.patch.object(block_assembler, "create_dynamic_block_specification")
+def test_compile_dynamic_blocks_assembles_identical_definitions_once(
+    create_dynamic_block_specification_mock: mock.MagicMock,
+) -> None:
+    # given
+    create_dynamic_block_specification_mock.side_effect = (
+        create_dynamic_block_specification
+    )
+    profiler = BaseWorkflowsProfiler.init()
+    definition = _dynamic_block_definition(block_type="CachedBlock")
+
+    # when
+    first_result = compile_dynamic_blocks(
+        dynamic_blocks_definitions=[definition], profiler=profiler
+    )
+    second_result = compile_dynamic_blocks(
+        dynamic_blocks_definitions=[_dynamic_block_definition("CachedBlock")],
+        profiler=profiler,
+    )
+
+    # then
+    assert create_dynamic_block_specification_mock.call_count == 1
+    assert first_result[0] is second_result[0], "Expected cached specification"
+    assembly_events = [
+        e for e in profiler.export_trace() if e["name"] == "dynamic_block_assembly"
+    ]
+    assert [e["args"]["cache_hit"] for e in assembly_events] == [False, True]
+    assert all(e["args"]["block_type"] == "CachedBlock" for e in assembly_events)
+
+
+@mock.patch.object(block_assembler, "create_dynamic_block_specification")
+def test_compile_dynamic_blocks_assembles_changed_definitions_again(
+    create_dynamic_block_specification_mock: mock.MagicMock,
+) -> None:
+    # given
+    create_dynamic_block_specification_mock.side_effect = (
+        create_dynamic_block_specification
+    )
+    definition = _dynamic_block_definition(block_type="ChangedBlock")
+    changed_definition = _dynamic_block_definition(block_type="ChangedBlock")
+    changed_definition["code"]["run_function_code"] = PYTHON_CODE + "\n# changed"
+
+    # when
+    first_result = compile_dynamic_blocks(dynamic_blocks_definitions=[definition])
+    second_result = compile_dynamic_blocks(
+        dynamic_blocks_definitions=[changed_definition]
+    )
+
+    # then
+    assert create_dynamic_block_specification_mock.call_count == 2
+    assert first_result[0] is not second_result[0]
+    assert second_result[0].block_class().run(a=None, b=[1, 2]) == {"output": [2, 1]}